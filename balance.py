@@ -0,0 +1,62 @@
+import argparse
+from time import perf_counter
+
+from src.simulation.balance import balance_matrix, balance_breakdown
+from src.utils.messages import BALANCE_CONDITIONS_MSG, BALANCE_WIN_RATE_MSG, BALANCE_TURNS_MSG, BALANCE_TIME_MSG
+from src.utils.constants import (
+    BALANCE_DUELS,
+    BALANCE_MAX_TURNS,
+    BALANCE_SEED,
+    BALANCE_DEFENCES,
+    BALANCE_POWER_DIFFERENCES,
+)
+
+
+def print_table(names, values, value_format):
+    width = max(len(name) for name in names) + 1
+    print(" " * width + "".join(name[:7].rjust(8) for name in names))
+    for name, row in zip(names, values):
+        print(name.ljust(width) + "".join(value_format.format(value).rjust(8) for value in row))
+
+
+def start():
+
+    parser = argparse.ArgumentParser(description="Матрица баланса классов (поединки один на один)")
+    parser.add_argument("--duels", type=int, default=BALANCE_DUELS, help="количество поединков на пару")
+    parser.add_argument("--seed", type=int, default=BALANCE_SEED, help="зерно")
+    parser.add_argument("--max-turns", type=int, default=BALANCE_MAX_TURNS, help="предел ходов поединка")
+    parser.add_argument("--defence", type=int, default=0, help="защита здания второго персонажа")
+    parser.add_argument("--power", type=int, default=0, help="разница мощи доменов")
+    parser.add_argument("--breakdown", action="store_true", help="разбивка по защите зданий и мощи доменов")
+    args = parser.parse_args()
+
+    start_time = perf_counter()
+    if args.breakdown:
+        matrices = balance_breakdown(
+            defences=BALANCE_DEFENCES,
+            differences=BALANCE_POWER_DIFFERENCES,
+            duels=args.duels,
+            max_turns=args.max_turns,
+            seed=args.seed,
+        ).values()
+    else:
+        matrices = [balance_matrix(
+            building_defence=args.defence,
+            power_difference=args.power,
+            duels=args.duels,
+            max_turns=args.max_turns,
+            seed=args.seed,
+        )]
+
+    for matrix in matrices:
+        print(BALANCE_CONDITIONS_MSG.format(**matrix._asdict()))
+        print(BALANCE_WIN_RATE_MSG)
+        print_table(names=matrix.names, values=matrix.win_rate, value_format="{:.2f}")
+        print(BALANCE_TURNS_MSG)
+        print_table(names=matrix.names, values=matrix.turns_to_kill, value_format="{:.1f}")
+        print()
+    print(BALANCE_TIME_MSG.format(duels=args.duels, seconds=perf_counter() - start_time))
+
+
+if __name__ == '__main__':
+    start()
@@ -0,0 +1,62 @@
+import argparse
+import os
+import sys
+
+from src.benchmarks.cases import get_benchmarks
+from src.benchmarks.runner import run_benchmarks, write_results, load_results, compare
+from src.utils.messages import (
+    BENCHMARK_RESULT_MSG,
+    BENCHMARK_COMPARE_MSG,
+    BENCHMARK_SLOWDOWN_MSG,
+    BENCHMARK_NO_BASELINE_MSG,
+)
+from src.utils.constants import (
+    BENCHMARK_MIN_TIME,
+    BENCHMARK_REPEATS,
+    BENCHMARK_TOLERANCE,
+    BENCHMARK_OUTPUT,
+    BENCHMARK_BASELINE,
+)
+
+
+def start():
+
+    parser = argparse.ArgumentParser(description="Замеры производительности правил игры")
+    parser.add_argument("--filter", default="", help="только замеры, в имени которых есть строка")
+    parser.add_argument("--min-time", type=float, default=BENCHMARK_MIN_TIME, help="время одного замера")
+    parser.add_argument("--repeats", type=int, default=BENCHMARK_REPEATS, help="количество замеров")
+    parser.add_argument("--output", default=BENCHMARK_OUTPUT, help="файл результатов (JSON)")
+    parser.add_argument("--baseline", default=BENCHMARK_BASELINE, help="файл базы (JSON)")
+    parser.add_argument("--save-baseline", action="store_true", help="сохранить результаты как базу")
+    parser.add_argument("--tolerance", type=float, default=BENCHMARK_TOLERANCE, help="допустимое замедление")
+    args = parser.parse_args()
+
+    benchmarks = get_benchmarks()
+    results = []
+    for result in run_benchmarks(
+        benchmarks=benchmarks,
+        names=[name for name in benchmarks if args.filter in name],
+        min_time=args.min_time,
+        repeats=args.repeats,
+    ):
+        results.append(result)
+        print(BENCHMARK_RESULT_MSG.format(**result._asdict()))
+    write_results(results=results, path=args.output)
+
+    if args.save_baseline:
+        write_results(results=results, path=args.baseline)
+        return
+    if not os.path.exists(args.baseline):
+        print(BENCHMARK_NO_BASELINE_MSG.format(path=args.baseline))
+        return
+    comparisons = compare(results=results, baseline=load_results(path=args.baseline), tolerance=args.tolerance)
+    for comparison in comparisons:
+        print(BENCHMARK_COMPARE_MSG.format(**comparison._asdict()))
+    slowdowns = [comparison.name for comparison in comparisons if comparison.slowdown]
+    if slowdowns:
+        print(BENCHMARK_SLOWDOWN_MSG.format(names=", ".join(slowdowns)))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    start()
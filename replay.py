@@ -0,0 +1,33 @@
+import argparse
+
+from src.models.replay import ReplayLog, ReplayPlayer
+from src.utils.messages import REPLAY_RESULT_MSG
+
+
+def start():
+
+    parser = argparse.ArgumentParser(description="Воспроизведение записи партии")
+    parser.add_argument("path", help="файл записи (JSONL, можно сжатый .gz)")
+    parser.add_argument("--headless", action="store_true", help="без окна, с полной скоростью")
+    args = parser.parse_args()
+
+    log = ReplayLog.load(path=args.path)
+    if args.headless:
+        board = ReplayPlayer(log=log).run()
+        print(REPLAY_RESULT_MSG.format(
+            commands=len(log),
+            figures={domain.name: len(domain.figures) for domain in board.players},
+            position=board.position_key,
+        ))
+        return
+
+    import arcade
+    from src.gui.window import ChessWindow
+
+    window = ChessWindow(log=log)
+    window.start_game()
+    arcade.run()
+
+
+if __name__ == '__main__':
+    start()
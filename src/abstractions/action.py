@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Sequence, Tuple
 
+from src.utils.enums import AreaShape
 from src.utils.descriptions import ACTION_SHORT_DESC
 
 if TYPE_CHECKING:
@@ -9,6 +10,7 @@ if TYPE_CHECKING:
     from utils.tools import BaseAttribute
     from src.abstractions.figure import BaseFigure
     from src.abstractions.cell import BaseCell
+    from src.utils.rng import Outcome
 
 
 class BaseAction(ABC):
@@ -36,6 +38,8 @@ class BaseAction(ABC):
         self._perk = perk
         self._texture = texture
         self._radius = perk.radius if perk else 1
+        self._area = perk.area if perk else 0
+        self._shape = perk.shape if perk else AreaShape.cross.value
 
     def __str__(self) -> str:
         """Полное описание действия"""
@@ -80,16 +84,62 @@ class BaseAction(ABC):
     def radius(self) -> int:
         return self._radius
 
+    @property
+    def area(self) -> int:
+        """Радиус области поражения вокруг цели (0 - только цель)"""
+        return self._area
+
+    @property
+    def shape(self) -> "BaseAttribute":
+        """Форма области поражения"""
+        return self._shape
+
+    @property
+    def self_target(self) -> bool:
+        """Действие совершается только на исходной клетке (цель не выбирается)"""
+        return False
+
     @abstractmethod
     def realise(
         self,
         current_cell: "BaseCell",
-        target: "BaseCell" = None
+        target: "BaseCell" = None,
+        area: Sequence["BaseCell"] = (),
     ) -> None:
         """Совершить действие
 
         Args:
             current_cell: исходная клетка
             target: цель действия (графический объект)
+            area: клетки области поражения вокруг цели
+        """
+        pass
+
+    def outcomes(self, target: "BaseCell") -> Tuple[Tuple[float, Optional["Outcome"]], ...]:
+        """Возможные исходы бросков действия с их точными вероятностями
+        Действие без способности имеет единственный исход
+
+        Args:
+            target: цель действия
+
+        Returns:
+            tuple: пары (вероятность, исход)
+        """
+        return (1.0, None),
+
+    @abstractmethod
+    def can_realise(
+        self,
+        current_cell: "BaseCell",
+        target: "BaseCell" = None
+    ) -> bool:
+        """Можно ли совершить действие (проверка правил без побочных эффектов)
+
+        Args:
+            current_cell: исходная клетка
+            target: цель действия
+
+        Returns:
+            bool: действие допустимо
         """
         pass
@@ -1,13 +1,20 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Iterable, Optional
+from uuid import uuid4
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, Tuple, FrozenSet
 
 if TYPE_CHECKING:
     from src.abstractions.domain import BaseDomain
     from src.abstractions.building import BaseBuilding
     from src.abstractions.cell import BaseCell
     from src.abstractions.figure import BaseFigure
-    from src.utils.tools import BaseAttribute, Index
+    from src.utils.tools import BaseAttribute, Index, BoardState, BoardLayout
     from src.abstractions.action import BaseAction
+    from src.models.bitboard import Bitboard
+    from src.models.spatial import SpatialIndex
+    from src.models.zobrist import ZobristHash
+    from src.models.journal import ChangeJournal
+    from src.models.scheduler import TurnScheduler
+    from src.models.replay import ReplayRecorder
     from collections import UserDict
 
 
@@ -21,9 +28,10 @@ class BaseBoard(ABC):
         grey_domain: "BaseDomain",
         time: "BaseAttribute",
         started: bool = False,
-        cells: "UserDict[str, BaseCell]" = None,
+        cells: "UserDict[int, BaseCell]" = None,
         figures: "UserDict[str, BaseFigure]" = None,
-        buildings: "UserDict[str, BaseBuilding]" = None,
+        buildings: "UserDict[int, BaseBuilding]" = None,
+        layout: "BoardLayout" = None,
     ):
         """Инициализация доски
 
@@ -35,6 +43,7 @@ class BaseBoard(ABC):
             cells: клетки доски
             figures: фигуры доски
             buildings: здания доски
+            layout: расстановка доски
         """
         self._blue_domain = blue_domain
         self._red_domain = red_domain
@@ -46,6 +55,21 @@ class BaseBoard(ABC):
         self._buildings = buildings
         self._current_cell: Optional["BaseCell"] = None
         self._current_action: Optional["BaseAction"] = None
+        # расстановка доски (размеры, полосы доменов, позиции зданий и фигур)
+        self._layout = layout
+        # пространственный индекс клеток: соседи и области (создается вместе с клетками)
+        self._spatial: Optional["SpatialIndex"] = None
+        # битовое представление доски (создается вместе с клетками)
+        self._bitboard: Optional["Bitboard"] = None
+        # журнал изменений и хэш Зобриста (создаются после расстановки)
+        self._journal: Optional["ChangeJournal"] = None
+        self._zobrist: Optional["ZobristHash"] = None
+        # планировщик конца хода (создается после расстановки)
+        self._scheduler: Optional["TurnScheduler"] = None
+        # доска-источник снимков (восстановление своих снимков затрагивает только изменения)
+        self._source = uuid4().int
+        # запись партии (команды игроков пишутся, только если запись подключена)
+        self._recorder: Optional["ReplayRecorder"] = None
 
     @property
     def started(self) -> bool:
@@ -59,11 +83,89 @@ class BaseBoard(ABC):
     def current_action(self) -> Optional["BaseAction"]:
         return self._current_action
 
+    @property
+    def bitboard(self) -> Optional["Bitboard"]:
+        return self._bitboard
+
+    @property
+    def spatial(self) -> Optional["SpatialIndex"]:
+        return self._spatial
+
+    @property
+    def layout(self) -> "BoardLayout":
+        return self._layout
+
+    @layout.setter
+    def layout(self, value: "BoardLayout") -> None:
+        """Сменить расстановку (только пустой доски)"""
+        if self._cells:
+            raise ValueError("Расстановку можно сменить только до создания клеток")
+        self._layout = value
+
+    @property
+    def journal(self) -> Optional["ChangeJournal"]:
+        return self._journal
+
+    @property
+    def recorder(self) -> Optional["ReplayRecorder"]:
+        return self._recorder
+
+    @recorder.setter
+    def recorder(self, value: Optional["ReplayRecorder"]) -> None:
+        self._recorder = value
+
+    @property
+    def zobrist(self) -> Optional["ZobristHash"]:
+        return self._zobrist
+
+    @property
+    def position_key(self) -> int:
+        """Хэш позиции (расстановка и чей ход)"""
+        return self._zobrist.position(time=self._time)
+
+    @property
+    def players(self) -> Tuple["BaseDomain", "BaseDomain"]:
+        """Домены игроков (красный и синий)"""
+        return self._red_domain, self._blue_domain
+
+    @property
+    def current_domain(self) -> Optional["BaseDomain"]:
+        """Домен, который сейчас ходит"""
+        for domain in self.players:
+            if domain.turn:
+                return domain
+        return None
+
     @property
     def time(self) -> "BaseAttribute":
         return self._time
 
-    def get_cells(self) -> "UserDict[str, BaseCell]":
+    def get_domain(self, name: str) -> "BaseDomain":
+        """Получить домен по имени
+
+        Args:
+            name: имя домена
+
+        Returns:
+            BaseDomain: домен
+        """
+        return next(
+            domain
+            for domain in (self._red_domain, self._blue_domain, self._grey_domain)
+            if domain.name == name
+        )
+
+    def record(self, command: str, *args: int | str) -> None:
+        """Записать команду игрока в запись партии (если запись подключена)
+
+        Args:
+            command: команда
+            args: параметры команды
+        """
+        if self._recorder is not None:
+            self._recorder.record(command, *args)
+
+    def get_cells(self) -> "UserDict[int, BaseCell]":
         """Получить список клеток доски
 
         Returns:
@@ -71,6 +173,14 @@ class BaseBoard(ABC):
         """
         return self._cells
 
+    def get_figures(self) -> "UserDict[str, BaseFigure]":
+        """Получить список фигур доски
+
+        Returns:
+            dict: список фигур
+        """
+        return self._figures
+
     @abstractmethod
     def initialize_cells(self) -> None:
         """Создать клетки"""
@@ -143,7 +253,7 @@ class BaseBoard(ABC):
         pass
 
     @abstractmethod
-    def get_cell_neighbors(self, radius: int = 1) -> Iterable[str]:
+    def get_cell_neighbors(self, radius: int = 1) -> Iterable[int]:
         """Получить список индексов допустимых клеток в качестве цели (соседей)
 
         Returns:
@@ -151,6 +261,81 @@ class BaseBoard(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_neighbors(self, cell_id: int, radius: int = 1) -> FrozenSet[int]:
+        """Получить номера клеток в пределах радиуса от клетки (включая ее саму)
+
+        Args:
+            cell_id: номер клетки
+            radius: радиус
+
+        Returns:
+            frozenset: номера клеток
+        """
+        pass
+
+    @abstractmethod
+    def get_footprint(self, action: "BaseAction", target: "BaseCell") -> Tuple["BaseCell", ...]:
+        """Получить клетки области поражения действия вокруг цели (без самой цели)
+
+        Args:
+            action: действие
+            target: цель действия
+
+        Returns:
+            tuple: клетки
+        """
+        pass
+
+    @abstractmethod
+    def legal_actions(
+        self,
+        domain: "BaseDomain" = None,
+    ) -> Iterator[Tuple["BaseFigure", "BaseAction", "BaseCell"]]:
+        """Все допустимые действия домена (фигура, действие, клетка-цель)
+
+        Args:
+            domain: домен (по умолчанию - домен, который сейчас ходит)
+
+        Returns:
+            iterator: допустимые действия
+        """
+        pass
+
+    @abstractmethod
+    def perform(
+        self,
+        current_cell: "BaseCell",
+        action: "BaseAction",
+        target: "BaseCell",
+    ) -> None:
+        """Совершить действие без выбора клеток (для компьютерных игроков)
+
+        Args:
+            current_cell: исходная клетка
+            action: действие фигуры исходной клетки
+            target: цель действия
+        """
+        pass
+
+    @abstractmethod
+    def snapshot(self) -> "BoardState":
+        """Снимок состояния доски
+
+        Returns:
+            BoardState: состояние
+        """
+        pass
+
+    @abstractmethod
+    def restore(self, state: "BoardState") -> None:
+        """Восстановить состояние доски из снимка
+
+        Args:
+            state: состояние
+        """
+        pass
+
     @abstractmethod
     def start_circle(self) -> None:
         """Начать цикл битвы"""
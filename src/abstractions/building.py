@@ -1,8 +1,9 @@
+from abc import ABC
 from typing import TYPE_CHECKING, Optional
 
-from src.abstractions.sprite import BaseImage
+from src.utils.tools import Observable, BuildingState
 from src.utils.descriptions import BUILDING_SHORT_DESC, BUILDING_LONG_DESC
-from src.utils.enums import ActionType, PerkStatus
+from src.utils.enums import ActionType, PerkStatus, ModelEvent
 
 if TYPE_CHECKING:
     from src.utils.tools import SpriteCore, Index
@@ -12,8 +13,10 @@ if TYPE_CHECKING:
     from src.abstractions.cell import BaseCell
 
 
-class BaseBuilding(BaseImage):
-    """Абстрактная UI модель здания"""
+class BaseBuilding(Observable, ABC):
+    """Абстрактная модель здания
+    Графика здания (src.gui.building) только наблюдает за моделью
+    """
 
     def __init__(
         self,
@@ -36,10 +39,9 @@ class BaseBuilding(BaseImage):
             figure: фигура
             can_change_domain: возможность сменить домен
         """
-        super().__init__(
-            core=core,
-        )
-        self.with_border(width=3, color=core.domain.color)
+        super().__init__()
+        self._core = core
+        self._cell: Optional["BaseCell"] = None
         self._figure = figure
         self._action = action
         self._can_change_domain = can_change_domain
@@ -56,6 +58,21 @@ class BaseBuilding(BaseImage):
         """Краткое описание здания"""
         return BUILDING_SHORT_DESC.format(title=self._title, index=self.core.index)
 
+    @property
+    def core(self) -> "SpriteCore":
+        """Свойства графического объекта здания"""
+        return self._core
+
+    @property
+    def cell(self) -> Optional["BaseCell"]:
+        """Клетка, на которой стоит здание"""
+        return self._cell
+
+    @cell.setter
+    def cell(self, value: "BaseCell") -> None:
+        """Установить клетку здания"""
+        self._cell = value
+
     @property
     def title(self) -> str:
         """Название"""
@@ -92,6 +109,11 @@ class BaseBuilding(BaseImage):
                     current_actions = self._figure.get_actions()
                     current_actions[self._action.name] = self._action
 
+    @property
+    def action(self) -> Optional["BaseAction"]:
+        """Действие здания (при наличии)"""
+        return self._action
+
     @property
     def can_change_domain(self) -> bool:
         """Может ли клетка с этим зданием сменить домен
@@ -101,12 +123,12 @@ class BaseBuilding(BaseImage):
 
     @property
     def name(self) -> str:
-        """Напрямую извлечь имя спрайта"""
+        """Напрямую извлечь имя здания"""
         return self._core.name
 
     @property
     def index(self) -> "Index":
-        """Напрямую извлечь индекс спрайта"""
+        """Напрямую извлечь индекс здания"""
         return self._core.index
 
     def change_domain(self, target: "BaseDomain") -> None:
@@ -116,16 +138,38 @@ class BaseBuilding(BaseImage):
             target: домен
         """
         self._core.domain = target
-        self.with_border(width=3, color=self._core.domain.color)
+        self.notify(event=ModelEvent.domain.value)
+
+    def snapshot(self) -> BuildingState:
+        """Снимок состояния здания
+
+        Returns:
+            BuildingState: состояние
+        """
+        return BuildingState(
+            domain=self._core.domain.name,
+            perk=self._action.perk.snapshot() if self._action else None,
+        )
+
+    def restore(self, state: BuildingState, domain: "BaseDomain") -> None:
+        """Восстановить состояние здания из снимка
+
+        Args:
+            state: состояние
+            domain: домен здания
+        """
+        if self._core.domain != domain:
+            self.change_domain(target=domain)
+        if self._action:
+            self._action.perk.restore(state=state.perk)
 
     def end_turn(self) -> None:
         """Завершить ход и активировать действие, уникальное для зданий"""
         if self._action:
             if self._action.attribute == ActionType.only_building.value:
-                if self.parent:
-                    parent: "BaseCell" = self.parent
+                if self._cell:
                     self._action.realise(
-                        current_cell=parent,
-                        target=parent,
+                        current_cell=self._cell,
+                        target=self._cell,
                     )
             self._action.perk.change_status(value=PerkStatus.active.value)
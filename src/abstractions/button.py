@@ -3,6 +3,8 @@ from arcade.gui import (
     UITextureButton,
 )
 
+from src.utils.textures import resolve_texture
+
 if TYPE_CHECKING:
     from arcade import Texture
     from utils.tools import SpriteCore
@@ -21,9 +23,9 @@ class BaseButton(UITextureButton):
             text=text,
             width=core.width,
             height=core.height,
-            texture=core.texture,
-            texture_hovered=texture_hovered,
-            texture_pressed=texture_pressed,
+            texture=resolve_texture(core.texture),
+            texture_hovered=resolve_texture(texture_hovered),
+            texture_pressed=resolve_texture(texture_pressed),
             multiline=True,
         )
         self._core = core
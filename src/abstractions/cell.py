@@ -1,9 +1,8 @@
-from abc import abstractmethod
+from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Optional
-from arcade import color
-from arcade.gui.widgets.layout import UIAnchorLayout
 
-from src.abstractions.sprite import BaseImage
+from src.utils.tools import Observable, CellState
+from src.utils.enums import ModelEvent
 from src.utils.descriptions import CELL_SHORT_DESC, CELL_LONG_DESC
 
 if TYPE_CHECKING:
@@ -15,70 +14,32 @@ if TYPE_CHECKING:
     from collections import UserDict
 
 
-class BaseCellSprite(BaseImage):
-    """Абстрактная UI модель графики клетки игральной доски"""
+class BaseCell(Observable, ABC):
+    """Абстрактная модель клетки игральной доски
+    Графика клетки (src.gui.cell) только наблюдает за моделью
+    """
 
     def __init__(
         self,
         core: "SpriteCore",
-    ):
-        """Инициализация клетки
-
-        Args:
-            core: свойства графического объекта
-        """
-        super().__init__(
-            core=core,
-        )
-        self.with_border(color=color.BLACK, width=1)
-
-    def change_domain(self, target: "BaseDomain") -> None:
-        """Установить новый домен
-
-        Args:
-            target: домен
-        """
-        # убрать бонус мощи для текущего домена
-        self._core.domain.power -= 1
-        # сменить домен, текстуры и прибавить бонус мощи для нового домена
-        self._core.domain = target
-        self.texture = self._core.domain.texture
-        self._core.domain.power += 1
-
-
-class BaseCell(UIAnchorLayout):
-    """Абстрактная UI модель клетки игральной доски"""
-
-    def __init__(
-        self,
-        sprite: BaseCellSprite,
         building: "BaseBuilding" = None,
         figure: "BaseFigure" = None,
     ):
         """Инициализация клетки
 
         Args:
-            sprite: UI спрайт клетки
+            core: свойства графического объекта
             building: здание клетки
             figure: фигура клетки
         """
-        super().__init__(
-            width=sprite.width,
-            height=sprite.height,
-        )
-        self._sprite = self.add(
-            child=sprite,
-        )
+        super().__init__()
+        self._core = core
+        self._building: Optional["BaseBuilding"] = None
+        self._figure: Optional["BaseFigure"] = None
         if building:
-            self.add(
-                child=building,
-            )
+            self.building = building
         if figure:
-            self.add(
-                child=figure,
-            )
-        self._building = building
-        self._figure = figure
+            self.figure = figure
         self._title = "Клетка"
 
     def __str__(self) -> str:
@@ -89,7 +50,7 @@ class BaseCell(UIAnchorLayout):
     @property
     def desc(self) -> str:
         """Краткое описание клетки"""
-        return CELL_SHORT_DESC.format(index=self._sprite.core.index)
+        return CELL_SHORT_DESC.format(index=self._core.index)
 
     @property
     def title(self) -> str:
@@ -97,9 +58,9 @@ class BaseCell(UIAnchorLayout):
         return self._title
 
     @property
-    def sprite(self) -> BaseCellSprite:
-        """Доступ к графике клетки"""
-        return self._sprite
+    def core(self) -> "SpriteCore":
+        """Свойства графического объекта клетки"""
+        return self._core
 
     @property
     def building(self) -> Optional["BaseBuilding"]:
@@ -109,9 +70,9 @@ class BaseCell(UIAnchorLayout):
     @building.setter
     def building(self, value: "BaseBuilding") -> None:
         """Установить здание (допускается только при инициализации доски)"""
-        self._building = self.add(
-            child=value,
-        )
+        self._building = value
+        self._building.cell = self
+        self.notify(event=ModelEvent.building.value)
 
     @property
     def figure(self) -> Optional["BaseFigure"]:
@@ -121,36 +82,33 @@ class BaseCell(UIAnchorLayout):
     @figure.setter
     def figure(self, value: "BaseFigure") -> None:
         """Установить фигуру на клетке"""
-        self._figure = self.add(
-            child=value,
-        )
+        self._figure = value
         if self._building:
             self._building.figure = self._figure
+        self.notify(event=ModelEvent.figure.value)
 
     def remove_figure(self) -> None:
         """Удалить фигуру с клетки"""
         if self._figure:
-            self.remove(
-                child=self._figure,
-            )
             self._figure = None
             if self._building:
                 self._building.figure = None
+            self.notify(event=ModelEvent.figure.value)
 
     @property
     def domain(self) -> "BaseDomain":
-        """Напрямую извлечь домен спрайта"""
-        return self._sprite.core.domain
+        """Напрямую извлечь домен клетки"""
+        return self._core.domain
 
     @property
     def name(self) -> str:
-        """Напрямую извлечь имя спрайта"""
-        return self._sprite.core.name
+        """Напрямую извлечь имя клетки"""
+        return self._core.name
 
     @property
     def index(self) -> "Index":
-        """Напрямую извлечь индекс спрайта"""
-        return self._sprite.core.index
+        """Напрямую извлечь индекс клетки"""
+        return self._core.index
 
     @abstractmethod
     def capture(self, figure: "BaseFigure") -> None:
@@ -165,10 +123,45 @@ class BaseCell(UIAnchorLayout):
         """
         if self._building:
             if self._building.can_change_domain:
-                self._sprite.change_domain(target=target)
+                self._set_domain(target=target)
                 self._building.change_domain(target=target)
         else:
-            self._sprite.change_domain(target=target)
+            self._set_domain(target=target)
+
+    def snapshot(self) -> CellState:
+        """Снимок состояния клетки
+
+        Returns:
+            CellState: состояние
+        """
+        return CellState(
+            figure=self._figure.name if self._figure else None,
+            domain=self._core.domain.name,
+        )
+
+    def restore_domain(self, target: "BaseDomain") -> None:
+        """Вернуть клетке домен из снимка (мощь доменов восстанавливается вместе с доменами)
+
+        Args:
+            target: домен
+        """
+        self._core.domain = target
+        self._core.texture = target.texture
+        self.notify(event=ModelEvent.domain.value)
+
+    def _set_domain(self, target: "BaseDomain") -> None:
+        """Сменить домен клетки и пересчитать мощь доменов
+
+        Args:
+            target: домен
+        """
+        # убрать бонус мощи для текущего домена
+        self._core.domain.power -= 1
+        # сменить домен, текстуры и прибавить бонус мощи для нового домена
+        self._core.domain = target
+        self._core.texture = target.texture
+        self._core.domain.power += 1
+        self.notify(event=ModelEvent.domain.value)
 
     @abstractmethod
     def get_figure_actions(self) -> "UserDict[str, BaseAction]":
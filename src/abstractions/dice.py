@@ -1,9 +1,14 @@
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
+from src.utils.probability import point_distribution
+
 if TYPE_CHECKING:
+    from numpy import ndarray
+    from numpy.random import Generator
     from src.utils.tools import BaseAttribute
     from src.utils.tools import F_spec
+    from src.utils.probability import Distribution
 
 
 class BaseDice(ABC):
@@ -35,6 +40,33 @@ class BaseDice(ABC):
         """
         pass
 
+    @abstractmethod
+    def rolls(self, size: int, generator: "Generator") -> "ndarray":
+        """Результаты серии бросков кости (векторно)
+
+        Args:
+            size: количество бросков
+            generator: генератор случайных чисел
+
+        Returns:
+            ndarray: значения
+        """
+        pass
+
+    @abstractmethod
+    def distribution(self) -> "Distribution":
+        """Точное распределение броска кости
+
+        Returns:
+            Distribution: распределение
+        """
+        pass
+
+    @property
+    def side(self) -> int:
+        """Количество граней кости"""
+        return self._side
+
     @property
     def lower(self) -> int:
         """Минимальное значение"""
@@ -75,6 +107,28 @@ class BaseRoll(ABC):
         """
         pass
 
+    @abstractmethod
+    def actions(
+        self,
+        size: int,
+        generator: "Generator",
+        **kwargs: "F_spec.kwargs",
+    ) -> "ndarray":
+        """Бросить кость size раз (векторно, по тем же правилам, что и action)
+
+        Args:
+            size: количество бросков
+            generator: генератор случайных чисел
+
+        Returns:
+            ndarray: результаты
+        """
+        pass
+
+    @property
+    def dice(self) -> BaseDice:
+        return self._dice
+
     @property
     def modifier(self) -> "BaseAttribute":
         return self._modifier
@@ -89,3 +143,29 @@ class BaseRoll(ABC):
             return self._resistance.roll()
         else:
             return self._resistance
+
+    def resistance_distribution(self) -> "Distribution":
+        """Точное распределение базового шанса на провал
+
+        Returns:
+            Distribution: распределение
+        """
+        if isinstance(self._resistance, BaseDice):
+            return self._resistance.distribution()
+        else:
+            return point_distribution(value=self._resistance)
+
+    def resistances(self, size: int, generator: "Generator") -> "ndarray | int":
+        """Базовый шанс на провал для серии бросков (векторно)
+
+        Args:
+            size: количество бросков
+            generator: генератор случайных чисел
+
+        Returns:
+            ndarray | int: значения
+        """
+        if isinstance(self._resistance, BaseDice):
+            return self._resistance.rolls(size=size, generator=generator)
+        else:
+            return self._resistance
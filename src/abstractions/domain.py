@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, Iterable, Mapping, Optional
 from collections import UserDict
 
 from src.utils.descriptions import DOMAIN_SHORT_DESC, DOMAIN_LONG_DESC
+from src.utils.tools import Observable, DomainState
+from src.utils.enums import ModelEvent
 
 if TYPE_CHECKING:
     from arcade import Texture
@@ -10,8 +12,10 @@ if TYPE_CHECKING:
     from src.abstractions.figure import BaseFigure
 
 
-class BaseDomain(ABC):
-    """Абстрактная модель домена"""
+class BaseDomain(Observable, ABC):
+    """Абстрактная модель домена
+    Изменение мощи, очереди, фигур и пленников домена - событие модели
+    """
 
     def __init__(
         self,
@@ -33,6 +37,7 @@ class BaseDomain(ABC):
             domain_color: цвет домена
             power: мощь домена
         """
+        super().__init__()
         self._name = name
         self._title = title
         self._desc = description
@@ -40,6 +45,7 @@ class BaseDomain(ABC):
         self._color = domain_color
         self._power = power
         self._turn = turn
+        self._automated = False
         self._figures: UserDict[str, "BaseFigure"] = UserDict()
         self._prisoners: UserDict[str, "BaseFigure"] = UserDict()
 
@@ -81,12 +87,23 @@ class BaseDomain(ABC):
     def power(self, value: int) -> None:
         """Установить мощь домена"""
         self._power = value
+        self.notify(event=ModelEvent.status.value)
 
     @property
     def turn(self) -> bool:
         """Очередь домена"""
         return self._turn
 
+    @property
+    def automated(self) -> bool:
+        """Доменом управляет компьютер"""
+        return self._automated
+
+    @automated.setter
+    def automated(self, value: bool) -> None:
+        """Передать управление доменом компьютеру (или игроку)"""
+        self._automated = value
+
     @property
     def figures(self) -> UserDict[str, "BaseFigure"]:
         return self._figures
@@ -95,6 +112,29 @@ class BaseDomain(ABC):
     def prisoners(self) -> UserDict[str, "BaseFigure"]:
         return self._prisoners
 
+    def snapshot(self) -> DomainState:
+        """Снимок состояния домена
+
+        Returns:
+            DomainState: состояние
+        """
+        return DomainState(
+            power=self._power,
+            turn=self._turn,
+            figures=tuple(self._figures),
+            prisoners=tuple(self._prisoners),
+        )
+
+    @abstractmethod
+    def restore(self, state: DomainState, figures: Mapping[str, "BaseFigure"]) -> None:
+        """Восстановить состояние домена из снимка
+
+        Args:
+            state: состояние
+            figures: все фигуры доски по именам
+        """
+        pass
+
     @abstractmethod
     def set_figures(self, figures: Iterable["BaseFigure"]) -> None:
         """Установить фигуры домена
@@ -123,8 +163,21 @@ class BaseDomain(ABC):
         pass
 
     @abstractmethod
-    def end_circle(self) -> None:
-        """Завершить цикл ходов домена, начав новый"""
+    def release_prisoner(self) -> Optional["BaseFigure"]:
+        """Отпустить первого пленника домена (например, в жертву)
+
+        Returns:
+            BaseFigure: пленник (пусто - пленников нет)
+        """
+        pass
+
+    @abstractmethod
+    def end_circle(self, expiring: Optional[Iterable["BaseFigure"]] = None) -> None:
+        """Завершить цикл ходов домена, начав новый
+
+        Args:
+            expiring: фигуры домена, у которых снимаются бафы и перезаряжаются способности (по умолчанию - все)
+        """
         pass
 
     @abstractmethod
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List
 
 if TYPE_CHECKING:
+    from numpy import ndarray
+    from numpy.random import Generator
     from src.abstractions.item import BaseItem
     from src.abstractions.unit import BaseUnit
     from utils.tools import F_spec
@@ -62,3 +64,49 @@ class BaseEffect(ABC):
             kwargs: дополнительные параметры
         """
         pass
+
+    @abstractmethod
+    def simulate(
+        self,
+        target: "BaseUnit",
+        hit: "ndarray",
+        crit: "ndarray",
+        hit_points: "ndarray",
+        generator: "Generator",
+        **kwargs: "F_spec.kwargs",
+    ) -> "ndarray":
+        """Применить эффект к серии исходов (векторный аналог apply)
+        Состояние цели не изменяется
+
+        Args:
+            target: цель способности
+            hit: броски на попадание
+            crit: броски на критический удар
+            hit_points: здоровье цели до применения эффекта
+            generator: генератор случайных чисел
+            kwargs: дополнительные параметры
+
+        Returns:
+            ndarray: здоровье цели после применения эффекта
+        """
+        pass
+
+    @abstractmethod
+    def apply_area(
+        self,
+        targets: List["BaseUnit"],
+        hit: "ndarray",
+        crit: "ndarray",
+        generator: "Generator",
+        **kwargs: "F_spec.kwargs",
+    ) -> None:
+        """Применить эффект к целям области (значения бросаются сразу для всех целей)
+
+        Args:
+            targets: цели способности
+            hit: броски на попадание (по одному на цель)
+            crit: броски на критический удар (по одному на цель)
+            generator: генератор случайных чисел
+            kwargs: дополнительные параметры (по одному значению на цель)
+        """
+        pass
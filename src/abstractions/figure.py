@@ -1,9 +1,8 @@
-from abc import abstractmethod
+from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
-from arcade.gui.widgets.layout import UIAnchorLayout
 
-from src.abstractions.sprite import BaseImage
-from src.utils.constants import CELL_SIZE
+from src.utils.tools import Observable, FigureState
+from src.utils.enums import ModelEvent
 from src.utils.descriptions import FIGURE_LONG_DESC
 
 if TYPE_CHECKING:
@@ -12,40 +11,17 @@ if TYPE_CHECKING:
     from src.abstractions.item import BaseAttribute
     from src.abstractions.unit import BaseUnit
     from src.abstractions.action import BaseAction
-    from src.abstractions.indicator import BaseIndicatorBar
     from collections import UserDict
 
 
-class BaseFigureSprite(BaseImage):
-    """Абстрактная UI модель графики фигуры"""
+class BaseFigure(Observable, ABC):
+    """Абстрактная модель фигуры
+    Графика фигуры (src.gui.figure) только наблюдает за моделью
+    """
 
     def __init__(
         self,
         core: "SpriteCore",
-    ):
-        """Инициализация фигуры
-
-        Args:
-            core: свойства графического объекта
-
-        """
-        super().__init__(
-            core=core,
-        )
-        self.with_border(width=3, color=core.domain.color)
-
-    def change_domain(self, target: "BaseDomain") -> None:
-        """Установить новый домен (запрещено для фигур)"""
-        pass
-
-
-class BaseFigure(UIAnchorLayout):
-    """Абстрактная UI модель фигуры"""
-
-    def __init__(
-        self,
-        sprite: BaseFigureSprite,
-        indicator: "BaseIndicatorBar",
         unit: "BaseUnit",
         actions: "UserDict[str, BaseAction]",
         status: "BaseAttribute",
@@ -53,29 +29,14 @@ class BaseFigure(UIAnchorLayout):
         """Инициализация фигуры
 
         Args:
-            sprite: UI спрайт фигуры
-            indicator: UI спрайт индикатора
+            core: свойства графического объекта
             unit: персонаж
             actions: списсок действий фигуры
             status: статус фигуры
         """
-        super().__init__(
-            width=sprite.width,
-            height=sprite.height,
-            size_hint=(
-                sprite.width / CELL_SIZE,
-                sprite.height / CELL_SIZE,
-            )
-        )
-        self._title = sprite.core.domain.title + " " + unit.title
-        self._sprite = self.add(
-            child=sprite,
-        )
-        self._indicator = self.add(
-            child=indicator,
-            # anchor_x="left",
-            anchor_y="top",
-        )
+        super().__init__()
+        self._core = core
+        self._title = core.domain.title + " " + unit.title
         self._unit = unit
         self._status = status
         self._actions = actions
@@ -96,14 +57,9 @@ class BaseFigure(UIAnchorLayout):
         return self._title
 
     @property
-    def sprite(self) -> BaseFigureSprite:
-        """Графика фигуры"""
-        return self._sprite
-
-    @property
-    def indicator(self) -> "BaseIndicatorBar":
-        """Индикатор здоровья фигуры"""
-        return self._indicator
+    def core(self) -> "SpriteCore":
+        """Свойства графического объекта фигуры"""
+        return self._core
 
     @property
     def unit(self) -> "BaseUnit":
@@ -129,25 +85,49 @@ class BaseFigure(UIAnchorLayout):
     def can_move(self, value: bool) -> None:
         """Изменить возможность перемещаться"""
         self._can_move = value
+        self.notify(event=ModelEvent.status.value)
 
     @property
     def domain(self) -> "BaseDomain":
-        """Напрямую извлечь домен спрайта"""
-        return self._sprite.core.domain
+        """Напрямую извлечь домен фигуры"""
+        return self._core.domain
 
     @property
     def name(self) -> str:
-        """Напрямую извлечь имя спрайта"""
-        return self._sprite.core.name
+        """Напрямую извлечь имя фигуры"""
+        return self._core.name
 
     @property
     def index(self) -> "Index":
-        """Напрямую извлечь индекс спрайта"""
-        return self._sprite.core.index
+        """Напрямую извлечь индекс фигуры"""
+        return self._core.index
 
     def change_domain(self, target: "BaseDomain") -> None:
-        """Установить новый домен (делигируем спрайту)"""
-        self._sprite.change_domain(target=target)
+        """Установить новый домен (запрещено для фигур)"""
+        pass
+
+    def snapshot(self) -> FigureState:
+        """Снимок состояния фигуры
+
+        Returns:
+            FigureState: состояние
+        """
+        return FigureState(
+            can_move=self._can_move,
+            status=self._status,
+            unit=self._unit.snapshot(),
+        )
+
+    def restore(self, state: FigureState) -> None:
+        """Восстановить состояние фигуры из снимка
+
+        Args:
+            state: состояние
+        """
+        self._can_move = state.can_move
+        self._status = state.status
+        self._unit.restore(state=state.unit)
+        self.notify(event=ModelEvent.status.value)
 
     @abstractmethod
     def check_status(self):
@@ -1,9 +1,13 @@
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
+from src.utils.enums import AreaShape
 from src.utils.descriptions import ITEM_LONG_DESC
 
 if TYPE_CHECKING:
+    from typing import List
+    from numpy import ndarray
+    from numpy.random import Generator
     from src.abstractions.effect import BaseEffect
     from src.abstractions.dice import BaseRoll
     from utils.tools import BaseAttribute
@@ -22,6 +26,8 @@ class BaseItem(ABC):
         effect: "BaseEffect",
         attribute: "BaseAttribute",
         radius: int = 1,
+        area: int = 0,
+        shape: "BaseAttribute" = AreaShape.cross.value,
     ):
         """Инициализация предмета
 
@@ -32,6 +38,8 @@ class BaseItem(ABC):
             effect: эффект предмета
             attribute: тип предмета
             radius: радиус действия
+            area: радиус области поражения вокруг цели (0 - только цель)
+            shape: форма области поражения
         """
         self._name = name
         self._title = title
@@ -39,6 +47,8 @@ class BaseItem(ABC):
         self._effect = effect
         self._attribute = attribute
         self._radius = radius
+        self._area = area
+        self._shape = shape
 
     def __str__(self) -> str:
         """Описание предмета"""
@@ -63,6 +73,16 @@ class BaseItem(ABC):
     def radius(self) -> int:
         return self._radius
 
+    @property
+    def area(self) -> int:
+        """Радиус области поражения"""
+        return self._area
+
+    @property
+    def shape(self) -> "BaseAttribute":
+        """Форма области поражения"""
+        return self._shape
+
     def change_modifier(self, value: "BaseAttribute") -> None:
         """Изменить модификатор урона предмета
 
@@ -86,6 +106,46 @@ class BaseItem(ABC):
             **kwargs,
         )
 
+    def simulate(
+        self,
+        target: "BaseUnit",
+        hit: "ndarray",
+        crit: "ndarray",
+        hit_points: "ndarray",
+        generator: "Generator",
+        **kwargs: "F_spec.kwargs",
+    ) -> "ndarray":
+        """Активировать предмет для серии исходов (векторный аналог charge)
+
+        Returns:
+            ndarray: здоровье цели после применения эффекта
+        """
+        return self._effect.simulate(
+            target=target,
+            hit=hit,
+            crit=crit,
+            hit_points=hit_points,
+            generator=generator,
+            **kwargs,
+        )
+
+    def charge_area(
+        self,
+        targets: "List[BaseUnit]",
+        hit: "ndarray",
+        crit: "ndarray",
+        generator: "Generator",
+        **kwargs: "F_spec.kwargs",
+    ) -> None:
+        """Активировать предмет на целях области (по одному исходу на цель)"""
+        self._effect.apply_area(
+            targets=targets,
+            hit=hit,
+            crit=crit,
+            generator=generator,
+            **kwargs,
+        )
+
     @abstractmethod
     def deal(self, **kwargs: "F_spec.kwargs") -> int:
         """Выполнить действие предмета
@@ -94,3 +154,17 @@ class BaseItem(ABC):
             int: значение
         """
         pass
+
+    @abstractmethod
+    def deals(
+        self,
+        size: int,
+        generator: "Generator",
+        **kwargs: "F_spec.kwargs",
+    ) -> "ndarray":
+        """Выполнить действие предмета size раз (векторно)
+
+        Returns:
+            ndarray: значения
+        """
+        pass
@@ -1,21 +1,29 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
+from src.utils.tools import Observable, Stored, StoredAttribute, PerkState
+from src.utils.enums import PerkStatus
 from src.utils.descriptions import PERK_LONG_DESC
 
 if TYPE_CHECKING:
+    from numpy import ndarray
+    from numpy.random import Generator
     from arcade import Texture
     from src.abstractions.item import BaseItem
     from utils.tools import BaseAttribute
     from src.abstractions.unit import BaseUnit
     from utils.tools import F_spec
+    from src.utils.rng import Outcome
 
 
-class BasePerk(ABC):
+class BasePerk(Stored, Observable, ABC):
     """Абстрактная модель способности
     Способность отвечает за броски попадания и критического удара
     Также способность вызывает определенный эффект, связанный с предметом
+    Смена статуса способности - событие модели
+    Статус может храниться в общем хранилище (src.models.store)
     """
+    _status = StoredAttribute(column="perk_status", values=[status.value for status in PerkStatus])
 
     def __init__(
         self,
@@ -40,6 +48,7 @@ class BasePerk(ABC):
             texture: иконка способности
             person: персонаж
         """
+        super().__init__()
         self._name = name
         self._title = title
         self._person = person
@@ -49,6 +58,8 @@ class BasePerk(ABC):
         self._modifier = modifier
         self._texture = texture
         self._radius = item.radius
+        self._area = item.area
+        self._shape = item.shape
 
     def __str__(self) -> str:
         """Полное описание способности"""
@@ -96,6 +107,26 @@ class BasePerk(ABC):
     def radius(self) -> int:
         return self._radius
 
+    @property
+    def area(self) -> int:
+        """Радиус области поражения вокруг цели (0 - только цель)"""
+        return self._area
+
+    @property
+    def shape(self) -> "BaseAttribute":
+        """Форма области поражения"""
+        return self._shape
+
+    @property
+    def parts(self) -> Tuple["BasePerk", ...]:
+        """Составные способности (у простой способности их нет)"""
+        return ()
+
+    @property
+    def item(self) -> "BaseItem":
+        """Предмет"""
+        return self._item
+
     @property
     def person(self) -> Optional["BaseUnit"]:
         return self._person
@@ -114,6 +145,76 @@ class BasePerk(ABC):
         """
         pass
 
+    @abstractmethod
+    def simulate(
+        self,
+        target: "BaseUnit",
+        hit_points: "ndarray",
+        generator: "Generator",
+        **kwargs: "F_spec.kwargs",
+    ) -> Tuple["ndarray", "ndarray", "ndarray"]:
+        """Смоделировать серию активаций способности (векторный аналог activate)
+        Состояние персонажей и способности не изменяется
+
+        Args:
+            target: цель способности
+            hit_points: здоровье цели до активации (по одному значению на исход)
+            generator: генератор случайных чисел
+            kwargs: дополнительные параметры
+
+        Returns:
+            tuple: попадания, критические удары, здоровье цели после активации
+        """
+        pass
+
+    @abstractmethod
+    def outcomes(self, target: "BaseUnit") -> Tuple[Tuple[float, "Outcome"], ...]:
+        """Возможные исходы бросков способности с их точными вероятностями
+
+        Args:
+            target: цель способности
+
+        Returns:
+            tuple: пары (вероятность, исход)
+        """
+        pass
+
+    @abstractmethod
+    def splash(
+        self,
+        targets: List["BaseUnit"],
+        generator: "Generator",
+        **kwargs: "F_spec.kwargs",
+    ) -> None:
+        """Воздействие на цели области вокруг главной цели
+        Броски делаются сразу для всех целей; статус способности не меняется
+
+        Args:
+            targets: цели способности
+            generator: генератор случайных чисел
+            kwargs: дополнительные параметры (по одному значению на цель)
+        """
+        pass
+
+    def snapshot(self) -> PerkState:
+        """Снимок состояния способности
+
+        Returns:
+            PerkState: состояние
+        """
+        return PerkState(status=self._status, modifier=self._modifier)
+
+    def restore(self, state: PerkState) -> None:
+        """Восстановить состояние способности из снимка (меняются только отличающиеся значения)
+
+        Args:
+            state: состояние
+        """
+        if self._status != state.status:
+            self.change_status(value=state.status)
+        if self._modifier != state.modifier:
+            self.change_modifier(value=state.modifier)
+
     @abstractmethod
     def change_attribute(self, value: "BaseAttribute") -> None:
         """Изменить тип способности
@@ -4,6 +4,8 @@ from arcade.gui.widgets.image import UIImage
 from arcade.gui import UISpriteWidget
 from typing import TYPE_CHECKING
 
+from src.utils.textures import resolve_texture
+
 if TYPE_CHECKING:
     from utils.tools import SpriteCore
     from src.abstractions.domain import BaseDomain
@@ -23,7 +25,7 @@ class BaseImage(UIImage, ABC):
         """
 
         super().__init__(
-            texture=core.texture,
+            texture=resolve_texture(core.texture),
             width=core.width,
             height=core.height,
         )
@@ -56,7 +58,7 @@ class BasicUISprite(UISpriteWidget, ABC):
             core: свойства графического объекта
         """
         sprite = Sprite(
-            path_or_texture=core.texture,
+            path_or_texture=resolve_texture(core.texture),
         )
         super().__init__(
             width=core.width,
@@ -1,6 +1,8 @@
 from abc import ABC
-from typing import TYPE_CHECKING
-from arcade import uicolor, load_texture
+from collections import deque
+from typing import TYPE_CHECKING, Iterable, Deque
+from arcade import uicolor
+from arcade.types import Color
 from arcade.gui import (
     UIAnchorLayout,
     UIImage,
@@ -11,14 +13,12 @@ from src.utils.constants import (
     DEFAULT_FONT_SIZE,
     DEFAULT_FONT_NAME,
     CELL_SIZE,
+    INFO_PANEL_HISTORY,
 )
+from src.utils.textures import SCROLL_DOWN_TEXTURE, SCROLL_UP_TEXTURE, resolve_texture
 
 if TYPE_CHECKING:
     from utils.tools import F_spec
-    from arcade.types import Color
-
-TEX_SCROLL_DOWN = load_texture(":resources:gui_basic_assets/scroll/indicator_down.png")
-TEX_SCROLL_UP = load_texture(":resources:gui_basic_assets/scroll/indicator_up.png")
 
 
 class BaseScrollableTextArea(UITextArea, UIAnchorLayout, ABC):
@@ -43,9 +43,18 @@ class BaseScrollableTextArea(UITextArea, UIAnchorLayout, ABC):
             size_hint=(0.5, 0.8),
             **kwargs)
 
+        # стиль дописываемого текста и размеры строк (для удаления старых строк)
+        self._text_style = dict(
+            font_name=font_name,
+            font_size=font_size,
+            color=Color.from_iterable(text_color),
+        )
+        self._line_sizes: Deque[int] = deque([len(text)] if text else [])
+        self._history = INFO_PANEL_HISTORY
+
         indicator_size = 22
         self._down_indicator = UIImage(
-            texture=TEX_SCROLL_DOWN,
+            texture=resolve_texture(SCROLL_DOWN_TEXTURE),
             size_hint=None,
             width=indicator_size,
             height=indicator_size,
@@ -59,7 +68,7 @@ class BaseScrollableTextArea(UITextArea, UIAnchorLayout, ABC):
         )
 
         self._up_indicator = UIImage(
-            texture=TEX_SCROLL_UP,
+            texture=resolve_texture(SCROLL_UP_TEXTURE),
             size_hint=None,
             width=indicator_size,
             height=indicator_size,
@@ -80,3 +89,35 @@ class BaseScrollableTextArea(UITextArea, UIAnchorLayout, ABC):
         self._down_indicator.visible = (
             abs(self.layout.view_y) < self.layout.content_height - self.layout.height
         )
+
+    def clear_text(self) -> None:
+        """Очистить текст"""
+        self.doc.delete_text(0, len(self.doc.text))
+        self._line_sizes.clear()
+        self.trigger_full_render()
+
+    def append_lines(self, lines: Iterable[str]) -> None:
+        """Дописать строки в конец текста
+        Документ изменяется только на новые строки, самые старые строки сверх
+        INFO_PANEL_HISTORY удаляются, текст прокручивается к последней строке
+
+        Args:
+            lines: строки
+        """
+        lines = list(lines)
+        if not lines:
+            return
+        text = "\n".join(lines)
+        if self._line_sizes:
+            text = "\n" + text
+        self.doc.insert_text(len(self.doc.text), text, self._text_style)
+        self._line_sizes.extend(len(line) for line in lines)
+
+        removed = 0
+        while len(self._line_sizes) > self._history:
+            removed += self._line_sizes.popleft() + 1
+        if removed:
+            self.doc.delete_text(0, removed)
+
+        self.layout.view_y = -self.layout.content_height
+        self.trigger_full_render()
@@ -3,8 +3,13 @@ from typing import TYPE_CHECKING
 
 from src.utils.constants import BASE_CHARACTERISTIC
 from src.utils.descriptions import ABILITY_LONG_DESC, UNIT_LONG_DESC
+from src.utils.tools import Observable, Stored, StoredAttribute, UnitState
+from src.utils.enums import ModelEvent
 
 if TYPE_CHECKING:
+    from numpy import ndarray
+    from numpy.random import Generator
+    from src.utils.probability import Distribution
     from src.abstractions.item import BaseAttribute
     from src.utils.characters import Characteristic
     from src.abstractions.perk import BasePerk
@@ -96,6 +101,37 @@ class BaseAbility(ABC):
         """
         pass
 
+    @abstractmethod
+    def save_throws(
+        self,
+        attribute: "BaseAttribute",
+        size: int,
+        generator: "Generator",
+    ) -> "ndarray | int":
+        """Серия спасбросков (векторно)
+
+        Args:
+            attribute: тип спасброска
+            size: количество спасбросков
+            generator: генератор случайных чисел
+
+        Returns:
+            ndarray | int: значения спасбросков
+        """
+        pass
+
+    @abstractmethod
+    def save_distribution(self, attribute: "BaseAttribute") -> "Distribution":
+        """Точное распределение спасброска
+
+        Args:
+            attribute: тип спасброска
+
+        Returns:
+            Distribution: распределение
+        """
+        pass
+
     @abstractmethod
     def mastery(self, attribute: "BaseAttribute" = None) -> int:
         """Мастерство
@@ -109,8 +145,14 @@ class BaseAbility(ABC):
         pass
 
 
-class BaseUnit(ABC):
-    """Абстрактная модель персонажа"""
+class BaseUnit(Stored, Observable, ABC):
+    """Абстрактная модель персонажа
+    Изменение здоровья и уровня персонажа - событие модели
+    Уровень, здоровье и броня могут храниться в общем хранилище (src.models.store)
+    """
+    _level = StoredAttribute(column="level")
+    _current_hp = StoredAttribute(column="current_hp")
+    _armor = StoredAttribute(column="armor")
 
     def __init__(
         self,
@@ -131,6 +173,7 @@ class BaseUnit(ABC):
             perks: список способностей
             level: уровень персонажа
         """
+        super().__init__()
         self._name = name
         self._title = title
         self._description = description
@@ -166,11 +209,26 @@ class BaseUnit(ABC):
         """Наименование"""
         return self._title
 
+    @property
+    def level(self) -> int:
+        """Уровень персонажа"""
+        return self._level
+
     @property
     def hp_percent(self) -> float:
         """Остаток здоровья"""
         return self._current_hp / self.hit_points
 
+    @property
+    def current_hp(self) -> int:
+        """Текущее здоровье"""
+        return self._current_hp
+
+    @property
+    def armor(self) -> int:
+        """Временная броня (снимается в конце хода)"""
+        return self._armor
+
     @property
     def is_dead(self) -> bool:
         """Статус персонажа"""
@@ -196,6 +254,39 @@ class BaseUnit(ABC):
         """
         return self._ability.save_throw(attribute=attribute)
 
+    def save_throws(
+        self,
+        attribute: "BaseAttribute",
+        size: int,
+        generator: "Generator",
+    ) -> "ndarray | int":
+        """Серия спасбросков (векторно)
+
+        Args:
+            attribute: тип спасброска
+            size: количество спасбросков
+            generator: генератор случайных чисел
+
+        Returns:
+            ndarray | int: значения спасбросков
+        """
+        return self._ability.save_throws(
+            attribute=attribute,
+            size=size,
+            generator=generator,
+        )
+
+    def save_distribution(self, attribute: "BaseAttribute") -> "Distribution":
+        """Точное распределение спасброска
+
+        Args:
+            attribute: тип спасброска
+
+        Returns:
+            Distribution: распределение
+        """
+        return self._ability.save_distribution(attribute=attribute)
+
     def mastery(self, attribute: "BaseAttribute" = None) -> int:
         """Мастерство
 
@@ -270,6 +361,35 @@ class BaseUnit(ABC):
         """
         pass
 
+    def snapshot(self) -> UnitState:
+        """Снимок состояния персонажа
+
+        Returns:
+            UnitState: состояние
+        """
+        return UnitState(
+            level=self._level,
+            current_hp=self._current_hp,
+            armor=self._armor,
+            perks=tuple(
+                (name, perk.snapshot())
+                for name, perk in self._perks.items()
+            ),
+        )
+
+    def restore(self, state: UnitState) -> None:
+        """Восстановить состояние персонажа из снимка
+
+        Args:
+            state: состояние
+        """
+        self._level = state.level
+        self._current_hp = state.current_hp
+        self._armor = state.armor
+        for name, perk_state in state.perks:
+            self._perks[name].restore(state=perk_state)
+        self.notify(event=ModelEvent.health.value)
+
     @abstractmethod
     def level_up(self) -> None:
         """Повысить уровень персонажа (на 1 пункт)"""
@@ -284,6 +404,19 @@ class BaseUnit(ABC):
         """
         pass
 
+    @abstractmethod
+    def damaged_hp(self, hit_points: "ndarray", damage: "ndarray") -> "ndarray":
+        """Здоровье после получения урона (векторно, без изменения состояния)
+
+        Args:
+            hit_points: текущее здоровье
+            damage: урон
+
+        Returns:
+            ndarray: здоровье
+        """
+        pass
+
     @abstractmethod
     def shield_self(self, value: int = 0) -> None:
         """Действие - укрыться щитом
@@ -302,6 +435,19 @@ class BaseUnit(ABC):
         """
         pass
 
+    @abstractmethod
+    def healed_hp(self, hit_points: "ndarray", value: "ndarray") -> "ndarray":
+        """Здоровье после исцеления (векторно, без изменения состояния)
+
+        Args:
+            hit_points: текущее здоровье
+            value: значение
+
+        Returns:
+            ndarray: здоровье
+        """
+        pass
+
     @abstractmethod
     def end_circle(self) -> None:
         """Завершить ход"""
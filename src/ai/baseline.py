@@ -0,0 +1,44 @@
+from typing import TYPE_CHECKING, Optional
+from numpy.random import default_rng, SeedSequence
+
+from src.ai.player import BasePlayer, Choice
+from src.utils.constants import AI_DOMAIN
+
+if TYPE_CHECKING:
+    from src.abstractions.board import BaseBoard
+
+
+class RandomPlayer(BasePlayer):
+    """Компьютерный противник: случайное допустимое действие (базовый уровень для турниров)
+    Завершение хода - один из вариантов выбора, поэтому ход заканчивается сам собой
+    """
+
+    def __init__(self, domain: str = AI_DOMAIN, seed: int | SeedSequence = None):
+        """Инициализация игрока
+
+        Args:
+            domain: имя домена игрока
+            seed: зерно (без зерна - случайное)
+        """
+        super().__init__(domain=domain)
+        self._generator = default_rng(seed)
+
+    def new_game(self, seed: int | SeedSequence) -> None:
+        """Начать новую партию с новой последовательностью случайных чисел
+
+        Args:
+            seed: зерно
+        """
+        self._generator = default_rng(seed)
+
+    def choose(self, board: "BaseBoard") -> Optional[Choice]:
+        """Выбрать действие, не трогая доску
+
+        Args:
+            board: доска
+
+        Returns:
+            Choice: действие (пусто - завершить ход)
+        """
+        options = self.options(board=board)
+        return options[self._generator.integers(len(options))]
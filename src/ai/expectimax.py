@@ -0,0 +1,209 @@
+from contextvars import copy_context
+from time import perf_counter
+from typing import TYPE_CHECKING, NamedTuple, Optional
+
+from src.ai.player import BasePlayer, Choice
+from src.ai.transposition import TranspositionTable
+from src.utils.tools import info_context
+from src.utils.rng import random_context, outcome_context, BucketBackend
+from src.utils.constants import (
+    AI_DOMAIN,
+    AI_TIME_BUDGET,
+    AI_MAX_DEPTH,
+    AI_DAMAGE_BUCKETS,
+)
+
+if TYPE_CHECKING:
+    from src.abstractions.board import BaseBoard
+
+
+class SearchResult(NamedTuple):
+    """Результат поиска хода
+    Пустой выбор - завершить ход (finish_circle)
+    """
+    choice: Optional[Choice]
+    value: float
+    depth: int
+    nodes: int
+    hits: int = 0
+
+
+class SearchTimeout(Exception):
+    """Время или узлы на ход закончились"""
+    pass
+
+
+class ExpectimaxPlayer(BasePlayer):
+    """Компьютерный противник: поиск expectimax с итеративным углублением
+    Узлы выбора - допустимые действия домена и завершение хода,
+    узлы случая - исходы бросков на попадание и критический удар (точные вероятности)
+    и равновероятные части точных распределений бросков урона (значение части - ее среднее;
+    броски по целям области поражения дают ту же часть).
+    Поиск делается на доске-двойнике через снимки состояния, журнал сообщений отключен.
+    Оценки просчитанных позиций хранятся в таблице транспозиций (по хэшу Зобриста),
+    поэтому позиция, достигнутая разными порядками действий, не просчитывается заново
+    """
+
+    def __init__(
+        self,
+        domain: str = AI_DOMAIN,
+        time_budget: float = AI_TIME_BUDGET,
+        max_depth: int = AI_MAX_DEPTH,
+        max_nodes: int = None,
+        buckets: int = AI_DAMAGE_BUCKETS,
+        table: TranspositionTable = None,
+    ):
+        """Инициализация игрока
+
+        Args:
+            domain: имя домена игрока
+            time_budget: время на выбор одного действия (секунды)
+            max_depth: предельная глубина поиска (количество действий)
+            max_nodes: предельное количество узлов на выбор одного действия (без предела - только время)
+            buckets: количество частей распределения бросков урона
+            table: таблица транспозиций (по умолчанию - своя)
+        """
+        super().__init__(domain=domain)
+        self._time_budget = time_budget
+        self._max_depth = max_depth
+        self._max_nodes = max_nodes if max_nodes is not None else float("inf")
+        self._buckets = buckets
+        self._table = table if table is not None else TranspositionTable()
+        self._deadline = 0.0
+        self._node_limit = 0.0
+        self._nodes = 0
+
+    @property
+    def table(self) -> TranspositionTable:
+        return self._table
+
+    def new_game(self, seed: int = None) -> None:
+        """Начать новую партию: оценки прошлой партии не переносятся
+
+        Args:
+            seed: зерно (поиск детерминирован, зерно не используется)
+        """
+        self._table.clear()
+
+    def search(self, board: "BaseBoard") -> SearchResult:
+        """Найти лучшее действие на доске (состояние доски восстанавливается)
+
+        Args:
+            board: доска
+
+        Returns:
+            SearchResult: результат поиска
+        """
+        return copy_context().run(self._search, board)
+
+    def choose(self, board: "BaseBoard") -> Optional[Choice]:
+        """Выбрать действие, не трогая доску (поиск идет на доске-двойнике)
+
+        Args:
+            board: доска
+
+        Returns:
+            Choice: действие (пусто - завершить ход)
+        """
+        return self.search(board=self._sync_twin(board=board)).choice
+
+    def _search(self, board: "BaseBoard") -> SearchResult:
+        """Итеративное углубление (в отдельном контексте: журнал и кости поиска не видны игре)
+        Первое действие корня оценивается всегда; если время или узлы кончились до конца первого прохода,
+        выбирается лучшее из уже оцененных действий
+        """
+        info_context.set_capacity(capacity=0)
+        random_context.set(BucketBackend())
+        start = perf_counter()
+        # время и узлы отсчитываются после оценки первого действия (не завершения хода): без оценки нет и хода
+        self._deadline = float("inf")
+        self._node_limit = float("inf")
+        self._nodes = 0
+        self._table.new_search()
+        hits = self._table.hits
+
+        state = board.snapshot()
+        domain = board.current_domain
+        result = SearchResult(choice=None, value=self.evaluate(board=board), depth=0, nodes=0)
+        if not domain or domain.name != self._domain:
+            return result
+
+        options = self.options(board=board)
+        for depth in range(1, self._max_depth + 1):
+            values = []
+            try:
+                for choice in options:
+                    values.append(self._expected(board=board, choice=choice, depth=depth))
+                    if choice is not None:
+                        self._deadline = start + self._time_budget
+                        self._node_limit = self._max_nodes
+            except SearchTimeout:
+                board.restore(state=state)
+                if not result.depth:
+                    # первый проход не закончен: лучшее из уже оцененных действий
+                    value = max(values)
+                    result = SearchResult(
+                        choice=options[values.index(value)],
+                        value=value,
+                        depth=depth,
+                        nodes=self._nodes,
+                        hits=self._table.hits - hits,
+                    )
+                break
+            value = max(values)
+            best = options[values.index(value)]
+            result = SearchResult(
+                choice=best,
+                value=value,
+                depth=depth,
+                nodes=self._nodes,
+                hits=self._table.hits - hits,
+            )
+            # лучшее действие проверяется первым на следующей глубине
+            options.remove(best)
+            options.insert(0, best)
+            if len(options) == 1:
+                break
+        return result
+
+    def _value(self, board: "BaseBoard", depth: int) -> float:
+        """Значение позиции: максимум для игрока, минимум для противника"""
+        self._nodes += 1
+        if self._nodes > self._node_limit or perf_counter() > self._deadline:
+            raise SearchTimeout
+        if depth == 0 or self.is_over(board=board):
+            return self.evaluate(board=board)
+        key = board.position_key
+        value = self._table.get(key=key, depth=depth)
+        if value is not None:
+            return value
+        values = [
+            self._expected(board=board, choice=choice, depth=depth)
+            for choice in self.options(board=board)
+        ]
+        value = max(values) if board.current_domain.name == self._domain else min(values)
+        self._table.put(key=key, depth=depth, value=value)
+        return value
+
+    def _expected(self, board: "BaseBoard", choice: Optional[Choice], depth: int) -> float:
+        """Ожидаемое значение действия (узел случая)"""
+        state = board.snapshot()
+        if choice is None:
+            board.finish_circle()
+            value = self._value(board=board, depth=depth - 1)
+            board.restore(state=state)
+            return value
+
+        cell, action, target = choice.resolve(board=board)
+        buckets = self._buckets if action.perk else 1
+        value = 0.0
+        for probability, outcome in action.outcomes(target=target):
+            for bucket in range(buckets):
+                outcome_token = outcome_context.set(outcome)
+                random_token = random_context.set(BucketBackend(bucket=bucket, buckets=buckets))
+                board.perform(current_cell=cell, action=action, target=target)
+                random_context.restore(random_token)
+                outcome_context.restore(outcome_token)
+                value += probability / buckets * self._value(board=board, depth=depth - 1)
+                board.restore(state=state)
+        return value
@@ -0,0 +1,325 @@
+from concurrent.futures import ProcessPoolExecutor
+from contextvars import copy_context
+from math import exp, log, sqrt
+from multiprocessing import get_context
+from os import cpu_count
+from time import perf_counter
+from typing import TYPE_CHECKING, NamedTuple, Optional, Dict, List, Tuple
+from numpy.random import SeedSequence
+
+from src.ai.player import BasePlayer, Choice
+from src.board.layouts import standard_layout
+from src.utils.tools import info_context
+from src.utils.rng import random_context, PooledBackend
+from src.utils.constants import (
+    AI_DOMAIN,
+    MCTS_WORKERS,
+    MCTS_ITERATIONS,
+    MCTS_TIME_BUDGET,
+    MCTS_EXPLORATION,
+    MCTS_ROLLOUT_DEPTH,
+    MCTS_ROLLOUT_END_CHANCE,
+    MCTS_ROLLOUT_ATTEMPTS,
+    MCTS_REWARD_SCALE,
+)
+
+if TYPE_CHECKING:
+    from numpy.random import Generator
+    from src.abstractions.board import BaseBoard
+    from src.utils.tools import BoardState, BoardLayout
+
+# статистика корня дерева: выбор -> (посещения, сумма наград)
+TreeStatistics = Dict[Optional[Choice], Tuple[int, float]]
+
+
+class TreeNode:
+    """Узел дерева поиска (награды - с точки зрения игрока дерева)"""
+    __slots__ = ("visits", "value", "children")
+
+    def __init__(self):
+        self.visits = 0
+        self.value = 0.0
+        self.children: Dict[Optional[Choice], "TreeNode"] = {}
+
+
+class MctsResult(NamedTuple):
+    """Результат поиска хода (статистика всех деревьев сложена)
+    Пустой выбор - завершить ход (finish_circle)
+    """
+    choice: Optional[Choice]
+    visits: int
+    value: float
+    statistics: TreeStatistics
+
+
+class MctsPlayer(BasePlayer):
+    """Компьютерный противник: поиск по дереву методом Монте-Карло (UCT)
+    Деревья строятся независимо в процессах (распараллеливание по корню) и складываются в конце.
+    Каждое дерево начинает с доски без графики, восстановленной из снимка,
+    и бросает кости из собственного потока случайных чисел (независимые зерна)
+    """
+
+    def __init__(
+        self,
+        domain: str = AI_DOMAIN,
+        workers: int = MCTS_WORKERS,
+        iterations: int = MCTS_ITERATIONS,
+        time_budget: float = MCTS_TIME_BUDGET,
+        exploration: float = MCTS_EXPLORATION,
+        rollout_depth: int = MCTS_ROLLOUT_DEPTH,
+        seed: int = None,
+        layout: "BoardLayout" = None,
+    ):
+        """Инициализация игрока
+
+        Args:
+            domain: имя домена игрока
+            workers: количество процессов (деревьев); 0 - по числу ядер, 1 - без процессов
+            iterations: предельное количество итераций одного дерева
+            time_budget: время на выбор одного действия (секунды)
+            exploration: коэффициент исследования UCT
+            rollout_depth: количество действий в случайной партии
+            seed: зерно (без зерна - случайное)
+            layout: расстановка доски (по умолчанию - стандартная; при поиске берется с доски)
+        """
+        super().__init__(domain=domain)
+        self._workers = workers or cpu_count() or 1
+        self._iterations = iterations
+        self._time_budget = time_budget
+        self._exploration = exploration
+        self._rollout_depth = rollout_depth
+        self._seed_sequence = SeedSequence(seed)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._layout = layout if layout is not None else standard_layout()
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    def new_game(self, seed: int | SeedSequence) -> None:
+        """Начать новую партию с новой последовательностью зерен деревьев
+
+        Args:
+            seed: зерно
+        """
+        self._seed_sequence = seed if isinstance(seed, SeedSequence) else SeedSequence(seed)
+
+    def choose(self, board: "BaseBoard") -> Optional[Choice]:
+        """Выбрать действие, не трогая доску
+
+        Args:
+            board: доска
+
+        Returns:
+            Choice: действие (пусто - завершить ход)
+        """
+        return self.search(board=board).choice
+
+    def search(self, board: "BaseBoard") -> MctsResult:
+        """Построить деревья поиска и выбрать самое посещаемое действие корня
+
+        Args:
+            board: доска
+
+        Returns:
+            MctsResult: результат поиска
+        """
+        domain = board.current_domain
+        if not domain or domain.name != self._domain:
+            return MctsResult(choice=None, visits=0, value=0.0, statistics={})
+
+        self._layout = board.layout
+        state = board.snapshot()
+        seeds = self._seed_sequence.spawn(self._workers)
+        if self._workers == 1:
+            trees = [self.grow(state=state, seed=seeds[0])]
+        else:
+            executor = self._get_executor()
+            futures = [
+                executor.submit(grow_tree, self._settings(), state, seed)
+                for seed in seeds
+            ]
+            trees = [future.result() for future in futures]
+        return self._merge(trees=trees)
+
+    def grow(self, state: "BoardState", seed: SeedSequence) -> TreeStatistics:
+        """Построить одно дерево поиска
+
+        Args:
+            state: снимок доски (корень дерева)
+            seed: зерно потока случайных чисел дерева
+
+        Returns:
+            TreeStatistics: статистика корня
+        """
+        return copy_context().run(self._grow, state, seed)
+
+    def close(self) -> None:
+        """Остановить процессы поиска"""
+        if self._executor:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _grow(self, state: "BoardState", seed: SeedSequence) -> TreeStatistics:
+        """Итерации дерева (в отдельном контексте: журнал и кости поиска не видны игре)"""
+        info_context.set_capacity(capacity=0)
+        backend = PooledBackend(seed=seed)
+        random_context.set(backend)
+        generator = backend.generator
+        if self._twin is None or self._twin.layout != self._layout:
+            self._twin = self.create_twin(layout=self._layout)
+        board = self._twin
+
+        root = TreeNode()
+        deadline = perf_counter() + self._time_budget
+        for _ in range(self._iterations):
+            if perf_counter() > deadline:
+                break
+            board.restore(state=state)
+            self._iterate(board=board, root=root, generator=generator)
+        board.restore(state=state)
+        return {
+            choice: (node.visits, node.value)
+            for choice, node in root.children.items()
+        }
+
+    def _iterate(self, board: "BaseBoard", root: TreeNode, generator: "Generator") -> None:
+        """Одна итерация: выбор по UCT, расширение, случайная партия, обновление статистики
+        Дерево открытое: узлы - последовательности действий, исходы костей разыгрываются заново
+        """
+        node = root
+        path = [root]
+        while not self.is_over(board=board):
+            options = self.options(board=board)
+            untried = [choice for choice in options if choice not in node.children]
+            if untried:
+                choice = untried[generator.integers(len(untried))]
+                node.children[choice] = TreeNode()
+                self._apply(board=board, choice=choice)
+                path.append(node.children[choice])
+                break
+            choice = self._select(board=board, node=node, options=options)
+            self._apply(board=board, choice=choice)
+            node = node.children[choice]
+            path.append(node)
+
+        reward = self._rollout(board=board, generator=generator)
+        for node in path:
+            node.visits += 1
+            node.value += reward
+
+    def _select(self, board: "BaseBoard", node: TreeNode, options: List[Optional[Choice]]) -> Optional[Choice]:
+        """Выбор по UCT среди вариантов, допустимых в текущем состоянии"""
+        own_turn = board.current_domain.name == self._domain
+        total = log(node.visits)
+
+        def bound(choice: Optional[Choice]) -> float:
+            child = node.children[choice]
+            mean = child.value / child.visits
+            if not own_turn:
+                mean = 1 - mean
+            return mean + self._exploration * sqrt(total / child.visits)
+
+        return max(options, key=bound)
+
+    def _rollout(self, board: "BaseBoard", generator: "Generator") -> float:
+        """Случайная партия и награда от 0 до 1 (логистическая функция оценки позиции)"""
+        for _ in range(self._rollout_depth):
+            if self.is_over(board=board):
+                break
+            choice = None
+            if generator.random() >= MCTS_ROLLOUT_END_CHANCE:
+                choice = self._random_choice(board=board, generator=generator)
+            self._apply(board=board, choice=choice)
+        return 1 / (1 + exp(-self.evaluate(board=board) / MCTS_REWARD_SCALE))
+
+    @staticmethod
+    def _random_choice(board: "BaseBoard", generator: "Generator") -> Optional[Choice]:
+        """Случайное допустимое действие для случайной партии
+        Фигура, действие и цель выбираются по очереди (без перебора всех действий);
+        если за несколько попыток действие не найдено - завершить ход
+        """
+        bitboard = board.bitboard
+        cells = board.get_cells()
+        ids = bitboard.ids(bitboard.occupancy(domain=board.current_domain))
+        if not ids:
+            return None
+        for _ in range(MCTS_ROLLOUT_ATTEMPTS):
+            cell_id = ids[generator.integers(len(ids))]
+            cell = cells[cell_id]
+            actions = list(cell.figure.get_actions().values())
+            action = actions[generator.integers(len(actions))]
+            if action.self_target:
+                target = cell_id
+            else:
+                targets = tuple(board.get_neighbors(cell_id=cell_id, radius=action.radius))
+                target = targets[generator.integers(len(targets))]
+            if action.can_realise(current_cell=cell, target=cells[target]):
+                return Choice(cell=cell_id, action=action.name, target=target)
+        return None
+
+    @staticmethod
+    def _apply(board: "BaseBoard", choice: Optional[Choice]) -> None:
+        """Совершить выбор на доске"""
+        if choice is None:
+            board.finish_circle()
+        else:
+            cell, action, target = choice.resolve(board=board)
+            board.perform(current_cell=cell, action=action, target=target)
+
+    @staticmethod
+    def _merge(trees: List[TreeStatistics]) -> MctsResult:
+        """Сложить статистику деревьев и выбрать самое посещаемое действие"""
+        statistics: TreeStatistics = {}
+        for tree in trees:
+            for choice, (visits, value) in tree.items():
+                total_visits, total_value = statistics.get(choice, (0, 0.0))
+                statistics[choice] = (total_visits + visits, total_value + value)
+        if not statistics:
+            return MctsResult(choice=None, visits=0, value=0.0, statistics=statistics)
+        choice = max(statistics, key=lambda key: statistics[key][0])
+        visits, value = statistics[choice]
+        return MctsResult(choice=choice, visits=visits, value=value / visits, statistics=statistics)
+
+    def _settings(self) -> Dict[str, object]:
+        """Настройки игрока для процессов поиска"""
+        return {
+            "domain": self._domain,
+            "iterations": self._iterations,
+            "time_budget": self._time_budget,
+            "exploration": self._exploration,
+            "rollout_depth": self._rollout_depth,
+            "layout": self._layout,
+        }
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Пул процессов (создается один раз; процессы запускаются заново, без копии окна игры)"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._workers,
+                mp_context=get_context("spawn"),
+            )
+        return self._executor
+
+
+# игрок процесса поиска (доска-двойник создается один раз на процесс)
+_worker_players: Dict[Tuple, MctsPlayer] = {}
+
+
+def grow_tree(settings: Dict[str, object], state: "BoardState", seed: SeedSequence) -> TreeStatistics:
+    """Построить одно дерево поиска в процессе пула
+
+    Args:
+        settings: настройки игрока
+        state: снимок доски
+        seed: зерно потока случайных чисел дерева
+
+    Returns:
+        TreeStatistics: статистика корня
+    """
+    key = tuple(sorted(settings.items()))
+    player = _worker_players.get(key)
+    if player is None:
+        player = MctsPlayer(workers=1, **settings)
+        _worker_players[key] = player
+    return player.grow(state=state, seed=seed)
@@ -0,0 +1,197 @@
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, NamedTuple, Optional, List, Tuple
+from numpy.random import SeedSequence
+
+from src.models.board import Board
+from src.utils.constants import (
+    AI_FIGURE_WEIGHT,
+    AI_HEALTH_WEIGHT,
+    AI_LEVEL_WEIGHT,
+    AI_POWER_WEIGHT,
+    AI_PRISONER_WEIGHT,
+    AI_VICTORY_WEIGHT,
+)
+
+if TYPE_CHECKING:
+    from src.abstractions.board import BaseBoard
+    from src.abstractions.domain import BaseDomain
+    from src.abstractions.action import BaseAction
+    from src.abstractions.cell import BaseCell
+    from src.utils.tools import BoardLayout
+
+
+class Choice(NamedTuple):
+    """Выбранное действие (номер исходной клетки, имя действия и номер клетки-цели)"""
+    cell: int
+    action: str
+    target: int
+
+    def resolve(self, board: "BaseBoard") -> Tuple["BaseCell", "BaseAction", "BaseCell"]:
+        """Найти объекты действия на доске
+
+        Args:
+            board: доска
+
+        Returns:
+            tuple: исходная клетка, действие, клетка-цель
+        """
+        cells = board.get_cells()
+        cell = cells[self.cell]
+        return cell, cell.figure.get_actions()[self.action], cells[self.target]
+
+
+class BasePlayer(ABC):
+    """Абстрактный компьютерный игрок
+    Игрок выбирает одно действие за раз; пустой выбор - завершить ход (finish_circle)
+    """
+
+    def __init__(self, domain: str):
+        """Инициализация игрока
+
+        Args:
+            domain: имя домена игрока
+        """
+        self._domain = domain
+        self._twin: Optional["BaseBoard"] = None
+
+    @property
+    def domain(self) -> str:
+        return self._domain
+
+    @abstractmethod
+    def choose(self, board: "BaseBoard") -> Optional[Choice]:
+        """Выбрать действие, не трогая доску
+
+        Args:
+            board: доска
+
+        Returns:
+            Choice: действие (пусто - завершить ход)
+        """
+        pass
+
+    def new_game(self, seed: int | SeedSequence) -> None:
+        """Начать новую партию: новая последовательность случайных чисел (для воспроизводимых партий)
+        Детерминированным игрокам зерно не нужно
+
+        Args:
+            seed: зерно
+        """
+        pass
+
+    def play(self, board: "BaseBoard") -> bool:
+        """Совершить одно действие на доске
+
+        Args:
+            board: доска
+
+        Returns:
+            bool: действие совершено (иначе игрок завершает ход)
+        """
+        choice = self.choose(board=board)
+        if choice is None:
+            return False
+        cell, action, target = choice.resolve(board=board)
+        board.perform(current_cell=cell, action=action, target=target)
+        return True
+
+    def evaluate(self, board: "BaseBoard") -> float:
+        """Оценка позиции с точки зрения игрока
+
+        Args:
+            board: доска
+
+        Returns:
+            float: оценка
+        """
+        value = 0.0
+        for domain in board.players:
+            score = self.domain_score(domain=domain)
+            value += score if domain.name == self._domain else -score
+        return value
+
+    @staticmethod
+    def domain_score(domain: "BaseDomain") -> float:
+        """Оценка домена: фигуры, их здоровье (без учета избытка) и уровень, мощь и пленники
+
+        Args:
+            domain: домен
+
+        Returns:
+            float: оценка
+        """
+        if not domain.figures:
+            return -AI_VICTORY_WEIGHT
+        score = AI_POWER_WEIGHT * domain.power + AI_PRISONER_WEIGHT * len(domain.prisoners)
+        for figure in domain.figures.values():
+            score += (
+                AI_FIGURE_WEIGHT
+                + AI_HEALTH_WEIGHT * min(figure.unit.hp_percent, 1.0)
+                + AI_LEVEL_WEIGHT * (figure.unit.level - 1)
+            )
+        return score
+
+    @staticmethod
+    def options(board: "BaseBoard") -> List[Optional[Choice]]:
+        """Варианты выбора: завершить ход (первым - при равных оценках) и допустимые действия
+
+        Args:
+            board: доска
+
+        Returns:
+            list: варианты выбора
+        """
+        positions = {
+            cell.figure.name: cell_id
+            for cell_id, cell in board.get_cells().items()
+            if cell.figure
+        }
+        options: List[Optional[Choice]] = [None]
+        options.extend(
+            Choice(cell=positions[figure.name], action=action.name, target=target.index.id)
+            for figure, action, target in board.legal_actions()
+        )
+        return options
+
+    @staticmethod
+    def is_over(board: "BaseBoard") -> bool:
+        """У одного из игроков не осталось фигур
+
+        Args:
+            board: доска
+
+        Returns:
+            bool: игра окончена
+        """
+        return any(not domain.figures for domain in board.players)
+
+    @staticmethod
+    def create_twin(layout: "BoardLayout" = None) -> "BaseBoard":
+        """Создать доску без графики с начальной расстановкой
+
+        Args:
+            layout: расстановка (по умолчанию - стандартная доска)
+
+        Returns:
+            BaseBoard: доска
+        """
+        board = Board(layout=layout)
+        board.initialize_cells()
+        board.initialize_buildings()
+        board.initialize_figures()
+        board.fill_domains()
+        return board
+
+    def _sync_twin(self, board: "BaseBoard") -> "BaseBoard":
+        """Перенести состояние доски на доску-двойник игрока
+
+        Args:
+            board: доска
+
+        Returns:
+            BaseBoard: доска-двойник
+        """
+        if self._twin is None or self._twin.layout != board.layout:
+            self._twin = self.create_twin(layout=board.layout)
+        self._twin.restore(state=board.snapshot())
+        return self._twin
@@ -0,0 +1,114 @@
+from typing import NamedTuple, Optional, List
+
+from src.utils.enums import ReplacementPolicy
+from src.utils.constants import AI_TABLE_SIZE, AI_TABLE_POLICY
+
+
+class TableEntry(NamedTuple):
+    """Запись таблицы транспозиций"""
+    key: int
+    depth: int
+    value: float
+    generation: int
+
+
+class TranspositionTable:
+    """Таблица транспозиций: оценки уже просчитанных позиций по хэшу Зобриста
+    Размер таблицы ограничен; ячейка выбирается по хэшу, а при совпадении ячеек
+    запись замещается по политике:
+        always - новая запись всегда вытесняет старую;
+        depth - новая запись вытесняет более мелкую или оставшуюся от прошлых поисков;
+        two_tier - две записи на ячейку: по глубине и всегда новая
+    """
+
+    def __init__(self, size: int = AI_TABLE_SIZE, policy: str = AI_TABLE_POLICY):
+        """Инициализация таблицы
+
+        Args:
+            size: количество ячеек
+            policy: политика замещения (значение ReplacementPolicy)
+        """
+        self._policy = ReplacementPolicy(policy).value
+        self._ways = 2 if self._policy == ReplacementPolicy.two_tier.value else 1
+        self._size = size
+        self._slots: List[Optional[TableEntry]] = [None] * (size * self._ways)
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def policy(self) -> str:
+        return self._policy
+
+    def __len__(self) -> int:
+        """Количество занятых записей"""
+        return sum(1 for entry in self._slots if entry is not None)
+
+    def new_search(self) -> None:
+        """Начать новый поиск (записи прошлых поисков вытесняются в первую очередь)"""
+        self._generation += 1
+
+    def clear(self) -> None:
+        """Очистить таблицу"""
+        self._slots = [None] * (self._size * self._ways)
+        self.hits = self.misses = self.stores = 0
+
+    def get(self, key: int, depth: int) -> Optional[float]:
+        """Оценка позиции, просчитанной не мельче заданной глубины
+
+        Args:
+            key: хэш позиции
+            depth: требуемая глубина
+
+        Returns:
+            float: оценка (пусто - позиции нет в таблице)
+        """
+        index = (key % self._size) * self._ways
+        for entry in self._slots[index:index + self._ways]:
+            if entry is not None and entry.key == key and entry.depth >= depth:
+                self.hits += 1
+                return entry.value
+        self.misses += 1
+        return None
+
+    def put(self, key: int, depth: int, value: float) -> None:
+        """Записать оценку позиции
+
+        Args:
+            key: хэш позиции
+            depth: глубина просчета
+            value: оценка
+        """
+        index = (key % self._size) * self._ways
+        entry = TableEntry(key=key, depth=depth, value=value, generation=self._generation)
+        if self._policy == ReplacementPolicy.always.value:
+            self._slots[index] = entry
+        elif self._policy == ReplacementPolicy.depth.value:
+            if self._prefers(new=entry, old=self._slots[index]):
+                self._slots[index] = entry
+            else:
+                return
+        else:
+            # та же позиция обновляется на месте, иначе глубокая запись уходит во второй уровень
+            if self._prefers(new=entry, old=self._slots[index]):
+                old = self._slots[index]
+                self._slots[index] = entry
+                if old is not None and old.key != key:
+                    self._slots[index + 1] = old
+            else:
+                self._slots[index + 1] = entry
+        self.stores += 1
+
+    def _prefers(self, new: TableEntry, old: Optional[TableEntry]) -> bool:
+        """Замещает ли новая запись старую в ячейке по глубине"""
+        return (
+            old is None
+            or old.key == new.key
+            or old.generation != new.generation
+            or new.depth >= old.depth
+        )
@@ -0,0 +1,287 @@
+from typing import TYPE_CHECKING, Callable, Optional, Dict, Tuple
+from numpy.random import default_rng
+
+from src.ai.player import BasePlayer, Choice
+from src.models.board import Board
+from src.models.dice import Dice, DiceRoll
+from src.models.savegame import get_codec
+from src.board.layouts import stress_layout
+from src.simulation.balance import create_units
+from src.simulation.tournament import GameConfig, play_game
+from src.utils.tools import Index
+from src.utils.enums import AreaShape
+from src.utils.constants import BENCHMARK_SEED, BOARD_ROWS
+
+if TYPE_CHECKING:
+    from src.abstractions.board import BaseBoard
+    from src.benchmarks.runner import Benchmark
+    from src.utils.tools import BoardState
+
+# предел случайных действий при поиске позиции для замера действия
+SCRIPT_MAX_ACTIONS = 2000
+
+
+def dice_roll() -> Callable[[], object]:
+    """Бросок кости (Dice.roll)"""
+    dice = Dice(side=20)
+    return dice.roll
+
+
+def dice_roll_action() -> Callable[[], object]:
+    """Бросок нескольких костей со штрафом (DiceRoll.action)"""
+    roll = DiceRoll(dice=Dice(side=6), times=2)
+    return lambda: roll.action(bonus=1, penalty=2)
+
+
+def perk_activate(perk_class: str) -> "Benchmark":
+    """Активация способности (Perk.activate) с восстановлением персонажей после каждой активации
+
+    Args:
+        perk_class: имя класса способности
+
+    Returns:
+        Benchmark: подготовка операции
+    """
+    def benchmark() -> Callable[[], object]:
+        units = create_units()
+        unit, perk = next(
+            (unit, perk)
+            for unit in units
+            for perk in unit.get_perks().values()
+            if type(perk).__name__ == perk_class
+        )
+        target = units[1] if unit is units[0] else units[0]
+        unit_state, target_state = unit.snapshot(), target.snapshot()
+
+        def operation() -> None:
+            perk.activate(target=target)
+            unit.restore(state=unit_state)
+            target.restore(state=target_state)
+
+        return operation
+
+    return benchmark
+
+
+def scripted_position(
+    predicate: Callable[["BaseBoard", Choice], bool],
+    seed: int = BENCHMARK_SEED,
+) -> Tuple["BaseBoard", "BoardState", Choice]:
+    """Позиция, в которой допустимо нужное действие
+    Партия разыгрывается случайными действиями с заданным зерном, поэтому позиция всегда одна и та же
+
+    Args:
+        predicate: условие на действие
+        seed: зерно
+
+    Returns:
+        tuple: доска, снимок позиции, действие
+    """
+    board = BasePlayer.create_twin()
+    board.start_circle()
+    generator = default_rng(seed)
+    for _ in range(SCRIPT_MAX_ACTIONS):
+        options = BasePlayer.options(board=board)
+        found = [choice for choice in options if choice and predicate(board, choice)]
+        if found:
+            return board, board.snapshot(), found[0]
+        choice = options[generator.integers(len(options))]
+        if choice is None:
+            board.finish_circle()
+        else:
+            cell, action, target = choice.resolve(board=board)
+            board.perform(current_cell=cell, action=action, target=target)
+    raise LookupError("Позиция для замера не найдена")
+
+
+def is_move(board: "BaseBoard", choice: Choice) -> bool:
+    """Действие - движение"""
+    _, action, _ = choice.resolve(board=board)
+    return not action.perk
+
+
+def is_attack(board: "BaseBoard", choice: Choice) -> bool:
+    """Действие - способность против фигуры другого домена"""
+    cell, action, target = choice.resolve(board=board)
+    return bool(action.perk) and bool(target.figure) and target.figure.domain is not cell.figure.domain
+
+
+def action_realise(predicate: Callable[["BaseBoard", Choice], bool]) -> "Benchmark":
+    """Совершение действия (Action.realise) с восстановлением позиции после каждого действия
+
+    Args:
+        predicate: условие на действие
+
+    Returns:
+        Benchmark: подготовка операции
+    """
+    def benchmark() -> Callable[[], object]:
+        board, state, choice = scripted_position(predicate=predicate)
+
+        def operation() -> None:
+            cell, action, target = choice.resolve(board=board)
+            action.realise(
+                current_cell=cell,
+                target=target,
+                area=board.get_footprint(action=action, target=target),
+            )
+            board.restore(state=state)
+
+        return operation
+
+    return benchmark
+
+
+def action_realise_area() -> Callable[[], object]:
+    """Заклинание с областью поражения (Action.realise): огненный шар по строю противника,
+    с восстановлением позиции после каждого действия
+    """
+    board = BasePlayer.create_twin()
+    board.start_circle()
+    cells = board.get_cells()
+    caster = cells[Index(row=4, column=3).id]
+    source = cells[Index(row=BOARD_ROWS, column=3).id]
+    figure = source.figure
+    source.remove_figure()
+    caster.capture(figure=figure)
+    action = next(
+        action for action in figure.get_actions().values()
+        if action.perk and action.perk.area and action.perk.shape == AreaShape.square.value
+    )
+    target = cells[Index(row=2, column=3).id]
+    area = board.get_footprint(action=action, target=target)
+    state = board.snapshot()
+
+    def operation() -> None:
+        action.realise(current_cell=caster, target=target, area=area)
+        board.restore(state=state)
+
+    return operation
+
+
+def select_target() -> Callable[[], object]:
+    """Выбор клетки и цели, как при игре мышью (Board.select_target), с восстановлением позиции"""
+    board, state, choice = scripted_position(predicate=is_move)
+    cells = board.get_cells()
+    source, target = cells[choice.cell].index, cells[choice.target].index
+
+    def operation() -> None:
+        board.select_cell(index=source)
+        board.select_target(index=target)
+        board.restore(state=state)
+
+    return operation
+
+
+def finish_circle() -> Callable[[], object]:
+    """Завершение хода домена (Board.finish_circle) на начальной расстановке"""
+    board = BasePlayer.create_twin()
+    board.start_circle()
+    return board.finish_circle
+
+
+def board_cells() -> Callable[[], object]:
+    """Создание доски и клеток (initialize_cells)"""
+    def operation() -> None:
+        board = Board()
+        board.initialize_cells()
+
+    return operation
+
+
+def board_buildings() -> Callable[[], object]:
+    """Создание доски, клеток и зданий (initialize_cells, initialize_buildings)"""
+    def operation() -> None:
+        board = Board()
+        board.initialize_cells()
+        board.initialize_buildings()
+
+    return operation
+
+
+def board_setup() -> Callable[[], object]:
+    """Полная расстановка доски (клетки, здания, фигуры, домены)"""
+    return BasePlayer.create_twin
+
+
+def stress_setup() -> Callable[[], object]:
+    """Полная расстановка нагрузочной доски 100x100"""
+    layout = stress_layout()
+    return lambda: BasePlayer.create_twin(layout=layout)
+
+
+def stress_legal_actions() -> Callable[[], object]:
+    """Перебор всех допустимых действий домена на нагрузочной доске"""
+    board = BasePlayer.create_twin(layout=stress_layout())
+    board.start_circle()
+    return lambda: sum(1 for _ in board.legal_actions())
+
+
+def stress_finish_circle() -> Callable[[], object]:
+    """Завершение хода домена на нагрузочной доске"""
+    board = BasePlayer.create_twin(layout=stress_layout())
+    board.start_circle()
+    return board.finish_circle
+
+
+def save_dumps() -> Callable[[], object]:
+    """Двоичное сохранение снимка доски (SaveCodec.dumps)"""
+    board, state, _ = scripted_position(predicate=is_attack)
+    codec = get_codec()
+    return lambda: codec.dumps(state=board.snapshot())
+
+
+def save_loads() -> Callable[[], object]:
+    """Загрузка сохранения на расставленную доску (SaveCodec.loads, Board.restore)"""
+    board, state, _ = scripted_position(predicate=is_attack)
+    codec = get_codec()
+    data = codec.dumps(state=state)
+    return lambda: board.restore(state=codec.loads(data=data))
+
+
+def scripted_game() -> Callable[[], object]:
+    """Целая партия случайных игроков с постоянным зерном"""
+    config = GameConfig(game=0, seed=BENCHMARK_SEED, red="random", blue="random")
+    return lambda: play_game(config=config)
+
+
+def perk_classes() -> Tuple[str, ...]:
+    """Имена классов способностей всех персонажей (без повторов, в порядке классов персонажей)"""
+    names: Dict[str, None] = {}
+    for unit in create_units():
+        for perk in unit.get_perks().values():
+            names[type(perk).__name__] = None
+    return tuple(names)
+
+
+def get_benchmarks(perks: Optional[Tuple[str, ...]] = None) -> Dict[str, "Benchmark"]:
+    """Все замеры: имя -> подготовка операции
+
+    Args:
+        perks: имена классов способностей (по умолчанию - все)
+
+    Returns:
+        dict: замеры
+    """
+    return {
+        "dice.roll": dice_roll,
+        "dice_roll.action": dice_roll_action,
+        **{
+            f"perk.activate.{name}": perk_activate(perk_class=name)
+            for name in (perks if perks is not None else perk_classes())
+        },
+        "action.realise.move": action_realise(predicate=is_move),
+        "action.realise.attack": action_realise(predicate=is_attack),
+        "action.realise.area": action_realise_area,
+        "board.select_target": select_target,
+        "board.finish_circle": finish_circle,
+        "board.initialize_cells": board_cells,
+        "board.initialize_buildings": board_buildings,
+        "board.setup": board_setup,
+        "stress.setup": stress_setup,
+        "stress.legal_actions": stress_legal_actions,
+        "stress.finish_circle": stress_finish_circle,
+        "savegame.dumps": save_dumps,
+        "savegame.loads": save_loads,
+        "game.random": scripted_game,
+    }
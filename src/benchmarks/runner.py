@@ -0,0 +1,217 @@
+import json
+import tracemalloc
+from contextvars import copy_context
+from time import perf_counter
+from typing import NamedTuple, Callable, Iterable, Iterator, Mapping, Optional, Dict, List, Tuple
+
+from src.utils.rng import random_context, PooledBackend
+from src.utils.constants import (
+    BENCHMARK_MIN_TIME,
+    BENCHMARK_REPEATS,
+    BENCHMARK_MEMORY_OPS,
+    BENCHMARK_SEED,
+    BENCHMARK_TOLERANCE,
+)
+
+# замер: подготовка (вне замера) возвращает операцию, которую замер повторяет
+Benchmark = Callable[[], Callable[[], object]]
+
+
+class BenchmarkResult(NamedTuple):
+    """Результат замера
+    Скорость - лучший из замеров; память - в среднем на одну операцию
+    (пик - наибольший объем временно выделенной памяти, удержано - не освобожденной)
+    """
+    name: str
+    ops_per_second: float
+    number: int
+    repeats: int
+    peak_bytes: float
+    retained_bytes: float
+
+
+class Comparison(NamedTuple):
+    """Сравнение замера с базой (отношение скоростей: меньше 1 - медленнее базы)"""
+    name: str
+    ratio: float
+    slowdown: bool
+
+
+def calibrate(operation: Callable[[], object], min_time: float) -> int:
+    """Количество повторений операции, которое длится не меньше min_time (1, 2, 5, 10, 20, ...)
+
+    Args:
+        operation: операция
+        min_time: минимальное время замера
+
+    Returns:
+        int: количество повторений
+    """
+    scale = 1
+    while True:
+        for number in (scale, 2 * scale, 5 * scale):
+            if timed(operation=operation, number=number) >= min_time:
+                return number
+        scale *= 10
+
+
+def timed(operation: Callable[[], object], number: int) -> float:
+    """Время number повторений операции
+
+    Args:
+        operation: операция
+        number: количество повторений
+
+    Returns:
+        float: время (секунды)
+    """
+    start = perf_counter()
+    for _ in range(number):
+        operation()
+    return perf_counter() - start
+
+
+def traced(operation: Callable[[], object], number: int) -> Tuple[float, float]:
+    """Память, выделенная операцией (в среднем на одну операцию)
+
+    Args:
+        operation: операция
+        number: количество повторений
+
+    Returns:
+        tuple: пик и удержанная память (байты)
+    """
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        peak_total = 0
+        for _ in range(number):
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            operation()
+            _, peak = tracemalloc.get_traced_memory()
+            peak_total += peak - before
+        end, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak_total / number, (end - start) / number
+
+
+def measure(
+    name: str,
+    benchmark: Benchmark,
+    min_time: float = BENCHMARK_MIN_TIME,
+    repeats: int = BENCHMARK_REPEATS,
+    memory_ops: int = BENCHMARK_MEMORY_OPS,
+    seed: int = BENCHMARK_SEED,
+) -> BenchmarkResult:
+    """Замерить скорость и память одной операции
+    Замер идет в отдельном контексте со своим источником костей (зерно одно для всех замеров),
+    поэтому замеры не влияют друг на друга
+
+    Args:
+        name: имя замера
+        benchmark: подготовка операции
+        min_time: минимальное время одного замера
+        repeats: количество замеров
+        memory_ops: количество операций при подсчете памяти
+        seed: зерно костей
+
+    Returns:
+        BenchmarkResult: результат
+    """
+    return copy_context().run(_measure, name, benchmark, min_time, repeats, memory_ops, seed)
+
+
+def _measure(
+    name: str,
+    benchmark: Benchmark,
+    min_time: float,
+    repeats: int,
+    memory_ops: int,
+    seed: int,
+) -> BenchmarkResult:
+    """Замер в текущем контексте"""
+    random_context.set(PooledBackend(seed=seed))
+    operation = benchmark()
+    # первый вызов прогревает кэши и не учитывается
+    operation()
+    number = calibrate(operation=operation, min_time=min_time)
+    best = min(timed(operation=operation, number=number) for _ in range(repeats))
+    peak_bytes, retained_bytes = traced(operation=operation, number=max(1, min(memory_ops, number)))
+    return BenchmarkResult(
+        name=name,
+        ops_per_second=number / best,
+        number=number,
+        repeats=repeats,
+        peak_bytes=peak_bytes,
+        retained_bytes=retained_bytes,
+    )
+
+
+def run_benchmarks(
+    benchmarks: Mapping[str, Benchmark],
+    names: Optional[Iterable[str]] = None,
+    **kwargs,
+) -> Iterator[BenchmarkResult]:
+    """Выполнить замеры по порядку
+
+    Args:
+        benchmarks: замеры (имя -> подготовка операции)
+        names: имена замеров (по умолчанию - все)
+        kwargs: параметры замера (см. measure)
+
+    Returns:
+        iterator: результаты
+    """
+    for name in names if names is not None else benchmarks:
+        yield measure(name=name, benchmark=benchmarks[name], **kwargs)
+
+
+def write_results(results: Iterable[BenchmarkResult], path: str) -> None:
+    """Записать результаты замеров в файл JSON
+
+    Args:
+        results: результаты
+        path: путь к файлу
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({result.name: result._asdict() for result in results}, file, ensure_ascii=False, indent=1)
+
+
+def load_results(path: str) -> Dict[str, BenchmarkResult]:
+    """Прочитать результаты замеров из файла JSON
+
+    Args:
+        path: путь к файлу
+
+    Returns:
+        dict: имя замера -> результат
+    """
+    with open(path, encoding="utf-8") as file:
+        return {name: BenchmarkResult(**values) for name, values in json.load(file).items()}
+
+
+def compare(
+    results: Iterable[BenchmarkResult],
+    baseline: Mapping[str, BenchmarkResult],
+    tolerance: float = BENCHMARK_TOLERANCE,
+) -> List[Comparison]:
+    """Сравнить результаты с базой (замеры, которых нет в базе, пропускаются)
+
+    Args:
+        results: результаты
+        baseline: база (имя замера -> результат)
+        tolerance: допустимое замедление (доля скорости базы)
+
+    Returns:
+        list: сравнения
+    """
+    comparisons = []
+    for result in results:
+        base = baseline.get(result.name)
+        if base is None:
+            continue
+        ratio = result.ops_per_second / base.ops_per_second
+        comparisons.append(Comparison(name=result.name, ratio=ratio, slowdown=ratio < 1 - tolerance))
+    return comparisons
@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING, Type
 
 from src.models.building import Building
 from src.utils.tools import Index
+from src.utils.constants import BOARD_ROWS, BOARD_COLUMNS
 from src.models.action import BuildingAction
 from src.perks.passive import BuildingHealing, AltarGift
 from src.utils.enums import ActionType
@@ -83,17 +84,31 @@ class Altar(Building):
         )
 
 
-def get_buildings_position() -> dict[str, Type[Building]]:
+def get_buildings_position(rows: int = BOARD_ROWS, columns: int = BOARD_COLUMNS) -> dict[int, Type[Building]]:
+    """Позиции зданий: расстановка стандартной доски повторяется по большой доске
 
-    buildings_position = {
-        Index(row=1, column=3).name: Castle,
-        Index(row=7, column=4).name: Castle,
-        Index(row=3, column=1).name: Altar,
-        Index(row=5, column=6).name: Altar,
-        Index(row=5, column=1).name: Crypt,
-        Index(row=3, column=3).name: Crypt,
-        Index(row=3, column=4).name: Crypt,
-        Index(row=3, column=6).name: Crypt
+    Args:
+        rows: количество строк доски
+        columns: количество столбцов доски
+
+    Returns:
+        dict: номер позиции -> класс здания
+    """
+    pattern = {
+        (1, 3): Castle,
+        (7, 4): Castle,
+        (3, 1): Altar,
+        (5, 6): Altar,
+        (5, 1): Crypt,
+        (3, 3): Crypt,
+        (3, 4): Crypt,
+        (3, 6): Crypt,
     }
+    buildings_position: dict[int, Type[Building]] = {}
+    for top in range(0, rows, BOARD_ROWS):
+        for left in range(0, columns, BOARD_COLUMNS):
+            for (row, column), building in pattern.items():
+                if top + row <= rows and left + column <= columns:
+                    buildings_position[Index(row=top + row, column=left + column).id] = building
 
     return buildings_position
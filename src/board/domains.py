@@ -1,6 +1,5 @@
-from arcade import color
-
 from src.models.domain import Domain
+from src.utils.constants import RED_DOMAIN_COLOR, BLUE_DOMAIN_COLOR
 from src.utils.descriptions import RED_DOMAIN_DESC, BLUE_DOMAIN_DESC, GRAY_DOMAIN_DESC
 from src.utils.textures import RED_DOMAIN_TEXTURE, BLUE_DOMAIN_TEXTURE, GRAY_DOMAIN_TEXTURE
 
@@ -22,7 +21,7 @@ class RedDomain(Domain):
             title=title,
             description=RED_DOMAIN_DESC,
             texture=RED_DOMAIN_TEXTURE,
-            domain_color=color.RED,
+            domain_color=RED_DOMAIN_COLOR,
         )
 
 
@@ -43,7 +42,7 @@ class BlueDomain(Domain):
             title=title,
             description=BLUE_DOMAIN_DESC,
             texture=BLUE_DOMAIN_TEXTURE,
-            domain_color=color.BLUE,
+            domain_color=BLUE_DOMAIN_COLOR,
         )
 
 
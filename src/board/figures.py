@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING, Type
 
 from src.models.figure import Figure
 from src.utils.tools import Index
+from src.utils.constants import BOARD_ROWS, BOARD_COLUMNS
 from src.units.units import (
     UnitBarbarian,
     UnitBard,
@@ -299,36 +300,25 @@ class Wizard(Figure):
         )
 
 
-def get_figures_position() -> dict[str, Type[Figure]]:
-    figures_position: dict[str, Type[Figure]] = {}
-    for row in range(1, 8):
-        for column in range(1, 7):
+def get_figures_position(rows: int = BOARD_ROWS, columns: int = BOARD_COLUMNS) -> dict[int, Type[Figure]]:
+    """Позиции фигур: заклинатели в крайних строках, воины перед ними (классы повторяются по столбцам)
+
+    Args:
+        rows: количество строк доски
+        columns: количество столбцов доски
+
+    Returns:
+        dict: номер позиции -> класс фигуры
+    """
+    back_line = (Druid, Bard, Sorcerer, Wizard, Warlock, Cleric)
+    front_line = (Ranger, Monk, Fighter, Barbarian, Paladin, Rogue)
+    figures_position: dict[int, Type[Figure]] = {}
+    for row in range(1, rows + 1):
+        for column in range(1, columns + 1):
             index = Index(row=row, column=column)
-            if row in (1, 7):
-                if column == 1:
-                    figures_position[index.name] = Druid
-                elif column == 2:
-                    figures_position[index.name] = Bard
-                elif column == 3:
-                    figures_position[index.name] = Sorcerer
-                elif column == 4:
-                    figures_position[index.name] = Wizard
-                elif column == 5:
-                    figures_position[index.name] = Warlock
-                else:
-                    figures_position[index.name] = Cleric
-            if row in (2, 6):
-                if column == 1:
-                    figures_position[index.name] = Ranger
-                elif column == 2:
-                    figures_position[index.name] = Monk
-                elif column == 3:
-                    figures_position[index.name] = Fighter
-                elif column == 4:
-                    figures_position[index.name] = Barbarian
-                elif column == 5:
-                    figures_position[index.name] = Paladin
-                else:
-                    figures_position[index.name] = Rogue
+            if row in (1, rows):
+                figures_position[index.id] = back_line[(column - 1) % len(back_line)]
+            if row in (2, rows - 1):
+                figures_position[index.id] = front_line[(column - 1) % len(front_line)]
 
     return figures_position
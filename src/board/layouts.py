@@ -0,0 +1,46 @@
+from src.board.figures import get_figures_position
+from src.board.buildings import get_buildings_position
+from src.utils.tools import BoardLayout, DomainBand
+from src.utils.constants import BOARD_ROWS, BOARD_COLUMNS, STRESS_ROWS, STRESS_COLUMNS
+
+
+def create_layout(rows: int, columns: int, band: int) -> BoardLayout:
+    """Расстановка доски: синий домен сверху, красный снизу, фигуры в двух крайних строках каждого домена
+
+    Args:
+        rows: количество строк
+        columns: количество столбцов
+        band: количество строк полосы каждого домена
+
+    Returns:
+        BoardLayout: расстановка
+    """
+    return BoardLayout(
+        rows=rows,
+        columns=columns,
+        bands=(
+            DomainBand(domain="Blue", first_row=1, last_row=band),
+            DomainBand(domain="Red", first_row=rows - band + 1, last_row=rows),
+        ),
+        buildings=tuple(get_buildings_position(rows=rows, columns=columns).items()),
+        figures=tuple(get_figures_position(rows=rows, columns=columns).items()),
+    )
+
+
+def standard_layout() -> BoardLayout:
+    """Расстановка стандартной доски 7x6"""
+    return create_layout(rows=BOARD_ROWS, columns=BOARD_COLUMNS, band=2)
+
+
+def stress_layout(rows: int = STRESS_ROWS, columns: int = STRESS_COLUMNS) -> BoardLayout:
+    """Нагрузочная расстановка: большая доска с сотнями фигур и повторяющимися зданиями
+    Полосы доменов занимают ту же долю строк, что и на стандартной доске
+
+    Args:
+        rows: количество строк
+        columns: количество столбцов
+
+    Returns:
+        BoardLayout: расстановка
+    """
+    return create_layout(rows=rows, columns=columns, band=max(2, rows * 2 // BOARD_ROWS))
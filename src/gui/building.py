@@ -0,0 +1,52 @@
+from typing import TYPE_CHECKING
+
+from src.abstractions.sprite import BaseImage
+from src.utils.enums import ModelEvent
+
+if TYPE_CHECKING:
+    from src.utils.tools import BaseAttribute
+    from src.abstractions.domain import BaseDomain
+    from src.abstractions.building import BaseBuilding
+
+
+class BuildingView(BaseImage):
+    """UI модель здания (наблюдает за моделью здания)"""
+
+    def __init__(
+        self,
+        building: "BaseBuilding",
+    ):
+        """Инициализация графики здания
+
+        Args:
+            building: модель здания
+        """
+        super().__init__(
+            core=building.core,
+        )
+        self.with_border(width=3, color=building.core.domain.color)
+        self._building = building
+        building.subscribe(observer=self._on_building_event)
+
+    @property
+    def building(self) -> "BaseBuilding":
+        """Модель здания"""
+        return self._building
+
+    def change_domain(self, target: "BaseDomain") -> None:
+        """Установить новый домен
+
+        Args:
+            target: домен
+        """
+        self.with_border(width=3, color=target.color)
+
+    def _on_building_event(self, source: "BaseBuilding", event: "BaseAttribute") -> None:
+        """Обновить графику по событию модели
+
+        Args:
+            source: здание
+            event: событие
+        """
+        if event == ModelEvent.domain.value:
+            self.change_domain(target=source.core.domain)
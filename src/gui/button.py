@@ -4,14 +4,17 @@ from arcade import color
 from src.models.button import Button
 from src.utils.tools import info_context
 from src.utils.constants import CELL_SIZE
-from src.utils.messages import NEXT_DOMAIN_MSG, ACTION_CHOOSE_MSG
+from src.utils.messages import NEXT_DOMAIN_MSG, ACTION_CHOOSE_MSG, UNDO_MSG, NO_UNDO_MSG
 from src.utils.enums import ActionType, PerkType
+from src.utils.textures import resolve_texture
 
 if TYPE_CHECKING:
     from src.utils.tools import Index
     from src.abstractions.board import BaseBoard
     from src.abstractions.action import BaseAction
     from src.gui.action_box import ActionBox
+    from src.gui.grid import BoardGrid
+    from src.models.history import UndoHistory
 
 
 class StartButton(Button):
@@ -31,7 +34,7 @@ class StartButton(Button):
     def on_click(self, event) -> bool:
         """Emit a ChooseColorEvent event when clicked."""
         self._board.start_circle()
-        info_context.reset(value=NEXT_DOMAIN_MSG.format(domain=self._board.time))
+        info_context.reset(template=NEXT_DOMAIN_MSG, domain=self._board.time)
         return True
 
 
@@ -51,9 +54,41 @@ class CircleButton(Button):
 
     def on_click(self, event) -> bool:
         """Emit a ChooseColorEvent event when clicked."""
-        if self._board.started:
+        domain = self._board.current_domain
+        if self._board.started and not (domain and domain.automated):
             self._board.finish_circle()
-            info_context.reset(value=NEXT_DOMAIN_MSG.format(domain=self._board.time))
+            info_context.reset(template=NEXT_DOMAIN_MSG, domain=self._board.time)
+            return True
+
+
+class UndoButton(Button):
+
+    def __init__(
+        self,
+        index: "Index",
+        board: "BaseBoard",
+        history: "UndoHistory",
+    ):
+        super().__init__(
+            name="Undo_Button",
+            index=index,
+            text="Отменить",
+            board=board,
+        )
+        self._history = history
+
+    def on_click(self, event) -> bool:
+        """Отменить последнее действие игрока"""
+        domain = self._board.current_domain
+        if self._board.started and not (domain and domain.automated):
+            if self._history.undo():
+                info_context.reset(template=UNDO_MSG, domain=self._board.time)
+            else:
+                info_context.reset(template=NO_UNDO_MSG)
+            # выбор клетки сброшен - скрываем панель действий
+            if self.parent:
+                grid: "BoardGrid" = self.parent
+                grid.actions.hide_actions()
             return True
 
 
@@ -88,14 +123,14 @@ class ActionButton(Button):
     @action.setter
     def action(self, value: "BaseAction") -> None:
         self._action = value
-        self.texture = value.texture
+        self.texture = resolve_texture(value.texture)
         # self.text = value.perk.name
 
     def on_click(self, event) -> bool:
         """Emit a ChooseColorEvent event when clicked."""
         if self._board.started and self._action and self.visible:
             self._board.select_action(action=self._action)
-            info_context.set(value=ACTION_CHOOSE_MSG.format(action=self._action.desc))
+            info_context.set(template=ACTION_CHOOSE_MSG, action=self._action.desc)
             if (
                     # пропуск хода активируем сразу
                     self._action.attribute == ActionType.defend.value
@@ -107,9 +142,10 @@ class ActionButton(Button):
             return True
 
     def _activate_immediately(self) -> None:
-        """Немедленная активация действия"""
-        self._action.realise(
+        """Немедленная активация действия (через доску, чтобы действие попало в запись партии)"""
+        self._board.perform(
             current_cell=self._board.current_cell,
+            action=self._action,
             target=self._board.current_cell,
         )
         # пробуем скрыть панель действий
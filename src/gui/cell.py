@@ -0,0 +1,125 @@
+from typing import TYPE_CHECKING, Dict, Optional
+from arcade import color
+from arcade.gui.widgets.layout import UIAnchorLayout
+
+from src.abstractions.sprite import BaseImage
+from src.gui.building import BuildingView
+from src.gui.figure import FigureView
+from src.utils.enums import ModelEvent
+from src.utils.textures import resolve_texture
+
+if TYPE_CHECKING:
+    from src.utils.tools import SpriteCore, BaseAttribute
+    from src.abstractions.domain import BaseDomain
+    from src.abstractions.cell import BaseCell
+    from src.abstractions.figure import BaseFigure
+
+
+class CellSprite(BaseImage):
+    """UI модель графики клетки игральной доски"""
+
+    def __init__(
+        self,
+        core: "SpriteCore",
+    ):
+        """Инициализация графики клетки
+
+        Args:
+            core: свойства графического объекта
+        """
+        super().__init__(
+            core=core,
+        )
+        self.with_border(color=color.BLACK, width=1)
+
+    def change_domain(self, target: "BaseDomain") -> None:
+        """Установить новый домен
+
+        Args:
+            target: домен
+        """
+        self.texture = resolve_texture(target.texture)
+
+
+class CellView(UIAnchorLayout):
+    """UI модель клетки игральной доски (наблюдает за моделью клетки)"""
+
+    def __init__(
+        self,
+        cell: "BaseCell",
+        figure_views: Dict["BaseFigure", FigureView],
+    ):
+        """Инициализация графики клетки
+
+        Args:
+            cell: модель клетки
+            figure_views: общий для доски список графики фигур
+                (фигура переходит между клетками вместе со своей графикой)
+        """
+        sprite = CellSprite(
+            core=cell.core,
+        )
+        super().__init__(
+            width=sprite.width,
+            height=sprite.height,
+        )
+        self._cell = cell
+        self._figure_views = figure_views
+        self._sprite = self.add(
+            child=sprite,
+        )
+        self._building_view: Optional[BuildingView] = None
+        self._figure_view: Optional[FigureView] = None
+        self._show_building()
+        self._show_figure()
+        cell.subscribe(observer=self._on_cell_event)
+
+    @property
+    def cell(self) -> "BaseCell":
+        """Модель клетки"""
+        return self._cell
+
+    def _on_cell_event(self, source: "BaseCell", event: "BaseAttribute") -> None:
+        """Обновить графику по событию модели
+
+        Args:
+            source: клетка
+            event: событие
+        """
+        if event == ModelEvent.figure.value:
+            self._show_figure()
+        elif event == ModelEvent.domain.value:
+            self._sprite.change_domain(target=source.domain)
+        elif event == ModelEvent.building.value:
+            self._show_building()
+
+    def _show_building(self) -> None:
+        """Показать здание клетки"""
+        if self._building_view:
+            self.remove(child=self._building_view)
+            self._building_view = None
+        if self._cell.building:
+            self._building_view = self.add(
+                child=BuildingView(building=self._cell.building),
+            )
+            # фигура всегда поверх здания
+            if self._figure_view:
+                self.remove(child=self._figure_view)
+                self.add(child=self._figure_view)
+
+    def _show_figure(self) -> None:
+        """Показать фигуру клетки"""
+        figure = self._cell.figure
+        if self._figure_view:
+            if self._figure_view.figure is figure:
+                return
+            self.remove(child=self._figure_view)
+            self._figure_view = None
+        if figure:
+            figure_view = self._figure_views.get(figure)
+            if not figure_view:
+                figure_view = FigureView(figure=figure)
+                self._figure_views[figure] = figure_view
+            self._figure_view = self.add(
+                child=figure_view,
+            )
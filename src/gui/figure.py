@@ -0,0 +1,91 @@
+from typing import TYPE_CHECKING
+from arcade.gui.widgets.layout import UIAnchorLayout
+
+from src.abstractions.sprite import BaseImage
+from src.models.indicator import IndicatorBar
+from src.utils.constants import CELL_SIZE
+from src.utils.enums import ModelEvent, FigureStatus
+
+if TYPE_CHECKING:
+    from src.utils.tools import SpriteCore, BaseAttribute
+    from src.abstractions.domain import BaseDomain
+    from src.abstractions.figure import BaseFigure
+
+
+class FigureSprite(BaseImage):
+    """UI модель графики фигуры"""
+
+    def __init__(
+        self,
+        core: "SpriteCore",
+    ):
+        """Инициализация графики фигуры
+
+        Args:
+            core: свойства графического объекта
+        """
+        super().__init__(
+            core=core,
+        )
+        self.with_border(width=3, color=core.domain.color)
+
+    def change_domain(self, target: "BaseDomain") -> None:
+        """Установить новый домен (запрещено для фигур)"""
+        pass
+
+
+class FigureView(UIAnchorLayout):
+    """UI модель фигуры (наблюдает за моделью фигуры)"""
+
+    def __init__(
+        self,
+        figure: "BaseFigure",
+    ):
+        """Инициализация графики фигуры
+
+        Args:
+            figure: модель фигуры
+        """
+        sprite = FigureSprite(
+            core=figure.core,
+        )
+        super().__init__(
+            width=sprite.width,
+            height=sprite.height,
+            size_hint=(
+                sprite.width / CELL_SIZE,
+                sprite.height / CELL_SIZE,
+            )
+        )
+        self._figure = figure
+        self._sprite = self.add(
+            child=sprite,
+        )
+        self._indicator = self.add(
+            child=IndicatorBar(
+                width=figure.core.width,
+                height=figure.core.height // 10,
+            ),
+            anchor_y="top",
+        )
+        self._indicator.value = figure.unit.hp_percent
+        figure.subscribe(observer=self._on_figure_event)
+
+    @property
+    def figure(self) -> "BaseFigure":
+        """Модель фигуры"""
+        return self._figure
+
+    def _on_figure_event(self, source: "BaseFigure", event: "BaseAttribute") -> None:
+        """Обновить графику по событию модели
+
+        Args:
+            source: фигура
+            event: событие
+        """
+        if event == ModelEvent.status.value:
+            self._indicator.value = source.unit.hp_percent
+            # фигура, возвращенная из плена (отмена хода), снова видна
+            self.visible = source.status != FigureStatus.captive.value
+        elif event == ModelEvent.killed.value:
+            self.visible = False
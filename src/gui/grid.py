@@ -1,8 +1,9 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict
 from arcade.gui import UIGridLayout
 
 from src.utils.tools import Entry
-from src.gui.button import StartButton, CircleButton
+from src.gui.button import StartButton, CircleButton, UndoButton
+from src.gui.cell import CellView
 from src.models.text import ScrollableTextArea
 from src.gui.action_box import ActionBox
 from src.utils.constants import (
@@ -14,6 +15,9 @@ from src.utils.messages import START_GAME_MSG
 
 if TYPE_CHECKING:
     from src.abstractions.board import BaseBoard
+    from src.abstractions.figure import BaseFigure
+    from src.gui.figure import FigureView
+    from src.models.history import UndoHistory
 
 
 class BoardGrid(UIGridLayout):
@@ -21,6 +25,7 @@ class BoardGrid(UIGridLayout):
     def __init__(
         self,
         board: "BaseBoard",
+        history: "UndoHistory",
     ):
         super().__init__(
             column_count=GRID_COLUMN_COUNT,
@@ -29,6 +34,9 @@ class BoardGrid(UIGridLayout):
             height=GRID_ROW_COUNT * CELL_SIZE,
         )
         self._board = board
+        self._history = history
+        # графика фигур (фигура переходит между клетками вместе со своей графикой)
+        self._figure_views: Dict["BaseFigure", "FigureView"] = {}
         self.rect = self.rect.at_position(position=(0, 0))
         self._actions: ActionBox = self.fill_actions(board=board)
         # информационное табло
@@ -102,7 +110,10 @@ class BoardGrid(UIGridLayout):
         """Заполнить поле клетками"""
         for cell in self._board.get_cells().values():
             self.add(
-                child=cell,
+                child=CellView(
+                    cell=cell,
+                    figure_views=self._figure_views,
+                ),
                 row=cell.index.row,
                 column=cell.index.column,
             )
@@ -128,6 +139,16 @@ class BoardGrid(UIGridLayout):
             column=8,
             align_center_y=True,
         )
+        self.add(
+            child=UndoButton(
+                index=(6, 9),
+                board=self._board,
+                history=self._history,
+            ),
+            row=6,
+            column=9,
+            align_center_y=True,
+        )
 
     def fill_actions(self, board: "BaseBoard") -> ActionBox:
         """Показать список возможных действий"""
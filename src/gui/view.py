@@ -1,10 +1,22 @@
+import os
 import arcade
+from concurrent.futures import ThreadPoolExecutor, Future
 from arcade.gui import UIView
-from typing import Any
+from numpy.random import SeedSequence
+from typing import Any, Optional
 
 from src.gui.grid import BoardGrid
 from src.models.board import Board
-from src.utils.tools import info_context, Index
+from src.models.history import UndoHistory
+from src.models.replay import ReplayLog, ReplayRecorder, ReplayPlayer, SCENARIOS, new_replay_path
+from src.models.savegame import save_game, load_game
+from src.ai.expectimax import ExpectimaxPlayer
+from src.ai.mcts import MctsPlayer
+from src.ai.player import BasePlayer, Choice
+from src.utils.tools import BoardState, InfoFeed, Index, info_context
+from src.utils.rng import random_context, PooledBackend
+from src.utils.messages import NEXT_DOMAIN_MSG, SAVE_MSG, LOAD_MSG, NO_SAVE_MSG
+from src.utils.constants import AI_ENGINE, REPLAY_RECORD, REPLAY_SCENARIO, REPLAY_STEP_TIME, SAVE_PATH
 
 
 class Chess(UIView):
@@ -20,21 +32,40 @@ class Chess(UIView):
         self.camera = arcade.Camera2D()
         # инициализация доски
         self._board = Board()
+        # история состояний доски для отмены действий
+        self._history = UndoHistory(board=self._board)
         # сетка игральной доски
         self._grid = self.add_widget(
             widget=BoardGrid(
                 board=self._board,
+                history=self._history,
             )
         )
+        # лента сообщений для информационного табло
+        self._feed = InfoFeed()
+        # компьютерный противник (синий домен)
+        engines = {"expectimax": ExpectimaxPlayer, "mcts": MctsPlayer}
+        self._ai = engines[AI_ENGINE]()
+        # поиск хода компьютера идет в отдельном потоке на единственной доске-двойнике, окно при этом не замирает
+        self._ai_executor = ThreadPoolExecutor(max_workers=1)
+        self._ai_board: Optional[Board] = None
+        self._ai_search: Optional[Future] = None
+        self._ai_state: Optional[BoardState] = None
+        # запись партии
+        self._recorder: Optional[ReplayRecorder] = None
 
     def setup(self):
         """Начало игры"""
 
+        # кости партии бросаются из источника с известным зерном (для записи партии)
+        seed = SeedSequence().entropy
+        random_context.set(PooledBackend(seed=seed))
+
         # заполнение игральной доски
-        self._board.initialize_cells()
-        self._board.initialize_buildings()
-        self._board.initialize_figures()
-        self._board.fill_domains()
+        SCENARIOS[REPLAY_SCENARIO](self._board)
+        self._board.get_domain(name=self._ai.domain).automated = True
+        if REPLAY_RECORD:
+            self._recorder = ReplayRecorder(board=self._board, seed=seed, path=new_replay_path())
 
         # заполнение сетки игры
         self._grid.fill_cells()
@@ -56,7 +87,7 @@ class Chess(UIView):
         """
         Called when the user presses a mouse button.
         """
-        if not self._board.started:
+        if not self._board.started or self._board.current_domain.automated:
             return
 
         index = Index(
@@ -74,6 +105,127 @@ class Chess(UIView):
             if selection:
                 self._grid.actions.hide_actions()
 
+    def on_key_press(self, symbol: int, modifiers: int):
+        """F5 - сохранить игру, F9 - загрузить сохранение"""
+        if not self._board.started or self._board.current_domain.automated:
+            return
+        if symbol == arcade.key.F5:
+            save_game(board=self._board, path=SAVE_PATH)
+            info_context.reset(template=SAVE_MSG)
+        elif symbol == arcade.key.F9:
+            self.load_game()
+
+    def load_game(self) -> None:
+        """Загрузить сохранение на доску
+        Запись партии после загрузки прекращается: ввод с этого места не повторить из начальной расстановки
+        """
+        if not os.path.exists(SAVE_PATH):
+            info_context.reset(template=NO_SAVE_MSG)
+            return
+        self._grid.actions.hide_actions()
+        load_game(path=SAVE_PATH, board=self._board)
+        self.close_recording()
+        self._board.recorder = None
+        self._history.record()
+        info_context.reset(template=LOAD_MSG, domain=self._board.time)
+
     def on_update(self, delta_time: float) -> None:
+        """Запомнить изменения доски, продвинуть ход компьютера (не больше одного действия за кадр)
+        и дописать на табло новые сообщения
+        """
         if self._board.started:
-            self._grid.info_text.text = info_context.get()
+            self._history.record()
+            if self._board.current_domain.automated:
+                self._play_ai()
+            self._pull_feed()
+
+    def close_recording(self) -> None:
+        """Закрыть файл записи партии"""
+        if self._recorder:
+            self._recorder.close()
+
+    def stop_ai(self) -> None:
+        """Остановить поток поиска хода компьютера (начатый поиск доводится до конца в фоне)"""
+        self._ai_executor.shutdown(wait=False, cancel_futures=True)
+
+    def _pull_feed(self) -> None:
+        """Дописать на табло новые сообщения"""
+        update = self._feed.pull()
+        if update.clear:
+            self._grid.info_text.clear_text()
+        self._grid.info_text.append_lines(lines=update.lines)
+
+    def _play_ai(self) -> None:
+        """Одно действие компьютера; если действовать больше незачем - завершить ход
+        Поиск запускается в отдельном потоке на доске-двойнике окна (search, а не choose:
+        второй двойник игрока не нужен), действие совершается в кадре, когда поиск закончен
+        (кости партии бросаются только в потоке окна)
+        """
+        if self._ai_search is None:
+            self._grid.actions.hide_actions()
+            if self._ai_board is None or self._ai_board.layout is not self._board.layout:
+                self._ai_board = BasePlayer.create_twin(layout=self._board.layout)
+            self._ai_state = self._board.snapshot()
+            self._ai_board.restore(state=self._ai_state)
+            self._ai_search = self._ai_executor.submit(self._ai.search, self._ai_board)
+            return
+        if not self._ai_search.done():
+            return
+        choice: Optional[Choice] = self._ai_search.result().choice
+        self._ai_search = None
+        if self._board.snapshot() != self._ai_state:
+            # доска изменилась во время поиска - ищем заново
+            return
+        if choice is None:
+            self._board.finish_circle()
+            info_context.reset(template=NEXT_DOMAIN_MSG, domain=self._board.time)
+            return
+        cell, action, target = choice.resolve(board=self._board)
+        self._board.perform(current_cell=cell, action=action, target=target)
+
+
+class ReplayChess(Chess):
+    """Просмотр записи партии: команды выполняются по одной через равные промежутки времени,
+    ввод игрока и компьютерный противник отключены
+    """
+
+    def __init__(self, log: ReplayLog, step_time: float = REPLAY_STEP_TIME):
+        """Инициализация просмотра
+
+        Args:
+            log: запись партии
+            step_time: пауза между командами (секунды)
+        """
+        super().__init__()
+        self._player = ReplayPlayer(log=log, board=self._board, history=self._history)
+        self._step_time = step_time
+        self._elapsed = 0.0
+
+    def setup(self):
+        """Расстановка доски по записи (без кнопок управления партией)"""
+        self._player.prepare()
+        self._grid.fill_cells()
+        self._grid.actions.prepare_buttons()
+
+    def on_mouse_press(
+        self,
+        x: int,
+        y: int,
+        button: int,
+        key_modifiers: Any,
+    ):
+        """Ввод игрока при просмотре не принимается"""
+        return
+
+    def on_key_press(self, symbol: int, modifiers: int):
+        """Сохранение и загрузка при просмотре недоступны"""
+        return
+
+    def on_update(self, delta_time: float) -> None:
+        """Выполнить следующую команду записи, когда подошло ее время"""
+        self._elapsed += delta_time
+        if self._elapsed >= self._step_time and not self._player.finished:
+            self._elapsed = 0.0
+            self._grid.actions.hide_actions()
+            self._player.step()
+        self._pull_feed()
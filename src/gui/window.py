@@ -1,6 +1,9 @@
 import arcade
+from typing import Optional
 
-from src.gui.view import Chess
+from src.gui.view import Chess, ReplayChess
+from src.models.replay import ReplayLog
+from src.models.text import load_fonts
 from src.utils.constants import (
     WINDOW_WIDTH,
     WINDOW_HEIGHT,
@@ -10,7 +13,7 @@ from src.utils.constants import (
 
 class ChessWindow(arcade.Window):
 
-    def __init__(self):
+    def __init__(self, log: Optional[ReplayLog] = None):
         super().__init__(
             width=WINDOW_WIDTH,
             height=WINDOW_HEIGHT,
@@ -19,8 +22,16 @@ class ChessWindow(arcade.Window):
             # update_rate=1,
             # draw_rate=1,
         )
-        self.game = Chess()
+        # шрифты загружаются до создания виджетов
+        load_fonts()
+        # с записью партии - просмотр записи вместо новой игры
+        self.game = ReplayChess(log=log) if log is not None else Chess()
 
     def start_game(self):
         self.game.setup()
         self.show_view(self.game)
+
+    def on_close(self):
+        self.game.close_recording()
+        self.game.stop_ai()
+        super().on_close()
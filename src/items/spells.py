@@ -1,5 +1,5 @@
 from models.item import Spell
-from src.utils.enums import MagicType
+from src.utils.enums import MagicType, AreaShape
 from src.models.effect import Elemental, Heal, Sacrifice, Crush
 
 
@@ -35,6 +35,8 @@ class FireBall(Spell):
             damage=8,
             magic_type=MagicType.fire.value,
             radius=2,
+            area=1,
+            shape=AreaShape.square.value,
         )
 
 
@@ -70,6 +72,7 @@ class IceStorm(Spell):
             damage=8,
             magic_type=MagicType.ice.value,
             radius=2,
+            area=1,
         )
 
 
@@ -172,4 +175,6 @@ class FireStorm(Spell):
             effect=effect,
             damage=8,
             magic_type=MagicType.fire.value,
+            area=1,
+            shape=AreaShape.square.value,
         )
@@ -1,8 +1,10 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, List, Sequence, Tuple, Optional
+from numpy import array
 
 from src.utils.tools import info_context
+from src.utils.rng import random_context
 from src.abstractions.action import BaseAction
-from src.utils.enums import ActionType, PerkType, FigureStatus
+from src.utils.enums import ActionType, PerkType, PerkStatus, FigureStatus, LogKind
 from src.utils.messages import (
     ACTION_DEFEND_MSG,
     ACTION_NO_TARGET_MSG,
@@ -14,6 +16,8 @@ from src.utils.messages import (
     ACTION_MOVE_MSG,
     ACTION_NO_SACRIFICE_MSG,
     ACTION_SACRIFICE_MSG,
+    ACTION_AREA_MSG,
+    ACTION_CAPTURE_MSG,
 )
 from src.utils.textures import MOVE_ACTION_TEXTURE, PASS_ACTION_TEXTURE
 
@@ -23,6 +27,9 @@ if TYPE_CHECKING:
     from utils.tools import BaseAttribute
     from src.abstractions.figure import BaseFigure
     from src.abstractions.cell import BaseCell
+    from numpy import ndarray
+    from src.abstractions.unit import BaseUnit
+    from src.utils.rng import Outcome
 
 
 class Action(BaseAction):
@@ -56,13 +63,15 @@ class Action(BaseAction):
     def realise(
         self,
         current_cell: "BaseCell",
-        target: "BaseCell" = None
+        target: "BaseCell" = None,
+        area: Sequence["BaseCell"] = (),
     ) -> None:
         """Совершить действие
 
         Args:
             current_cell: исходная клетка
             target: цель действия (графический объект)
+            area: клетки области поражения вокруг цели
         """
 
         # Если нет фигуры, то пропускаем
@@ -71,44 +80,158 @@ class Action(BaseAction):
 
         if self.attribute == ActionType.defend.value:
             self.figure.can_move = False
-            info_context.update(
-                value=ACTION_DEFEND_MSG.format(figure=self.figure.title)
-            )
+            info_context.update(template=ACTION_DEFEND_MSG, figure=self.figure.title)
             return
         else:
             if not target:
-                info_context.reset(value=ACTION_NO_TARGET_MSG)
+                info_context.reset(template=ACTION_NO_TARGET_MSG)
                 return
             if target.figure:
                 if self.attribute == ActionType.move.value:
-                    info_context.reset(value=ACTION_WRONG_MOVE_MSG)
+                    info_context.reset(template=ACTION_WRONG_MOVE_MSG)
                     return
                 else:
                     if (
                         self.figure == target.figure
                         and self.perk.attribute in (PerkType.melee.value, PerkType.elemental.value)
                     ):
-                        info_context.reset(value=ACTION_WRONG_USE_MSG)
+                        info_context.reset(template=ACTION_WRONG_USE_MSG)
                         return
             else:
                 if self.attribute == ActionType.use.value:
-                    info_context.reset(value=ACTION_NO_FIGURE_MSG)
+                    info_context.reset(template=ACTION_NO_FIGURE_MSG)
                     return
             self._create_action(
                 current_cell=current_cell,
                 target=target,
+                area=area,
             )
 
+    @property
+    def self_target(self) -> bool:
+        """Пропуск хода совершается на исходной клетке"""
+        return self.attribute == ActionType.defend.value
+
+    def can_realise(
+        self,
+        current_cell: "BaseCell",
+        target: "BaseCell" = None
+    ) -> bool:
+        """Можно ли совершить действие (те же правила, что и в realise, без побочных эффектов)
+        Дополнительно отбрасываются действия, которые ничего не изменят:
+        движение или пропуск хода фигуры, которая уже ходила, и использованная способность
+
+        Args:
+            current_cell: исходная клетка
+            target: цель действия
+
+        Returns:
+            bool: действие допустимо
+        """
+        if not self._figure:
+            return False
+        if self.attribute == ActionType.defend.value:
+            return self.figure.can_move
+        if not target:
+            return False
+        if self.attribute == ActionType.move.value:
+            return not target.figure and self.figure.can_move
+        if not target.figure:
+            return False
+        if (
+            self.figure == target.figure
+            and self.perk.attribute in (PerkType.melee.value, PerkType.elemental.value)
+        ):
+            return False
+        return self.perk.status == PerkStatus.active.value
+
+    def outcomes(self, target: "BaseCell") -> Tuple[Tuple[float, Optional["Outcome"]], ...]:
+        """Возможные исходы бросков действия с их точными вероятностями
+
+        Args:
+            target: цель действия (клетка)
+
+        Returns:
+            tuple: пары (вероятность, исход)
+        """
+        if self.attribute == ActionType.use.value:
+            return self.perk.outcomes(target=self.perk_target(target=target))
+        return super().outcomes(target=target)
+
+    def perk_target(self, target: "BaseCell") -> "BaseUnit":
+        """Цель способности (персонаж)
+
+        Args:
+            target: цель действия (клетка)
+
+        Returns:
+            BaseUnit: персонаж
+        """
+        if self.perk.attribute == PerkType.shield.value:
+            # если используется щит, то цель - сам персонаж
+            return self.figure.unit
+        else:
+            # иначе - другой юнит
+            return target.figure.unit
+
+    def perk_bonuses(self, target: "BaseCell") -> Dict[str, int]:
+        """Расчет бонусов от домена и здания
+
+        Args:
+            target: цель действия (клетка)
+
+        Returns:
+            dict: бонус домена и бонус здания
+        """
+        domain_bonus = (self.figure.domain.power - target.figure.domain.power) // 2
+        building_bonus = target.building.defence if target.building else 0
+        return {
+            "domain_bonus": domain_bonus,
+            "building_bonus": building_bonus,
+        }
+
+    def area_targets(self, target: "BaseCell", area: Sequence["BaseCell"]) -> List["BaseCell"]:
+        """Клетки области поражения с фигурами противника (кроме главной цели; свои фигуры не задеваются)
+        Область поражения есть только у активной способности
+
+        Args:
+            target: цель действия (клетка)
+            area: клетки области поражения
+
+        Returns:
+            list: клетки
+        """
+        if not area or self.perk.status != PerkStatus.active.value:
+            return []
+        return [
+            cell for cell in area
+            if cell.figure and cell is not target and cell.figure.domain != self.figure.domain
+        ]
+
+    def area_bonuses(self, cells: List["BaseCell"]) -> Dict[str, "ndarray"]:
+        """Бонусы от домена и здания для каждой цели области (аналог perk_bonuses)
+
+        Args:
+            cells: клетки целей области
+
+        Returns:
+            dict: бонусы домена и бонусы зданий (по одному значению на цель)
+        """
+        bonuses = [self.perk_bonuses(target=cell) for cell in cells]
+        return {key: array([bonus[key] for bonus in bonuses]) for key in bonuses[0]}
+
     def _create_action(
         self,
         current_cell: "BaseCell",
         target: "BaseCell",
+        area: Sequence["BaseCell"] = (),
     ) -> None:
         """Процесс совершения действия
 
         Args:
             current_cell: исходная клетка
             target: цель действия (клетка)
+            area: клетки области поражения вокруг цели
         """
         if self.attribute == ActionType.use.value:
             # if self.perk.attribute == PerkType.melee.value:
@@ -116,6 +239,7 @@ class Action(BaseAction):
             self.__use_perk(
                 current_cell=current_cell,
                 target=target,
+                area=area,
             )
         else:
             self.__create_move(
@@ -127,47 +251,50 @@ class Action(BaseAction):
         self,
         current_cell: "BaseCell",
         target: "BaseCell",
+        area: Sequence["BaseCell"] = (),
     ) -> None:
         """Использование способности
 
         Args:
             current_cell: исходная клетка
             target: цель действия (клетка)
+            area: клетки области поражения вокруг цели
         """
         info_context.set(
-            value=ACTION_USE_MSG.format(
-                figure=self.figure.title,
-                action=self.perk.title,
-                target=target.figure.title,
-            )
+            template=ACTION_USE_MSG,
+            figure=self.figure.title,
+            action=self.perk.title,
+            target=target.figure.title,
         )
-
-        # Расчет бонусов от домена и здания
-        domain_bonus = (self.figure.domain.power - target.figure.domain.power) // 2
-        building_bonus = target.building.defence if target.building else 0
+        # цели области выбираются до активации (пока способность активна)
+        splash = self.area_targets(target=target, area=area)
 
         # активируем способность, цель - фигура (персонаж фигуры)
-        if self.perk.attribute == PerkType.shield.value:
-            # если используется щит, то цель - сам персонаж
-            unit = self.figure.unit
-        else:
-            # иначе - другой юнит
-            unit = target.figure.unit
         self.perk.activate(
-            target=unit,
-            domain_bonus=domain_bonus,
-            building_bonus=building_bonus,
+            target=self.perk_target(target=target),
+            **self.perk_bonuses(target=target),
         )
 
+        # остальные цели области - одной серией бросков
+        if splash:
+            info_context.update(
+                template=ACTION_AREA_MSG,
+                kind=LogKind.damage.value,
+                action=self.perk.title,
+                targets=", ".join(cell.figure.title for cell in splash),
+            )
+            self.perk.splash(
+                targets=[cell.figure.unit for cell in splash],
+                generator=random_context.get().dice_generator,
+                **self.area_bonuses(cells=splash),
+            )
+
         # проверяем статус фигуры
         target.figure.check_status()
 
         # если фигура мертва
         if target.figure.status == FigureStatus.captive.value:
-            figure = target.figure
-            target.remove_figure()
-            target.domain.kill_figure(figure=figure)
-            self.figure.domain.get_prisoner(figure=figure)
+            self.__capture(target=target)
             # если атака ближнего боя - перемещаемся на клетку
             if self.perk.attribute == PerkType.melee.value:
                 self.__create_move(
@@ -175,6 +302,28 @@ class Action(BaseAction):
                     target=target,
                 )
 
+        for cell in splash:
+            cell.figure.check_status()
+            if cell.figure.status == FigureStatus.captive.value:
+                self.__capture(target=cell)
+
+    def __capture(self, target: "BaseCell") -> None:
+        """Взять в плен фигуру клетки
+
+        Args:
+            target: клетка фигуры
+        """
+        figure = target.figure
+        target.remove_figure()
+        target.domain.kill_figure(figure=figure)
+        self.figure.domain.get_prisoner(figure=figure)
+        info_context.update(
+            template=ACTION_CAPTURE_MSG,
+            kind=LogKind.capture.value,
+            figure=figure.title,
+            domain=self.figure.domain.title,
+        )
+
     def __create_move(
         self,
         current_cell: "BaseCell",
@@ -187,14 +336,14 @@ class Action(BaseAction):
             target: цель действия (клетка)
         """
         info_context.update(
-            value=ACTION_MOVE_MSG.format(
-                figure=self.figure.title,
-                cell=target.title,
-            )
+            template=ACTION_MOVE_MSG,
+            kind=LogKind.move.value,
+            figure=self.figure.title,
+            cell=target.title,
         )
 
         if not self.figure.can_move:
-            info_context.set(value=ACTION_CANNOT_MOVE_MSG)
+            info_context.set(template=ACTION_CANNOT_MOVE_MSG)
             return
         current_cell.remove_figure()
         target.capture(figure=self.figure)
@@ -259,13 +408,16 @@ class BuildingAction(BaseAction):
     def realise(
         self,
         current_cell: "BaseCell",
-        target: "BaseCell" = None
+        target: "BaseCell" = None,
+        area: Sequence["BaseCell"] = (),
     ) -> None:
         """Совершить действие
+        Действия зданий совершаются на клетке здания, область поражения не используется
 
         Args:
             current_cell: исходная клетка
             target: цель действия (графический объект)
+            area: клетки области поражения вокруг цели
         """
 
         # Если нет фигуры, то пропускаем
@@ -284,7 +436,7 @@ class BuildingAction(BaseAction):
         if self.attribute == ActionType.sacrifice.value:
             # то потребуются жертвы
             if not current_cell.domain.prisoners:
-                info_context.reset(value=ACTION_NO_SACRIFICE_MSG)
+                info_context.reset(template=ACTION_NO_SACRIFICE_MSG)
                 return
 
         self._create_action(
@@ -292,6 +444,48 @@ class BuildingAction(BaseAction):
             target=current_cell,
         )
 
+    @property
+    def self_target(self) -> bool:
+        """Действия зданий всегда совершаются на клетке здания"""
+        return True
+
+    def outcomes(self, target: "BaseCell") -> Tuple[Tuple[float, Optional["Outcome"]], ...]:
+        """Возможные исходы бросков действия (цель способности - фигура в здании)
+
+        Args:
+            target: цель действия (клетка)
+
+        Returns:
+            tuple: пары (вероятность, исход)
+        """
+        return self.perk.outcomes(target=self.figure.unit)
+
+    def can_realise(
+        self,
+        current_cell: "BaseCell",
+        target: "BaseCell" = None
+    ) -> bool:
+        """Можно ли совершить действие (те же правила, что и в realise, без побочных эффектов)
+
+        Args:
+            current_cell: исходная клетка
+            target: цель действия
+
+        Returns:
+            bool: действие допустимо
+        """
+        if not self._figure:
+            return False
+        if (
+                self.attribute == ActionType.only_building.value
+                and
+                (not target or current_cell.domain != target.domain)
+        ):
+            return False
+        if self.attribute == ActionType.sacrifice.value and not current_cell.domain.prisoners:
+            return False
+        return self.perk.status == PerkStatus.active.value
+
     def _create_action(
         self,
         current_cell: "BaseCell",
@@ -305,18 +499,14 @@ class BuildingAction(BaseAction):
         """
         # если это жертва алтарю
         if self.attribute == ActionType.sacrifice.value:
-            # то потребуются жертвы
-            prisoners = current_cell.domain.prisoners
-            for prisoner in prisoners:
-                # берем первую попавшуюся жертву
-                victim = prisoners.pop(prisoner)
+            # то потребуются жертвы: берем первую попавшуюся
+            victim = current_cell.domain.release_prisoner()
+            if victim:
                 info_context.set(
-                    value=ACTION_SACRIFICE_MSG.format(
-                        figure=self.figure.title,
-                        target=victim.title,
-                    )
+                    template=ACTION_SACRIFICE_MSG,
+                    figure=self.figure.title,
+                    target=victim.title,
                 )
-                break
 
         self.__use_perk(
             target=target,
@@ -0,0 +1,210 @@
+from typing import TYPE_CHECKING, Iterable, Dict, List
+
+from src.utils.enums import ModelEvent
+
+if TYPE_CHECKING:
+    from src.abstractions.cell import BaseCell
+    from src.abstractions.domain import BaseDomain
+    from src.utils.tools import BaseAttribute
+
+
+class Bitboard:
+    """Битовое представление доски
+    Каждой клетке соответствует бит целого числа (строка за строкой, слева направо).
+    Маски занятости по доменам, зданий и клеток доменов обновляются по событиям клеток,
+    поэтому запросы соседей и подсчет клеток сводятся к сдвигам и подсчету битов
+    """
+
+    def __init__(self, cells: Iterable["BaseCell"]):
+        """Инициализация битовой доски
+
+        Args:
+            cells: клетки доски
+        """
+        cells = list(cells)
+        rows = [cell.index.row for cell in cells]
+        columns = [cell.index.column for cell in cells]
+        self._min_row, self._min_column = min(rows), min(columns)
+        self._width = max(columns) - self._min_column + 1
+        self._height = max(rows) - self._min_row + 1
+
+        # номер клетки -> бит и бит -> номер клетки
+        self._bits: Dict[int, int] = {}
+        self._ids: Dict[int, int] = {}
+        self._board = 0
+        for cell in cells:
+            bit = self.bit(row=cell.index.row, column=cell.index.column)
+            self._bits[cell.index.id] = bit
+            self._ids[bit] = cell.index.id
+            self._board |= 1 << bit
+
+        # маски крайних столбцов (чтобы сдвиги не переносили биты между строками)
+        first_column = sum(1 << (row * self._width) for row in range(self._height))
+        self._not_first_column = self._board & ~first_column
+        self._not_last_column = self._board & ~(first_column << (self._width - 1))
+
+        self._occupancy: Dict[str, int] = {}
+        self._owned: Dict[str, int] = {}
+        self._buildings = 0
+        for cell in cells:
+            self._update(cell=cell, event=ModelEvent.figure.value)
+            self._update(cell=cell, event=ModelEvent.domain.value)
+            self._update(cell=cell, event=ModelEvent.building.value)
+            cell.subscribe(observer=self._update)
+
+    @property
+    def board(self) -> int:
+        """Маска всех клеток доски"""
+        return self._board
+
+    @property
+    def occupied(self) -> int:
+        """Маска клеток с фигурами"""
+        mask = 0
+        for occupancy in self._occupancy.values():
+            mask |= occupancy
+        return mask
+
+    @property
+    def buildings(self) -> int:
+        """Маска клеток со зданиями"""
+        return self._buildings
+
+    def bit(self, row: int, column: int) -> int:
+        """Номер бита клетки
+
+        Args:
+            row: строка
+            column: столбец
+
+        Returns:
+            int: номер бита
+        """
+        return (row - self._min_row) * self._width + (column - self._min_column)
+
+    def mask(self, ids: Iterable[int]) -> int:
+        """Маска клеток по номерам
+
+        Args:
+            ids: номера клеток
+
+        Returns:
+            int: маска
+        """
+        mask = 0
+        for cell_id in ids:
+            mask |= 1 << self._bits[cell_id]
+        return mask
+
+    def ids(self, mask: int) -> List[int]:
+        """Номера клеток маски
+
+        Args:
+            mask: маска
+
+        Returns:
+            list: номера клеток
+        """
+        ids = []
+        while mask:
+            low = mask & -mask
+            ids.append(self._ids[low.bit_length() - 1])
+            mask ^= low
+        return ids
+
+    def occupancy(self, domain: "BaseDomain") -> int:
+        """Маска клеток с фигурами домена
+
+        Args:
+            domain: домен
+
+        Returns:
+            int: маска
+        """
+        return self._occupancy.get(domain.name, 0)
+
+    def owned(self, domain: "BaseDomain") -> int:
+        """Маска клеток, принадлежащих домену
+
+        Args:
+            domain: домен
+
+        Returns:
+            int: маска
+        """
+        return self._owned.get(domain.name, 0)
+
+    def neighbors(self, mask: int, radius: int = 1) -> int:
+        """Маска клеток в пределах радиуса по горизонтали или вертикали (включая сами клетки)
+
+        Args:
+            mask: маска исходных клеток
+            radius: радиус
+
+        Returns:
+            int: маска
+        """
+        horizontal = vertical = mask
+        for _ in range(min(radius, max(self._width, self._height))):
+            horizontal |= (
+                ((horizontal << 1) & self._not_first_column)
+                | ((horizontal >> 1) & self._not_last_column)
+            )
+            vertical |= ((vertical << self._width) & self._board) | (vertical >> self._width)
+        return horizontal | vertical
+
+    @staticmethod
+    def count(mask: int) -> int:
+        """Количество клеток маски
+
+        Args:
+            mask: маска
+
+        Returns:
+            int: количество клеток
+        """
+        return mask.bit_count()
+
+    def _update(self, cell: "BaseCell", event: "BaseAttribute") -> None:
+        """Обновить маски по событию клетки
+
+        Args:
+            cell: клетка
+            event: событие
+        """
+        bit = 1 << self._bits[cell.index.id]
+        if event == ModelEvent.figure.value:
+            self._occupancy = self._move_bit(
+                masks=self._occupancy,
+                bit=bit,
+                key=cell.figure.domain.name if cell.figure else None,
+            )
+        elif event == ModelEvent.domain.value:
+            self._owned = self._move_bit(
+                masks=self._owned,
+                bit=bit,
+                key=cell.domain.name,
+            )
+        elif event == ModelEvent.building.value:
+            if cell.building:
+                self._buildings |= bit
+            else:
+                self._buildings &= ~bit
+
+    @staticmethod
+    def _move_bit(masks: Dict[str, int], bit: int, key: str = None) -> Dict[str, int]:
+        """Снять бит со всех масок и установить его в маске ключа
+
+        Args:
+            masks: маски по ключам
+            bit: бит клетки
+            key: ключ (без ключа бит только снимается)
+
+        Returns:
+            dict: маски
+        """
+        for name in masks:
+            masks[name] &= ~bit
+        if key is not None:
+            masks[key] = masks.get(key, 0) | bit
+        return masks
@@ -1,14 +1,18 @@
-from typing import TYPE_CHECKING, Iterable, Optional
-from arcade import color
+from typing import TYPE_CHECKING, Optional, FrozenSet, Iterator, Callable, NamedTuple, Dict, List, Tuple, Union
 
 from src.abstractions.board import BaseBoard
 from src.models.collection import FigureCollection, CellCollection, BuildingCollection
 from src.models.cell import Cell
-from src.board.figures import get_figures_position
-from src.board.buildings import get_buildings_position
+from src.models.bitboard import Bitboard
+from src.models.spatial import SpatialIndex
+from src.models.zobrist import ZobristHash
+from src.models.journal import ChangeJournal
+from src.models.scheduler import TurnScheduler
+from src.board.layouts import standard_layout
 from src.board.domains import RedDomain, BlueDomain, GrayDomain
-from src.utils.enums import Time
-from src.utils.tools import info_context, Index
+from src.utils.enums import Time, ReplayCommand
+from src.utils.tools import info_context, Index, BoardState, BoardLayout, StateKey
+from src.utils.descriptions import FIGURE_NAME
 from src.utils.messages import (
     CELL_SELECT_MSG,
     FIGURE_SELECT_MSG,
@@ -21,14 +25,23 @@ from src.utils.messages import (
 if TYPE_CHECKING:
     from src.abstractions.cell import BaseCell
     from src.abstractions.action import BaseAction
+    from src.abstractions.domain import BaseDomain
+    from src.abstractions.figure import BaseFigure
     from collections import UserDict
 
 
 class Board(BaseBoard):
-    """Модель доски"""
+    """Модель доски
+    Доска, клетки, фигуры и здания - обычные объекты без графики,
+    поэтому правила игры работают и без окна (графика лишь наблюдает за ними)
+    """
 
-    def __init__(self):
-        """Инициализация доски"""
+    def __init__(self, layout: BoardLayout = None):
+        """Инициализация доски
+
+        Args:
+            layout: расстановка (по умолчанию - стандартная доска)
+        """
 
         blue_domain = BlueDomain(
             title=Time.night.value,
@@ -51,49 +64,56 @@ class Board(BaseBoard):
             cells=cells,
             figures=figures,
             buildings=buildings,
+            layout=layout if layout is not None else standard_layout(),
         )
 
     def initialize_cells(self):
-        """Создать клетки"""
-        for row in range(1, 8):
-            for column in range(1, 7):
-                if row <= 2:
-                    domain = self._blue_domain
-                elif row >= 6:
-                    domain = self._red_domain
-                else:
-                    domain = self._grey_domain
-
+        """Создать клетки (размеры доски и полосы доменов - из расстановки)"""
+        layout = self._layout
+        domains = {}
+        for band in layout.bands:
+            for row in range(band.first_row, band.last_row + 1):
+                domains[row] = self.get_domain(name=band.domain)
+        for row in range(1, layout.rows + 1):
+            domain = domains.get(row, self._grey_domain)
+            for column in range(1, layout.columns + 1):
                 index = Index(column=column, row=row)
                 new_cell = Cell(
                     index=index,
                     domain=domain,
                 )
-                self._cells[new_cell.index.name] = new_cell
+                self._cells[new_cell.index.id] = new_cell
+
+        self._spatial = SpatialIndex(cells=self._cells.values())
+        self._bitboard = Bitboard(cells=self._cells.values())
 
     def initialize_buildings(self):
         """Создать здания"""
+        buildings_position = dict(self._layout.buildings)
         for cell in self._cells.values():
-            buildings_position = get_buildings_position()
-            building_fabric = buildings_position.get(cell.index.name)
+            building_fabric = buildings_position.get(cell.index.id)
             if building_fabric:
                 new_building = building_fabric(
                     index=cell.index,
                     domain=cell.domain,
                 )
                 cell.building = new_building
-                self._buildings[new_building.index.name] = new_building
+                self._buildings[new_building.index.id] = new_building
 
     def initialize_figures(self):
-        """Создать фигуры"""
-        figures_position = get_figures_position()
+        """Создать фигуры
+        Имена фигур - ключи доски, поэтому повторяющаяся фигура домена получает имя с позицией
+        """
+        figures_position = dict(self._layout.figures)
         for cell in self._cells.values():
-            figure_fabric = figures_position.get(cell.index.name)
+            figure_fabric = figures_position.get(cell.index.id)
             if figure_fabric:
                 new_figure = figure_fabric(
                     index=cell.index,
                     domain=cell.domain,
                 )
+                if new_figure.name in self._figures:
+                    new_figure.core.name = FIGURE_NAME.format(name=new_figure.name, index=cell.index)
                 cell.figure = new_figure
                 self._figures[new_figure.name] = new_figure
 
@@ -113,6 +133,41 @@ class Board(BaseBoard):
                 if figure.domain == self._red_domain
             ]
         )
+        self._initialize_journal()
+        self._scheduler = TurnScheduler(figures=self._figures.values(), buildings=self._buildings.values())
+
+    def _initialize_journal(self) -> None:
+        """Подключить журнал изменений к объектам доски, запомнить их состояние и создать хэш Зобриста
+        Фигура меняется вместе с персонажем и его способностями, здание - вместе со своей способностью
+        """
+        journal = ChangeJournal()
+        self._snapshots: Dict[StateKey, Callable[[], NamedTuple]] = {}
+        for cell_id, cell in self._cells.items():
+            journal.watch(source=cell, key=("cell", cell_id))
+            self._snapshots[("cell", cell_id)] = cell.snapshot
+        for name, figure in self._figures.items():
+            for source in (figure, figure.unit, *figure.unit.get_perks().values()):
+                journal.watch(source=source, key=("figure", name))
+            self._snapshots[("figure", name)] = figure.snapshot
+        for building_id, building in self._buildings.items():
+            journal.watch(source=building, key=("building", building_id))
+            if building.action:
+                journal.watch(source=building.action.perk, key=("building", building_id))
+            self._snapshots[("building", building_id)] = building.snapshot
+        for domain in (self._red_domain, self._blue_domain, self._grey_domain):
+            journal.watch(source=domain, key=("domain", domain.name))
+            self._snapshots[("domain", domain.name)] = domain.snapshot
+
+        self._journal = journal
+        # состояния объектов на момент последнего снимка (пересчитываются только изменившиеся)
+        self._states = {key: snapshot() for key, snapshot in self._snapshots.items()}
+        self._states_clock = journal.clock
+        self._zobrist = ZobristHash(
+            journal=journal,
+            cells=self._cells.values(),
+            figures=self._figures.values(),
+            buildings=self._buildings.values(),
+        )
 
     def select_cell(
         self,
@@ -126,12 +181,13 @@ class Board(BaseBoard):
         Returns:
             bool: успешно выбрана
         """
-        cell = self._cells.get(index.name)
+        self.record(ReplayCommand.select_cell.value, index.row, index.column)
+        cell = self._cells.get(index.id)
         if cell:
             self._current_cell = cell
-            info_context.set(value=CELL_SELECT_MSG.format(cell=cell))
+            info_context.set(template=CELL_SELECT_MSG, cell=str(cell))
             if cell.figure:
-                info_context.update(value=FIGURE_SELECT_MSG.format(figure=cell.figure))
+                info_context.update(template=FIGURE_SELECT_MSG, figure=str(cell.figure))
                 if cell.figure.domain.turn:
                     # действие по умолчанию - движение
                     actions = self.get_figure_action_list()
@@ -151,6 +207,7 @@ class Board(BaseBoard):
         Args:
             action: действие
         """
+        self.record(ReplayCommand.select_action.value, action.name)
         self._current_action = action
 
     def select_target(
@@ -165,21 +222,22 @@ class Board(BaseBoard):
         Returns:
             bool: успешно выбрана
         """
+        self.record(ReplayCommand.select_target.value, index.row, index.column)
         if not self._current_cell:
-            info_context.set(value=NO_CELL_MSG)
+            info_context.set(template=NO_CELL_MSG)
         elif not self._current_cell.figure.domain.turn:
-            info_context.set(value=WRONG_DOMAIN_MSG.format(domain=self._time))
+            info_context.set(template=WRONG_DOMAIN_MSG, domain=self._time)
         elif not self._current_action:
-            info_context.set(value=NO_FIGURE_MSG)
+            info_context.set(template=NO_FIGURE_MSG)
         else:
-            if index.name in self.get_cell_neighbors(
+            if index.id in self.get_cell_neighbors(
                 radius=self._current_action.radius,
             ):
-                cell = self._cells.get(index.name)
+                cell = self._cells.get(index.id)
                 self._start_action(target=cell)
                 return True
             else:
-                info_context.set(value=WRONG_RADIUS_MSG)
+                info_context.set(template=WRONG_RADIUS_MSG)
 
         return False
 
@@ -192,58 +250,207 @@ class Board(BaseBoard):
         if self._current_cell.figure:
             return self._current_cell.get_figure_actions()
 
-    def get_cell_neighbors(self, radius: int = 1) -> Iterable[str]:
+    def get_cell_neighbors(self, radius: int = 1) -> FrozenSet[int]:
         """Получить список индексов допустимых клеток в качестве цели (соседей)
 
         Returns:
-            iterable: список индексов соседних клеток
+            frozenset: индексы соседних клеток (включая выбранную клетку)
         """
-
         if self._current_cell:
-            indexes = []
-            for r in range(1, radius + 1):
-                indexes.extend([(-r, 0), (r, 0), (0, -r), (0, r)])
-            cell_neighbors = [
-                Index(
-                    column=self._current_cell.index.column + i,
-                    row=self._current_cell.index.row + j,
-                ).name
-                for i, j in indexes
-            ]
-            cell_neighbors.append(self._current_cell.index.name)
+            return self.get_neighbors(cell_id=self._current_cell.index.id, radius=radius)
+        return frozenset()
+
+    def get_neighbors(self, cell_id: int, radius: int = 1) -> FrozenSet[int]:
+        """Получить номера клеток в пределах радиуса от клетки (включая ее саму)
+        Значения берутся из пространственного индекса доски
+
+        Args:
+            cell_id: номер клетки
+            radius: радиус
+
+        Returns:
+            frozenset: номера клеток
+        """
+        return self._spatial.neighbors(cell_id=cell_id, radius=radius)
+
+    def get_footprint(self, action: "BaseAction", target: "BaseCell") -> Tuple["BaseCell", ...]:
+        """Получить клетки области поражения действия вокруг цели (без самой цели)
+        Номера клеток области берутся из пространственного индекса доски
+
+        Args:
+            action: действие
+            target: цель действия
+
+        Returns:
+            tuple: клетки (в порядке номеров)
+        """
+        if not action.area:
+            return ()
+        return tuple(
+            self._cells[cell_id]
+            for cell_id in self._spatial.footprint(
+                cell_id=target.index.id,
+                radius=action.area,
+                shape=action.shape,
+            )
+            if cell_id != target.index.id
+        )
+
+    def legal_actions(
+        self,
+        domain: "BaseDomain" = None,
+    ) -> Iterator[Tuple["BaseFigure", "BaseAction", "BaseCell"]]:
+        """Все допустимые действия домена (фигура, действие, клетка-цель)
+        Действия перебираются лениво: клетки фигур берутся из битовой доски,
+        цели - из пространственного индекса, допустимость проверяется без побочных эффектов.
+        Доску нельзя менять до окончания перебора (при необходимости сохраните результат в список)
+
+        Args:
+            domain: домен (по умолчанию - домен, который сейчас ходит)
+
+        Returns:
+            iterator: допустимые действия
+        """
+        domain = domain or self.current_domain
+        if not domain or not domain.turn:
+            return
+        for cell_id in self._bitboard.ids(self._bitboard.occupancy(domain=domain)):
+            cell = self._cells[cell_id]
+            figure = cell.figure
+            for action in figure.get_actions().values():
+                if action.self_target:
+                    targets = (cell_id,)
+                else:
+                    targets = self.get_neighbors(cell_id=cell_id, radius=action.radius)
+                for target_id in targets:
+                    target = self._cells[target_id]
+                    if action.can_realise(current_cell=cell, target=target):
+                        yield figure, action, target
+
+    def perform(
+        self,
+        current_cell: "BaseCell",
+        action: "BaseAction",
+        target: "BaseCell",
+    ) -> None:
+        """Совершить действие без выбора клеток (для компьютерных игроков)
+
+        Args:
+            current_cell: исходная клетка
+            action: действие фигуры исходной клетки
+            target: цель действия
+        """
+        self.record(ReplayCommand.perform.value, current_cell.index.id, action.name, target.index.id)
+        self._realise(current_cell=current_cell, action=action, target=target)
+
+    def snapshot(self) -> BoardState:
+        """Снимок состояния доски
+        Заново снимаются только объекты, изменившиеся после прошлого снимка
+
+        Returns:
+            BoardState: состояние
+        """
+        if self._states_clock != self._journal.clock:
+            for key in self._journal.changed(since=self._states_clock):
+                self._states[key] = self._snapshots[key]()
+            self._states_clock = self._journal.clock
+        return BoardState(
+            started=self._started,
+            time=self._time,
+            objects=dict(self._states),
+            source=self._source,
+            stamp=self._journal.clock,
+        )
+
+    def restore(self, state: BoardState) -> None:
+        """Восстановить состояние доски из снимка
+        Снимок этой доски затрагивает только объекты, изменившиеся после него (по журналу);
+        снимок может быть сделан и на другой доске с той же расстановкой (объекты ищутся по ключам)
+
+        Args:
+            state: состояние
+        """
+        self._started = state.started
+        self._time = state.time
+        self._current_cell = None
+        self._current_action = None
+        if state.source == self._source:
+            keys = self._journal.changed(since=state.stamp)
         else:
-            cell_neighbors = []
+            keys = list(state.objects)
+        changed: Dict[str, List[Union[str, int]]] = {"figure": [], "domain": [], "cell": [], "building": []}
+        for kind, key in keys:
+            changed[kind].append(key)
+        objects = state.objects
 
-        return cell_neighbors
+        for name in changed["figure"]:
+            self._figures[name].restore(state=objects[("figure", name)])
+        for name in changed["domain"]:
+            self.get_domain(name=name).restore(state=objects[("domain", name)], figures=self._figures)
+        # сначала убираем фигуры, которые стоят не на своих клетках, затем расставляем
+        for cell_id in changed["cell"]:
+            cell = self._cells[cell_id]
+            if cell.figure and cell.figure.name != objects[("cell", cell_id)].figure:
+                cell.remove_figure()
+        for cell_id in changed["cell"]:
+            cell = self._cells[cell_id]
+            cell_state = objects[("cell", cell_id)]
+            if cell_state.figure and not cell.figure:
+                cell.figure = self._figures[cell_state.figure]
+            if cell.domain.name != cell_state.domain:
+                cell.restore_domain(target=self.get_domain(name=cell_state.domain))
+        for building_id in changed["building"]:
+            building_state = objects[("building", building_id)]
+            self._buildings[building_id].restore(
+                state=building_state,
+                domain=self.get_domain(name=building_state.domain),
+            )
 
     def start_circle(self):
         """Начать цикл битвы"""
+        self.record(ReplayCommand.start_circle.value)
         self._started = True
         self._time = Time.day.value
         self._red_domain.end_circle()
 
     def finish_circle(self):
         """Завершить один цикл битвы"""
+        self.record(ReplayCommand.finish_circle.value)
         # в зависимости от цикла дня, пропускаем ходы доменов
         if self._time == Time.day.value:
             self._time = Time.night.value
             self._red_domain.end_turn()
-            self._blue_domain.end_circle()
+            self._blue_domain.end_circle(expiring=self._scheduler.expiring(domain=self._blue_domain))
         else:
             self._time = Time.day.value
             self._blue_domain.end_turn()
-            self._red_domain.end_circle()
-        # активируем эффекты зданий
-        for buildings in self._buildings.values():
-            buildings.end_turn()
-        # проверяем статусы фигур
-        for figure in self._figures.values():
+            self._red_domain.end_circle(expiring=self._scheduler.expiring(domain=self._red_domain))
+        # активируем эффекты зданий (только зданий с фигурой или потраченной способностью)
+        for building in self._scheduler.buildings():
+            building.end_turn()
+        # проверяем статусы фигур, здоровье которых изменилось
+        for figure in self._scheduler.damaged():
             figure.check_status()
 
     def _start_action(self, target: "BaseCell"):
-        self._current_action.realise(
+        # выбор цели уже записан в запись партии, действие совершается без повторной записи
+        self._realise(
             current_cell=self._current_cell,
+            action=self._current_action,
+            target=target,
+        )
+
+    def _realise(
+        self,
+        current_cell: "BaseCell",
+        action: "BaseAction",
+        target: "BaseCell",
+    ) -> None:
+        """Совершить действие и сбросить выбор клетки и действия"""
+        action.realise(
+            current_cell=current_cell,
             target=target,
+            area=self.get_footprint(action=action, target=target) if target else (),
         )
         self._current_cell = None
         self._current_action = None
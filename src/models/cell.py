@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from src.abstractions.cell import BaseCell, BaseCellSprite
+from src.abstractions.cell import BaseCell
 from src.utils.tools import SpriteCore
 from src.utils.descriptions import CELL_NAME
 
@@ -13,25 +13,8 @@ if TYPE_CHECKING:
     from collections import UserDict
 
 
-class CellSprite(BaseCellSprite):
-    """Абстрактная UI модель клетки игральной доски"""
-
-    def __init__(
-        self,
-        core: "SpriteCore",
-    ):
-        """Инициализация клетки
-
-        Args:
-            core: свойства графического объекта
-        """
-        super().__init__(
-            core=core,
-        )
-
-
 class Cell(BaseCell):
-    """UI модель клетки игральной доски"""
+    """Модель клетки игральной доски"""
 
     def __init__(
         self,
@@ -44,6 +27,7 @@ class Cell(BaseCell):
 
         Args:
             index: свойства графического объекта
+            domain: домен
             building: здание клетки
             figure: фигура клетки
         """
@@ -53,11 +37,8 @@ class Cell(BaseCell):
             texture=domain.texture,
             domain=domain,
         )
-        sprite = CellSprite(
-            core=core,
-        )
         super().__init__(
-            sprite=sprite,
+            core=core,
             building=building,
             figure=figure,
         )
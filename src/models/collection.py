@@ -49,7 +49,7 @@ class CellCollection(UserDict):
     ):
         if cells:
             collection = {
-                cell.index.name: cell
+                cell.index.id: cell
                 for cell in cells
             }
         else:
@@ -65,7 +65,7 @@ class BuildingCollection(UserDict):
     ):
         if buildings:
             collection = {
-                building.index.name: building
+                building.index.id: building
                 for building in buildings
             }
         else:
@@ -1,10 +1,20 @@
-from random import randint
 from typing import TYPE_CHECKING
+from numpy import full, where, maximum, minimum
 
 from src.abstractions.dice import BaseDice, BaseRoll
-from src.utils.enums import RollModifier
-from src.utils.decorators import modify_roll
+from src.utils.enums import RollModifier, LogKind
+from src.utils.decorators import modify_roll, modify_rolls
 from src.utils.tools import info_context
+from src.utils.rng import random_context, BucketBackend, BucketGenerator
+from src.utils.probability import (
+    uniform_distribution,
+    point_distribution,
+    shift_distribution,
+    add_distributions,
+    sum_distribution,
+    modify_distribution,
+    success_probability,
+)
 from src.utils.constants import (
     CRITICAL_DICE_SIDE,
     CRITICAL_ROLL_RESISTANCE,
@@ -17,7 +27,10 @@ from src.utils.messages import (
 )
 
 if TYPE_CHECKING:
+    from numpy import ndarray
+    from numpy.random import Generator
     from src.utils.tools import BaseAttribute
+    from src.utils.probability import Distribution
 
 
 class Dice(BaseDice):
@@ -42,9 +55,29 @@ class Dice(BaseDice):
         Returns:
             int: значение
         """
-        value = randint(a=1, b=self._side)
+        value = random_context.get().randint(1, self._side)
         return value
 
+    def rolls(self, size: int, generator: "Generator") -> "ndarray":
+        """Результаты серии бросков кости (векторно)
+
+        Args:
+            size: количество бросков
+            generator: генератор случайных чисел
+
+        Returns:
+            ndarray: значения от 1 до side
+        """
+        return generator.integers(low=1, high=self._side + 1, size=size)
+
+    def distribution(self) -> "Distribution":
+        """Точное распределение броска кости (равномерное от 1 до side)
+
+        Returns:
+            Distribution: распределение
+        """
+        return uniform_distribution(lower=1, higher=self._side)
+
 
 class StaticDice(BaseDice):
     """Модель статичной кости"""
@@ -66,6 +99,26 @@ class StaticDice(BaseDice):
         """
         return self._side
 
+    def rolls(self, size: int, generator: "Generator") -> "ndarray":
+        """Результаты серии бросков кости (векторно)
+
+        Args:
+            size: количество бросков
+            generator: генератор случайных чисел
+
+        Returns:
+            ndarray: значения, равные side
+        """
+        return full(shape=size, fill_value=self._side)
+
+    def distribution(self) -> "Distribution":
+        """Точное распределение броска кости (всегда side)
+
+        Returns:
+            Distribution: распределение
+        """
+        return point_distribution(value=self._side)
+
 
 class DiceRoll(BaseRoll):
     """Модель броска кости"""
@@ -99,17 +152,29 @@ class DiceRoll(BaseRoll):
         Returns:
             int: результат
         """
-        value = self._action()
-        real_bonus = max(bonus, 0)
-        real_penalty = min(real_bonus - penalty, 0)
+        value = self._value()
+        real_penalty = self._real_penalty(bonus=bonus, penalty=penalty)
         info_context.update(
-            value=DICE_ROLL_MSG.format(
-                value=value,
-                penalty=real_penalty,
-            )
+            template=DICE_ROLL_MSG,
+            kind=LogKind.roll.value,
+            value=value,
+            penalty=real_penalty,
         )
         return value + real_penalty
 
+    def _value(self) -> int:
+        """Результат броска без штрафа
+        При поиске хода значение берется из точного распределения суммы (а не из каждой кости),
+        иначе кость бросается
+
+        Returns:
+            int: результат
+        """
+        backend = random_context.get()
+        if isinstance(backend, BucketBackend):
+            return backend.value(distribution=self.distribution())
+        return self._action()
+
     @modify_roll
     def _action(self) -> int:
         """Бросить кость
@@ -123,6 +188,100 @@ class DiceRoll(BaseRoll):
             value += self._dice.roll()
         return value
 
+    @property
+    def times(self) -> int:
+        """Количество бросков"""
+        return self._times
+
+    @staticmethod
+    def _real_penalty(bonus: int = 0, penalty: int = 0) -> int:
+        """Итоговый штраф
+        Бонус только гасит штраф и не может увеличить результат
+
+        Args:
+            bonus: бонус
+            penalty: штраф
+
+        Returns:
+            int: значение (не больше 0)
+        """
+        real_bonus = max(bonus, 0)
+        return min(real_bonus - penalty, 0)
+
+    @staticmethod
+    def _real_penalties(bonus: "ndarray | int" = 0, penalty: "ndarray | int" = 0) -> "ndarray | int":
+        """Итоговый штраф для серии бросков (векторный аналог _real_penalty)
+
+        Args:
+            bonus: бонус (одно значение или по одному на бросок)
+            penalty: штраф (одно значение или по одному на бросок)
+
+        Returns:
+            ndarray | int: значения (не больше 0)
+        """
+        return minimum(maximum(bonus, 0) - penalty, 0)
+
+    def distribution(self, bonus: int = 0, penalty: int = 0) -> "Distribution":
+        """Точное распределение результата броска (аналог action)
+        Кость бросается times раз, результаты складываются,
+        модификатор учитывается как максимум/минимум двух таких сумм
+
+        Args:
+            bonus: бонус (только для погашения штрафа)
+            penalty: штраф (уменьшает конечное значение)
+
+        Returns:
+            Distribution: распределение
+        """
+        value = modify_distribution(
+            distribution=sum_distribution(
+                distribution=self._dice.distribution(),
+                times=self._times,
+            ),
+            modifier=self._modifier,
+        )
+        return shift_distribution(
+            distribution=value,
+            value=self._real_penalty(bonus=bonus, penalty=penalty),
+        )
+
+    def actions(
+        self,
+        size: int,
+        generator: "Generator",
+        bonus: "ndarray | int" = 0,
+        penalty: "ndarray | int" = 0,
+    ) -> "ndarray":
+        """Бросить кость size раз (векторный аналог action)
+
+        Args:
+            size: количество бросков
+            generator: генератор случайных чисел
+            bonus: бонус (только для погашения штрафа; одно значение или по одному на бросок)
+            penalty: штраф (уменьшает конечное значение; одно значение или по одному на бросок)
+
+        Returns:
+            ndarray: результаты
+        """
+        if isinstance(generator, BucketGenerator):
+            value = full(shape=size, fill_value=generator.value(distribution=self.distribution()))
+        else:
+            value = self._actions(size=size, generator=generator)
+        return value + self._real_penalties(bonus=bonus, penalty=penalty)
+
+    @modify_rolls
+    def _actions(self, size: int, generator: "Generator") -> "ndarray":
+        """Бросить кость size раз
+        Каждый бросок состоит из times бросков, результаты складываются
+
+        Returns:
+            ndarray: результаты
+        """
+        value = full(shape=size, fill_value=0)
+        for time in range(1, self._times + 1):
+            value += self._dice.rolls(size=size, generator=generator)
+        return value
+
 
 class DifficultyRoll(BaseRoll):
     """Модель броска многогранной кости на шанс попадания"""
@@ -163,23 +322,19 @@ class DifficultyRoll(BaseRoll):
         success = value + bonus
         failure = penalty + self.resistance
         if value == self._dice.lower:
-            info_context.update(
-                value=CRIT_FAILURE_MSG.format(value=value)
-            )
+            info_context.update(template=CRIT_FAILURE_MSG, kind=LogKind.hit.value, value=value)
             return False
         elif value == self._dice.higher:
-            info_context.update(
-                value=CRIT_SUCCESS_MSG.format(value=value)
-            )
+            info_context.update(template=CRIT_SUCCESS_MSG, kind=LogKind.hit.value, value=value)
             return True
         else:
             result = success >= failure
             info_context.update(
-                value=CHECK_ROLL_MSG.format(
-                    success=success,
-                    failure=failure,
-                    result="Успех!" if result else "Провал!"
-                )
+                template=CHECK_ROLL_MSG,
+                kind=LogKind.hit.value,
+                success=success,
+                failure=failure,
+                result="Успех!" if result else "Провал!",
             )
             return result
 
@@ -194,6 +349,73 @@ class DifficultyRoll(BaseRoll):
         value = self._dice.roll()
         return value
 
+    def actions(
+        self,
+        size: int,
+        generator: "Generator",
+        bonus: "ndarray | int" = 0,
+        penalty: "ndarray | int" = 0,
+    ) -> "ndarray":
+        """Бросить кость на попадание size раз (векторный аналог action)
+
+        Args:
+            size: количество бросков
+            generator: генератор случайных чисел
+            bonus: бонус (увеличивает шанс попадания)
+            penalty: штраф (уменьшает шанс попадания)
+
+        Returns:
+            ndarray: результаты (да/нет)
+        """
+        value = self._actions(size=size, generator=generator)
+        success = value + bonus
+        failure = penalty + self.resistances(size=size, generator=generator)
+        result = success >= failure
+        result = where(value == self._dice.higher, True, result)
+        result = where(value == self._dice.lower, False, result)
+        return result
+
+    def probability(
+        self,
+        bonus: int = 0,
+        penalty: int = 0,
+        penalty_distribution: "Distribution" = None,
+    ) -> float:
+        """Точная вероятность успеха броска на попадание (аналог action)
+        Учитываются критический успех и критический провал
+
+        Args:
+            bonus: бонус (увеличивает шанс попадания)
+            penalty: штраф (уменьшает шанс попадания)
+            penalty_distribution: распределение случайной части штрафа (например, спасброска)
+
+        Returns:
+            float: вероятность
+        """
+        failure = self.resistance_distribution()
+        if penalty_distribution:
+            failure = add_distributions(first=failure, second=penalty_distribution)
+        return success_probability(
+            distribution=modify_distribution(
+                distribution=self._dice.distribution(),
+                modifier=self._modifier,
+            ),
+            lower=self._dice.lower,
+            higher=self._dice.higher,
+            bonus=bonus,
+            failure=shift_distribution(distribution=failure, value=penalty),
+        )
+
+    @modify_rolls
+    def _actions(self, size: int, generator: "Generator") -> "ndarray":
+        """Бросить кость size раз
+
+        Returns:
+            ndarray: результаты
+        """
+        value = self._dice.rolls(size=size, generator=generator)
+        return value
+
 
 class CritRoll(DifficultyRoll):
     """Модель броска кости на критический удар"""
@@ -1,14 +1,15 @@
-from typing import TYPE_CHECKING, Iterable
-from arcade import color
+from typing import TYPE_CHECKING, Iterable, Mapping, Optional
 
 from src.abstractions.domain import BaseDomain
 from src.models.collection import FigureCollection
-from src.utils.constants import BASE_DOMAIN_POWER
+from src.utils.constants import BASE_DOMAIN_POWER, GRAY_DOMAIN_COLOR
+from src.utils.enums import ModelEvent
 
 if TYPE_CHECKING:
     from arcade import Texture
     from arcade.types import Color
     from src.abstractions.figure import BaseFigure
+    from src.utils.tools import DomainState
 
 
 class Domain(BaseDomain):
@@ -20,7 +21,7 @@ class Domain(BaseDomain):
         title: str,
         description: str,
         texture: "Texture",
-        domain_color: "Color" = color.GRAY,
+        domain_color: "Color" = GRAY_DOMAIN_COLOR,
         power: int = BASE_DOMAIN_POWER,
         turn: bool = False,
     ):
@@ -53,6 +54,20 @@ class Domain(BaseDomain):
         """
         self._figures = FigureCollection(figures=figures)
         self._prisoners = FigureCollection()
+        self.notify(event=ModelEvent.status.value)
+
+    def restore(self, state: "DomainState", figures: Mapping[str, "BaseFigure"]) -> None:
+        """Восстановить состояние домена из снимка
+
+        Args:
+            state: состояние
+            figures: все фигуры доски по именам
+        """
+        self._power = state.power
+        self._turn = state.turn
+        self._figures = FigureCollection(figures=[figures[name] for name in state.figures])
+        self._prisoners = FigureCollection(figures=[figures[name] for name in state.prisoners])
+        self.notify(event=ModelEvent.status.value)
 
     def kill_figure(self, figure: "BaseFigure") -> None:
         """Убить фигуру домена
@@ -62,6 +77,7 @@ class Domain(BaseDomain):
         """
         figure = self._figures.pop(figure.name)
         figure.kill_self()
+        self.notify(event=ModelEvent.status.value)
 
     def get_prisoner(self, figure: "BaseFigure") -> None:
         """Установить фигуру-пленника домена
@@ -70,15 +86,45 @@ class Domain(BaseDomain):
             figure: фигура
         """
         self._prisoners[figure.name] = figure
+        self.notify(event=ModelEvent.status.value)
+
+    def release_prisoner(self) -> Optional["BaseFigure"]:
+        """Отпустить первого пленника домена (например, в жертву)
 
-    def end_circle(self):
-        """Завершить цикл ходов домена, начав новый"""
+        Returns:
+            BaseFigure: пленник (пусто - пленников нет)
+        """
+        for name in self._prisoners:
+            prisoner = self._prisoners.pop(name)
+            self.notify(event=ModelEvent.status.value)
+            return prisoner
+        return None
+
+    def end_circle(self, expiring: Optional[Iterable["BaseFigure"]] = None):
+        """Завершить цикл ходов домена, начав новый
+
+        Args:
+            expiring: фигуры домена, у которых снимаются бафы и перезаряжаются способности (по умолчанию - все)
+        """
         self._turn = True
-        for figure in self._figures.values():
-            figure.end_circle()
+        figures = list(self._figures.values())
+        expiring = figures if expiring is None else list(expiring)
+        store = expiring[0].unit.store if expiring else None
+        if store is not None and all(figure.unit.store is store for figure in expiring):
+            # персонажи в общем хранилище - броня и способности сбрасываются одним присваиванием
+            store.end_circle(units=[figure.unit for figure in expiring])
+        else:
+            for figure in expiring:
+                figure.unit.end_circle()
+        for figure in figures:
+            if not figure.can_move:
+                figure.can_move = True
+        self.notify(event=ModelEvent.status.value)
 
     def end_turn(self) -> None:
         """Завершить ход домена"""
         self._turn = False
         for figure in self._figures.values():
-            figure.can_move = False
+            if figure.can_move:
+                figure.can_move = False
+        self.notify(event=ModelEvent.status.value)
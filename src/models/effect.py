@@ -1,7 +1,9 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List
+from numpy import array, maximum, where
 
 from src.abstractions.effect import BaseEffect
 from src.utils.tools import info_context
+from src.utils.enums import LogKind
 from src.utils.messages import (
     EFFECT_HIT_VALUE_MSG,
     EFFECT_CRIT_VALUE_MSG,
@@ -13,6 +15,8 @@ from src.utils.messages import (
 )
 
 if TYPE_CHECKING:
+    from numpy import ndarray
+    from numpy.random import Generator
     from src.abstractions.item import BaseItem
     from src.abstractions.unit import BaseUnit
     from utils.tools import F_spec
@@ -76,7 +80,10 @@ class Effect(BaseEffect):
         """
         value = self.item_value(**kwargs)
         info_context.update(
-            value=EFFECT_HIT_VALUE_MSG.format(value=value, mastery=mastery),
+            template=EFFECT_HIT_VALUE_MSG,
+            kind=LogKind.damage.value,
+            value=value,
+            mastery=mastery,
         )
         return value + mastery
 
@@ -89,11 +96,50 @@ class Effect(BaseEffect):
             int: значение
         """
         value = self.item_value()
-        info_context.update(
-            value=EFFECT_CRIT_VALUE_MSG.format(value=value),
-        )
+        info_context.update(template=EFFECT_CRIT_VALUE_MSG, kind=LogKind.damage.value, value=value)
         return value
 
+    def item_values(
+        self,
+        size: int,
+        generator: "Generator",
+        domain_bonus: int = 0,
+        building_bonus: int = 0,
+    ) -> "ndarray":
+        """Сделать серию бросков кубика предмета (векторный аналог item_value)
+
+        Returns:
+            ndarray: значения
+        """
+        return self._item.deals(
+            size=size,
+            generator=generator,
+            bonus=domain_bonus,
+            penalty=building_bonus,
+        )
+
+    def hit_values(
+        self,
+        size: int,
+        generator: "Generator",
+        mastery: int = 0,
+        **kwargs: "F_spec.kwargs"
+    ) -> "ndarray":
+        """Значения предмета при попадании (векторный аналог hit_value)
+
+        Returns:
+            ndarray: значения
+        """
+        return self.item_values(size=size, generator=generator, **kwargs) + mastery
+
+    def crit_values(self, size: int, generator: "Generator") -> "ndarray":
+        """Значения предмета при критическом ударе (векторный аналог crit_value)
+
+        Returns:
+            ndarray: значения
+        """
+        return self.item_values(size=size, generator=generator)
+
     def apply(
         self,
         target: "BaseUnit",
@@ -111,6 +157,49 @@ class Effect(BaseEffect):
         """
         pass
 
+    def simulate(
+        self,
+        target: "BaseUnit",
+        hit: "ndarray",
+        crit: "ndarray",
+        hit_points: "ndarray",
+        generator: "Generator",
+        **kwargs: "F_spec.kwargs",
+    ) -> "ndarray":
+        """Применить эффект к серии исходов (векторный аналог apply)
+
+        Args:
+            target: цель способности
+            hit: броски на попадание
+            crit: броски на критический удар
+            hit_points: здоровье цели до применения эффекта
+            generator: генератор случайных чисел
+            kwargs: дополнительные параметры
+
+        Returns:
+            ndarray: здоровье цели после применения эффекта
+        """
+        return hit_points
+
+    def apply_area(
+        self,
+        targets: List["BaseUnit"],
+        hit: "ndarray",
+        crit: "ndarray",
+        generator: "Generator",
+        **kwargs: "F_spec.kwargs",
+    ) -> None:
+        """Применить эффект к целям области
+
+        Args:
+            targets: цели способности
+            hit: броски на попадание (по одному на цель)
+            crit: броски на критический удар (по одному на цель)
+            generator: генератор случайных чисел
+            kwargs: дополнительные параметры (по одному значению на цель)
+        """
+        pass
+
 
 class Cut(Effect):
     """Модель эффекта - Режущий Урон"""
@@ -157,13 +246,41 @@ class Cut(Effect):
 
         target.defend_self(damage=value)
         info_context.update(
-            value=MELEE_ATTACK_MSG.format(
-                result=value,
-                type=self._item.attribute,
-                name=target.title,
-            ),
+            template=MELEE_ATTACK_MSG,
+            kind=LogKind.damage.value,
+            result=value,
+            type=self._item.attribute,
+            name=target.title,
         )
 
+    def simulate(
+        self,
+        target: "BaseUnit",
+        hit: "ndarray",
+        crit: "ndarray",
+        hit_points: "ndarray",
+        generator: "Generator",
+        **kwargs: "F_spec.kwargs",
+    ) -> "ndarray":
+        """Применить эффект к серии исходов (векторный аналог apply)
+
+        Args:
+            target: цель способности
+            hit: броски на попадание
+            crit: броски на критический удар
+            hit_points: здоровье цели до применения эффекта
+            generator: генератор случайных чисел
+            kwargs: дополнительные параметры
+
+        Returns:
+            ndarray: здоровье цели после применения эффекта
+        """
+        size = hit.size
+        value = self.hit_values(size=size, generator=generator, **kwargs)
+        value = value + where(crit, self.crit_values(size=size, generator=generator), 0)
+        value = where(hit, value, 0)
+        return target.damaged_hp(hit_points=hit_points, damage=value)
+
 
 class Pierce(Effect):
     """Модель эффекта - Колющий Урон"""
@@ -211,13 +328,41 @@ class Pierce(Effect):
 
         target.defend_self(damage=value)
         info_context.update(
-            value=MELEE_ATTACK_MSG.format(
-                result=value,
-                type=self._item.attribute,
-                name=target.title,
-            ),
+            template=MELEE_ATTACK_MSG,
+            kind=LogKind.damage.value,
+            result=value,
+            type=self._item.attribute,
+            name=target.title,
         )
 
+    def simulate(
+        self,
+        target: "BaseUnit",
+        hit: "ndarray",
+        crit: "ndarray",
+        hit_points: "ndarray",
+        generator: "Generator",
+        **kwargs: "F_spec.kwargs",
+    ) -> "ndarray":
+        """Применить эффект к серии исходов (векторный аналог apply)
+
+        Args:
+            target: цель способности
+            hit: броски на попадание
+            crit: броски на критический удар
+            hit_points: здоровье цели до применения эффекта
+            generator: генератор случайных чисел
+            kwargs: дополнительные параметры
+
+        Returns:
+            ndarray: здоровье цели после применения эффекта
+        """
+        size = hit.size
+        value = self.hit_values(size=size, generator=generator, **kwargs)
+        value = value + where(crit, self.crit_values(size=size, generator=generator), 0)
+        value = where(hit, value, 0)
+        return target.damaged_hp(hit_points=hit_points, damage=value)
+
 
 class Crush(Effect):
     """Модель эффекта - Дробящий Урон"""
@@ -266,13 +411,41 @@ class Crush(Effect):
 
         target.defend_self(damage=value)
         info_context.update(
-            value=MELEE_ATTACK_MSG.format(
-                result=value,
-                type=self._item.attribute,
-                name=target.title,
-            ),
+            template=MELEE_ATTACK_MSG,
+            kind=LogKind.damage.value,
+            result=value,
+            type=self._item.attribute,
+            name=target.title,
         )
 
+    def simulate(
+        self,
+        target: "BaseUnit",
+        hit: "ndarray",
+        crit: "ndarray",
+        hit_points: "ndarray",
+        generator: "Generator",
+        **kwargs: "F_spec.kwargs",
+    ) -> "ndarray":
+        """Применить эффект к серии исходов (векторный аналог apply)
+
+        Args:
+            target: цель способности
+            hit: броски на попадание
+            crit: броски на критический удар
+            hit_points: здоровье цели до применения эффекта
+            generator: генератор случайных чисел
+            kwargs: дополнительные параметры
+
+        Returns:
+            ndarray: здоровье цели после применения эффекта
+        """
+        size = hit.size
+        value = self.hit_values(size=size, generator=generator, **kwargs)
+        crit_value = where(crit, self.crit_values(size=size, generator=generator), 0)
+        value = where(hit, value + crit_value, value // 2)
+        return target.damaged_hp(hit_points=hit_points, damage=value)
+
 
 class Shield(Effect):
     """Модель эффекта - Добавить Защиту"""
@@ -305,6 +478,20 @@ class Shield(Effect):
         """
         return self._item.deal()
 
+    def item_values(
+        self,
+        size: int,
+        generator: "Generator",
+        **kwargs: "F_spec.kwargs",
+    ) -> "ndarray":
+        """Сделать серию бросков кубика предмета (векторный аналог item_value)
+        При поднятии щита обычно нет бонусов и штрафов
+
+        Returns:
+            ndarray: значения
+        """
+        return self._item.deals(size=size, generator=generator)
+
     def hit_value(
         self,
         **kwargs: "F_spec.kwargs"
@@ -318,6 +505,19 @@ class Shield(Effect):
         """
         return self.item_value(**kwargs)
 
+    def hit_values(
+        self,
+        size: int,
+        generator: "Generator",
+        **kwargs: "F_spec.kwargs"
+    ) -> "ndarray":
+        """Значения предмета при попадании (векторный аналог hit_value)
+
+        Returns:
+            ndarray: значения
+        """
+        return self.item_values(size=size, generator=generator, **kwargs)
+
     def apply(
         self,
         target: "BaseUnit",
@@ -338,10 +538,10 @@ class Shield(Effect):
 
         target.shield_self(value=value)
         info_context.update(
-            value=SHIELD_APPLY_MSG.format(
-                result=value,
-                name=target.title,
-            ),
+            template=SHIELD_APPLY_MSG,
+            kind=LogKind.damage.value,
+            result=value,
+            name=target.title,
         )
 
 
@@ -385,9 +585,7 @@ class Elemental(Effect):
         # расчет магического урона
         value = self.hit_value(**kwargs)
         resist = target.magic_resistance
-        info_context.update(
-            value=RESIST_VALUE_MSG.format(resist=resist),
-        )
+        info_context.update(template=RESIST_VALUE_MSG, kind=LogKind.damage.value, resist=resist)
         if hit:
             if crit:
                 value += self.crit_value()
@@ -400,12 +598,75 @@ class Elemental(Effect):
         value = max(value - resist, 0)
         target.defend_self(damage=value)
         info_context.update(
-            value=MAGIC_ATTACK_MSG.format(
-                result=value,
+            template=MAGIC_ATTACK_MSG,
+            kind=LogKind.damage.value,
+            result=value,
+            type=self._item.attribute,
+            name=target.title,
+        )
+
+    def simulate(
+        self,
+        target: "BaseUnit",
+        hit: "ndarray",
+        crit: "ndarray",
+        hit_points: "ndarray",
+        generator: "Generator",
+        **kwargs: "F_spec.kwargs",
+    ) -> "ndarray":
+        """Применить эффект к серии исходов (векторный аналог apply)
+
+        Args:
+            target: цель способности
+            hit: броски на попадание
+            crit: броски на критический удар
+            hit_points: здоровье цели до применения эффекта
+            generator: генератор случайных чисел
+            kwargs: дополнительные параметры
+
+        Returns:
+            ndarray: здоровье цели после применения эффекта
+        """
+        size = hit.size
+        value = self.hit_values(size=size, generator=generator, **kwargs)
+        crit_value = self.crit_values(size=size, generator=generator)
+        value = where(crit, value + crit_value, where(hit, value, value // 2))
+        value = maximum(value - target.magic_resistance, 0)
+        return target.damaged_hp(hit_points=hit_points, damage=value)
+
+    def apply_area(
+        self,
+        targets: List["BaseUnit"],
+        hit: "ndarray",
+        crit: "ndarray",
+        generator: "Generator",
+        **kwargs: "F_spec.kwargs",
+    ) -> None:
+        """Применить эффект к целям области (векторный аналог apply)
+        Броски урона делаются одним вызовом для всех целей, урон наносится каждой цели
+
+        Args:
+            targets: цели способности
+            hit: броски на попадание (по одному на цель)
+            crit: броски на критический удар (по одному на цель)
+            generator: генератор случайных чисел
+            kwargs: дополнительные параметры (по одному значению на цель)
+        """
+        size = len(targets)
+        value = self.hit_values(size=size, generator=generator, **kwargs)
+        crit_value = self.crit_values(size=size, generator=generator)
+        value = where(crit, value + crit_value, where(hit, value, value // 2))
+        resist = array([target.magic_resistance for target in targets])
+        value = maximum(value - resist, 0)
+        for target, damage in zip(targets, value.tolist()):
+            target.defend_self(damage=damage)
+            info_context.update(
+                template=MAGIC_ATTACK_MSG,
+                kind=LogKind.damage.value,
+                result=damage,
                 type=self._item.attribute,
                 name=target.title,
-            ),
-        )
+            )
 
 
 class Heal(Effect):
@@ -439,6 +700,20 @@ class Heal(Effect):
         """
         return self._item.deal()
 
+    def item_values(
+        self,
+        size: int,
+        generator: "Generator",
+        **kwargs: "F_spec.kwargs",
+    ) -> "ndarray":
+        """Сделать серию бросков кубика предмета (векторный аналог item_value)
+        При исцелении обычно нет бонусов и штрафов
+
+        Returns:
+            ndarray: значения
+        """
+        return self._item.deals(size=size, generator=generator)
+
     def apply(
         self,
         target: "BaseUnit",
@@ -457,9 +732,7 @@ class Heal(Effect):
         # расчет исцеления
         value = self.hit_value(**kwargs)
         resist = target.magic_resistance
-        info_context.update(
-            value=RESIST_VALUE_MSG.format(resist=resist),
-        )
+        info_context.update(template=RESIST_VALUE_MSG, kind=LogKind.damage.value, resist=resist)
         if hit:
             if crit:
                 value += self.crit_value()
@@ -473,22 +746,56 @@ class Heal(Effect):
         # при критическом промахе будет нанесен урон самому заклинателю
         if not hit and crit:
             info_context.update(
-                value=MAGIC_ATTACK_MSG.format(
-                    result=value,
-                    type=self._item.attribute,
-                    name=target.title,
-                ),
+                template=MAGIC_ATTACK_MSG,
+                kind=LogKind.damage.value,
+                result=value,
+                type=self._item.attribute,
+                name=target.title,
             )
             target.defend_self(damage=value)
         else:
             info_context.update(
-                value=HEAL_APPLY_MSG.format(
-                    result=value,
-                    name=target.title,
-                ),
+                template=HEAL_APPLY_MSG,
+                kind=LogKind.damage.value,
+                result=value,
+                name=target.title,
             )
             target.heal_self(value=value)
 
+    def simulate(
+        self,
+        target: "BaseUnit",
+        hit: "ndarray",
+        crit: "ndarray",
+        hit_points: "ndarray",
+        generator: "Generator",
+        **kwargs: "F_spec.kwargs",
+    ) -> "ndarray":
+        """Применить эффект к серии исходов (векторный аналог apply)
+
+        Args:
+            target: цель способности
+            hit: броски на попадание
+            crit: броски на критический удар
+            hit_points: здоровье цели до применения эффекта
+            generator: генератор случайных чисел
+            kwargs: дополнительные параметры
+
+        Returns:
+            ndarray: здоровье цели после применения эффекта
+        """
+        size = hit.size
+        value = self.hit_values(size=size, generator=generator, **kwargs)
+        crit_value = self.crit_values(size=size, generator=generator)
+        value = where(crit, value + crit_value, where(hit, value, value // 2))
+        value = maximum(value - target.magic_resistance, 0)
+        # при критическом промахе будет нанесен урон самому заклинателю
+        return where(
+            ~hit & crit,
+            target.damaged_hp(hit_points=hit_points, damage=value),
+            target.healed_hp(hit_points=hit_points, value=value),
+        )
+
 
 class Buff(Effect):
     """Модель эффекта - бафф/дебафф"""
@@ -521,6 +828,20 @@ class Buff(Effect):
         """
         return self._item.deal()
 
+    def item_values(
+        self,
+        size: int,
+        generator: "Generator",
+        **kwargs: "F_spec.kwargs",
+    ) -> "ndarray":
+        """Сделать серию бросков кубика предмета (векторный аналог item_value)
+        При бафах/дебафах обычно нет бонусов и штрафов
+
+        Returns:
+            ndarray: значения
+        """
+        return self._item.deals(size=size, generator=generator)
+
     def apply(
         self,
         target: "BaseUnit",
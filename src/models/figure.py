@@ -1,11 +1,10 @@
 from typing import TYPE_CHECKING
 
-from src.abstractions.figure import BaseFigure, BaseFigureSprite
+from src.abstractions.figure import BaseFigure
 from utils.tools import SpriteCore
-from src.utils.enums import FigureStatus, ActionType
+from src.utils.enums import FigureStatus, ActionType, ModelEvent
 from src.models.action import Action, MoveAction, PassAction
 from src.models.collection import ActionCollection
-from src.models.indicator import IndicatorBar
 from src.utils.constants import CELL_SIZE
 
 if TYPE_CHECKING:
@@ -18,28 +17,8 @@ if TYPE_CHECKING:
     from collections import UserDict
 
 
-class FigureSprite(BaseFigureSprite):
-    """UI модель графики фигуры"""
-
-    def __init__(
-        self,
-        core: "SpriteCore",
-    ):
-        """Инициализация графики фигуры
-
-        Args:
-            core: свойства графического объекта
-
-        """
-        core.width = CELL_SIZE // 1.3
-        core.height = CELL_SIZE // 1.3
-        super().__init__(
-            core=core,
-        )
-
-
 class Figure(BaseFigure):
-    """UI модель фигуры"""
+    """Модель фигуры"""
 
     def __init__(
         self,
@@ -62,19 +41,13 @@ class Figure(BaseFigure):
             name=domain.name + "_" + unit.name,
             index=index,
             texture=texture,
+            width=CELL_SIZE // 1.3,
+            height=CELL_SIZE // 1.3,
             domain=domain,
         )
-        sprite = FigureSprite(
-            core=core,
-        )
         actions = self.__initialize_actions(unit=unit)
-        health_bar = IndicatorBar(
-            width=sprite.core.width,
-            height=sprite.core.height // 10,
-        )
         super().__init__(
-            sprite=sprite,
-            indicator=health_bar,
+            core=core,
             unit=unit,
             actions=actions,
             status=status,
@@ -91,18 +64,18 @@ class Figure(BaseFigure):
 
     def check_status(self):
         """Проверить статус фигуры"""
-        self.indicator.value = self._unit.hp_percent
         if self._unit.is_dead:
             self.status = FigureStatus.captive.value
+        self.notify(event=ModelEvent.status.value)
 
     def end_circle(self) -> None:
         """Завершить ход"""
         self._unit.end_circle()
-        self._can_move = True
+        self.can_move = True
 
     def kill_self(self) -> None:
         """Уничтожить себя"""
-        self.visible = False
+        self.notify(event=ModelEvent.killed.value)
 
     def __initialize_actions(self, unit: "BaseUnit" = None) -> ActionCollection:
         """Создать список возможных действий фигуры"""
@@ -0,0 +1,65 @@
+from collections import deque
+from typing import TYPE_CHECKING, Deque
+
+from src.utils.constants import UNDO_HISTORY_SIZE
+from src.utils.enums import ReplayCommand
+
+if TYPE_CHECKING:
+    from src.abstractions.board import BaseBoard
+    from src.utils.tools import BoardState
+
+
+class UndoHistory:
+    """История состояний доски для отмены действий
+    Состояние запоминается, только если доска изменилась (по журналу изменений),
+    поэтому запись можно делать хоть каждый кадр
+    """
+
+    def __init__(self, board: "BaseBoard", size: int = UNDO_HISTORY_SIZE):
+        """Инициализация истории
+
+        Args:
+            board: доска
+            size: количество запоминаемых состояний
+        """
+        self._board = board
+        self._states: Deque["BoardState"] = deque(maxlen=size)
+        self._clock = -1
+
+    def __len__(self) -> int:
+        """Количество запомненных состояний"""
+        return len(self._states)
+
+    def record(self) -> None:
+        """Запомнить состояние доски, если оно изменилось"""
+        journal = self._board.journal
+        if journal is None or journal.clock == self._clock:
+            return
+        self._clock = journal.clock
+        state = self._board.snapshot()
+        if not self._states or self._states[-1] != state:
+            self._states.append(state)
+
+    def undo(self) -> bool:
+        """Вернуть доску к предыдущему состоянию, в котором ходит игрок (а не компьютер)
+
+        Returns:
+            bool: состояние восстановлено
+        """
+        self._board.record(ReplayCommand.undo.value)
+        self.record()
+        if len(self._states) < 2:
+            return False
+        self._states.pop()
+        while len(self._states) > 1 and self._is_automated(state=self._states[-1]):
+            self._states.pop()
+        self._board.restore(state=self._states[-1])
+        self._clock = self._board.journal.clock
+        return True
+
+    def _is_automated(self, state: "BoardState") -> bool:
+        """Ходит ли в состоянии компьютер"""
+        return any(
+            state.objects[("domain", domain.name)].turn and domain.automated
+            for domain in self._board.players
+        )
@@ -2,9 +2,11 @@ from typing import TYPE_CHECKING
 
 from src.abstractions.item import BaseItem
 from src.models.dice import DiceRoll, Dice, StaticDice
-from src.utils.enums import MagicType, WeaponType, ArmorType, RollModifier
+from src.utils.enums import MagicType, WeaponType, ArmorType, RollModifier, AreaShape
 
 if TYPE_CHECKING:
+    from numpy import ndarray
+    from numpy.random import Generator
     from src.abstractions.effect import BaseEffect
     from utils.tools import BaseAttribute
     from src.abstractions.dice import BaseDice
@@ -24,6 +26,8 @@ class Item(BaseItem):
         modifier: "BaseAttribute" = RollModifier.standard.value,
         radius: int = 1,
         times: int = 1,
+        area: int = 0,
+        shape: "BaseAttribute" = AreaShape.cross.value,
     ):
         """Инициализация предмета
 
@@ -36,6 +40,8 @@ class Item(BaseItem):
             modifier: модификатор предмета
             radius: радиус действия
             times: количество бросков кости
+            area: радиус области поражения вокруг цели
+            shape: форма области поражения
         """
         value = DiceRoll(
             dice=value_dice,
@@ -49,6 +55,8 @@ class Item(BaseItem):
             effect=effect,
             attribute=attribute,
             radius=radius,
+            area=area,
+            shape=shape,
         )
 
     def deal(self, **kwargs: "F_spec.kwargs") -> int:
@@ -60,6 +68,20 @@ class Item(BaseItem):
         """
         return self._value.action(**kwargs)
 
+    def deals(
+        self,
+        size: int,
+        generator: "Generator",
+        **kwargs: "F_spec.kwargs",
+    ) -> "ndarray":
+        """Выполнить действие предмета size раз
+        Делается серия бросков кости предмета
+
+        Returns:
+            ndarray: значения
+        """
+        return self._value.actions(size=size, generator=generator, **kwargs)
+
 
 class Weapon(Item):
     """Модель оружия"""
@@ -109,6 +131,8 @@ class Spell(Item):
         magic_type: "BaseAttribute" = MagicType.fire.value,
         radius: int = 1,
         times: int = 1,
+        area: int = 0,
+        shape: "BaseAttribute" = AreaShape.cross.value,
     ):
         """Инициализация заклинания
 
@@ -120,6 +144,8 @@ class Spell(Item):
             magic_type: тип заклинания
             radius: радиус действия
             times: количество бросков кости
+            area: радиус области поражения вокруг цели
+            shape: форма области поражения
         """
         value_dice = Dice(side=damage)
         super().__init__(
@@ -130,6 +156,8 @@ class Spell(Item):
             attribute=magic_type,
             radius=radius,
             times=times,
+            area=area,
+            shape=shape,
         )
 
 
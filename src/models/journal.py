@@ -0,0 +1,63 @@
+from typing import TYPE_CHECKING, Dict, List
+
+if TYPE_CHECKING:
+    from src.utils.tools import BaseAttribute, Observable, StateKey
+
+
+class ChangeJournal:
+    """Журнал изменений доски
+    Для каждого объекта доски (клетки, фигуры вместе с персонажем и способностями, здания, домена)
+    хранится отметка часов журнала при последнем событии его модели.
+    Объекты упорядочены по времени последнего изменения, поэтому изменившиеся после заданной
+    отметки объекты находятся за время, пропорциональное их количеству
+    """
+
+    def __init__(self):
+        """Инициализация журнала"""
+        self._clock = 0
+        self._sources: Dict[int, "StateKey"] = {}
+        self._stamps: Dict["StateKey", int] = {}
+
+    @property
+    def clock(self) -> int:
+        """Текущая отметка журнала (растет с каждым событием)"""
+        return self._clock
+
+    def watch(self, source: "Observable", key: "StateKey") -> None:
+        """Отслеживать события модели
+
+        Args:
+            source: наблюдаемая модель
+            key: объект доски, который меняют события модели
+        """
+        self._sources[id(source)] = key
+        source.subscribe(observer=self._update)
+
+    def changed(self, since: int) -> List["StateKey"]:
+        """Объекты, изменившиеся после отметки
+
+        Args:
+            since: отметка журнала
+
+        Returns:
+            list: объекты (сначала изменившиеся последними)
+        """
+        keys = []
+        for key, stamp in reversed(self._stamps.items()):
+            if stamp <= since:
+                break
+            keys.append(key)
+        return keys
+
+    def _update(self, source: "Observable", event: "BaseAttribute") -> None:
+        """Отметить изменение объекта
+
+        Args:
+            source: источник события
+            event: событие
+        """
+        key = self._sources[id(source)]
+        self._clock += 1
+        # объект переносится в конец порядка изменений
+        self._stamps.pop(key, None)
+        self._stamps[key] = self._clock
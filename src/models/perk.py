@@ -1,8 +1,13 @@
-from typing import TYPE_CHECKING, Iterable, Union
+from itertools import product
+from math import prod
+from typing import TYPE_CHECKING, Iterable, List, Union, Tuple
+from numpy import array, full, hstack
 
 from src.utils.tools import info_context
+from src.utils.rng import Outcome, outcome_context
+from src.utils.probability import shift_distribution
 from src.abstractions.perk import BasePerk
-from src.utils.enums import PerkType, PerkStatus, RollModifier
+from src.utils.enums import PerkType, PerkStatus, RollModifier, LogKind, ModelEvent
 from models.dice import (
     StaticDice,
     CritRoll,
@@ -23,6 +28,9 @@ from src.utils.messages import (
 )
 
 if TYPE_CHECKING:
+    from numpy import ndarray
+    from numpy.random import Generator
+    from src.utils.probability import Distribution
     from arcade import Texture
     from src.abstractions.item import BaseItem
     from src.abstractions.unit import BaseUnit
@@ -110,6 +118,80 @@ class Perk(BasePerk):
         """
         return target.save_throw(attribute=self._item.attribute)
 
+    def base_hit_resistance_distribution(self, target: "BaseUnit") -> "Distribution":
+        """Точное распределение базовой сопротивляемости удару
+
+        Args:
+            target: цель способности
+
+        Returns:
+            Distribution: распределение
+        """
+        return target.save_distribution(attribute=self._item.attribute)
+
+    def base_hit_resistances(
+        self,
+        target: "BaseUnit",
+        size: int,
+        generator: "Generator",
+    ) -> "ndarray | int":
+        """Базовая сопротивляемость удару для серии бросков (векторно)
+
+        Args:
+            target: цель способности
+            size: количество бросков
+            generator: генератор случайных чисел
+
+        Returns:
+            ndarray | int: значения
+        """
+        return target.save_throws(
+            attribute=self._item.attribute,
+            size=size,
+            generator=generator,
+        )
+
+    def hit_probability(self, target: "BaseUnit") -> float:
+        """Точная вероятность попадания (аналог hit)
+
+        Args:
+            target: цель способности
+
+        Returns:
+            float: вероятность
+        """
+        return self._difficulty.probability(
+            bonus=self.base_hit_chance,
+            penalty_distribution=self.base_hit_resistance_distribution(target=target),
+        )
+
+    def hits(
+        self,
+        target: "BaseUnit",
+        size: int,
+        generator: "Generator",
+    ) -> "ndarray":
+        """Серия бросков на попадание (векторный аналог hit)
+
+        Args:
+            target: цель способности
+            size: количество бросков
+            generator: генератор случайных чисел
+
+        Returns:
+            ndarray: значения
+        """
+        return self._difficulty.actions(
+            size=size,
+            generator=generator,
+            bonus=self.base_hit_chance,
+            penalty=self.base_hit_resistances(
+                target=target,
+                size=size,
+                generator=generator,
+            ),
+        )
+
     def hit(self, target: "BaseUnit") -> bool:
         """Попадание
         Рассчитывается как:
@@ -123,7 +205,7 @@ class Perk(BasePerk):
         """
         bonus = self.base_hit_chance
         penalty = self.base_hit_resistance(target=target)
-        info_context.update(value=PERK_HIT_CHANCE_MSG)
+        info_context.update(template=PERK_HIT_CHANCE_MSG, kind=LogKind.hit.value)
         return self._difficulty.action(
             bonus=bonus,
             penalty=penalty,
@@ -168,12 +250,68 @@ class Perk(BasePerk):
         """
         bonus = self.base_crit_chance
         penalty = self.base_crit_resistance(target=target)
-        info_context.update(value=PERK_CRIT_CHANCE_MSG)
+        info_context.update(template=PERK_CRIT_CHANCE_MSG, kind=LogKind.hit.value)
         return self._crit_roll.action(
             bonus=bonus,
             penalty=penalty,
         )
 
+    def crit_probability(self, target: "BaseUnit") -> float:
+        """Точная вероятность критического удара (аналог crit)
+
+        Args:
+            target: цель способности
+
+        Returns:
+            float: вероятность
+        """
+        return self._crit_roll.probability(
+            bonus=self.base_crit_chance,
+            penalty=self.base_crit_resistance(target=target),
+        )
+
+    def outcomes(self, target: "BaseUnit") -> Tuple[Tuple[float, Outcome], ...]:
+        """Возможные исходы бросков способности с их точными вероятностями
+        Броски на попадание и критический удар независимы
+
+        Args:
+            target: цель способности
+
+        Returns:
+            tuple: пары (вероятность, исход) с ненулевой вероятностью
+        """
+        hit = self.hit_probability(target=target)
+        crit = self.crit_probability(target=target)
+        return tuple(
+            (hit_probability * crit_probability, Outcome(hit=is_hit, crit=is_crit))
+            for is_hit, hit_probability in ((True, hit), (False, 1 - hit))
+            for is_crit, crit_probability in ((True, crit), (False, 1 - crit))
+            if hit_probability * crit_probability > 0
+        )
+
+    def crits(
+        self,
+        target: "BaseUnit",
+        size: int,
+        generator: "Generator",
+    ) -> "ndarray":
+        """Серия бросков на критический удар (векторный аналог crit)
+
+        Args:
+            target: цель способности
+            size: количество бросков
+            generator: генератор случайных чисел
+
+        Returns:
+            ndarray: значения
+        """
+        return self._crit_roll.actions(
+            size=size,
+            generator=generator,
+            bonus=self.base_crit_chance,
+            penalty=self.base_crit_resistance(target=target),
+        )
+
     def activate(self, target: "BaseUnit", **kwargs: "F_spec.kwargs"):
         """Активировать способность
 
@@ -182,25 +320,48 @@ class Perk(BasePerk):
              kwargs: дополнительные параметры
          """
         if self._status == PerkStatus.done.value:
-            info_context.update(
-                value=PERK_STATUS_DONE_MSG.format(name=self._item.title)
-            )
+            info_context.update(template=PERK_STATUS_DONE_MSG, name=self._item.title)
             return
         elif self._status == PerkStatus.blocked.value:
-            info_context.update(
-                value=PERK_STATUS_BLOCKED_MSG.format(name=self._item.title)
-            )
+            info_context.update(template=PERK_STATUS_BLOCKED_MSG, name=self._item.title)
             return
         else:
             info_context.update(
-                value=PERK_ACTIVATE_MSG.format(
-                    name=self._item.title,
-                    target=target.title,
-                    modifier=self._modifier,
-                )
+                template=PERK_ACTIVATE_MSG,
+                name=self._item.title,
+                target=target.title,
+                modifier=self._modifier,
             )
             self.action(target=target, **kwargs)
-            self._status = PerkStatus.done.value
+            self.change_status(value=PerkStatus.done.value)
+
+    def simulate(
+        self,
+        target: "BaseUnit",
+        hit_points: "ndarray",
+        generator: "Generator",
+        **kwargs: "F_spec.kwargs",
+    ) -> Tuple["ndarray", "ndarray", "ndarray"]:
+        """Смоделировать серию активаций способности (векторный аналог activate)
+
+        Args:
+            target: цель способности
+            hit_points: здоровье цели до активации (по одному значению на исход)
+            generator: генератор случайных чисел
+            kwargs: дополнительные параметры
+
+        Returns:
+            tuple: попадания, критические удары, здоровье цели после активации
+        """
+        if self._status in (PerkStatus.done.value, PerkStatus.blocked.value):
+            nothing = full(shape=hit_points.size, fill_value=False)
+            return nothing, nothing, hit_points
+        return self.simulate_action(
+            target=target,
+            hit_points=hit_points,
+            generator=generator,
+            **kwargs,
+        )
 
     def change_attribute(self, value: "BaseAttribute") -> None:
         """Изменить тип способности
@@ -217,6 +378,7 @@ class Perk(BasePerk):
             value: значение
         """
         self._status = value
+        self.notify(event=ModelEvent.status.value)
 
     def change_modifier(self, value: "BaseAttribute") -> None:
         """Изменить модификатор способности
@@ -228,6 +390,7 @@ class Perk(BasePerk):
         self._item.change_modifier(value=value)
         self._difficulty.modifier = value
         self._crit_roll.modifier = value
+        self.notify(event=ModelEvent.status.value)
 
     def action(self, target: "BaseUnit", **kwargs: "F_spec.kwargs") -> None:
         """Воздействие на цель
@@ -236,8 +399,12 @@ class Perk(BasePerk):
             target: цель способности
             kwargs: дополнительные параметры
         """
-        hit = self.hit(target=target)
-        crit = self.crit(target=target)
+        outcome = outcome_context.get()
+        if outcome:
+            hit, crit = outcome
+        else:
+            hit = self.hit(target=target)
+            crit = self.crit(target=target)
         mastery = self._person.mastery(attribute=self._item.attribute)
         self._item.charge(
             target=target,
@@ -247,6 +414,82 @@ class Perk(BasePerk):
             **kwargs,
         )
 
+    def simulate_action(
+        self,
+        target: "BaseUnit",
+        hit_points: "ndarray",
+        generator: "Generator",
+        **kwargs: "F_spec.kwargs",
+    ) -> Tuple["ndarray", "ndarray", "ndarray"]:
+        """Серия воздействий на цель (векторный аналог action)
+
+        Args:
+            target: цель способности
+            hit_points: здоровье цели до воздействия
+            generator: генератор случайных чисел
+            kwargs: дополнительные параметры
+
+        Returns:
+            tuple: попадания, критические удары, здоровье цели после воздействия
+        """
+        size = hit_points.size
+        hit = self.hits(target=target, size=size, generator=generator)
+        crit = self.crits(target=target, size=size, generator=generator)
+        mastery = self._person.mastery(attribute=self._item.attribute)
+        hit_points = self._item.simulate(
+            target=target,
+            hit=hit,
+            crit=crit,
+            hit_points=hit_points,
+            generator=generator,
+            mastery=mastery,
+            **kwargs,
+        )
+        return hit, crit, hit_points
+
+    def splash(
+        self,
+        targets: List["BaseUnit"],
+        generator: "Generator",
+        **kwargs: "F_spec.kwargs",
+    ) -> None:
+        """Воздействие на цели области (векторный аналог action)
+        Попадание и критический удар бросаются для каждой цели своим спасброском,
+        значения предмета - одним броском на все цели
+
+        Args:
+            targets: цели способности
+            generator: генератор случайных чисел
+            kwargs: дополнительные параметры (по одному значению на цель)
+        """
+        if not targets:
+            return
+        size = len(targets)
+        hit = self._difficulty.actions(
+            size=size,
+            generator=generator,
+            bonus=self.base_hit_chance,
+            penalty=hstack([
+                self.base_hit_resistances(target=target, size=1, generator=generator)
+                for target in targets
+            ]),
+        )
+        crit = self._crit_roll.actions(
+            size=size,
+            generator=generator,
+            bonus=self.base_crit_chance,
+            penalty=array([self.base_crit_resistance(target=target) for target in targets]),
+        )
+        mastery = self._person.mastery(attribute=self._item.attribute)
+        self._item.charge_area(
+            targets=targets,
+            hit=hit,
+            crit=crit,
+            generator=generator,
+            mastery=mastery,
+            **kwargs,
+        )
+
 
 class Melee(Perk):
     """Модель способности - физическая атака"""
@@ -303,6 +546,42 @@ class Melee(Perk):
         """
         return target.defense + target.save_throw(attribute=self._item.attribute)
 
+    def base_hit_resistance_distribution(self, target: "BaseUnit") -> "Distribution":
+        """Точное распределение базовой сопротивляемости удару
+
+        Args:
+            target: цель способности
+
+        Returns:
+            Distribution: распределение
+        """
+        return shift_distribution(
+            distribution=target.save_distribution(attribute=self._item.attribute),
+            value=target.defense,
+        )
+
+    def base_hit_resistances(
+        self,
+        target: "BaseUnit",
+        size: int,
+        generator: "Generator",
+    ) -> "ndarray | int":
+        """Базовая сопротивляемость удару для серии бросков (векторно)
+
+        Args:
+            target: цель способности
+            size: количество бросков
+            generator: генератор случайных чисел
+
+        Returns:
+            ndarray | int: значения
+        """
+        return target.defense + target.save_throws(
+            attribute=self._item.attribute,
+            size=size,
+            generator=generator,
+        )
+
 
 class Armor(Perk):
     """Модель способности - использовать защитную стойку (требуется щит)"""
@@ -345,6 +624,17 @@ class Armor(Perk):
             texture=texture,
         )
 
+    def outcomes(self, target: "BaseUnit") -> Tuple[Tuple[float, Outcome], ...]:
+        """Возможные исходы бросков способности (щит всегда срабатывает)
+
+        Args:
+            target: цель способности
+
+        Returns:
+            tuple: пары (вероятность, исход)
+        """
+        return (1.0, Outcome(hit=True, crit=False)),
+
     def action(self, target: "BaseUnit", **kwargs: "F_spec.kwargs") -> None:
         """Укрыться щитом
 
@@ -359,6 +649,37 @@ class Armor(Perk):
             **kwargs,
         )
 
+    def simulate_action(
+        self,
+        target: "BaseUnit",
+        hit_points: "ndarray",
+        generator: "Generator",
+        **kwargs: "F_spec.kwargs",
+    ) -> Tuple["ndarray", "ndarray", "ndarray"]:
+        """Серия воздействий на цель (векторный аналог action)
+
+        Args:
+            target: цель способности
+            hit_points: здоровье цели до воздействия
+            generator: генератор случайных чисел
+            kwargs: дополнительные параметры
+
+        Returns:
+            tuple: попадания, критические удары, здоровье цели после воздействия
+        """
+        size = hit_points.size
+        hit = full(shape=size, fill_value=True)
+        crit = full(shape=size, fill_value=False)
+        hit_points = self._item.simulate(
+            target=target,
+            hit=hit,
+            crit=crit,
+            hit_points=hit_points,
+            generator=generator,
+            **kwargs,
+        )
+        return hit, crit, hit_points
+
 
 class Magic(Perk):
     """Модель способности - использование магии"""
@@ -443,6 +764,17 @@ class Passive(Perk):
             texture=texture,
         )
 
+    def outcomes(self, target: "BaseUnit") -> Tuple[Tuple[float, Outcome], ...]:
+        """Возможные исходы бросков способности (пассивный эффект всегда срабатывает)
+
+        Args:
+            target: цель способности
+
+        Returns:
+            tuple: пары (вероятность, исход)
+        """
+        return (1.0, Outcome(hit=True, crit=False)),
+
     def action(self, target: "BaseUnit", **kwargs: "F_spec.kwargs") -> None:
         """Использовать пассивный эффект
 
@@ -457,6 +789,37 @@ class Passive(Perk):
             **kwargs,
         )
 
+    def simulate_action(
+        self,
+        target: "BaseUnit",
+        hit_points: "ndarray",
+        generator: "Generator",
+        **kwargs: "F_spec.kwargs",
+    ) -> Tuple["ndarray", "ndarray", "ndarray"]:
+        """Серия воздействий на цель (векторный аналог action)
+
+        Args:
+            target: цель способности
+            hit_points: здоровье цели до воздействия
+            generator: генератор случайных чисел
+            kwargs: дополнительные параметры
+
+        Returns:
+            tuple: попадания, критические удары, здоровье цели после воздействия
+        """
+        size = hit_points.size
+        hit = full(shape=size, fill_value=True)
+        crit = full(shape=size, fill_value=False)
+        hit_points = self._item.simulate(
+            target=target,
+            hit=hit,
+            crit=crit,
+            hit_points=hit_points,
+            generator=generator,
+            **kwargs,
+        )
+        return hit, crit, hit_points
+
 
 class PerkCombination(BasePerk):
     """Модель способности - комбинированная атака (оружие + заклинание)"""
@@ -486,6 +849,11 @@ class PerkCombination(BasePerk):
         self._main_perk = main_perk
         self._other_perks = other_perks
 
+    @property
+    def parts(self) -> Tuple[BasePerk, ...]:
+        """Составные способности: главная и эффекты"""
+        return self._main_perk, *self._other_perks
+
     def activate(self, target: "BaseUnit", **kwargs: "F_spec.kwargs"):
         """Воздействие на цель
         Заклинание должно пройти проверку на попадание, иначе нанесет половину урона
@@ -498,15 +866,84 @@ class PerkCombination(BasePerk):
             kwargs: дополнительные параметры
         """
 
-        # вызывается главная способность
-        self._main_perk.activate(target=target, **kwargs)
+        # заданный исход (при поиске хода) - свой для каждой составной способности
+        outcomes = outcome_context.get()
 
-        # затем последовательно вызоваются все эффекты
-        for next_perk in self._other_perks:
+        # вызывается главная способность, затем последовательно вызоваются все эффекты
+        for index, next_perk in enumerate(self.parts):
+            token = outcome_context.set(outcomes[index] if outcomes else None)
             next_perk.activate(target=target, **kwargs)
+            outcome_context.restore(token)
 
         self.change_status(value=PerkStatus.done.value)
 
+    def simulate(
+        self,
+        target: "BaseUnit",
+        hit_points: "ndarray",
+        generator: "Generator",
+        **kwargs: "F_spec.kwargs",
+    ) -> Tuple["ndarray", "ndarray", "ndarray"]:
+        """Смоделировать серию активаций способности (векторный аналог activate)
+        Попадания и критические удары возвращаются для главной способности
+
+        Args:
+            target: цель способности
+            hit_points: здоровье цели до активации (по одному значению на исход)
+            generator: генератор случайных чисел
+            kwargs: дополнительные параметры
+
+        Returns:
+            tuple: попадания, критические удары, здоровье цели после активации
+        """
+        hit, crit, hit_points = self._main_perk.simulate(
+            target=target,
+            hit_points=hit_points,
+            generator=generator,
+            **kwargs,
+        )
+        for next_perk in self._other_perks:
+            _, _, hit_points = next_perk.simulate(
+                target=target,
+                hit_points=hit_points,
+                generator=generator,
+                **kwargs,
+            )
+        return hit, crit, hit_points
+
+    def splash(
+        self,
+        targets: List["BaseUnit"],
+        generator: "Generator",
+        **kwargs: "F_spec.kwargs",
+    ) -> None:
+        """Воздействие на цели области: главная способность, затем все эффекты
+
+        Args:
+            targets: цели способности
+            generator: генератор случайных чисел
+            kwargs: дополнительные параметры (по одному значению на цель)
+        """
+        self._main_perk.splash(targets=targets, generator=generator, **kwargs)
+        for next_perk in self._other_perks:
+            next_perk.splash(targets=targets, generator=generator, **kwargs)
+
+    def outcomes(self, target: "BaseUnit") -> Tuple[Tuple[float, Tuple[Outcome, ...]], ...]:
+        """Возможные исходы бросков составных способностей с их точными вероятностями
+        Каждая способность бросает кости независимо, поэтому исход - по одному исходу на способность,
+        а вероятность - произведение вероятностей
+
+        Args:
+            target: цель способности
+
+        Returns:
+            tuple: пары (вероятность, исходы составных способностей)
+        """
+        return tuple(
+            (prod([probability for probability, _ in parts]), tuple(outcome for _, outcome in parts))
+            for parts in product(*(perk.outcomes(target=target) for perk in self.parts))
+        )
+
     def change_attribute(self, value: "BaseAttribute") -> None:
         """Изменить тип способности
 
@@ -528,6 +965,7 @@ class PerkCombination(BasePerk):
         self._main_perk.change_status(value=value)
         for next_perk in self._other_perks:
             next_perk.change_status(value=value)
+        self.notify(event=ModelEvent.status.value)
 
     def change_modifier(self, value: "BaseAttribute") -> None:
         """Изменить модификатор способности
@@ -539,3 +977,4 @@ class PerkCombination(BasePerk):
         self._main_perk.change_modifier(value=value)
         for next_perk in self._other_perks:
             next_perk.change_modifier(value=value)
+        self.notify(event=ModelEvent.status.value)
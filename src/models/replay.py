@@ -0,0 +1,326 @@
+import gzip
+import json
+from contextvars import copy_context
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple, Callable, Optional, Union, Dict, List, Tuple, IO
+
+from src.board.layouts import stress_layout
+from src.models.board import Board
+from src.models.history import UndoHistory
+from src.utils.enums import ReplayCommand
+from src.utils.rng import random_context, PooledBackend
+from src.utils.tools import Index
+from src.utils.constants import REPLAY_VERSION, REPLAY_SCENARIO, REPLAY_DIRECTORY
+
+if TYPE_CHECKING:
+    from src.abstractions.board import BaseBoard
+
+
+def standard_scenario(board: "BaseBoard") -> None:
+    """Начальная расстановка игры: клетки, здания, фигуры, домены (по расстановке доски)
+
+    Args:
+        board: пустая доска
+    """
+    board.initialize_cells()
+    board.initialize_buildings()
+    board.initialize_figures()
+    board.fill_domains()
+
+
+def stress_scenario(board: "BaseBoard") -> None:
+    """Нагрузочная расстановка: доска 100x100 с сотнями фигур (только без графики)
+
+    Args:
+        board: пустая доска
+    """
+    board.layout = stress_layout()
+    standard_scenario(board=board)
+
+
+# начальные расстановки: имя -> заполнение пустой доски
+SCENARIOS: Dict[str, Callable[["BaseBoard"], None]] = {
+    "standard": standard_scenario,
+    "stress": stress_scenario,
+}
+
+# команда записи: код команды и ее параметры
+Command = Tuple[Union[str, int], ...]
+
+
+class ReplayHeader(NamedTuple):
+    """Заголовок записи партии: все, что нужно, чтобы начать партию заново
+    Начальная позиция (хэш Зобриста) проверяет, что расстановка совпала с записанной
+    """
+    version: int
+    scenario: str
+    seed: int
+    automated: Tuple[str, ...]
+    start: int
+
+
+def open_log(path: Union[str, Path], mode: str) -> IO[str]:
+    """Открыть файл записи (файлы *.gz сжимаются)
+
+    Args:
+        path: путь к файлу
+        mode: режим ("r", "w")
+
+    Returns:
+        IO: текстовый файл
+    """
+    if str(path).endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def new_replay_path(directory: Union[str, Path] = REPLAY_DIRECTORY) -> Path:
+    """Путь к файлу записи новой партии (имя - время начала партии)
+
+    Args:
+        directory: папка записей (создается при необходимости)
+
+    Returns:
+        Path: путь
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory / f"{datetime.now():%Y%m%d-%H%M%S}.jsonl.gz"
+
+
+class ReplayLog:
+    """Запись партии в формате JSONL: первая строка - заголовок, затем по строке на команду игрока
+    Команды - ввод игроков (выбор клетки, действия и цели, действие компьютера, завершение хода, отмена),
+    поэтому при том же зерне костей партия повторяется ход в ход
+    """
+
+    def __init__(self, header: ReplayHeader, commands: List[Command] = None):
+        """Инициализация записи
+
+        Args:
+            header: заголовок
+            commands: команды
+        """
+        self._header = header
+        self._commands: List[Command] = commands if commands is not None else []
+
+    @property
+    def header(self) -> ReplayHeader:
+        return self._header
+
+    @property
+    def commands(self) -> List[Command]:
+        return self._commands
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Сохранить запись в файл
+
+        Args:
+            path: путь к файлу
+        """
+        with open_log(path=path, mode="w") as file:
+            file.write(self.dump_header(header=self._header))
+            for command in self._commands:
+                file.write(self.dump_command(command=command))
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ReplayLog":
+        """Прочитать запись из файла
+
+        Args:
+            path: путь к файлу
+
+        Returns:
+            ReplayLog: запись
+        """
+        with open_log(path=path, mode="r") as file:
+            values = json.loads(file.readline())
+            header = ReplayHeader(**{**values, "automated": tuple(values["automated"])})
+            if header.version != REPLAY_VERSION:
+                raise ValueError(f"Неизвестная версия записи: {header.version}")
+            commands = [tuple(json.loads(line)) for line in file if line.strip()]
+        return cls(header=header, commands=commands)
+
+    @staticmethod
+    def dump_header(header: ReplayHeader) -> str:
+        """Строка заголовка"""
+        return json.dumps(header._asdict(), separators=(",", ":")) + "\n"
+
+    @staticmethod
+    def dump_command(command: Command) -> str:
+        """Строка команды"""
+        return json.dumps(command, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+class ReplayRecorder:
+    """Запись партии по ходу игры
+    Подключается к доске: доска передает ей каждую команду игрока;
+    если задан файл, команды дописываются в него по ходу партии и сбрасываются на диск в конце каждого хода
+    """
+
+    def __init__(
+        self,
+        board: "BaseBoard",
+        seed: int,
+        path: Union[str, Path] = None,
+        scenario: str = REPLAY_SCENARIO,
+    ):
+        """Инициализация записи (доска должна быть расставлена)
+
+        Args:
+            board: доска
+            seed: зерно костей партии
+            path: путь к файлу записи (без пути - запись только в памяти)
+            scenario: начальная расстановка
+        """
+        self._log = ReplayLog(
+            header=ReplayHeader(
+                version=REPLAY_VERSION,
+                scenario=scenario,
+                seed=seed,
+                automated=tuple(domain.name for domain in board.players if domain.automated),
+                start=board.position_key,
+            ),
+        )
+        self._file: Optional[IO[str]] = None
+        if path is not None:
+            self._file = open_log(path=path, mode="w")
+            self._file.write(ReplayLog.dump_header(header=self._log.header))
+            self._file.flush()
+        board.recorder = self
+
+    @property
+    def log(self) -> ReplayLog:
+        return self._log
+
+    def record(self, command: str, *args: int | str) -> None:
+        """Записать команду
+
+        Args:
+            command: код команды
+            args: параметры команды
+        """
+        entry = (command, *args)
+        self._log.commands.append(entry)
+        if self._file is not None:
+            self._file.write(ReplayLog.dump_command(command=entry))
+            # сброс на диск - по ходам (частый сброс портит сжатие)
+            if command == ReplayCommand.finish_circle.value:
+                self._file.flush()
+
+    def close(self) -> None:
+        """Закрыть файл записи"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class ReplayPlayer:
+    """Воспроизведение записи партии
+    Доска расставляется по заголовку, кости бросаются из источника с записанным зерном,
+    затем команды выполняются по одной (step) или все сразу без графики (run)
+    """
+
+    def __init__(
+        self,
+        log: ReplayLog,
+        board: "BaseBoard" = None,
+        history: UndoHistory = None,
+    ):
+        """Инициализация воспроизведения
+
+        Args:
+            log: запись
+            board: пустая доска (по умолчанию - доска без графики)
+            history: история отмены действий доски (по умолчанию - своя)
+        """
+        self._log = log
+        self._board = board if board is not None else Board()
+        self._history = history if history is not None else UndoHistory(board=self._board)
+        self._position = 0
+        self._prepared = False
+
+    @property
+    def board(self) -> "BaseBoard":
+        return self._board
+
+    @property
+    def position(self) -> int:
+        """Количество выполненных команд"""
+        return self._position
+
+    @property
+    def finished(self) -> bool:
+        return self._position >= len(self._log)
+
+    def prepare(self) -> None:
+        """Расставить доску и задать источник костей (в текущем контексте)"""
+        header = self._log.header
+        random_context.set(PooledBackend(seed=header.seed))
+        SCENARIOS[header.scenario](self._board)
+        for domain in self._board.players:
+            domain.automated = domain.name in header.automated
+        if self._board.position_key != header.start:
+            raise ValueError("Начальная позиция записи не совпадает с расстановкой")
+        self._history.record()
+        self._prepared = True
+
+    def step(self) -> bool:
+        """Выполнить следующую команду
+
+        Returns:
+            bool: команда выполнена (иначе запись закончилась)
+        """
+        if not self._prepared:
+            self.prepare()
+        if self.finished:
+            return False
+        self.apply(command=self._log.commands[self._position])
+        self._position += 1
+        self._history.record()
+        return True
+
+    def run(self) -> "BaseBoard":
+        """Воспроизвести запись целиком без графики
+        Воспроизведение идет в отдельном контексте: источник костей игры не меняется
+
+        Returns:
+            BaseBoard: доска после последней команды
+        """
+        def play() -> None:
+            while self.step():
+                pass
+
+        copy_context().run(play)
+        return self._board
+
+    def apply(self, command: Command) -> None:
+        """Выполнить команду на доске
+
+        Args:
+            command: команда
+        """
+        board = self._board
+        code, *args = command
+        if code == ReplayCommand.start_circle.value:
+            board.start_circle()
+        elif code == ReplayCommand.select_cell.value:
+            board.select_cell(index=Index(row=args[0], column=args[1]))
+        elif code == ReplayCommand.select_action.value:
+            board.select_action(action=board.get_figure_action_list()[args[0]])
+        elif code == ReplayCommand.select_target.value:
+            board.select_target(index=Index(row=args[0], column=args[1]))
+        elif code == ReplayCommand.perform.value:
+            cells = board.get_cells()
+            cell = cells[args[0]]
+            board.perform(current_cell=cell, action=cell.figure.get_actions()[args[1]], target=cells[args[2]])
+        elif code == ReplayCommand.finish_circle.value:
+            board.finish_circle()
+        elif code == ReplayCommand.undo.value:
+            self._history.undo()
+        else:
+            raise ValueError(f"Неизвестная команда записи: {code}")
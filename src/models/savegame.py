@@ -0,0 +1,254 @@
+import struct
+from pathlib import Path
+from zlib import crc32
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+from src.models.board import Board
+from src.models.replay import SCENARIOS
+from src.utils.enums import Time, FigureStatus, PerkStatus, RollModifier
+from src.utils.tools import (
+    BoardState,
+    CellState,
+    DomainState,
+    FigureState,
+    UnitState,
+    PerkState,
+    BuildingState,
+    StateKey,
+)
+from src.utils.constants import SAVE_MAGIC, SAVE_VERSION, REPLAY_SCENARIO
+
+if TYPE_CHECKING:
+    from src.abstractions.board import BaseBoard
+
+# заголовок файла: метка, версия, контрольная сумма расстановки, начата ли битва, цикл времени, длина имени расстановки
+HEADER = struct.Struct("<4sHI?BB")
+# форматы номера фигуры: байт для обычных досок, два байта для больших (последний номер - нет фигуры)
+FIGURE_CODES = (("B", 0xFF), ("H", 0xFFFF))
+
+
+def encoder(values: Tuple[str, ...]) -> Dict[str, int]:
+    """Номера значений перечисления (значение -> номер)"""
+    return {value: number for number, value in enumerate(values)}
+
+
+TIMES = tuple(member.value for member in Time)
+FIGURE_STATUSES = tuple(member.value for member in FigureStatus)
+PERK_STATUSES = tuple(member.value for member in PerkStatus)
+MODIFIERS = tuple(member.value for member in RollModifier)
+
+
+class SaveCodec:
+    """Двоичный формат сохранения доски
+    Порядок объектов (каталог) берется из снимка расстановки, поэтому в файле хранятся только
+    изменяемые значения: номера фигур и доменов вместо имен, номера значений перечислений вместо строк.
+    Постоянная часть упаковывается одним вызовом struct, списки фигур доменов дописываются байтами
+    """
+
+    def __init__(self, board: "BaseBoard", scenario: str = REPLAY_SCENARIO):
+        """Инициализация формата по расставленной доске
+
+        Args:
+            board: доска
+            scenario: имя расстановки
+        """
+        self._scenario = scenario
+        state = board.snapshot()
+        keys: Dict[str, List[StateKey]] = {"figure": [], "domain": [], "cell": [], "building": []}
+        for key in state.objects:
+            keys[key[0]].append(key)
+        self._keys = keys
+        self._figures = tuple(name for _, name in keys["figure"])
+        self._domains = tuple(name for _, name in keys["domain"])
+        self._figure_numbers = encoder(self._figures)
+        self._domain_numbers = encoder(self._domains)
+        self._perks = {
+            key: tuple(name for name, _ in state.objects[key].unit.perks)
+            for key in keys["figure"]
+        }
+        self._building_perks = {key: state.objects[key].perk is not None for key in keys["building"]}
+        self._figure_code, self._no_figure = next(
+            (code, empty) for code, empty in FIGURE_CODES if len(self._figures) < empty
+        )
+
+        fields = ["<"]
+        for key in keys["figure"]:
+            # может ходить, статус, уровень, здоровье, броня, статус и модификатор способностей
+            fields.append("?Bhhh" + "BB" * len(self._perks[key]))
+        for _ in keys["domain"]:
+            # мощь, очередь, количество фигур и пленников
+            fields.append("h?" + self._figure_code * 2)
+        # фигура и домен клетки
+        fields.append((self._figure_code + "B") * len(keys["cell"]))
+        for key in keys["building"]:
+            # домен здания, статус и модификатор способности (при наличии)
+            fields.append("BBB" if self._building_perks[key] else "B")
+        self._body = struct.Struct("".join(fields))
+        catalogue = "|".join([scenario, *map(str, state.objects)])
+        self._checksum = crc32(catalogue.encode("utf-8"))
+
+        self._times = encoder(TIMES)
+        self._figure_statuses = encoder(FIGURE_STATUSES)
+        self._perk_statuses = encoder(PERK_STATUSES)
+        self._modifiers = encoder(MODIFIERS)
+
+    def dumps(self, state: BoardState) -> bytes:
+        """Упаковать снимок доски
+
+        Args:
+            state: снимок
+
+        Returns:
+            bytes: данные
+        """
+        objects = state.objects
+        values: list = []
+        for key in self._keys["figure"]:
+            figure: FigureState = objects[key]
+            unit = figure.unit
+            values += (figure.can_move, self._figure_statuses[figure.status], unit.level, unit.current_hp, unit.armor)
+            for _, perk in unit.perks:
+                values += (self._perk_statuses[perk.status], self._modifiers[perk.modifier])
+        members: List[int] = []
+        for key in self._keys["domain"]:
+            domain: DomainState = objects[key]
+            values += (domain.power, domain.turn, len(domain.figures), len(domain.prisoners))
+            members += (self._figure_numbers[name] for name in domain.figures + domain.prisoners)
+        for key in self._keys["cell"]:
+            cell: CellState = objects[key]
+            values += (
+                self._figure_numbers[cell.figure] if cell.figure else self._no_figure,
+                self._domain_numbers[cell.domain],
+            )
+        for key in self._keys["building"]:
+            building: BuildingState = objects[key]
+            values.append(self._domain_numbers[building.domain])
+            if self._building_perks[key]:
+                values += (self._perk_statuses[building.perk.status], self._modifiers[building.perk.modifier])
+
+        scenario = self._scenario.encode("utf-8")
+        header = HEADER.pack(
+            SAVE_MAGIC,
+            SAVE_VERSION,
+            self._checksum,
+            state.started,
+            self._times[state.time],
+            len(scenario),
+        )
+        members_data = struct.pack(f"<{len(members)}{self._figure_code}", *members)
+        return b"".join((header, scenario, self._body.pack(*values), members_data))
+
+    def loads(self, data: bytes) -> BoardState:
+        """Распаковать снимок доски (снимок восстанавливается на любой доске с той же расстановкой)
+
+        Args:
+            data: данные
+
+        Returns:
+            BoardState: снимок
+        """
+        magic, version, checksum, started, time, length = HEADER.unpack_from(data)
+        if magic != SAVE_MAGIC or version != SAVE_VERSION:
+            raise ValueError(f"Неизвестный формат сохранения: {magic!r}, версия {version}")
+        if checksum != self._checksum:
+            raise ValueError("Сохранение сделано для другой расстановки")
+        offset = HEADER.size + length
+        values = iter(self._body.unpack_from(data, offset))
+        offset += self._body.size
+        count = (len(data) - offset) // struct.calcsize(self._figure_code)
+        members = iter(struct.unpack_from(f"<{count}{self._figure_code}", data, offset))
+
+        objects: Dict[StateKey, tuple] = {}
+        for key in self._keys["figure"]:
+            can_move, status, level, current_hp, armor = (next(values) for _ in range(5))
+            perks = tuple(
+                (name, PerkState(status=PERK_STATUSES[next(values)], modifier=MODIFIERS[next(values)]))
+                for name in self._perks[key]
+            )
+            objects[key] = FigureState(
+                can_move=can_move,
+                status=FIGURE_STATUSES[status],
+                unit=UnitState(level=level, current_hp=current_hp, armor=armor, perks=perks),
+            )
+        for key in self._keys["domain"]:
+            power, turn, figures, prisoners = (next(values) for _ in range(4))
+            objects[key] = DomainState(
+                power=power,
+                turn=turn,
+                figures=tuple(self._figures[next(members)] for _ in range(figures)),
+                prisoners=tuple(self._figures[next(members)] for _ in range(prisoners)),
+            )
+        for key in self._keys["cell"]:
+            figure, domain = next(values), next(values)
+            objects[key] = CellState(
+                figure=self._figures[figure] if figure != self._no_figure else None,
+                domain=self._domains[domain],
+            )
+        for key in self._keys["building"]:
+            domain = self._domains[next(values)]
+            perk: Optional[PerkState] = None
+            if self._building_perks[key]:
+                perk = PerkState(status=PERK_STATUSES[next(values)], modifier=MODIFIERS[next(values)])
+            objects[key] = BuildingState(domain=domain, perk=perk)
+        return BoardState(started=started, time=TIMES[time], objects=objects)
+
+
+# форматы сохранения по расстановкам (каталог строится один раз)
+_codecs: Dict[str, SaveCodec] = {}
+
+
+def get_codec(scenario: str = REPLAY_SCENARIO) -> SaveCodec:
+    """Формат сохранения расстановки
+
+    Args:
+        scenario: имя расстановки
+
+    Returns:
+        SaveCodec: формат
+    """
+    if scenario not in _codecs:
+        board = Board()
+        SCENARIOS[scenario](board)
+        _codecs[scenario] = SaveCodec(board=board, scenario=scenario)
+    return _codecs[scenario]
+
+
+def save_game(board: "BaseBoard", path: Union[str, Path], scenario: str = REPLAY_SCENARIO) -> int:
+    """Сохранить доску в файл
+
+    Args:
+        board: доска
+        path: путь к файлу
+        scenario: имя расстановки доски
+
+    Returns:
+        int: размер сохранения (байты)
+    """
+    data = get_codec(scenario=scenario).dumps(state=board.snapshot())
+    with open(path, "wb") as file:
+        file.write(data)
+    return len(data)
+
+
+def load_game(path: Union[str, Path], board: "BaseBoard" = None) -> "BaseBoard":
+    """Загрузить доску из файла
+    Расставленная доска только восстанавливается из снимка; без доски создается новая
+    (объекты расстановки строятся один раз, затем их состояние восстанавливается)
+
+    Args:
+        path: путь к файлу
+        board: расставленная доска той же расстановки
+
+    Returns:
+        BaseBoard: доска
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+    _, _, _, _, _, length = HEADER.unpack_from(data)
+    scenario = data[HEADER.size:HEADER.size + length].decode("utf-8")
+    state = get_codec(scenario=scenario).loads(data=data)
+    if board is None:
+        board = Board()
+        SCENARIOS[scenario](board)
+    board.restore(state=state)
+    return board
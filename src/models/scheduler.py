@@ -0,0 +1,137 @@
+from typing import TYPE_CHECKING, Dict, Iterable, List
+
+from src.utils.enums import ModelEvent, PerkStatus, ActionType
+
+if TYPE_CHECKING:
+    from src.abstractions.building import BaseBuilding
+    from src.abstractions.cell import BaseCell
+    from src.abstractions.domain import BaseDomain
+    from src.abstractions.figure import BaseFigure
+    from src.abstractions.perk import BasePerk
+    from src.abstractions.unit import BaseUnit
+    from src.utils.tools import BaseAttribute
+
+
+class TurnScheduler:
+    """Планировщик конца хода
+    Объекты доски записываются в фазы конца хода по событиям своих моделей:
+    фигура с броней или потраченной способностью - на перезарядку в конце цикла своего домена,
+    фигура с изменившимся здоровьем - на проверку статуса,
+    здание с фигурой внутри (эффект здания) или с потраченной способностью - на действие здания.
+    Конец хода обходит только записанные объекты; порядок обхода - порядок объектов на доске
+    """
+
+    def __init__(self, figures: Iterable["BaseFigure"], buildings: Iterable["BaseBuilding"]):
+        """Инициализация планировщика (подписка на события персонажей, способностей и зданий)
+
+        Args:
+            figures: фигуры доски
+            buildings: здания доски
+        """
+        # порядок объектов на доске
+        self._order: Dict[int, int] = {}
+        # владельцы наблюдаемых моделей (персонаж, способность -> фигура; способность, клетка -> здание)
+        self._owners: Dict[int, object] = {}
+        # здоровье персонажей при последнем событии
+        self._hit_points: Dict[int, int] = {}
+        # записанные фигуры и здания
+        self._expiring: Dict[int, "BaseFigure"] = {}
+        self._damaged: Dict[int, "BaseFigure"] = {}
+        self._buildings: Dict[int, "BaseBuilding"] = {}
+        # здания с эффектом, в которых стоит фигура (эффект действует каждый ход)
+        self._occupied: Dict[int, "BaseBuilding"] = {}
+
+        for position, figure in enumerate(figures):
+            self._order[id(figure)] = position
+            unit = figure.unit
+            self._owners[id(unit)] = figure
+            self._hit_points[id(figure)] = unit.current_hp
+            unit.subscribe(observer=self._on_unit)
+            for perk in unit.get_perks().values():
+                self._owners[id(perk)] = figure
+                perk.subscribe(observer=self._on_perk)
+                self._on_perk(source=perk, event=ModelEvent.status.value)
+            self._on_unit(source=unit, event=ModelEvent.health.value)
+
+        for position, building in enumerate(buildings):
+            self._order[id(building)] = position
+            action = building.action
+            if not action:
+                continue
+            self._owners[id(action.perk)] = building
+            action.perk.subscribe(observer=self._on_building_perk)
+            self._on_building_perk(source=action.perk, event=ModelEvent.status.value)
+            if action.attribute == ActionType.only_building.value and building.cell:
+                self._owners[id(building.cell)] = building
+                building.cell.subscribe(observer=self._on_cell)
+                self._on_cell(source=building.cell, event=ModelEvent.figure.value)
+
+    def expiring(self, domain: "BaseDomain") -> List["BaseFigure"]:
+        """Забрать фигуры домена, у которых истекают бафы или потрачены способности
+
+        Args:
+            domain: домен
+
+        Returns:
+            list: фигуры (в порядке доски)
+        """
+        figures = domain.figures
+        found = [figure for figure in self._expiring.values() if figure.name in figures]
+        for figure in found:
+            del self._expiring[id(figure)]
+        return self._sorted(found)
+
+    def damaged(self) -> List["BaseFigure"]:
+        """Забрать фигуры, здоровье которых изменилось
+
+        Returns:
+            list: фигуры (в порядке доски)
+        """
+        found = list(self._damaged.values())
+        self._damaged.clear()
+        return self._sorted(found)
+
+    def buildings(self) -> List["BaseBuilding"]:
+        """Забрать здания, которым нужно действие конца хода (эффект или перезарядка способности)
+
+        Returns:
+            list: здания (в порядке доски)
+        """
+        found = {**self._buildings, **self._occupied}
+        self._buildings.clear()
+        return self._sorted(found.values())
+
+    def _sorted(self, objects: Iterable[object]) -> list:
+        """Объекты в порядке доски"""
+        return sorted(objects, key=lambda item: self._order[id(item)])
+
+    def _on_unit(self, source: "BaseUnit", event: "BaseAttribute") -> None:
+        """Записать фигуру по событию персонажа: броня - на перезарядку, новое здоровье - на проверку статуса"""
+        figure = self._owners[id(source)]
+        if source.armor:
+            self._expiring[id(figure)] = figure
+        if source.current_hp != self._hit_points[id(figure)]:
+            self._hit_points[id(figure)] = source.current_hp
+            self._damaged[id(figure)] = figure
+
+    def _on_perk(self, source: "BasePerk", event: "BaseAttribute") -> None:
+        """Записать фигуру с потраченной способностью на перезарядку"""
+        if source.status != PerkStatus.active.value:
+            figure = self._owners[id(source)]
+            self._expiring[id(figure)] = figure
+
+    def _on_building_perk(self, source: "BasePerk", event: "BaseAttribute") -> None:
+        """Записать здание с потраченной способностью на перезарядку"""
+        if source.status != PerkStatus.active.value:
+            building = self._owners[id(source)]
+            self._buildings[id(building)] = building
+
+    def _on_cell(self, source: "BaseCell", event: "BaseAttribute") -> None:
+        """Отметить, стоит ли фигура в здании с эффектом"""
+        if event != ModelEvent.figure.value:
+            return
+        building = self._owners[id(source)]
+        if building.figure:
+            self._occupied[id(building)] = building
+        else:
+            self._occupied.pop(id(building), None)
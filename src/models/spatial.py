@@ -0,0 +1,186 @@
+from typing import TYPE_CHECKING, Iterable, Dict, List, Set, Tuple, FrozenSet
+
+from src.utils.enums import ModelEvent, AreaShape
+from src.utils.constants import SPATIAL_BUCKET_SIZE
+
+if TYPE_CHECKING:
+    from src.abstractions.cell import BaseCell
+    from src.utils.tools import BaseAttribute
+
+
+class SpatialIndex:
+    """Пространственный индекс доски (сетка корзин)
+    Клетки разложены по квадратным корзинам со стороной bucket_size клеток; клетки с фигурами
+    отмечаются в корзинах по событиям клеток. Запрос области обходит только корзины, которые она задевает,
+    поэтому цена запроса зависит от размера области, а не от размера доски.
+    Ответы на запросы соседей, областей и областей поражения запоминаются (клетки доски не меняются)
+    """
+
+    def __init__(self, cells: Iterable["BaseCell"], bucket_size: int = SPATIAL_BUCKET_SIZE):
+        """Инициализация индекса
+
+        Args:
+            cells: клетки доски
+            bucket_size: сторона корзины (в клетках)
+        """
+        self._bucket_size = bucket_size
+        # позиция (строка, столбец) -> номер клетки и номер клетки -> позиция
+        self._ids: Dict[Tuple[int, int], int] = {}
+        self._positions: Dict[int, Tuple[int, int]] = {}
+        # корзина -> номера клеток и номера клеток с фигурами
+        self._buckets: Dict[Tuple[int, int], List[int]] = {}
+        self._occupied: Dict[Tuple[int, int], Set[int]] = {}
+        self._neighbors: Dict[Tuple[int, int], FrozenSet[int]] = {}
+        self._areas: Dict[Tuple[int, int], FrozenSet[int]] = {}
+        # (клетка, радиус, форма) -> номера клеток области поражения
+        self._footprints: Dict[Tuple[int, int, "BaseAttribute"], Tuple[int, ...]] = {}
+
+        cells = list(cells)
+        for cell in cells:
+            position = (cell.index.row, cell.index.column)
+            self._ids[position] = cell.index.id
+            self._positions[cell.index.id] = position
+            self._buckets.setdefault(self._bucket(*position), []).append(cell.index.id)
+        rows = {row for row, _ in self._ids}
+        columns = {column for _, column in self._ids}
+        self._max_radius = max(len(rows), len(columns)) if cells else 0
+
+        for cell in cells:
+            self._update(cell=cell, event=ModelEvent.figure.value)
+            cell.subscribe(observer=self._update)
+
+    @property
+    def max_radius(self) -> int:
+        """Радиус, покрывающий всю доску"""
+        return self._max_radius
+
+    def neighbors(self, cell_id: int, radius: int = 1) -> FrozenSet[int]:
+        """Номера клеток в пределах радиуса по горизонтали или вертикали (включая саму клетку)
+
+        Args:
+            cell_id: номер клетки
+            radius: радиус
+
+        Returns:
+            frozenset: номера клеток
+        """
+        radius = min(max(radius, 0), self._max_radius)
+        key = (cell_id, radius)
+        neighbors = self._neighbors.get(key)
+        if neighbors is None:
+            row, column = self._positions[cell_id]
+            found = {cell_id}
+            for step in range(1, radius + 1):
+                for position in (
+                    (row, column - step),
+                    (row, column + step),
+                    (row - step, column),
+                    (row + step, column),
+                ):
+                    neighbor = self._ids.get(position)
+                    if neighbor is not None:
+                        found.add(neighbor)
+            neighbors = self._neighbors[key] = frozenset(found)
+        return neighbors
+
+    def area(self, cell_id: int, radius: int = 1) -> FrozenSet[int]:
+        """Номера клеток квадрата с центром в клетке (радиус - по каждой оси)
+
+        Args:
+            cell_id: номер клетки
+            radius: радиус
+
+        Returns:
+            frozenset: номера клеток
+        """
+        radius = min(max(radius, 0), self._max_radius)
+        key = (cell_id, radius)
+        area = self._areas.get(key)
+        if area is None:
+            row, column = self._positions[cell_id]
+            area = self._areas[key] = frozenset(
+                found
+                for bucket in self._touched(row=row, column=column, radius=radius)
+                for found in self._buckets.get(bucket, ())
+                if self._inside(found, row=row, column=column, radius=radius)
+            )
+        return area
+
+    def footprint(
+        self,
+        cell_id: int,
+        radius: int = 1,
+        shape: "BaseAttribute" = AreaShape.cross.value,
+    ) -> Tuple[int, ...]:
+        """Номера клеток области поражения с центром в клетке
+        Крест - клетки по горизонтали и вертикали (как соседи), квадрат - клетки по каждой оси
+
+        Args:
+            cell_id: номер клетки
+            radius: радиус
+            shape: форма области
+
+        Returns:
+            tuple: номера клеток (по возрастанию)
+        """
+        key = (cell_id, radius, shape)
+        footprint = self._footprints.get(key)
+        if footprint is None:
+            if shape == AreaShape.square.value:
+                found = self.area(cell_id=cell_id, radius=radius)
+            else:
+                found = self.neighbors(cell_id=cell_id, radius=radius)
+            footprint = self._footprints[key] = tuple(sorted(found))
+        return footprint
+
+    def occupied(self, cell_id: int, radius: int = 1) -> List[int]:
+        """Номера клеток с фигурами в квадрате с центром в клетке
+
+        Args:
+            cell_id: номер клетки
+            radius: радиус
+
+        Returns:
+            list: номера клеток (по возрастанию)
+        """
+        row, column = self._positions[cell_id]
+        return sorted(
+            found
+            for bucket in self._touched(row=row, column=column, radius=radius)
+            for found in self._occupied.get(bucket, ())
+            if self._inside(found, row=row, column=column, radius=radius)
+        )
+
+    def _bucket(self, row: int, column: int) -> Tuple[int, int]:
+        """Корзина позиции"""
+        return row // self._bucket_size, column // self._bucket_size
+
+    def _touched(self, row: int, column: int, radius: int) -> List[Tuple[int, int]]:
+        """Корзины, которые задевает квадрат"""
+        top, left = self._bucket(row - radius, column - radius)
+        bottom, right = self._bucket(row + radius, column + radius)
+        return [
+            (bucket_row, bucket_column)
+            for bucket_row in range(top, bottom + 1)
+            for bucket_column in range(left, right + 1)
+        ]
+
+    def _inside(self, cell_id: int, row: int, column: int, radius: int) -> bool:
+        """Лежит ли клетка в квадрате"""
+        cell_row, cell_column = self._positions[cell_id]
+        return abs(cell_row - row) <= radius and abs(cell_column - column) <= radius
+
+    def _update(self, cell: "BaseCell", event: "BaseAttribute") -> None:
+        """Отметить клетку с фигурой в корзине
+
+        Args:
+            cell: клетка
+            event: событие
+        """
+        if event != ModelEvent.figure.value:
+            return
+        bucket = self._bucket(cell.index.row, cell.index.column)
+        if cell.figure:
+            self._occupied.setdefault(bucket, set()).add(cell.index.id)
+        elif bucket in self._occupied:
+            self._occupied[bucket].discard(cell.index.id)
@@ -0,0 +1,130 @@
+from typing import TYPE_CHECKING, Iterable, Dict, List
+from numpy import ndarray, zeros, concatenate, fromiter, int8, int32
+
+from src.abstractions.perk import BasePerk
+from src.utils.constants import UNIT_STORE_CAPACITY
+from src.utils.enums import PerkStatus, ModelEvent
+
+if TYPE_CHECKING:
+    from src.abstractions.board import BaseBoard
+    from src.abstractions.unit import BaseUnit
+
+
+class UnitStore:
+    """Хранилище боевого состояния персонажей (структура массивов)
+    Уровень, здоровье и броня всех подключенных персонажей лежат в непрерывных массивах NumPy,
+    статусы их способностей - в отдельном массиве; персонажи и способности читают и пишут
+    свои значения по номеру в хранилище. Одно хранилище может обслуживать несколько досок
+    (пакет партий), поэтому массовые операции над ними сводятся к одному присваиванию
+    """
+
+    # столбцы персонажей и способностей: имя -> тип значений
+    UNIT_COLUMNS = {"level": int32, "current_hp": int32, "armor": int32}
+    PERK_COLUMNS = {"perk_status": int8}
+
+    def __init__(self, capacity: int = UNIT_STORE_CAPACITY):
+        """Инициализация хранилища
+
+        Args:
+            capacity: начальная вместимость (массивы растут по мере надобности)
+        """
+        self._columns: Dict[str, ndarray] = {
+            name: zeros(capacity, dtype=dtype)
+            for name, dtype in {**self.UNIT_COLUMNS, **self.PERK_COLUMNS}.items()
+        }
+        self._units: List["BaseUnit"] = []
+        self._perks: Dict[int, int] = {}
+        self._unit_perks: List[ndarray] = []
+        self._active = BasePerk._status.encode(PerkStatus.active.value)
+
+    @property
+    def columns(self) -> Dict[str, ndarray]:
+        """Столбцы хранилища"""
+        return self._columns
+
+    @property
+    def units(self) -> List["BaseUnit"]:
+        """Подключенные персонажи (по номерам)"""
+        return self._units
+
+    def __len__(self) -> int:
+        return len(self._units)
+
+    def attach(self, board: "BaseBoard") -> None:
+        """Подключить всех персонажей доски
+
+        Args:
+            board: доска
+        """
+        for figure in board.get_figures().values():
+            self.add_unit(unit=figure.unit)
+
+    def add_unit(self, unit: "BaseUnit") -> int:
+        """Подключить персонажа вместе с его способностями
+
+        Args:
+            unit: персонаж
+
+        Returns:
+            int: номер персонажа в хранилище
+        """
+        if unit.store is self:
+            return unit.slot
+        slot = len(self._units)
+        self._grow(columns=self.UNIT_COLUMNS, size=slot + 1)
+        self._units.append(unit)
+        unit.attach(store=self, slot=slot)
+
+        perks: List[int] = []
+        for perk in unit.get_perks().values():
+            self._add_perk(perk=perk, slots=perks)
+        self._unit_perks.append(fromiter(perks, dtype=int32, count=len(perks)))
+        return slot
+
+    def end_circle(self, units: Iterable["BaseUnit"]) -> None:
+        """Завершить ход персонажей: снять броню и перезарядить способности
+        Значения меняются одним присваиванием; затем каждый персонаж сообщает об изменении
+
+        Args:
+            units: подключенные персонажи
+        """
+        units = list(units)
+        if not units:
+            return
+        slots = fromiter((unit.slot for unit in units), dtype=int32, count=len(units))
+        self._columns["armor"][slots] = 0
+        perks = concatenate([self._unit_perks[slot] for slot in slots])
+        self._columns["perk_status"][perks] = self._active
+        for unit in units:
+            unit.notify(event=ModelEvent.health.value)
+
+    def _add_perk(self, perk: "BasePerk", slots: List[int]) -> None:
+        """Подключить способность и ее составные части
+
+        Args:
+            perk: способность
+            slots: номера способностей персонажа (дополняются)
+        """
+        key = id(perk)
+        if key not in self._perks:
+            slot = len(self._perks)
+            self._grow(columns=self.PERK_COLUMNS, size=slot + 1)
+            self._perks[key] = slot
+            perk.attach(store=self, slot=slot)
+        slots.append(self._perks[key])
+        for part in perk.parts:
+            self._add_perk(perk=part, slots=slots)
+
+    def _grow(self, columns: Dict[str, type], size: int) -> None:
+        """Увеличить столбцы вдвое, если в них не хватает места
+
+        Args:
+            columns: столбцы
+            size: требуемый размер
+        """
+        for name in columns:
+            column = self._columns[name]
+            if len(column) < size:
+                grown = zeros(max(size, 2 * len(column)), dtype=column.dtype)
+                grown[:len(column)] = column
+                self._columns[name] = grown
@@ -1,8 +1,12 @@
+from functools import cache
 from arcade import resources
 from src.abstractions.text import BaseScrollableTextArea
 
 
-resources.load_kenney_fonts()
+@cache
+def load_fonts() -> None:
+    """Загрузить шрифты Kenney (один раз, при создании первого текстового поля)"""
+    resources.load_kenney_fonts()
 
 
 class ScrollableTextArea(BaseScrollableTextArea):
@@ -11,6 +15,7 @@ class ScrollableTextArea(BaseScrollableTextArea):
         self,
         text: str = "",
     ):
+        load_fonts()
         super().__init__(
             text=text,
         )
@@ -1,12 +1,17 @@
 from typing import TYPE_CHECKING
+from numpy import minimum, where
 
 from src.abstractions.unit import BaseAbility, BaseUnit
-from src.utils.enums import WeaponType, MagicType, PerkStatus
+from src.utils.enums import WeaponType, MagicType, PerkStatus, ModelEvent
 from src.models.dice import Dice, DiceRoll
 from src.utils.constants import SAVE_THROW_DICE_SIDE
+from src.utils.probability import point_distribution, shift_distribution
 
 if TYPE_CHECKING:
+    from numpy import ndarray
+    from numpy.random import Generator
     from utils.tools import BaseAttribute
+    from src.utils.probability import Distribution
     from src.models.collection import PerkCollection
     from src.utils.characters import Characteristic
 
@@ -43,17 +48,79 @@ class Ability(BaseAbility):
         """
 
         # базовый спасбросок
+        value = self.save_roll.action() if self._has_save_roll(attribute=attribute) else 0
+        # спасбросок по умению
+        value += self._save_bonus(attribute=attribute)
+
+        return value
+
+    def save_throws(
+        self,
+        attribute: "BaseAttribute",
+        size: int,
+        generator: "Generator",
+    ) -> "ndarray | int":
+        """Серия спасбросков (векторный аналог save_throw)
+
+        Args:
+            attribute: тип спасброска
+            size: количество спасбросков
+            generator: генератор случайных чисел
+
+        Returns:
+            ndarray | int: значения спасбросков
+        """
+        value = 0
+        if self._has_save_roll(attribute=attribute):
+            value = self.save_roll.actions(size=size, generator=generator)
+        return value + self._save_bonus(attribute=attribute)
+
+    def save_distribution(self, attribute: "BaseAttribute") -> "Distribution":
+        """Точное распределение спасброска (аналог save_throw)
+
+        Args:
+            attribute: тип спасброска
+
+        Returns:
+            Distribution: распределение
+        """
+        value = point_distribution(value=0)
+        if self._has_save_roll(attribute=attribute):
+            value = self.save_roll.distribution()
+        return shift_distribution(
+            distribution=value,
+            value=self._save_bonus(attribute=attribute),
+        )
+
+    @staticmethod
+    def _has_save_roll(attribute: "BaseAttribute") -> bool:
+        """Бросается ли кость для базового спасброска
+
+        Args:
+            attribute: тип спасброска
+
+        Returns:
+            bool: да/нет
+        """
         if attribute in WeaponType.values():
             # против оружия нет бонусов
-            value = 0
+            return False
         elif attribute == MagicType.dark.value:
             # против магии тьмы не существует защиты
-            value = 0
+            return False
         else:
             # Против любых других заклинаний по умолчанию спасбросок d20, даже если это лечение
-            value = self.save_roll.action()
+            return True
 
-        # спасбросок по умению
+    def _save_bonus(self, attribute: "BaseAttribute") -> int:
+        """Спасбросок по умению (бонус характеристики)
+
+        Args:
+            attribute: тип спасброска
+
+        Returns:
+            int: бонус
+        """
         if attribute in WeaponType.values():
             # против оружия спасбросок по ловкости
             ability = self._dexterity
@@ -76,9 +143,8 @@ class Ability(BaseAbility):
             ability = None
 
         if ability:
-            value += self._ability_coefficient(value=ability)
-
-        return value
+            return self._ability_coefficient(value=ability)
+        return 0
 
     def mastery(self, attribute: "BaseAttribute" = None) -> int:
         """Мастерство
@@ -239,6 +305,7 @@ class Unit(BaseUnit):
         """Повысить уровень персонажа (на 1 пункт)"""
         self._level += 1
         self._current_hp = 0 + self.hit_points
+        self.notify(event=ModelEvent.health.value)
 
     def defend_self(self, damage: int = 0) -> None:
         """Действие - защищаться (получить урон от другого персонажа)
@@ -251,6 +318,21 @@ class Unit(BaseUnit):
             self._current_hp = 0
         else:
             self._current_hp = hit_points
+        self.notify(event=ModelEvent.health.value)
+
+    def damaged_hp(self, hit_points: "ndarray", damage: "ndarray") -> "ndarray":
+        """Здоровье после получения урона (векторный аналог defend_self)
+        Состояние персонажа не изменяется
+
+        Args:
+            hit_points: текущее здоровье
+            damage: урон
+
+        Returns:
+            ndarray: здоровье
+        """
+        hit_points = hit_points - damage
+        return where(hit_points <= 0, 0, hit_points)
 
     def shield_self(self, value: int = 0) -> None:
         """Действие - укрыться щитом
@@ -259,6 +341,7 @@ class Unit(BaseUnit):
             value: значение брони
         """
         self._armor += value
+        self.notify(event=ModelEvent.health.value)
 
     def heal_self(self, value: int = 0) -> None:
         """Действие - исцелиться
@@ -271,6 +354,20 @@ class Unit(BaseUnit):
             self._current_hp = 0 + self.hit_points
         else:
             self._current_hp = hit_points
+        self.notify(event=ModelEvent.health.value)
+
+    def healed_hp(self, hit_points: "ndarray", value: "ndarray") -> "ndarray":
+        """Здоровье после исцеления (векторный аналог heal_self)
+        Состояние персонажа не изменяется
+
+        Args:
+            hit_points: текущее здоровье
+            value: значение
+
+        Returns:
+            ndarray: здоровье
+        """
+        return minimum(hit_points + value, self.hit_points)
 
     def end_circle(self) -> None:
         """Завершить ход
@@ -279,3 +376,4 @@ class Unit(BaseUnit):
         self._armor = 0
         for perk in self._perks.values():
             perk.change_status(value=PerkStatus.active.value)
+        self.notify(event=ModelEvent.health.value)
@@ -0,0 +1,141 @@
+from functools import partial
+from hashlib import blake2b
+from math import ceil
+from typing import TYPE_CHECKING, Callable, Hashable, Iterable, Dict, Tuple
+
+from src.utils.constants import ZOBRIST_SEED, ZOBRIST_HP_BUCKETS
+
+if TYPE_CHECKING:
+    from src.abstractions.cell import BaseCell
+    from src.abstractions.figure import BaseFigure
+    from src.abstractions.building import BaseBuilding
+    from src.models.journal import ChangeJournal
+    from src.utils.tools import BaseAttribute, StateKey
+
+
+class ZobristHash:
+    """Хэш Зобриста позиции
+    Каждому признаку позиции (фигура определенного типа и домена на клетке, домен клетки,
+    уровень здоровья, уровень и возможность перемещаться фигуры, статусы и модификаторы
+    способностей, время суток) соответствует случайный 64-битный ключ; хэш - XOR ключей всех признаков.
+    При чтении хэша пересчитываются только вклады объектов, изменившихся по журналу доски,
+    поэтому хэш обновляется за время, пропорциональное изменению, а не размеру доски
+    """
+
+    def __init__(
+        self,
+        journal: "ChangeJournal",
+        cells: Iterable["BaseCell"],
+        figures: Iterable["BaseFigure"],
+        buildings: Iterable["BaseBuilding"],
+        seed: int = ZOBRIST_SEED,
+        buckets: int = ZOBRIST_HP_BUCKETS,
+    ):
+        """Инициализация хэша
+
+        Args:
+            journal: журнал изменений доски
+            cells: клетки доски
+            figures: фигуры доски
+            buildings: здания доски
+            seed: зерно ключей (одно зерно - одинаковые ключи на всех досках и в процессах)
+            buckets: количество уровней здоровья
+        """
+        self._journal = journal
+        self._seed = seed.to_bytes(8, "little")
+        self._buckets = buckets
+        self._keys: Dict[Tuple, int] = {}
+        # объект доски -> функция его вклада в хэш
+        self._functions: Dict["StateKey", Callable[[], int]] = {}
+        for cell in cells:
+            self._functions[("cell", cell.index.id)] = partial(self._cell_value, cell)
+        for figure in figures:
+            self._functions[("figure", figure.name)] = partial(self._figure_value, figure)
+        for building in buildings:
+            if building.action:
+                self._functions[("building", building.index.id)] = partial(self._building_value, building)
+
+        self._values = {key: value() for key, value in self._functions.items()}
+        self._key = 0
+        for value in self._values.values():
+            self._key ^= value
+        self._clock = journal.clock
+
+    @property
+    def key(self) -> int:
+        """Хэш расстановки (без времени суток)"""
+        if self._clock != self._journal.clock:
+            for key in self._journal.changed(since=self._clock):
+                function = self._functions.get(key)
+                if function:
+                    value = function()
+                    self._key ^= self._values[key] ^ value
+                    self._values[key] = value
+            self._clock = self._journal.clock
+        return self._key
+
+    def position(self, time: "BaseAttribute") -> int:
+        """Хэш позиции с учетом времени суток (чей ход)
+
+        Args:
+            time: время суток
+
+        Returns:
+            int: хэш
+        """
+        return self.key ^ self.feature("time", time)
+
+    def feature(self, *parts: Hashable) -> int:
+        """Ключ признака позиции (ключи не зависят от порядка обращений)
+
+        Args:
+            parts: описание признака
+
+        Returns:
+            int: 64-битный ключ
+        """
+        key = self._keys.get(parts)
+        if key is None:
+            digest = blake2b(repr(parts).encode(), digest_size=8, key=self._seed).digest()
+            key = self._keys[parts] = int.from_bytes(digest, "little")
+        return key
+
+    def recompute(self) -> int:
+        """Хэш расстановки, посчитанный заново (для проверки пошагового обновления)
+
+        Returns:
+            int: хэш
+        """
+        key = 0
+        for value in self._functions.values():
+            key ^= value()
+        return key
+
+    def _cell_value(self, cell: "BaseCell") -> int:
+        """Вклад клетки: домен клетки, тип и домен фигуры на клетке"""
+        cell_id = cell.index.id
+        value = self.feature("cell", cell_id, cell.domain.name)
+        if cell.figure:
+            value ^= self.feature("cell", cell_id, cell.figure.unit.name, cell.figure.domain.name)
+        return value
+
+    def _figure_value(self, figure: "BaseFigure") -> int:
+        """Вклад фигуры: статус, уровень и здоровье, возможность перемещаться, способности"""
+        name = figure.name
+        unit = figure.unit
+        bucket = min(ceil(unit.hp_percent * self._buckets), self._buckets)
+        value = (
+            self.feature("figure", name, figure.status)
+            ^ self.feature("figure", name, "level", unit.level)
+            ^ self.feature("figure", name, "hp", bucket)
+        )
+        if figure.can_move:
+            value ^= self.feature("figure", name, "can_move")
+        for perk_name, perk in unit.get_perks().items():
+            value ^= self.feature("figure", name, perk_name, perk.status, perk.modifier)
+        return value
+
+    def _building_value(self, building: "BaseBuilding") -> int:
+        """Вклад здания: статус и модификатор способности здания"""
+        perk = building.action.perk
+        return self.feature("building", building.index.id, perk.status, perk.modifier)
@@ -0,0 +1,299 @@
+from copy import deepcopy
+from typing import TYPE_CHECKING, NamedTuple, Iterable, Optional, Dict, List, Tuple
+from numpy import ndarray, arange, full, zeros, int32
+from numpy.random import default_rng
+
+from src.simulation.combat import estimate_combat
+from src.units.units import (
+    UnitBarbarian,
+    UnitBard,
+    UnitCleric,
+    UnitDruid,
+    UnitFighter,
+    UnitMonk,
+    UnitPaladin,
+    UnitRanger,
+    UnitRogue,
+    UnitSorcerer,
+    UnitWarlock,
+    UnitWizard,
+)
+from src.utils.characters import (
+    barbarian,
+    bard,
+    cleric,
+    druid,
+    fighter,
+    monk,
+    paladin,
+    ranger,
+    rogue,
+    sorcerer,
+    warlock,
+    wizard,
+)
+from src.utils.enums import PerkType
+from src.utils.constants import (
+    BALANCE_DUELS,
+    BALANCE_MAX_TURNS,
+    BALANCE_TURN_BLOCK,
+    BALANCE_SEED,
+    BALANCE_DEFENCES,
+    BALANCE_POWER_DIFFERENCES,
+)
+
+if TYPE_CHECKING:
+    from numpy.random import Generator
+    from src.abstractions.perk import BasePerk
+    from src.abstractions.unit import BaseUnit
+    from src.utils.tools import Character
+
+# классы персонажей: класс модели и характеристики
+CLASSES: Tuple[Tuple[type, "Character"], ...] = (
+    (UnitBarbarian, barbarian),
+    (UnitBard, bard),
+    (UnitCleric, cleric),
+    (UnitDruid, druid),
+    (UnitFighter, fighter),
+    (UnitMonk, monk),
+    (UnitPaladin, paladin),
+    (UnitRanger, ranger),
+    (UnitRogue, rogue),
+    (UnitSorcerer, sorcerer),
+    (UnitWarlock, warlock),
+    (UnitWizard, wizard),
+)
+
+# типы способностей, которые наносят урон
+ATTACK_TYPES = (PerkType.melee.value, PerkType.ranged.value, PerkType.elemental.value)
+
+
+class BalanceMatrix(NamedTuple):
+    """Матрица баланса классов при одних условиях поединка
+    Строка - первый (атакующий) персонаж, столбец - второй (защитник);
+    ходы до победы считаются без ответных ударов (не добитый противник - предел ходов + 1)
+    """
+    names: Tuple[str, ...]
+    perks: Tuple[Tuple[Optional[str], ...], ...]
+    win_rate: ndarray
+    draw_rate: ndarray
+    turns_to_kill: ndarray
+    building_defence: int = 0
+    power_difference: int = 0
+
+
+def create_units() -> List["BaseUnit"]:
+    """Создать по одному персонажу каждого класса (с собственными характеристиками)
+
+    Returns:
+        list: персонажи
+    """
+    return [
+        unit_class(
+            name=character.name,
+            title=character.title,
+            description=character.description,
+            characteristic=deepcopy(character.characteristic),
+        )
+        for unit_class, character in CLASSES
+    ]
+
+
+def best_perk(
+    unit: "BaseUnit",
+    target: "BaseUnit",
+    generator: "Generator",
+    domain_bonus: int = 0,
+    building_bonus: int = 0,
+    size: int = BALANCE_DUELS,
+) -> Optional["BasePerk"]:
+    """Способность персонажа с наибольшим средним уроном по цели
+
+    Args:
+        unit: персонаж
+        target: цель
+        generator: генератор случайных чисел
+        domain_bonus: бонус домена
+        building_bonus: бонус здания
+        size: количество исходов оценки
+
+    Returns:
+        BasePerk: способность (пусто - у персонажа нет атакующих способностей)
+    """
+    best, best_damage = None, 0.0
+    for perk in unit.get_perks().values():
+        if perk.attribute not in ATTACK_TYPES:
+            continue
+        damage = estimate_combat(
+            perk=perk,
+            target=target,
+            domain_bonus=domain_bonus,
+            building_bonus=building_bonus,
+            size=size,
+            generator=generator,
+        ).mean_damage
+        if damage > best_damage:
+            best, best_damage = perk, damage
+    return best
+
+
+def kill_turns(
+    perk: Optional["BasePerk"],
+    target: "BaseUnit",
+    generator: "Generator",
+    domain_bonus: int = 0,
+    building_bonus: int = 0,
+    size: int = BALANCE_DUELS,
+    max_turns: int = BALANCE_MAX_TURNS,
+    block: int = BALANCE_TURN_BLOCK,
+) -> ndarray:
+    """Ход, на котором способность добивает цель, в серии поединков
+    Урон способности не зависит от оставшегося здоровья цели, поэтому удары сразу нескольких ходов
+    разыгрываются одним векторным броском, а ход гибели находится по накопленному урону;
+    следующий блок (вдвое длиннее) разыгрывается только для поединков, где цель еще жива
+
+    Args:
+        perk: способность
+        target: цель
+        generator: генератор случайных чисел
+        domain_bonus: бонус домена
+        building_bonus: бонус здания
+        size: количество поединков
+        max_turns: предел ходов
+        block: количество ходов в первом броске
+
+    Returns:
+        ndarray: номер хода (max_turns + 1 - цель не погибла)
+    """
+    turns = full(shape=size, fill_value=max_turns + 1, dtype=int32)
+    if perk is None:
+        return turns
+    dealt = zeros(size, dtype=int32)
+    alive = arange(size)
+    first_turn = 0
+    while first_turn < max_turns and alive.size:
+        width = min(block, max_turns - first_turn)
+        hit_points = full(shape=alive.size * width, fill_value=target.current_hp)
+        _, _, remaining = perk.simulate(
+            target=target,
+            hit_points=hit_points,
+            generator=generator,
+            domain_bonus=domain_bonus,
+            building_bonus=building_bonus,
+        )
+        total = dealt[alive, None] + (hit_points - remaining).reshape(alive.size, width).cumsum(axis=1)
+        dead = total >= target.current_hp
+        killed = dead.any(axis=1)
+        turns[alive[killed]] = first_turn + 1 + dead[killed].argmax(axis=1)
+        dealt[alive] = total[:, -1]
+        alive = alive[~killed]
+        first_turn += width
+        block *= 2
+    return turns
+
+
+def balance_matrix(
+    building_defence: int = 0,
+    power_difference: int = 0,
+    duels: int = BALANCE_DUELS,
+    max_turns: int = BALANCE_MAX_TURNS,
+    seed: int = BALANCE_SEED,
+    units: List["BaseUnit"] = None,
+) -> BalanceMatrix:
+    """Матрица баланса классов: поединки один на один для каждой упорядоченной пары
+    Персонажи по очереди бьют друг друга лучшей атакующей способностью, первым ходит персонаж строки.
+    Бросок костей делается сразу для всех поединков пары; ходы обоих персонажей независимы,
+    поэтому исход поединка определяется ходами, на которых каждый из них добивает противника
+
+    Args:
+        building_defence: защита здания, в котором стоит персонаж столбца
+        power_difference: мощь домена строки минус мощь домена столбца
+        duels: количество поединков на пару
+        max_turns: предел ходов поединка (затем - ничья)
+        seed: зерно
+        units: персонажи (по умолчанию - по одному каждого класса)
+
+    Returns:
+        BalanceMatrix: матрица
+    """
+    units = units if units is not None else create_units()
+    generator = default_rng(seed)
+    size = len(units)
+    # бонусы как при действии на доске: половина разницы мощи доменов и защита здания цели
+    attack = {"domain_bonus": power_difference // 2, "building_bonus": building_defence}
+    defence = {"domain_bonus": -power_difference // 2, "building_bonus": 0}
+
+    perks: List[List[Optional[str]]] = [[None] * size for _ in range(size)]
+    win_rate = zeros((size, size))
+    draw_rate = zeros((size, size))
+    turns_to_kill = zeros((size, size))
+    for row, first in enumerate(units):
+        for column, second in enumerate(units):
+            first_perk = best_perk(unit=first, target=second, generator=generator, size=duels, **attack)
+            second_perk = best_perk(unit=second, target=first, generator=generator, size=duels, **defence)
+            first_turns = kill_turns(
+                perk=first_perk,
+                target=second,
+                generator=generator,
+                size=duels,
+                max_turns=max_turns,
+                **attack,
+            )
+            second_turns = kill_turns(
+                perk=second_perk,
+                target=first,
+                generator=generator,
+                size=duels,
+                max_turns=max_turns,
+                **defence,
+            )
+            # первый ходит раньше: он побеждает, если добивает противника не позже его самого
+            wins = (first_turns <= second_turns) & (first_turns <= max_turns)
+            draws = (first_turns > max_turns) & (second_turns > max_turns)
+            perks[row][column] = first_perk.name if first_perk else None
+            win_rate[row, column] = wins.mean()
+            draw_rate[row, column] = draws.mean()
+            turns_to_kill[row, column] = first_turns.mean()
+    return BalanceMatrix(
+        names=tuple(unit.name for unit in units),
+        perks=tuple(tuple(row) for row in perks),
+        win_rate=win_rate,
+        draw_rate=draw_rate,
+        turns_to_kill=turns_to_kill,
+        building_defence=building_defence,
+        power_difference=power_difference,
+    )
+
+
+def balance_breakdown(
+    defences: Iterable[int] = BALANCE_DEFENCES,
+    differences: Iterable[int] = BALANCE_POWER_DIFFERENCES,
+    duels: int = BALANCE_DUELS,
+    max_turns: int = BALANCE_MAX_TURNS,
+    seed: int = BALANCE_SEED,
+) -> Dict[Tuple[int, int], BalanceMatrix]:
+    """Матрицы баланса по защите здания и разнице мощи доменов
+
+    Args:
+        defences: значения защиты здания
+        differences: значения разницы мощи доменов
+        duels: количество поединков на пару
+        max_turns: предел ходов поединка
+        seed: зерно
+
+    Returns:
+        dict: (защита, разница мощи) -> матрица
+    """
+    units = create_units()
+    return {
+        (defence, difference): balance_matrix(
+            building_defence=defence,
+            power_difference=difference,
+            duels=duels,
+            max_turns=max_turns,
+            seed=seed,
+            units=units,
+        )
+        for defence in defences
+        for difference in differences
+    }
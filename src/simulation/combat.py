@@ -0,0 +1,109 @@
+from typing import TYPE_CHECKING, NamedTuple
+from numpy import full
+
+from src.utils.rng import random_context
+from src.utils.constants import COMBAT_SIMULATION_SIZE
+
+if TYPE_CHECKING:
+    from numpy import ndarray
+    from numpy.random import Generator
+    from src.abstractions.perk import BasePerk
+    from src.abstractions.unit import BaseUnit
+    from src.abstractions.action import BaseAction
+    from src.abstractions.cell import BaseCell
+
+
+class CombatOutcome(NamedTuple):
+    """Результаты серии активаций способности (по одному значению на исход)"""
+
+    hit: "ndarray"
+    crit: "ndarray"
+    damage: "ndarray"
+    target_hp: "ndarray"
+
+    @property
+    def hit_rate(self) -> float:
+        """Доля попаданий"""
+        return float(self.hit.mean())
+
+    @property
+    def crit_rate(self) -> float:
+        """Доля критических ударов"""
+        return float(self.crit.mean())
+
+    @property
+    def mean_damage(self) -> float:
+        """Средний урон"""
+        return float(self.damage.mean())
+
+    @property
+    def kill_rate(self) -> float:
+        """Доля исходов, в которых цель погибла"""
+        return float((self.target_hp == 0).mean())
+
+
+def estimate_combat(
+    perk: "BasePerk",
+    target: "BaseUnit",
+    domain_bonus: int = 0,
+    building_bonus: int = 0,
+    size: int = COMBAT_SIMULATION_SIZE,
+    generator: "Generator" = None,
+) -> CombatOutcome:
+    """Оценка активации способности методом Монте-Карло
+    Все броски делаются векторно по тем же правилам, что и Perk.activate,
+    состояние персонажей и способности не изменяется
+
+    Args:
+        perk: способность (персонаж способности должен быть задан)
+        target: цель способности
+        domain_bonus: бонус домена
+        building_bonus: бонус здания
+        size: количество исходов
+        generator: генератор случайных чисел (по умолчанию - генератор текущего источника)
+
+    Returns:
+        CombatOutcome: результаты
+    """
+    generator = generator if generator is not None else random_context.get().generator
+    hit_points = full(shape=size, fill_value=target.current_hp)
+    hit, crit, target_hp = perk.simulate(
+        target=target,
+        hit_points=hit_points,
+        generator=generator,
+        domain_bonus=domain_bonus,
+        building_bonus=building_bonus,
+    )
+    return CombatOutcome(
+        hit=hit,
+        crit=crit,
+        damage=hit_points - target_hp,
+        target_hp=target_hp,
+    )
+
+
+def estimate_action(
+    action: "BaseAction",
+    target: "BaseCell",
+    size: int = COMBAT_SIMULATION_SIZE,
+    generator: "Generator" = None,
+) -> CombatOutcome:
+    """Оценка действия-способности на доске методом Монте-Карло
+    Цель и бонусы домена и здания рассчитываются так же, как при совершении действия
+
+    Args:
+        action: действие фигуры (со способностью)
+        target: цель действия (клетка)
+        size: количество исходов
+        generator: генератор случайных чисел
+
+    Returns:
+        CombatOutcome: результаты
+    """
+    return estimate_combat(
+        perk=action.perk,
+        target=action.perk_target(target=target),
+        size=size,
+        generator=generator,
+        **action.perk_bonuses(target=target),
+    )
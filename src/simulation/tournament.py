@@ -0,0 +1,244 @@
+import json
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from os import cpu_count
+from time import perf_counter
+from typing import TYPE_CHECKING, NamedTuple, Callable, Iterable, Iterator, Optional, Dict, List, Tuple
+from numpy.random import SeedSequence
+
+from src.ai.baseline import RandomPlayer
+from src.ai.expectimax import ExpectimaxPlayer
+from src.ai.mcts import MctsPlayer
+from src.ai.player import BasePlayer
+from src.utils.tools import info_context
+from src.utils.rng import random_context, PooledBackend
+from src.utils.constants import (
+    TOURNAMENT_GAMES,
+    TOURNAMENT_SEED,
+    TOURNAMENT_MAX_TURNS,
+    TOURNAMENT_MAX_ACTIONS,
+    TOURNAMENT_NODE_BUDGET,
+    TOURNAMENT_MCTS_ITERATIONS,
+    TOURNAMENT_WORKERS,
+)
+
+if TYPE_CHECKING:
+    from src.abstractions.board import BaseBoard
+    from src.utils.tools import BoardState
+
+# без предела времени: ход поисковых игроков не зависит от загрузки машины
+NO_TIME_LIMIT = float("inf")
+
+# компьютерные игроки турнира: имя -> создание игрока (домен, узлы expectimax на выбор действия)
+# жадный игрок всегда делает полный проход глубины 1, MCTS - заданное количество итераций
+AGENTS: Dict[str, Callable[[str, int], BasePlayer]] = {
+    "random": lambda domain, node_budget: RandomPlayer(domain=domain),
+    "greedy": lambda domain, node_budget: ExpectimaxPlayer(domain=domain, time_budget=NO_TIME_LIMIT, max_depth=1),
+    "expectimax": lambda domain, node_budget: ExpectimaxPlayer(
+        domain=domain,
+        time_budget=NO_TIME_LIMIT,
+        max_nodes=node_budget,
+    ),
+    "mcts": lambda domain, node_budget: MctsPlayer(
+        domain=domain,
+        workers=1,
+        iterations=TOURNAMENT_MCTS_ITERATIONS,
+        time_budget=NO_TIME_LIMIT,
+    ),
+}
+
+
+class GameConfig(NamedTuple):
+    """Настройки одной партии (партия воспроизводится по зерну турнира и номеру)"""
+    game: int
+    seed: int
+    red: str
+    blue: str
+    max_turns: int = TOURNAMENT_MAX_TURNS
+    node_budget: int = TOURNAMENT_NODE_BUDGET
+
+
+class GameResult(NamedTuple):
+    """Результат партии
+    Победитель пустой - ничья (партия дошла до предела циклов)
+    """
+    game: int
+    seed: int
+    red: str
+    blue: str
+    winner: Optional[str]
+    turns: int
+    actions: int
+    captures: Dict[str, int]
+    move_time: float
+    seconds: float
+
+
+class TournamentSummary(NamedTuple):
+    """Сводка турнира"""
+    games: int
+    wins: Dict[str, int]
+    draws: int
+    mean_turns: float
+    mean_captures: Dict[str, float]
+    mean_move_time: float
+    games_per_hour: float
+
+
+# доска и игроки процесса (создаются один раз на процесс, между партиями доска восстанавливается)
+_worker_board: Optional[Tuple["BaseBoard", "BoardState"]] = None
+_worker_players: Dict[Tuple[str, str, float], BasePlayer] = {}
+
+
+def play_game(config: GameConfig) -> GameResult:
+    """Сыграть одну партию между компьютерными игроками
+
+    Args:
+        config: настройки партии
+
+    Returns:
+        GameResult: результат партии
+    """
+    global _worker_board
+    info_context.set_capacity(capacity=0)
+    if _worker_board is None:
+        board = BasePlayer.create_twin()
+        _worker_board = board, board.snapshot()
+    board, state = _worker_board
+    board.restore(state=state)
+
+    dice, red_seed, blue_seed = SeedSequence(config.seed, spawn_key=(config.game,)).spawn(3)
+    random_context.set(PooledBackend(seed=dice))
+    players = {}
+    for domain, agent, seed in zip(board.players, (config.red, config.blue), (red_seed, blue_seed)):
+        key = (agent, domain.name, config.node_budget)
+        if key not in _worker_players:
+            _worker_players[key] = AGENTS[agent](domain.name, config.node_budget)
+        players[domain.name] = _worker_players[key]
+        players[domain.name].new_game(seed=seed)
+    figures = {domain.name: len(domain.figures) for domain in board.players}
+
+    start = perf_counter()
+    move_time = 0.0
+    moves = turns = actions = 0
+    board.start_circle()
+    while turns < config.max_turns and not BasePlayer.is_over(board=board):
+        player = players[board.current_domain.name]
+        for _ in range(TOURNAMENT_MAX_ACTIONS):
+            move_start = perf_counter()
+            choice = player.choose(board=board)
+            move_time += perf_counter() - move_start
+            moves += 1
+            if choice is None:
+                break
+            cell, action, target = choice.resolve(board=board)
+            board.perform(current_cell=cell, action=action, target=target)
+            actions += 1
+            if BasePlayer.is_over(board=board):
+                break
+        board.finish_circle()
+        turns += 1
+
+    red, blue = board.players
+    winner = None
+    if not blue.figures and red.figures:
+        winner = red.name
+    elif not red.figures and blue.figures:
+        winner = blue.name
+    return GameResult(
+        game=config.game,
+        seed=config.seed,
+        red=config.red,
+        blue=config.blue,
+        winner=winner,
+        turns=turns,
+        actions=actions,
+        captures={
+            red.name: figures[blue.name] - len(blue.figures),
+            blue.name: figures[red.name] - len(red.figures),
+        },
+        move_time=move_time / max(moves, 1),
+        seconds=perf_counter() - start,
+    )
+
+
+def play_games(
+    red: str,
+    blue: str,
+    games: int = TOURNAMENT_GAMES,
+    seed: int = TOURNAMENT_SEED,
+    workers: int = TOURNAMENT_WORKERS,
+    max_turns: int = TOURNAMENT_MAX_TURNS,
+    node_budget: int = TOURNAMENT_NODE_BUDGET,
+) -> Iterator[GameResult]:
+    """Сыграть серию партий (по порядку номеров; партии распределяются по процессам)
+
+    Args:
+        red: игрок красного домена
+        blue: игрок синего домена
+        games: количество партий
+        seed: зерно турнира
+        workers: количество процессов (0 - по числу ядер, 1 - без процессов)
+        max_turns: предел циклов партии
+        node_budget: узлы expectimax на выбор действия
+
+    Returns:
+        iterator: результаты партий
+    """
+    for agent in (red, blue):
+        if agent not in AGENTS:
+            raise KeyError(agent)
+    configs = [
+        GameConfig(game=game, seed=seed, red=red, blue=blue, max_turns=max_turns, node_budget=node_budget)
+        for game in range(games)
+    ]
+    workers = workers or cpu_count() or 1
+    if workers == 1:
+        yield from map(play_game, configs)
+        return
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as executor:
+        yield from executor.map(play_game, configs, chunksize=max(1, games // (workers * 8)))
+
+
+def write_results(results: Iterable[GameResult], path: str) -> Iterator[GameResult]:
+    """Записывать результаты партий в файл JSONL по мере их поступления
+
+    Args:
+        results: результаты партий
+        path: путь к файлу
+
+    Returns:
+        iterator: те же результаты
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        for result in results:
+            file.write(json.dumps(result._asdict(), ensure_ascii=False) + "\n")
+            file.flush()
+            yield result
+
+
+def summarize(results: List[GameResult], seconds: float) -> TournamentSummary:
+    """Сводка турнира
+
+    Args:
+        results: результаты партий
+        seconds: длительность турнира
+
+    Returns:
+        TournamentSummary: сводка
+    """
+    games = max(len(results), 1)
+    domains = list(results[0].captures) if results else []
+    wins = {domain: sum(result.winner == domain for result in results) for domain in domains}
+    return TournamentSummary(
+        games=len(results),
+        wins=wins,
+        draws=len(results) - sum(wins.values()),
+        mean_turns=sum(result.turns for result in results) / games,
+        mean_captures={
+            domain: sum(result.captures[domain] for result in results) / games
+            for domain in domains
+        },
+        mean_move_time=sum(result.move_time for result in results) / games,
+        games_per_hour=len(results) * 3600 / seconds if seconds > 0 else 0.0,
+    )
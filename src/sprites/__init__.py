@@ -7,3 +7,5 @@ red_button_pressed = ":resources:gui_basic_assets/button/red_press.png"
 red_domain = ":resources:images/tiles/lava.png"
 blue_domain = ":resources:images/tiles/water.png"
 gray_domain = ":resources:images/tiles/brickGrey.png"
+scroll_down = ":resources:gui_basic_assets/scroll/indicator_down.png"
+scroll_up = ":resources:gui_basic_assets/scroll/indicator_up.png"
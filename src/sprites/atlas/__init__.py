@@ -0,0 +1,6 @@
+from pathlib import Path
+
+
+current_directory = Path(__file__).parent.resolve()
+atlas_image = current_directory.joinpath("atlas.png")
+atlas_metadata = current_directory.joinpath("atlas.json")
@@ -0,0 +1,168 @@
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Optional, Union, Dict, List, Tuple
+
+from src.sprites.atlas import atlas_image, atlas_metadata
+from src.utils.constants import ATLAS_WIDTH, ATLAS_PADDING
+
+if TYPE_CHECKING:
+    from arcade import Texture
+    from PIL.Image import Image
+    from src.utils.textures import LazyTexture
+
+# положение текстуры на рисунке атласа (left, upper, right, lower - как в PIL)
+Box = Tuple[int, int, int, int]
+
+
+def resolve_path(path: Union[str, Path]) -> Path:
+    """Путь к файлу рисунка (с учетом встроенных ресурсов arcade)
+
+    Args:
+        path: путь или имя ресурса (":resources:...")
+
+    Returns:
+        Path: путь к файлу
+    """
+    if str(path).startswith(":"):
+        from arcade import resources
+        return Path(resources.resolve(path))
+    return Path(path)
+
+
+def signature(path: Union[str, Path]) -> List[int]:
+    """Отпечаток исходного рисунка (размер и время изменения файла): атлас устаревает при замене рисунка
+    Список, а не кортеж: так отпечаток совпадает с прочитанным из файла метаданных
+
+    Args:
+        path: путь или имя ресурса
+
+    Returns:
+        list: отпечаток
+    """
+    stat = resolve_path(path).stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+class TextureAtlas:
+    """Упакованный атлас текстур: один рисунок и файл метаданных с положением каждой текстуры
+    Атлас собирается заранее (build_atlas); метаданные читаются при первом обращении,
+    рисунок - при первой текстуре, найденной в атласе.
+    Текстуры, которых нет в атласе (или чей исходный рисунок изменился), загружаются из своих файлов
+    """
+
+    def __init__(
+        self,
+        image_path: Union[str, Path] = atlas_image,
+        metadata_path: Union[str, Path] = atlas_metadata,
+    ):
+        """Инициализация атласа
+
+        Args:
+            image_path: путь к рисунку атласа
+            metadata_path: путь к файлу метаданных
+        """
+        self._image_path = Path(image_path)
+        self._metadata_path = Path(metadata_path)
+        self._regions: Optional[Dict[str, Dict]] = None
+        self._image: Optional["Image"] = None
+
+    @property
+    def regions(self) -> Dict[str, Dict]:
+        """Положение и отпечаток исходного рисунка для каждой текстуры атласа"""
+        if self._regions is None:
+            self._regions = {}
+            if self._metadata_path.exists() and self._image_path.exists():
+                with open(self._metadata_path, encoding="utf-8") as file:
+                    self._regions = json.load(file)["regions"]
+        return self._regions
+
+    def region(self, handle: "LazyTexture") -> Optional["Texture"]:
+        """Текстура из атласа
+
+        Args:
+            handle: ленивая текстура
+
+        Returns:
+            Texture: текстура (пусто - текстуры нет в атласе или атлас устарел)
+        """
+        entry = self.regions.get(handle.key)
+        if not entry or entry["signature"] != signature(path=handle.path):
+            return None
+        if self._image is None:
+            from PIL import Image
+            with Image.open(self._image_path) as image:
+                self._image = image.convert("RGBA")
+        from arcade import Texture
+        return Texture(self._image.crop(tuple(entry["box"])), hash=f"atlas:{handle.key}")
+
+
+def pack(sizes: List[Tuple[int, int]], width: int = ATLAS_WIDTH, padding: int = ATLAS_PADDING) -> List[Box]:
+    """Упаковать прямоугольники по полкам (сначала самые высокие)
+
+    Args:
+        sizes: размеры прямоугольников (ширина, высота)
+        width: ширина атласа
+        padding: отступ между прямоугольниками
+
+    Returns:
+        list: положения прямоугольников (в порядке размеров)
+    """
+    boxes: List[Optional[Box]] = [None] * len(sizes)
+    x = y = shelf = 0
+    for number in sorted(range(len(sizes)), key=lambda item: -sizes[item][1]):
+        box_width, box_height = sizes[number]
+        if x and x + box_width > width:
+            x, y, shelf = 0, y + shelf + padding, 0
+        boxes[number] = (x, y, x + box_width, y + box_height)
+        x += box_width + padding
+        shelf = max(shelf, box_height)
+    return boxes
+
+
+def build_atlas(
+    handles: Iterable["LazyTexture"],
+    image_path: Union[str, Path] = atlas_image,
+    metadata_path: Union[str, Path] = atlas_metadata,
+    width: int = ATLAS_WIDTH,
+) -> Dict[str, Dict]:
+    """Собрать атлас из исходных рисунков и записать метаданные
+
+    Args:
+        handles: ленивые текстуры
+        image_path: путь к рисунку атласа
+        metadata_path: путь к файлу метаданных
+        width: ширина атласа
+
+    Returns:
+        dict: положения текстур
+    """
+    from PIL import Image
+
+    handles = {handle.key: handle for handle in handles}
+    images = {}
+    for key, handle in handles.items():
+        with Image.open(resolve_path(handle.path)) as image:
+            image = image.convert("RGBA")
+        if handle.rect:
+            # положение на листе задано так же, как для arcade.SpriteSheet.get_texture
+            left, right, bottom, top = handle.rect
+            image = image.crop((left, bottom, right, top))
+        images[key] = image
+
+    keys = list(images)
+    boxes = pack(sizes=[images[key].size for key in keys], width=width)
+    atlas = Image.new("RGBA", (width, max(box[3] for box in boxes)))
+    regions = {}
+    for key, box in zip(keys, boxes):
+        atlas.paste(images[key], box[:2])
+        regions[key] = {"box": list(box), "signature": signature(path=handles[key].path)}
+
+    atlas.save(image_path, optimize=True)
+    with open(metadata_path, "w", encoding="utf-8") as file:
+        json.dump({"image": Path(image_path).name, "regions": regions}, file, sort_keys=True)
+    return regions
+
+
+if __name__ == "__main__":
+    from src.utils.textures import LazyTexture
+    build_atlas(handles=LazyTexture.handles())
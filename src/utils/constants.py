@@ -6,6 +6,18 @@ WINDOW_WIDTH = CELL_SIZE * 10
 WINDOW_HEIGHT = CELL_SIZE * 8
 GRID_ROW_COUNT = 8
 GRID_COLUMN_COUNT = 10
+# ширина сетки номеров позиций (номер = строка * ширина + столбец; больше числа столбцов любой доски и панелей)
+INDEX_WIDTH = 1024
+# размер стандартной доски (строки, столбцы) и доски нагрузочной расстановки
+BOARD_ROWS = 7
+BOARD_COLUMNS = 6
+STRESS_ROWS = 100
+STRESS_COLUMNS = 100
+# сторона корзины пространственного индекса доски (в клетках)
+SPATIAL_BUCKET_SIZE = 8
+# ширина упакованного атласа текстур и отступ между текстурами (в пикселях)
+ATLAS_WIDTH = 2048
+ATLAS_PADDING = 2
 WINDOW_TITLE = "DnD-Chess"
 DEFAULT_FONT_SIZE = 10
 DEFAULT_FONT_NAME = "Kenney Pixel Square"
@@ -20,9 +32,115 @@ SPELL_ROLL_RESISTANCE = 20
 WEAPON_ROLL_DIFFICULTY = 20
 CRITICAL_ROLL_RESISTANCE = 20
 
+# вместимость журнала сообщений (0 - сообщения отключены)
+INFO_LOG_CAPACITY = 512
+
+# количество последних сообщений на информационном табло
+INFO_PANEL_HISTORY = 100
+
+# размер блока заранее сгенерированных значений костей
+RANDOM_BLOCK_SIZE = 4096
+
+# количество исходов при оценке способностей методом Монте-Карло
+COMBAT_SIMULATION_SIZE = 10000
+
+# турнир компьютерных игроков: количество партий, зерно, предел циклов партии и действий за ход,
+# узлы expectimax и итерации MCTS на выбор действия (без предела времени: результат зависит только от зерна;
+# узлов хватает на полный проход глубины 1), процессы (0 - по числу ядер), файл результатов
+TOURNAMENT_GAMES = 100
+TOURNAMENT_SEED = 0
+TOURNAMENT_MAX_TURNS = 200
+TOURNAMENT_MAX_ACTIONS = 64
+TOURNAMENT_NODE_BUDGET = 1000
+TOURNAMENT_MCTS_ITERATIONS = 200
+TOURNAMENT_WORKERS = 0
+TOURNAMENT_OUTPUT = "tournament.jsonl"
+
+# матрица баланса классов: количество поединков на пару, предел ходов поединка,
+# ходов в первом векторном броске (затем вдвое больше), зерно, защита зданий и разница мощи доменов для разбивки
+BALANCE_DUELS = 10000
+BALANCE_MAX_TURNS = 100
+BALANCE_TURN_BLOCK = 2
+BALANCE_SEED = 0
+BALANCE_DEFENCES = (0, 2, 4, 6)
+BALANCE_POWER_DIFFERENCES = (-4, 0, 4)
+
+# замеры производительности: минимальное время одного замера (секунды), количество замеров,
+# операций при подсчете памяти, зерно костей, допустимое замедление относительно базы,
+# файлы результатов и базы
+BENCHMARK_MIN_TIME = 0.1
+BENCHMARK_REPEATS = 3
+BENCHMARK_MEMORY_OPS = 20
+BENCHMARK_SEED = 0
+BENCHMARK_TOLERANCE = 0.25
+BENCHMARK_OUTPUT = "benchmark.json"
+BENCHMARK_BASELINE = "benchmark_baseline.json"
+
+# компьютерный противник: домен, время на ход (секунды), предельная глубина поиска
+AI_DOMAIN = "Blue"
+AI_TIME_BUDGET = 1.0
+AI_MAX_DEPTH = 4
+# равновероятные части точного распределения бросков урона (узлы случая с равными весами)
+AI_DAMAGE_BUCKETS = 2
+# веса оценки позиции: фигура, доля здоровья, уровень, мощь домена, пленник, победа
+AI_FIGURE_WEIGHT = 10.0
+AI_HEALTH_WEIGHT = 10.0
+AI_LEVEL_WEIGHT = 5.0
+AI_POWER_WEIGHT = 1.0
+AI_PRISONER_WEIGHT = 2.0
+AI_VICTORY_WEIGHT = 1000.0
+
+# дерево поиска Монте-Карло: процессы (0 - все ядра), итерации и время на ход для каждого дерева,
+# коэффициент исследования, длина случайной партии, шанс завершить ход в ней,
+# попытки найти случайное допустимое действие, масштаб награды
+MCTS_WORKERS = 0
+MCTS_ITERATIONS = 2000
+MCTS_TIME_BUDGET = 1.0
+MCTS_EXPLORATION = 1.4
+MCTS_ROLLOUT_DEPTH = 20
+MCTS_ROLLOUT_END_CHANCE = 0.2
+MCTS_ROLLOUT_ATTEMPTS = 8
+MCTS_REWARD_SCALE = 20.0
+# движок компьютерного противника в окне игры: "expectimax" или "mcts"
+AI_ENGINE = "expectimax"
+
+# хэш Зобриста: зерно ключей, количество уровней здоровья (доля здоровья округляется вверх)
+ZOBRIST_SEED = 20240501
+ZOBRIST_HP_BUCKETS = 20
+# таблица транспозиций: количество ячеек и политика замещения ("always", "depth" или "two_tier")
+AI_TABLE_SIZE = 1 << 16
+AI_TABLE_POLICY = "depth"
+
+# бюджет времени импорта правил игры без графики (секунды; замер - около 0.25 с)
+RULES_IMPORT_BUDGET = 1.0
+
+# количество запоминаемых состояний доски для отмены действий
+UNDO_HISTORY_SIZE = 64
+
+# запись партий: версия формата, расстановка, запись партий окна, папка записей,
+# пауза между командами при просмотре записи в окне (секунды)
+REPLAY_VERSION = 3
+REPLAY_SCENARIO = "standard"
+REPLAY_RECORD = True
+REPLAY_DIRECTORY = "replays"
+REPLAY_STEP_TIME = 0.5
+
+# сохранение игры: метка и версия двоичного формата, файл сохранения окна
+SAVE_MAGIC = b"DNDC"
+SAVE_VERSION = 2
+SAVE_PATH = "savegame.bin"
+
+# начальная вместимость хранилища состояния персонажей (массивы NumPy растут вдвое)
+UNIT_STORE_CAPACITY = 64
+
 # базовые значения бонусов
 BASE_DOMAIN_POWER = 12
 
+# цвета доменов (RGBA)
+RED_DOMAIN_COLOR = (255, 0, 0, 255)
+BLUE_DOMAIN_COLOR = (0, 0, 255, 255)
+GRAY_DOMAIN_COLOR = (128, 128, 128, 255)
+
 # базовые характеристики персонажей
 BASE_CHARACTERISTIC = 10
 BASE_HIT_POINTS = 10
@@ -1,5 +1,6 @@
 from functools import wraps
 from math import inf
+from numpy import maximum, minimum
 from typing import TYPE_CHECKING, Callable, TypeVar, ParamSpec
 
 from src.utils.enums import RollModifier
@@ -37,3 +38,22 @@ def modify_roll(
 
         return value
     return wrapper
+
+
+def modify_rolls(
+    func: Callable[F_spec, F_result],
+) -> Callable[F_spec, F_result]:
+    """Векторный аналог modify_roll: серия бросков целиком бросается дважды"""
+    @wraps(func)
+    def wrapper(*args: F_spec.args, **kwargs: F_spec.kwargs) -> F_result:
+        roll: "BaseRoll" = args[0]
+        modifier = roll.modifier
+        if modifier == RollModifier.advantage.value:
+            value = maximum(func(*args, **kwargs), func(*args, **kwargs))
+        elif modifier == RollModifier.vulnerability.value:
+            value = minimum(func(*args, **kwargs), func(*args, **kwargs))
+        else:
+            value = func(*args, **kwargs)
+
+        return value
+    return wrapper
@@ -34,6 +34,7 @@ UNIT_LONG_DESC = (
 )
 
 # фигуры
+FIGURE_NAME = "{name} {index}"
 FIGURE_LONG_DESC = (
     "{title}, Описание:\n{unit}"
 )
@@ -60,6 +60,11 @@ class Time(BaseAttribute):
     dragon = "Серый"
 
 
+class AreaShape(BaseAttribute):
+    cross = "Крест"
+    square = "Квадрат"
+
+
 class ActionType(BaseAttribute):
     move = "Движение"
     use = "Использование"
@@ -72,3 +77,38 @@ class FigureStatus(BaseAttribute):
     alive = "Живой"
     captive = "Захвачен"
     killed = "Убит"
+
+
+class ModelEvent(BaseAttribute):
+    figure = "Фигура"
+    building = "Здание"
+    domain = "Домен"
+    status = "Статус"
+    health = "Здоровье"
+    killed = "Уничтожен"
+
+
+class LogKind(BaseAttribute):
+    roll = "Бросок"
+    hit = "Попадание"
+    damage = "Урон"
+    move = "Перемещение"
+    capture = "Пленение"
+
+
+class ReplacementPolicy(BaseAttribute):
+    # значения совпадают с настройкой AI_TABLE_POLICY
+    always = "always"
+    depth = "depth"
+    two_tier = "two_tier"
+
+
+class ReplayCommand(BaseAttribute):
+    # короткие коды команд в файле записи партии
+    start_circle = "start"
+    select_cell = "cell"
+    select_action = "action"
+    select_target = "target"
+    perform = "perform"
+    finish_circle = "finish"
+    undo = "undo"
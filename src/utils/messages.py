@@ -11,6 +11,11 @@ START_GAME_MSG = (
 )
 DEFAULT_MSG = "Выберите фигуру!"
 NEXT_DOMAIN_MSG = "Начинается ход фракции {domain}!"
+UNDO_MSG = "Действие отменено! Ход фракции {domain}"
+NO_UNDO_MSG = "Нечего отменять!"
+SAVE_MSG = "Игра сохранена!"
+LOAD_MSG = "Игра загружена! Ход фракции {domain}"
+NO_SAVE_MSG = "Нет сохраненной игры!"
 
 # Сообщения применения способности
 PERK_STATUS_DONE_MSG = "Способность {name} перезаряжается!"
@@ -43,6 +48,8 @@ ACTION_WRONG_USE_MSG = "Нельзя атаковать самого себя о
 ACTION_NO_FIGURE_MSG = "Чтобы использовать способность нужна цель!"
 ACTION_CANNOT_MOVE_MSG = "Фигура не может передвигаться!"
 ACTION_NO_SACRIFICE_MSG = "Нет жертвы, чтобы пожертвовать алтарю!"
+ACTION_AREA_MSG = "{action} задевает: {targets}"
+ACTION_CAPTURE_MSG = "Фигура {figure} взята в плен фракцией {domain}!"
 ACTION_SACRIFICE_MSG = "Фигура {figure} жертвует алтарю {target} и повышает свой уровень!"
 
 # Сообщения о выборе цели
@@ -52,3 +59,28 @@ NO_CELL_MSG = "Сначала нужно выбрать клетку!"
 WRONG_DOMAIN_MSG = "Сейчас очередь фракции {domain}!"
 NO_FIGURE_MSG = "Сначала нужно выбрать фигуру!"
 WRONG_RADIUS_MSG = "Необходимо выбрать клетку в пределах доступа (по горизонтали или вертикали)"
+
+# Сообщения турнира компьютерных игроков
+TOURNAMENT_GAME_MSG = "Партия {game}: победитель {winner}, ходов {turns}, {seconds:.2f} с"
+TOURNAMENT_DRAW_MSG = "нет (ничья)"
+TOURNAMENT_SUMMARY_MSG = (
+    "Партий: {games} ({games_per_hour:.0f} в час)\n"
+    "Победы: {wins}, ничьи: {draws}\n"
+    "Ходов в среднем: {mean_turns:.1f}, взято фигур в среднем: {mean_captures}\n"
+    "Время на действие: {mean_move_time:.4f} с"
+)
+
+# Сообщения матрицы баланса классов
+BALANCE_CONDITIONS_MSG = "Защита здания: {building_defence}, разница мощи доменов: {power_difference}"
+BALANCE_WIN_RATE_MSG = "Доля побед (строка против столбца, строка ходит первой):"
+BALANCE_TURNS_MSG = "Ходов до победы над противником (строка против столбца):"
+BALANCE_TIME_MSG = "Поединков: {duels}, время: {seconds:.2f} с"
+
+# Сообщения замеров производительности
+BENCHMARK_RESULT_MSG = "{name}: {ops_per_second:.1f} оп/с, пик памяти {peak_bytes:.0f} Б, удержано {retained_bytes:.0f} Б"
+BENCHMARK_COMPARE_MSG = "{name}: {ratio:.2f} от базы"
+BENCHMARK_SLOWDOWN_MSG = "Замедление относительно базы: {names}"
+BENCHMARK_NO_BASELINE_MSG = "Файл базы {path} не найден, сравнение пропущено"
+
+# Сообщения воспроизведения записи партии
+REPLAY_RESULT_MSG = "Команд: {commands}, фигуры доменов: {figures}, позиция: {position}"
@@ -0,0 +1,199 @@
+from functools import lru_cache
+from itertools import accumulate
+from typing import Tuple
+
+from src.utils.enums import RollModifier
+
+# распределение значения: пары (значение, вероятность), упорядоченные по значению
+Distribution = Tuple[Tuple[int, float], ...]
+
+
+@lru_cache(maxsize=None)
+def uniform_distribution(lower: int, higher: int) -> Distribution:
+    """Распределение броска многогранной кости
+
+    Args:
+        lower: минимальное значение
+        higher: максимальное значение
+
+    Returns:
+        Distribution: распределение
+    """
+    chance = 1 / (higher - lower + 1)
+    return tuple((value, chance) for value in range(lower, higher + 1))
+
+
+@lru_cache(maxsize=None)
+def point_distribution(value: int) -> Distribution:
+    """Распределение постоянного значения
+
+    Args:
+        value: значение
+
+    Returns:
+        Distribution: распределение
+    """
+    return ((value, 1.0),)
+
+
+@lru_cache(maxsize=None)
+def shift_distribution(distribution: Distribution, value: int) -> Distribution:
+    """Распределение, сдвинутое на постоянное значение
+
+    Args:
+        distribution: распределение
+        value: сдвиг
+
+    Returns:
+        Distribution: распределение
+    """
+    if not value:
+        return distribution
+    return tuple((key + value, chance) for key, chance in distribution)
+
+
+@lru_cache(maxsize=None)
+def add_distributions(first: Distribution, second: Distribution) -> Distribution:
+    """Распределение суммы двух независимых значений (свертка)
+
+    Args:
+        first: распределение первого значения
+        second: распределение второго значения
+
+    Returns:
+        Distribution: распределение
+    """
+    result = {}
+    for first_value, first_chance in first:
+        for second_value, second_chance in second:
+            value = first_value + second_value
+            result[value] = result.get(value, 0.0) + first_chance * second_chance
+    return tuple(sorted(result.items()))
+
+
+@lru_cache(maxsize=None)
+def sum_distribution(distribution: Distribution, times: int) -> Distribution:
+    """Распределение суммы times независимых бросков
+
+    Args:
+        distribution: распределение одного броска
+        times: количество бросков
+
+    Returns:
+        Distribution: распределение
+    """
+    if times <= 1:
+        return distribution
+    return add_distributions(
+        first=sum_distribution(distribution=distribution, times=times - 1),
+        second=distribution,
+    )
+
+
+@lru_cache(maxsize=None)
+def modify_distribution(distribution: Distribution, modifier: str) -> Distribution:
+    """Распределение броска с учетом модификатора (аналог modify_roll)
+    Преимущество - максимум из двух бросков: P(max <= x) = F(x) ** 2
+    Уязвимость - минимум из двух бросков: P(min >= x) = S(x) ** 2
+
+    Args:
+        distribution: распределение одного броска
+        modifier: модификатор броска
+
+    Returns:
+        Distribution: распределение
+    """
+    values = [value for value, _ in distribution]
+    chances = [chance for _, chance in distribution]
+    if modifier == RollModifier.advantage.value:
+        cumulative = [0.0] + list(accumulate(chances))
+        chances = [
+            cumulative[i + 1] ** 2 - cumulative[i] ** 2
+            for i in range(len(values))
+        ]
+    elif modifier == RollModifier.vulnerability.value:
+        survival = list(accumulate(reversed(chances)))[::-1] + [0.0]
+        chances = [
+            survival[i] ** 2 - survival[i + 1] ** 2
+            for i in range(len(values))
+        ]
+    else:
+        return distribution
+    return tuple(zip(values, chances))
+
+
+@lru_cache(maxsize=None)
+def success_probability(
+    distribution: Distribution,
+    lower: int,
+    higher: int,
+    bonus: int,
+    failure: Distribution,
+) -> float:
+    """Вероятность успеха броска на попадание (аналог DifficultyRoll.action)
+    При критическом провале (lower) - всегда НЕТ, при критическом успехе (higher) - всегда ДА,
+    иначе: значение + бонус >= значение, препятствующее попаданию
+
+    Args:
+        distribution: распределение броска (с учетом модификатора)
+        lower: значение критического провала
+        higher: значение критического успеха
+        bonus: бонус
+        failure: распределение значения, препятствующего попаданию
+
+    Returns:
+        float: вероятность
+    """
+    result = 0.0
+    for value, chance in distribution:
+        if value == lower:
+            continue
+        elif value == higher:
+            result += chance
+        else:
+            success = value + bonus
+            result += chance * sum(
+                failure_chance
+                for failure_value, failure_chance in failure
+                if success >= failure_value
+            )
+    return result
+
+
+@lru_cache(maxsize=None)
+def bucket_means(distribution: Distribution, buckets: int) -> Tuple[int, ...]:
+    """Средние значения равновероятных частей распределения (узлы случая при поиске хода)
+    Значение на границе частей делится между ними, поэтому вероятность каждой части - ровно 1 / buckets.
+    Средние округляются по накопленной сумме: среднее значений частей совпадает со средним распределения
+    с точностью до половины единицы, деленной на buckets
+
+    Args:
+        distribution: распределение
+        buckets: количество частей
+
+    Returns:
+        tuple: значения частей по возрастанию
+    """
+    means = [0.0] * buckets
+    lower = 0.0
+    for value, chance in distribution:
+        upper = lower + chance
+        for bucket in range(buckets):
+            share = min(upper, (bucket + 1) / buckets) - max(lower, bucket / buckets)
+            if share > 0:
+                means[bucket] += value * share * buckets
+        lower = upper
+    totals = [0] + [round(total) for total in accumulate(means)]
+    return tuple(totals[bucket + 1] - totals[bucket] for bucket in range(buckets))
+
+
+def expected_value(distribution: Distribution) -> float:
+    """Математическое ожидание
+
+    Args:
+        distribution: распределение
+
+    Returns:
+        float: значение
+    """
+    return sum(value * chance for value, chance in distribution)
@@ -0,0 +1,280 @@
+import random
+from abc import ABC, abstractmethod
+from contextvars import ContextVar, Token
+from typing import TYPE_CHECKING, Dict, List, Tuple, NamedTuple, Optional
+from numpy import full
+from numpy.random import SeedSequence, default_rng
+
+from src.utils.probability import uniform_distribution, bucket_means
+from src.utils.constants import RANDOM_BLOCK_SIZE
+
+if TYPE_CHECKING:
+    from numpy import ndarray
+    from numpy.random import Generator
+    from src.utils.probability import Distribution
+
+
+class RandomBackend(ABC):
+    """Абстрактный источник случайных чисел для бросков костей"""
+
+    @abstractmethod
+    def randint(self, a: int, b: int) -> int:
+        """Случайное целое число от a до b включительно
+
+        Args:
+            a: минимальное значение
+            b: максимальное значение
+
+        Returns:
+            int: значение
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def generator(self) -> "Generator":
+        """Генератор для векторных бросков (оценка способностей)"""
+        pass
+
+    @property
+    def dice_generator(self) -> "Generator":
+        """Генератор для векторных бросков в партии (цели области поражения)"""
+        return self.generator
+
+
+class StandardBackend(RandomBackend):
+    """Источник случайных чисел на модуле random (по умолчанию)"""
+
+    def __init__(self, seed: int = None):
+        """Инициализация источника
+
+        Args:
+            seed: зерно (без зерна используется общий генератор модуля random)
+        """
+        self._random = random.Random(seed) if seed is not None else random
+        self._generator = default_rng(seed)
+
+    def randint(self, a: int, b: int) -> int:
+        """Случайное целое число от a до b включительно
+
+        Args:
+            a: минимальное значение
+            b: максимальное значение
+
+        Returns:
+            int: значение
+        """
+        return self._random.randint(a, b)
+
+    @property
+    def generator(self) -> "Generator":
+        return self._generator
+
+
+class PooledBackend(RandomBackend):
+    """Источник случайных чисел с заранее сгенерированными блоками значений
+    Для каждого диапазона (кости) numpy генерирует блок значений целиком,
+    броски забирают значения из блока, пока он не закончится
+    """
+
+    def __init__(
+        self,
+        seed: int | SeedSequence = None,
+        block_size: int = RANDOM_BLOCK_SIZE,
+    ):
+        """Инициализация источника
+
+        Args:
+            seed: зерно или последовательность зерен
+            block_size: размер блока значений
+        """
+        if isinstance(seed, SeedSequence):
+            self._seed_sequence = seed
+        else:
+            self._seed_sequence = SeedSequence(seed)
+        self._generator = default_rng(self._seed_sequence)
+        self._block_size = block_size
+        self._pools: Dict[Tuple[int, int], List[int]] = {}
+
+    def randint(self, a: int, b: int) -> int:
+        """Случайное целое число от a до b включительно
+
+        Args:
+            a: минимальное значение
+            b: максимальное значение
+
+        Returns:
+            int: значение
+        """
+        try:
+            return self._pools[a, b].pop()
+        except (KeyError, IndexError):
+            return self._refill(a=a, b=b).pop()
+
+    def _refill(self, a: int, b: int) -> List[int]:
+        """Сгенерировать новый блок значений для диапазона
+
+        Args:
+            a: минимальное значение
+            b: максимальное значение
+
+        Returns:
+            list: блок значений
+        """
+        pool = self._generator.integers(low=a, high=b + 1, size=self._block_size).tolist()
+        self._pools[(a, b)] = pool
+        return pool
+
+    @property
+    def generator(self) -> "Generator":
+        return self._generator
+
+    def spawn(self, count: int) -> List["PooledBackend"]:
+        """Независимые источники (например, для параллельных партий)
+
+        Args:
+            count: количество источников
+
+        Returns:
+            list: источники
+        """
+        return [
+            PooledBackend(seed=seed_sequence, block_size=self._block_size)
+            for seed_sequence in self._seed_sequence.spawn(count)
+        ]
+
+
+class BucketBackend(RandomBackend):
+    """Детерминированный источник для поиска хода: точное распределение броска делится
+    на равновероятные части, бросок дает среднее значение заданной части
+    Броски урона становятся узлами случая с равными весами, среднее по частям совпадает со средним броска
+    """
+
+    def __init__(self, bucket: int = 0, buckets: int = 1, seed: int = 0):
+        """Инициализация источника
+
+        Args:
+            bucket: номер части (от 0 до buckets - 1)
+            buckets: количество частей (1 - среднее значение броска)
+            seed: зерно генератора для векторных бросков
+        """
+        self._dice_generator = BucketGenerator(bucket=bucket, buckets=buckets)
+        self._generator = default_rng(seed)
+
+    def randint(self, a: int, b: int) -> int:
+        """Значение части для равномерного распределения от a до b включительно
+
+        Args:
+            a: минимальное значение
+            b: максимальное значение
+
+        Returns:
+            int: значение
+        """
+        return self._dice_generator.value(distribution=uniform_distribution(lower=a, higher=b))
+
+    def value(self, distribution: "Distribution") -> int:
+        """Значение части для точного распределения броска (сумма костей с модификатором)
+
+        Args:
+            distribution: распределение
+
+        Returns:
+            int: значение
+        """
+        return self._dice_generator.value(distribution=distribution)
+
+    @property
+    def generator(self) -> "Generator":
+        return self._generator
+
+    @property
+    def dice_generator(self) -> "BucketGenerator":
+        """Векторные броски в партии тоже дают значение части (как randint)"""
+        return self._dice_generator
+
+
+class BucketGenerator:
+    """Векторный аналог BucketBackend: каждое значение серии - значение заданной части распределения"""
+
+    def __init__(self, bucket: int = 0, buckets: int = 1):
+        """Инициализация генератора
+
+        Args:
+            bucket: номер части (от 0 до buckets - 1)
+            buckets: количество частей
+        """
+        self._bucket = bucket
+        self._buckets = buckets
+
+    def value(self, distribution: "Distribution") -> int:
+        """Значение части распределения
+
+        Args:
+            distribution: распределение
+
+        Returns:
+            int: значение
+        """
+        return bucket_means(distribution=distribution, buckets=self._buckets)[self._bucket]
+
+    def integers(self, low: int, high: int, size: int) -> "ndarray":
+        """Серия значений части для равномерного распределения от low до high (не включая high)
+
+        Args:
+            low: минимальное значение
+            high: значение после максимального
+            size: количество значений
+
+        Returns:
+            ndarray: значения
+        """
+        return full(
+            shape=size,
+            fill_value=self.value(distribution=uniform_distribution(lower=low, higher=high - 1)),
+        )
+
+
+class RandomContext:
+    """Контекстный менеджер источника случайных чисел"""
+    def __init__(self):
+        self._backend = ContextVar("random_backend", default=StandardBackend())
+
+    def set(self, value: RandomBackend) -> Token:
+        return self._backend.set(value)
+
+    def get(self) -> RandomBackend:
+        return self._backend.get()
+
+    def restore(self, token: Token) -> None:
+        self._backend.reset(token)
+
+
+random_context = RandomContext()
+
+
+class Outcome(NamedTuple):
+    """Заданный исход бросков способности"""
+    hit: bool
+    crit: bool
+
+
+class OutcomeContext:
+    """Контекстный менеджер заданного исхода бросков способности
+    Если исход задан, способность не делает бросков на попадание и критический удар
+    Для комбинированной способности задается по одному исходу на каждую составную способность
+    """
+    def __init__(self):
+        self._outcome = ContextVar("perk_outcome", default=None)
+
+    def set(self, value: Optional[Outcome | Tuple[Outcome, ...]]) -> Token:
+        return self._outcome.set(value)
+
+    def get(self) -> Optional[Outcome | Tuple[Outcome, ...]]:
+        return self._outcome.get()
+
+    def restore(self, token: Token) -> None:
+        self._outcome.reset(token)
+
+
+outcome_context = OutcomeContext()
@@ -1,4 +1,7 @@
-from arcade import load_texture, load_spritesheet, LRBT
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple, Optional, Union, Dict, List
+
 from src.sprites import (
     switch_green,
     switch_red,
@@ -8,6 +11,8 @@ from src.sprites import (
     red_domain,
     blue_domain,
     gray_domain,
+    scroll_down,
+    scroll_up,
 )
 from src.sprites.perks import (
     move_action,
@@ -37,89 +42,213 @@ from src.sprites.perks import (
 )
 from src.sprites.units import units_sheet
 from src.sprites.buildings import altar_path, castle_path, crypt_path
+from src.utils.atlas import TextureAtlas
+
+if TYPE_CHECKING:
+    from arcade import Texture, SpriteSheet
+
+
+class SheetRect(NamedTuple):
+    """Положение текстуры на листе спрайтов (в пикселях, как arcade.LRBT)"""
+    left: int
+    right: int
+    bottom: int
+    top: int
+
+
+class LazyTexture:
+    """Текстура, которая загружается при первом обращении (при первой отрисовке)
+    Сначала текстура ищется в упакованном атласе, затем загружается из своего файла;
+    без графики (модели, тесты, процессы поиска) рисунки не загружаются вовсе
+    """
+    __slots__ = ("_path", "_rect", "_texture")
+    _handles: List["LazyTexture"] = []
+    _atlas = TextureAtlas()
+
+    def __init__(self, path: Union[str, Path], rect: SheetRect = None):
+        """Инициализация текстуры
+
+        Args:
+            path: путь к рисунку (или имя ресурса arcade)
+            rect: положение текстуры на листе спрайтов (без положения - весь рисунок)
+        """
+        self._path = path
+        self._rect = rect
+        self._texture: Optional["Texture"] = None
+        self._handles.append(self)
+
+    @classmethod
+    def handles(cls) -> List["LazyTexture"]:
+        """Все созданные ленивые текстуры"""
+        return list(cls._handles)
+
+    @property
+    def key(self) -> str:
+        """Имя текстуры в атласе"""
+        name = Path(str(self._path)).name
+        if self._rect:
+            name += "[{},{},{},{}]".format(*self._rect)
+        return name
+
+    @property
+    def path(self) -> Union[str, Path]:
+        return self._path
+
+    @property
+    def rect(self) -> Optional[SheetRect]:
+        return self._rect
+
+    @property
+    def loaded(self) -> bool:
+        """Текстура загружена"""
+        return self._texture is not None
+
+    @property
+    def texture(self) -> "Texture":
+        """Текстура arcade (загружается один раз)"""
+        if self._texture is None:
+            self._texture = self._atlas.region(handle=self) or self._load()
+        return self._texture
+
+    def _load(self) -> "Texture":
+        """Загрузить текстуру из ее файла"""
+        from arcade import load_texture, LRBT
+        if self._rect is None:
+            return load_texture(file_path=self._path)
+        return _load_spritesheet(path=self._path).get_texture(rect=LRBT(*self._rect))
+
+
+class LazySpriteSheet:
+    """Лист спрайтов, текстуры которого загружаются лениво"""
+
+    def __init__(self, path: Union[str, Path]):
+        """Инициализация листа
+
+        Args:
+            path: путь к рисунку
+        """
+        self._path = path
+        self._textures: Dict[SheetRect, LazyTexture] = {}
+
+    def get_texture(self, rect: SheetRect) -> LazyTexture:
+        """Текстура с листа
+
+        Args:
+            rect: положение текстуры на листе
+
+        Returns:
+            LazyTexture: ленивая текстура
+        """
+        if rect not in self._textures:
+            self._textures[rect] = LazyTexture(path=self._path, rect=rect)
+        return self._textures[rect]
+
+
+@lru_cache(maxsize=None)
+def _load_spritesheet(path: Union[str, Path]) -> "SpriteSheet":
+    """Загрузить лист спрайтов (один раз для всех его текстур)"""
+    from arcade import load_spritesheet
+    return load_spritesheet(file_name=path)
+
+
+def resolve_texture(texture: Union[LazyTexture, "Texture", None]) -> Optional["Texture"]:
+    """Текстура arcade для отрисовки
+
+    Args:
+        texture: ленивая текстура или текстура arcade
+
+    Returns:
+        Texture: текстура arcade
+    """
+    if isinstance(texture, LazyTexture):
+        return texture.texture
+    return texture
+
 
 # текстуры кнопок
-SWITCH_GREEN_TEXTURE = load_texture(file_path=switch_green)
-SWITCH_RED_TEXTURE = load_texture(file_path=switch_red)
-RED_BUTTON_NORMAL_TEXTURE = load_texture(file_path=red_button)
-RED_BUTTON_HOVER_TEXTURE = load_texture(file_path=red_button_hovered)
-RED_BUTTON_PRESS_TEXTURE = load_texture(file_path=red_button_pressed)
+SWITCH_GREEN_TEXTURE = LazyTexture(path=switch_green)
+SWITCH_RED_TEXTURE = LazyTexture(path=switch_red)
+RED_BUTTON_NORMAL_TEXTURE = LazyTexture(path=red_button)
+RED_BUTTON_HOVER_TEXTURE = LazyTexture(path=red_button_hovered)
+RED_BUTTON_PRESS_TEXTURE = LazyTexture(path=red_button_pressed)
+SCROLL_DOWN_TEXTURE = LazyTexture(path=scroll_down)
+SCROLL_UP_TEXTURE = LazyTexture(path=scroll_up)
 
 # текстуры зданий
-ALTAR_TEXTURE = load_texture(file_path=altar_path)
-CASTLE_TEXTURE = load_texture(file_path=castle_path)
-CRYPT_TEXTURE = load_texture(file_path=crypt_path)
+ALTAR_TEXTURE = LazyTexture(path=altar_path)
+CASTLE_TEXTURE = LazyTexture(path=castle_path)
+CRYPT_TEXTURE = LazyTexture(path=crypt_path)
 
 # Текстуры доменов
-RED_DOMAIN_TEXTURE = load_texture(file_path=red_domain)
-BLUE_DOMAIN_TEXTURE = load_texture(file_path=blue_domain)
-GRAY_DOMAIN_TEXTURE = load_texture(file_path=gray_domain)
+RED_DOMAIN_TEXTURE = LazyTexture(path=red_domain)
+BLUE_DOMAIN_TEXTURE = LazyTexture(path=blue_domain)
+GRAY_DOMAIN_TEXTURE = LazyTexture(path=gray_domain)
 
 # текстуры фигур
-# BARBARIAN_TEXTURE = load_texture(file_path="src/sprites/units/Barbarian.png")
-# BARD_TEXTURE = load_texture(file_path="src/sprites/units/Bard.png")
-# CLERIC_TEXTURE = load_texture(file_path="src/sprites/units/Cleric.png")
-# DRUID_TEXTURE = load_texture(file_path="src/sprites/units/Druid.png")
-# FIGHTER_TEXTURE = load_texture(file_path="src/sprites/units/Fighter.png")
-# MONK_TEXTURE = load_texture(file_path="src/sprites/units/Monk.png")
-# PALADIN_TEXTURE = load_texture(file_path="src/sprites/units/Paladin.png")
-# RANGER_TEXTURE = load_texture(file_path="src/sprites/units/Ranger.png")
-# ROGUE_TEXTURE = load_texture(file_path="src/sprites/units/Rogue.png")
-# SORCERER_TEXTURE = load_texture(file_path="src/sprites/units/Sorcerer.png")
-# WARLOCK_TEXTURE = load_texture(file_path="src/sprites/units/Warlock.png")
-# WIZARD_TEXTURE = load_texture(file_path="src/sprites/units/Wizard.png")
+# BARBARIAN_TEXTURE = LazyTexture(path="src/sprites/units/Barbarian.png")
+# BARD_TEXTURE = LazyTexture(path="src/sprites/units/Bard.png")
+# CLERIC_TEXTURE = LazyTexture(path="src/sprites/units/Cleric.png")
+# DRUID_TEXTURE = LazyTexture(path="src/sprites/units/Druid.png")
+# FIGHTER_TEXTURE = LazyTexture(path="src/sprites/units/Fighter.png")
+# MONK_TEXTURE = LazyTexture(path="src/sprites/units/Monk.png")
+# PALADIN_TEXTURE = LazyTexture(path="src/sprites/units/Paladin.png")
+# RANGER_TEXTURE = LazyTexture(path="src/sprites/units/Ranger.png")
+# ROGUE_TEXTURE = LazyTexture(path="src/sprites/units/Rogue.png")
+# SORCERER_TEXTURE = LazyTexture(path="src/sprites/units/Sorcerer.png")
+# WARLOCK_TEXTURE = LazyTexture(path="src/sprites/units/Warlock.png")
+# WIZARD_TEXTURE = LazyTexture(path="src/sprites/units/Wizard.png")
 # через один рисунок
-UNIT_SPRITE_SHEET = load_spritesheet(file_name=units_sheet)
+UNIT_SPRITE_SHEET = LazySpriteSheet(path=units_sheet)
 # и позиции текстур на этом рисунке (в пикселях)
-BARBARIAN_MALE_RECT = LRBT(left=10, right=175, bottom=730, top=900)
-BARBARIAN_FEMALE_RECT = LRBT(left=175, right=340, bottom=720, top=900)
-BARD_MALE_RECT = LRBT(left=380, right=530, bottom=580, top=725)
-BARD_FEMALE_RECT = LRBT(left=530, right=705, bottom=570, top=725)
-CLERIC_MALE_RECT = LRBT(left=345, right=520, bottom=930, top=1065)
-CLERIC_FEMALE_RECT = LRBT(left=540, right=680, bottom=930, top=1065)
-DRUID_MALE_RECT = LRBT(left=335, right=490, bottom=10, top=175)
-DRUID_FEMALE_RECT = LRBT(left=505, right=685, bottom=15, top=180)
-FIGHTER_MALE_RECT = LRBT(left=180, right=345, bottom=920, top=1065)
-FIGHTER_FEMALE_RECT = LRBT(left=15, right=180, bottom=920, top=1065)
-MONK_MALE_RECT = LRBT(left=20, right=160, bottom=570, top=725)
-MONK_FEMALE_RECT = LRBT(left=175, right=330, bottom=590, top=720)
-PALADIN_MALE_RECT = LRBT(left=340, right=520, bottom=720, top=900)
-PALADIN_FEMALE_RECT = LRBT(left=515, right=690, bottom=730, top=900)
-RANGER_MALE_RECT = LRBT(left=35, right=185, bottom=405, top=570)
-RANGER_FEMALE_RECT = LRBT(left=185, right=365, bottom=420, top=570)
-ROGUE_MALE_RECT = LRBT(left=380, right=530, bottom=430, top=565)
-ROGUE_FEMALE_RECT = LRBT(left=555, right=680, bottom=415, top=565)
-SORCERER_MALE_RECT = LRBT(left=45, right=165, bottom=220, top=390)
-SORCERER_FEMALE_RECT = LRBT(left=195, right=310, bottom=225, top=390)
-WARLOCK_MALE_RECT = LRBT(left=360, right=500, bottom=220, top=390)
-WARLOCK_FEMALE_RECT = LRBT(left=500, right=635, bottom=220, top=390)
-WIZARD_MALE_RECT = LRBT(left=50, right=165, bottom=50, top=170)
-WIZARD_FEMALE_RECT = LRBT(left=185, right=310, bottom=50, top=170)
+BARBARIAN_MALE_RECT = SheetRect(left=10, right=175, bottom=730, top=900)
+BARBARIAN_FEMALE_RECT = SheetRect(left=175, right=340, bottom=720, top=900)
+BARD_MALE_RECT = SheetRect(left=380, right=530, bottom=580, top=725)
+BARD_FEMALE_RECT = SheetRect(left=530, right=705, bottom=570, top=725)
+CLERIC_MALE_RECT = SheetRect(left=345, right=520, bottom=930, top=1065)
+CLERIC_FEMALE_RECT = SheetRect(left=540, right=680, bottom=930, top=1065)
+DRUID_MALE_RECT = SheetRect(left=335, right=490, bottom=10, top=175)
+DRUID_FEMALE_RECT = SheetRect(left=505, right=685, bottom=15, top=180)
+FIGHTER_MALE_RECT = SheetRect(left=180, right=345, bottom=920, top=1065)
+FIGHTER_FEMALE_RECT = SheetRect(left=15, right=180, bottom=920, top=1065)
+MONK_MALE_RECT = SheetRect(left=20, right=160, bottom=570, top=725)
+MONK_FEMALE_RECT = SheetRect(left=175, right=330, bottom=590, top=720)
+PALADIN_MALE_RECT = SheetRect(left=340, right=520, bottom=720, top=900)
+PALADIN_FEMALE_RECT = SheetRect(left=515, right=690, bottom=730, top=900)
+RANGER_MALE_RECT = SheetRect(left=35, right=185, bottom=405, top=570)
+RANGER_FEMALE_RECT = SheetRect(left=185, right=365, bottom=420, top=570)
+ROGUE_MALE_RECT = SheetRect(left=380, right=530, bottom=430, top=565)
+ROGUE_FEMALE_RECT = SheetRect(left=555, right=680, bottom=415, top=565)
+SORCERER_MALE_RECT = SheetRect(left=45, right=165, bottom=220, top=390)
+SORCERER_FEMALE_RECT = SheetRect(left=195, right=310, bottom=225, top=390)
+WARLOCK_MALE_RECT = SheetRect(left=360, right=500, bottom=220, top=390)
+WARLOCK_FEMALE_RECT = SheetRect(left=500, right=635, bottom=220, top=390)
+WIZARD_MALE_RECT = SheetRect(left=50, right=165, bottom=50, top=170)
+WIZARD_FEMALE_RECT = SheetRect(left=185, right=310, bottom=50, top=170)
 
 # иконки действий
-MOVE_ACTION_TEXTURE = load_texture(file_path=move_action)
-PASS_ACTION_TEXTURE = load_texture(file_path=pass_action)
+MOVE_ACTION_TEXTURE = LazyTexture(path=move_action)
+PASS_ACTION_TEXTURE = LazyTexture(path=pass_action)
 
 # иконки способностей
-HEALING_HAND_TEXTURE = load_texture(file_path=healing_hand)
-LIGHT_SHIELD_TEXTURE = load_texture(file_path=light_shield)
-MEDIUM_SHIELD_TEXTURE = load_texture(file_path=medium_shield)
-GREAT_SHIELD_TEXTURE = load_texture(file_path=great_shield)
-DS_SWORD_TEXTURE = load_texture(file_path=ds_sword)
-DAGGER_TEXTURE = load_texture(file_path=dagger)
-TWO_DAGGERS_TEXTURE = load_texture(file_path=two_daggers)
-SWORD_OH_TEXTURE = load_texture(file_path=sword_oh)
-SWORD_BASTARD_TEXTURE = load_texture(file_path=sword_bastard)
-SWORD_TH_TEXTURE = load_texture(file_path=sword_th)
-AXE_TEXTURE = load_texture(file_path=axe)
-BOW_TEXTURE = load_texture(file_path=bow)
-FISTS_TEXTURE = load_texture(file_path=fists)
-DIVINE_SMITE_TEXTURE = load_texture(file_path=divine_smite_spell)
-FIRE_BALL_TEXTURE = load_texture(file_path=fire_ball_spell)
-FAERY_TALE_TEXTURE = load_texture(file_path=faery_tale_spell)
-ICE_STORM_TEXTURE = load_texture(file_path=ice_storm_spell)
-SHADOW_BLADE_TEXTURE = load_texture(file_path=shadow_blade_spell)
-MAGIC_MISSILE_TEXTURE = load_texture(file_path=magic_missile_spell)
-BEAR_PAWS_TEXTURE = load_texture(file_path=bear_paws_spell)
-FIRE_STORM_TEXTURE = load_texture(file_path=fire_storm_spell)
-ALTAR_GIFT_TEXTURE = load_texture(file_path=sacrifice)
+HEALING_HAND_TEXTURE = LazyTexture(path=healing_hand)
+LIGHT_SHIELD_TEXTURE = LazyTexture(path=light_shield)
+MEDIUM_SHIELD_TEXTURE = LazyTexture(path=medium_shield)
+GREAT_SHIELD_TEXTURE = LazyTexture(path=great_shield)
+DS_SWORD_TEXTURE = LazyTexture(path=ds_sword)
+DAGGER_TEXTURE = LazyTexture(path=dagger)
+TWO_DAGGERS_TEXTURE = LazyTexture(path=two_daggers)
+SWORD_OH_TEXTURE = LazyTexture(path=sword_oh)
+SWORD_BASTARD_TEXTURE = LazyTexture(path=sword_bastard)
+SWORD_TH_TEXTURE = LazyTexture(path=sword_th)
+AXE_TEXTURE = LazyTexture(path=axe)
+BOW_TEXTURE = LazyTexture(path=bow)
+FISTS_TEXTURE = LazyTexture(path=fists)
+DIVINE_SMITE_TEXTURE = LazyTexture(path=divine_smite_spell)
+FIRE_BALL_TEXTURE = LazyTexture(path=fire_ball_spell)
+FAERY_TALE_TEXTURE = LazyTexture(path=faery_tale_spell)
+ICE_STORM_TEXTURE = LazyTexture(path=ice_storm_spell)
+SHADOW_BLADE_TEXTURE = LazyTexture(path=shadow_blade_spell)
+MAGIC_MISSILE_TEXTURE = LazyTexture(path=magic_missile_spell)
+BEAR_PAWS_TEXTURE = LazyTexture(path=bear_paws_spell)
+FIRE_STORM_TEXTURE = LazyTexture(path=fire_storm_spell)
+ALTAR_GIFT_TEXTURE = LazyTexture(path=sacrifice)
@@ -1,11 +1,17 @@
+from collections import deque
 from contextvars import ContextVar
+from itertools import islice
 from enum import Enum
-from dataclasses import dataclass
-from typing import TypeVar, ParamSpec, TYPE_CHECKING, Optional, NamedTuple, Dict
+from dataclasses import dataclass, field
+from typing import (
+    TypeVar, ParamSpec, TYPE_CHECKING, Optional, NamedTuple, Dict, List, Tuple, Callable, Any, Deque, Sequence, Union
+)
 
 from src.utils.messages import DEFAULT_MSG
 from src.utils.constants import (
     CELL_SIZE,
+    INDEX_WIDTH,
+    INFO_LOG_CAPACITY,
     BASE_CHARACTERISTIC,
     BASE_HIT_POINTS,
     BASE_HP_COEFFICIENT,
@@ -23,6 +29,7 @@ if TYPE_CHECKING:
     from arcade import Texture
     from arcade.gui import UIWidget
     from src.abstractions.domain import BaseDomain
+    from src.models.store import UnitStore
 
 
 class BaseAttribute(Enum):
@@ -36,30 +43,52 @@ class Entry(NamedTuple):
     data: Dict
 
 
-@dataclass
 class Index:
-    """Вспомогательный класс для обозначения индекса (позиции) на игровой доске"""
-    row: int = None
-    column: int = None
-    x: float = None
-    y: float = None
-
-    def __post_init__(self):
-        if self.column is not None and self.row is not None:
-            self.x = self.column * CELL_SIZE
-            self.y = self.row * CELL_SIZE
-        elif self.x is not None and self.y is not None:
-            self.column = int(self.x / CELL_SIZE)
-            self.row = int(self.y / CELL_SIZE)
-        else:
-            raise KeyError
+    """Вспомогательный класс для обозначения индекса (позиции) на игровой доске
+    Индексы неизменяемы и создаются один раз для каждой позиции (повторный вызов возвращает
+    тот же объект); номер позиции (строка * ширина сетки + столбец) - ключ клеток и зданий доски
+    """
+    __slots__ = ("row", "column", "x", "y", "id", "name")
+    _interned: Dict[Tuple[int, int], "Index"] = {}
+
+    def __new__(cls, row: int = None, column: int = None, x: float = None, y: float = None) -> "Index":
+        if column is None or row is None:
+            if x is None or y is None:
+                raise KeyError
+            column = int(x / CELL_SIZE)
+            row = int(y / CELL_SIZE)
+        index = cls._interned.get((row, column))
+        if index is None:
+            index = super().__new__(cls)
+            for name, value in (
+                ("row", row),
+                ("column", column),
+                ("x", column * CELL_SIZE),
+                ("y", row * CELL_SIZE),
+                ("id", row * INDEX_WIDTH + column),
+                ("name", f"({column}, {row})"),
+            ):
+                object.__setattr__(index, name, value)
+            cls._interned[(row, column)] = index
+        return index
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"Индекс {self.name} неизменяем")
+
+    def __reduce__(self) -> Tuple[type, Tuple[int, int]]:
+        return Index, (self.row, self.column)
+
+    def __repr__(self) -> str:
+        return f"Index(row={self.row}, column={self.column})"
 
     def __str__(self) -> str:
         return self.name
 
-    @property
-    def name(self) -> str:
-        return f"({self.column}, {self.row})"
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Index) and other.id == self.id
+
+    def __hash__(self) -> int:
+        return self.id
 
 
 @dataclass
@@ -175,28 +204,403 @@ class SpriteCore:
         self._domain = value
 
 
+class Observable:
+    """Вспомогательная модель наблюдаемого объекта
+    Модели игры не знают о графике: графический слой (и другие индексы доски)
+    подписываются на события модели и обновляют себя сами
+    """
+
+    def __init__(self):
+        self._observers: List[Callable[[Any, "BaseAttribute"], None]] = []
+
+    def subscribe(self, observer: Callable[[Any, "BaseAttribute"], None]) -> None:
+        """Подписаться на события модели
+
+        Args:
+            observer: обработчик события (источник, событие)
+        """
+        self._observers.append(observer)
+
+    def unsubscribe(self, observer: Callable[[Any, "BaseAttribute"], None]) -> None:
+        """Отписаться от событий модели
+
+        Args:
+            observer: обработчик события
+        """
+        if observer in self._observers:
+            self._observers.remove(observer)
+
+    def notify(self, event: "BaseAttribute") -> None:
+        """Оповестить подписчиков о событии
+
+        Args:
+            event: событие
+        """
+        for observer in self._observers:
+            observer(self, event)
+
+
+class StoredAttribute:
+    """Вспомогательная модель атрибута, который может храниться в хранилище (src.models.store)
+    Пока объект не подключен к хранилищу, значение лежит в самом объекте;
+    у подключенного объекта значение читается и пишется в столбец хранилища по номеру объекта
+    """
+
+    def __init__(self, column: str, values: Sequence[Any] = None):
+        """Инициализация атрибута
+
+        Args:
+            column: имя столбца хранилища
+            values: допустимые значения (в хранилище лежат их номера)
+        """
+        self._column = column
+        self._values = tuple(values) if values else None
+        self._codes = {value: code for code, value in enumerate(self._values or ())}
+        self._name = column
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance: Optional["Stored"], owner: type = None) -> Any:
+        if instance is None:
+            return self
+        store = instance._store
+        if store is None:
+            return instance.__dict__[self._name]
+        value = int(store.columns[self._column][instance._slot])
+        return self._values[value] if self._values else value
+
+    def __set__(self, instance: "Stored", value: Any) -> None:
+        store = instance._store
+        if store is None:
+            instance.__dict__[self._name] = value
+        else:
+            store.columns[self._column][instance._slot] = self._codes[value] if self._values else value
+
+    @property
+    def column(self) -> str:
+        return self._column
+
+    def encode(self, value: Any) -> int:
+        """Значение для хранилища
+
+        Args:
+            value: значение атрибута
+
+        Returns:
+            int: значение в столбце хранилища
+        """
+        return self._codes[value] if self._values else value
+
+
+class Stored:
+    """Вспомогательная модель объекта, чьи атрибуты StoredAttribute можно перенести в хранилище"""
+    _store: Optional["UnitStore"] = None
+    _slot: int = -1
+
+    @property
+    def store(self) -> Optional["UnitStore"]:
+        """Хранилище, к которому подключен объект"""
+        return self._store
+
+    @property
+    def slot(self) -> int:
+        """Номер объекта в хранилище"""
+        return self._slot
+
+    def attach(self, store: Optional["UnitStore"], slot: int = -1) -> None:
+        """Перенести значения атрибутов в хранилище (без хранилища - обратно в объект)
+
+        Args:
+            store: хранилище
+            slot: номер объекта в хранилище
+        """
+        names = [
+            name
+            for cls in type(self).__mro__
+            for name, attribute in vars(cls).items()
+            if isinstance(attribute, StoredAttribute)
+        ]
+        values = {name: getattr(self, name) for name in names}
+        self._store = store
+        self._slot = slot
+        for name, value in values.items():
+            self.__dict__.pop(name, None)
+            setattr(self, name, value)
+
+
+class PerkState(NamedTuple):
+    """Состояние способности: статус и модификатор"""
+    status: "BaseAttribute"
+    modifier: "BaseAttribute"
+
+
+class UnitState(NamedTuple):
+    """Состояние персонажа (изменяемая часть)"""
+    level: int
+    current_hp: int
+    armor: int
+    perks: Tuple[Tuple[str, PerkState], ...]
+
+
+class FigureState(NamedTuple):
+    """Состояние фигуры (изменяемая часть)"""
+    can_move: bool
+    status: "BaseAttribute"
+    unit: UnitState
+
+
+class DomainState(NamedTuple):
+    """Состояние домена: мощь, очередь, имена фигур и пленников (в порядке добавления)"""
+    power: int
+    turn: bool
+    figures: Tuple[str, ...]
+    prisoners: Tuple[str, ...]
+
+
+class CellState(NamedTuple):
+    """Состояние клетки: имя фигуры (при наличии) и имя домена"""
+    figure: Optional[str]
+    domain: str
+
+
+class BuildingState(NamedTuple):
+    """Состояние здания: имя домена и состояние способности действия (при наличии)"""
+    domain: str
+    perk: Optional[PerkState]
+
+
+# ключ объекта доски в снимке: (вид объекта, имя) - вид: "cell", "figure", "building" или "domain"
+StateKey = Tuple[str, Union[str, int]]
+
+
+class DomainBand(NamedTuple):
+    """Полоса строк доски, клетки которой в начале игры принадлежат домену"""
+    domain: str
+    first_row: int
+    last_row: int
+
+
+class BoardLayout(NamedTuple):
+    """Расстановка доски: размеры, полосы доменов (клетки вне полос - серого домена),
+    позиции зданий и фигур (номер позиции и класс объекта)
+    Расстановка неизменяема, поэтому ее можно сравнивать и передавать в процессы поиска
+    """
+    rows: int
+    columns: int
+    bands: Tuple[DomainBand, ...]
+    buildings: Tuple[Tuple[int, type], ...]
+    figures: Tuple[Tuple[int, type], ...]
+
+
+@dataclass(frozen=True)
+class BoardState:
+    """Снимок состояния доски
+    Хранит только изменяемые значения и имена объектов,
+    поэтому снимок можно восстановить на той же доске или на доске-двойнике.
+    Доска-источник и отметка журнала изменений не участвуют в сравнении снимков:
+    по ним восстановление на той же доске затрагивает только объекты, измененные после снимка
+    """
+    started: bool
+    time: "BaseAttribute"
+    objects: Dict[StateKey, NamedTuple]
+    source: int = field(default=0, compare=False)
+    stamp: int = field(default=0, compare=False)
+
+
+class LogRecord(NamedTuple):
+    """Запись журнала событий
+    Текст записи форматируется из шаблона только при чтении
+    """
+    kind: Optional[str]
+    template: str
+    params: Dict[str, Any]
+    new_message: bool = False
+
+    def __str__(self) -> str:
+        return self.template.format(**self.params) if self.params else self.template
+
+
+class EventLog:
+    """Журнал событий - кольцевой буфер записей ограниченной вместимости"""
+
+    def __init__(self, capacity: int = INFO_LOG_CAPACITY):
+        """Инициализация журнала
+
+        Args:
+            capacity: вместимость (0 - журнал отключен)
+        """
+        self._records: Deque[LogRecord] = deque(maxlen=capacity)
+        self._count = 0
+        self._start = 0
+        self._new_message = False
+
+    @property
+    def capacity(self) -> int:
+        """Вместимость журнала"""
+        return self._records.maxlen
+
+    @property
+    def count(self) -> int:
+        """Количество записей за все время (номер следующей записи)"""
+        return self._count
+
+    def append(self, record: LogRecord) -> None:
+        """Добавить запись в журнал
+
+        Args:
+            record: запись
+        """
+        if self._new_message:
+            record = record._replace(new_message=True)
+            self._new_message = False
+        self._records.append(record)
+        self._count += 1
+
+    def start_message(self) -> None:
+        """Начать новое сообщение (последующие записи образуют текущее сообщение)"""
+        self._start = self._count
+        self._new_message = True
+
+    def records(self, since: int = 0) -> List[LogRecord]:
+        """Записи журнала начиная с номера since (если они еще не вытеснены)
+
+        Args:
+            since: номер записи
+
+        Returns:
+            list: записи
+        """
+        skip = since - (self._count - len(self._records))
+        if skip <= 0:
+            return list(self._records)
+        return list(islice(self._records, skip, None))
+
+    def message(self) -> List[LogRecord]:
+        """Записи текущего сообщения
+
+        Returns:
+            list: записи
+        """
+        return self.records(since=self._start)
+
+
 class InfoContext:
-    """Контекстный менеджер сообщений"""
+    """Контекстный менеджер сообщений
+    Сообщения хранятся в журнале событий в виде записей (шаблон и параметры),
+    текст собирается только при чтении
+    """
     def __init__(self):
-        self._text = ContextVar("text")
-        self._text.set("")
+        self._log = ContextVar("log")
+        self._log.set(EventLog())
         self._default_value = DEFAULT_MSG
 
-    def set(self, value: str) -> None:
-        self._text.set(value)
+    @property
+    def log(self) -> EventLog:
+        """Журнал событий"""
+        return self._log.get()
+
+    def set_capacity(self, capacity: int) -> None:
+        """Заменить журнал журналом другой вместимости (0 - отключить сообщения)
+
+        Args:
+            capacity: вместимость
+        """
+        self._log.set(EventLog(capacity=capacity))
+
+    def set(self, template: str, kind: str = None, **params: Any) -> None:
+        """Начать новое сообщение
+
+        Args:
+            template: шаблон (src.utils.messages)
+            kind: тип записи (LogKind)
+            params: параметры шаблона
+        """
+        log = self._log.get()
+        log.start_message()
+        if log.capacity:
+            log.append(record=LogRecord(kind=kind, template=template, params=params))
 
     def get(self) -> str:
-        return self._text.get()
+        return "\n".join(str(record) for record in self._log.get().message())
 
-    def update(self, value: str) -> None:
-        current_text = self.get()
-        self.set(
-            value=current_text + "\n" + value
-        )
+    def update(self, template: str, kind: str = None, **params: Any) -> None:
+        """Дополнить текущее сообщение
 
-    def reset(self, value: str = None) -> None:
-        new_text = value + "\n" + self._default_value if value else self._default_value
-        self.set(value=new_text)
+        Args:
+            template: шаблон (src.utils.messages)
+            kind: тип записи (LogKind)
+            params: параметры шаблона
+        """
+        log = self._log.get()
+        if log.capacity:
+            log.append(record=LogRecord(kind=kind, template=template, params=params))
+
+    def reset(self, template: str = None, kind: str = None, **params: Any) -> None:
+        """Начать новое сообщение, завершающееся подсказкой по умолчанию
+
+        Args:
+            template: шаблон (src.utils.messages)
+            kind: тип записи (LogKind)
+            params: параметры шаблона
+        """
+        if template:
+            self.set(template=template, kind=kind, **params)
+            self.update(template=self._default_value)
+        else:
+            self.set(template=self._default_value)
 
 
 info_context = InfoContext()
+
+
+class FeedUpdate(NamedTuple):
+    """Изменения ленты сообщений"""
+    clear: bool
+    lines: List[str]
+
+
+class InfoFeed:
+    """Версионированная лента сообщений для информационного табло
+    Номер версии - количество записей журнала, прочитанных лентой,
+    при чтении форматируются только новые записи
+    """
+
+    def __init__(self, context: InfoContext = info_context):
+        """Инициализация ленты
+
+        Args:
+            context: контекстный менеджер сообщений
+        """
+        self._context = context
+        self._log: Optional[EventLog] = None
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Версия ленты"""
+        return self._version
+
+    def pull(self) -> FeedUpdate:
+        """Забрать новые строки
+        Если журнал был заменен, табло нужно очистить и заполнить заново
+
+        Returns:
+            FeedUpdate: изменения
+        """
+        log = self._context.log
+        clear = log is not self._log
+        if clear:
+            self._log = log
+            self._version = 0
+        elif log.count == self._version:
+            return FeedUpdate(clear=False, lines=[])
+
+        lines = []
+        for record in log.records(since=self._version):
+            # новое сообщение отделяется пустой строкой
+            if record.new_message and (lines or not clear):
+                lines.append("")
+            lines.append(str(record))
+        self._version = log.count
+        return FeedUpdate(clear=clear, lines=lines)
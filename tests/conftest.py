@@ -0,0 +1,58 @@
+import pytest
+from contextvars import copy_context
+from typing import TYPE_CHECKING, Callable
+
+from src.ai.baseline import RandomPlayer
+from src.models.board import Board
+from src.models.history import UndoHistory
+from src.models.replay import ReplayRecorder, standard_scenario
+from src.utils.rng import random_context, PooledBackend
+
+if TYPE_CHECKING:
+    from src.abstractions.board import BaseBoard
+
+
+def _play_recorded(seed: int, path: str, turns: int = 12) -> "BaseBoard":
+    """Партия с записью: красный ходит как человек (выбор клеток и действий, отмена), синий - компьютер"""
+    random_context.set(PooledBackend(seed=seed))
+    board = Board()
+    standard_scenario(board=board)
+    board.get_domain(name="Blue").automated = True
+    recorder = ReplayRecorder(board=board, seed=seed, path=path)
+    history = UndoHistory(board=board)
+    history.record()
+    red, blue = RandomPlayer(domain="Red", seed=seed), RandomPlayer(domain="Blue", seed=seed)
+
+    board.start_circle()
+    for turn in range(turns):
+        if board.current_domain.name == "Red":
+            for step in range(4):
+                choice = red.choose(board=board)
+                if choice is None:
+                    break
+                cell, action, target = choice.resolve(board=board)
+                if action.self_target:
+                    board.select_cell(index=cell.index)
+                    board.perform(current_cell=cell, action=action, target=target)
+                else:
+                    board.select_cell(index=cell.index)
+                    board.select_action(action=action)
+                    board.select_target(index=target.index)
+                history.record()
+                if step == 1 and turn % 4 == 0:
+                    history.undo()
+        else:
+            while blue.play(board=board):
+                history.record()
+        board.finish_circle()
+        history.record()
+    recorder.close()
+    return board
+
+
+@pytest.fixture()
+def play_recorded() -> Callable[..., "BaseBoard"]:
+    """Записанная партия (в отдельном контексте, чтобы не менять генератор случайных чисел теста)"""
+    def play(seed: int, path: str, turns: int = 12) -> "BaseBoard":
+        return copy_context().run(_play_recorded, seed, path, turns)
+    return play
@@ -0,0 +1,142 @@
+import pytest
+from numpy import isclose
+from typing import TYPE_CHECKING
+
+from src.models.board import Board
+from src.ai.expectimax import ExpectimaxPlayer
+from src.ai.mcts import MctsPlayer
+from src.ai.player import Choice
+from src.ai.transposition import TranspositionTable
+from src.utils.rng import outcome_context, Outcome
+from src.utils.enums import ActionType, LogKind
+from src.utils.tools import Index, info_context
+
+if TYPE_CHECKING:
+    from src.abstractions.board import BaseBoard
+
+
+@pytest.fixture()
+def board() -> "BaseBoard":
+    board = Board()
+    board.initialize_cells()
+    board.initialize_buildings()
+    board.initialize_figures()
+    board.fill_domains()
+    board.start_circle()
+    board.finish_circle()
+    return board
+
+
+def test_action_outcomes(board):
+    """Тест для проверки исходов бросков: точные вероятности и заданный исход"""
+    cells = board.get_cells()
+    figure, action, target = next(
+        (figure, action, target)
+        for figure, action, target in board.legal_actions()
+        if action.attribute == ActionType.use.value and target.figure != figure
+    )
+    outcomes = action.outcomes(target=target)
+    assert isclose(sum(probability for probability, _ in outcomes), 1)
+
+    start = next(cell for cell in cells.values() if cell.figure == figure)
+    since = info_context.log.count
+    token = outcome_context.set(Outcome(hit=False, crit=False))
+    board.perform(current_cell=start, action=action, target=target)
+    outcome_context.restore(token)
+    assert not [
+        record
+        for record in info_context.log.records(since=since)
+        if record.kind == LogKind.hit.value
+    ], "При заданном исходе броски на попадание не делаются!"
+
+
+def test_expectimax_search(board):
+    """Тест для проверки поиска: доска не меняется, выбранное действие допустимо"""
+    player = ExpectimaxPlayer(time_budget=0.5, max_depth=2)
+    state = board.snapshot()
+    result = player.search(board=board)
+    assert board.snapshot() == state, "Поиск не должен менять доску!"
+    assert result.depth >= 1 and result.nodes > 0
+    assert result.choice is not None
+    cell, action, target = result.choice.resolve(board=board)
+    assert action.can_realise(current_cell=cell, target=target)
+
+    red = ExpectimaxPlayer(domain=board.players[0].name)
+    assert red.search(board=board).choice is None, "Чужой ход - только завершение хода!"
+
+
+def test_expectimax_turn(board):
+    """Тест для проверки хода компьютера до завершения"""
+    player = ExpectimaxPlayer(time_budget=10, max_depth=1)
+    domain = board.current_domain
+    actions = 0
+    for _ in range(100):
+        if not player.play(board=board):
+            break
+        actions += 1
+    else:
+        pytest.fail("Компьютер должен завершить ход!")
+    assert actions > 0, "Компьютер должен действовать до завершения хода!"
+    assert board.current_domain == domain, "Ход завершает игровой цикл, а не игрок!"
+
+
+def test_expectimax_timeout(board):
+    """Тест для проверки поиска без времени: первое действие оценивается, выбирается лучшее из оцененных"""
+    player = ExpectimaxPlayer(time_budget=0)
+    result = player.search(board=board)
+    assert result.depth == 1 and result.nodes >= 2, "Кроме завершения хода оценено хотя бы одно действие!"
+    assert result.choice in player.options(board=board)[:2], "Выбор - из оцененных вариантов!"
+
+
+def test_mcts_search(board):
+    """Тест для проверки поиска Монте-Карло: доска не меняется, результат воспроизводим по зерну"""
+    state = board.snapshot()
+    results = [
+        MctsPlayer(workers=1, iterations=30, time_budget=10, seed=7).search(board=board)
+        for _ in range(2)
+    ]
+    assert board.snapshot() == state, "Поиск не должен менять доску!"
+    assert results[0].statistics == results[1].statistics, "Одно зерно - одно дерево!"
+    assert sum(visits for visits, _ in results[0].statistics.values()) == 30
+    assert 0 <= results[0].value <= 1
+    if results[0].choice is not None:
+        cell, action, target = results[0].choice.resolve(board=board)
+        assert action.can_realise(current_cell=cell, target=target)
+
+    red = MctsPlayer(domain=board.players[0].name, workers=1)
+    assert red.search(board=board).choice is None, "Чужой ход - только завершение хода!"
+
+
+def test_mcts_merge():
+    """Тест для проверки сложения статистики деревьев: выбирается самое посещаемое действие"""
+    move = Choice(cell=Index(row=1, column=1).id, action="Move_Action", target=Index(row=2, column=1).id)
+    result = MctsPlayer._merge(trees=[
+        {None: (3, 1.5), move: (2, 2.0)},
+        {None: (1, 0.5), move: (4, 1.0)},
+    ])
+    assert result.choice == move
+    assert result.visits == 6 and result.value == 0.5
+    assert result.statistics[None] == (4, 2.0)
+
+
+@pytest.mark.parametrize("policy", ["always", "depth", "two_tier"])
+def test_transposition_table(policy):
+    """Тест для проверки таблицы транспозиций: глубина записи и замещение при совпадении ячеек"""
+    table = TranspositionTable(size=4, policy=policy)
+    table.put(key=1, depth=3, value=1.0)
+    assert table.get(key=1, depth=2) == 1.0
+    assert table.get(key=1, depth=4) is None, "Мелкая запись не заменяет глубокий просчет!"
+    assert table.get(key=5, depth=0) is None, "Та же ячейка, но другая позиция!"
+
+    table.put(key=5, depth=1, value=5.0)
+    kept = {key: table.get(key=key, depth=0) is not None for key in (1, 5)}
+    assert kept == {
+        "always": {1: False, 5: True},
+        "depth": {1: True, 5: False},
+        "two_tier": {1: True, 5: True},
+    }[policy]
+
+    table.new_search()
+    table.put(key=9, depth=0, value=9.0)
+    assert table.get(key=9, depth=0) == 9.0, "Записи прошлых поисков вытесняются!"
+    assert len(table) <= 2 * table.size
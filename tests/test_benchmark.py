@@ -0,0 +1,24 @@
+from src.benchmarks.cases import get_benchmarks
+from src.benchmarks.runner import run_benchmarks, write_results, load_results, compare
+
+
+def test_benchmarks(tmp_path):
+    """Тест для проверки замеров: результаты пишутся и читаются, замедление находится по базе"""
+    benchmarks = get_benchmarks(perks=("AttackWithAxe",))
+    names = ["dice.roll", "perk.activate.AttackWithAxe", "action.realise.attack", "board.select_target"]
+    results = list(run_benchmarks(benchmarks=benchmarks, names=names, min_time=0.001, repeats=1, memory_ops=2))
+    assert [result.name for result in results] == names
+    assert all(result.ops_per_second > 0 and result.number >= 1 for result in results)
+
+    path = str(tmp_path / "benchmark.json")
+    write_results(results=results, path=path)
+    assert load_results(path=path) == {result.name: result for result in results}
+
+    slower = {
+        result.name: result._replace(ops_per_second=result.ops_per_second * factor)
+        for result, factor in zip(results, (2.0, 1.0, 0.5, 1.1))
+    }
+    comparisons = compare(results=results, baseline=slower, tolerance=0.25)
+    assert [comparison.slowdown for comparison in comparisons] == [True, False, False, False]
+    assert compare(results=results, baseline={}) == []
+
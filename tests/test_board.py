@@ -0,0 +1,430 @@
+import pytest
+from typing import TYPE_CHECKING
+
+from src.models.board import Board
+from src.models.history import UndoHistory
+from src.models.store import UnitStore
+from src.models.scheduler import TurnScheduler
+from src.models.replay import standard_scenario
+from src.board.layouts import stress_layout
+from src.utils.tools import Index, info_context
+from src.utils.enums import ModelEvent, Time, ActionType, RollModifier, PerkStatus, AreaShape
+from src.utils.rng import random_context, PooledBackend, BucketBackend
+
+if TYPE_CHECKING:
+    from src.abstractions.board import BaseBoard
+
+
+@pytest.fixture()
+def board() -> "BaseBoard":
+    board = Board()
+    board.initialize_cells()
+    board.initialize_buildings()
+    board.initialize_figures()
+    board.fill_domains()
+    board.start_circle()
+    return board
+
+
+def test_headless_move(board):
+    """Тест для проверки хода на доске без графики"""
+    cells = board.get_cells()
+    start = cells[Index(row=6, column=1).id]
+    target = cells[Index(row=5, column=1).id]
+    figure = start.figure
+
+    events = []
+    target.subscribe(observer=lambda source, event: events.append(event))
+
+    assert board.select_cell(index=start.index), "Клетка должна быть выбрана!"
+    assert board.select_target(index=target.index), "Цель должна быть выбрана!"
+    assert not start.figure, "Клетка должна стать пустой!"
+    assert target.figure == figure, "Фигура должна переместиться!"
+    assert target.domain == figure.domain, "Клетка должна сменить домен!"
+    assert ModelEvent.figure.value in events, "Наблюдатель должен узнать о фигуре!"
+    assert ModelEvent.domain.value in events, "Наблюдатель должен узнать о домене!"
+
+
+def test_headless_finish_circle(board):
+    """Тест для проверки смены хода на доске без графики"""
+    assert board.time == Time.day.value
+    board.finish_circle()
+    assert board.time == Time.night.value
+    board.finish_circle()
+    assert board.time == Time.day.value
+
+
+def test_select_message(board):
+    """Тест для проверки сообщения о выборе клетки: текст не меняется вместе с фигурой"""
+    start = board.get_cells()[Index(row=6, column=1).id]
+    assert board.select_cell(index=start.index)
+    text = info_context.get()
+    start.figure.unit.defend_self(damage=7)
+    assert info_context.get() == text, "Запись журнала хранит текст на момент выбора!"
+
+
+def test_neighbors_table(board):
+    """Тест для проверки таблицы соседей"""
+    cells = board.get_cells()
+    corner = Index(row=1, column=1).id
+    assert board.get_neighbors(cell_id=corner, radius=1) == {
+        corner,
+        Index(row=2, column=1).id,
+        Index(row=1, column=2).id,
+    }, "Соседи за пределами доски не учитываются!"
+
+    for cell_id, cell in cells.items():
+        for radius in (1, 2, 3):
+            expected = {
+                other
+                for other, target in cells.items()
+                if (
+                    (target.index.row == cell.index.row and abs(target.index.column - cell.index.column) <= radius)
+                    or (target.index.column == cell.index.column and abs(target.index.row - cell.index.row) <= radius)
+                )
+            }
+            assert board.get_neighbors(cell_id=cell_id, radius=radius) == expected
+
+    assert not board.get_cell_neighbors(radius=1), "Без выбранной клетки соседей нет!"
+
+
+def test_bitboard(board):
+    """Тест для проверки битовой доски: маски обновляются вместе с клетками"""
+    bitboard = board.bitboard
+    cells = board.get_cells()
+    red_domain = cells[Index(row=7, column=1).id].domain
+    blue_domain = cells[Index(row=1, column=1).id].domain
+    assert bitboard.count(bitboard.owned(domain=red_domain)) == 12
+    assert bitboard.count(bitboard.owned(domain=blue_domain)) == 12
+    for domain in (red_domain, blue_domain):
+        assert set(bitboard.ids(bitboard.occupancy(domain=domain))) == {
+            cell_id for cell_id, cell in cells.items() if cell.figure and cell.figure.domain == domain
+        }
+    assert set(bitboard.ids(bitboard.buildings)) == {cell_id for cell_id, cell in cells.items() if cell.building}
+
+    for cell_id in cells:
+        for radius in (1, 2, 7):
+            mask = bitboard.neighbors(mask=bitboard.mask(ids=[cell_id]), radius=radius)
+            assert set(bitboard.ids(mask)) == board.get_neighbors(cell_id=cell_id, radius=radius)
+
+    start = cells[Index(row=6, column=1).id]
+    target = cells[Index(row=5, column=1).id]
+    board.select_cell(index=start.index)
+    board.select_target(index=target.index)
+    occupancy = bitboard.occupancy(domain=red_domain)
+    assert not occupancy & bitboard.mask(ids=[start.index.id]), "Клетка должна стать пустой!"
+    assert occupancy & bitboard.mask(ids=[target.index.id]), "Фигура должна переместиться!"
+    assert bitboard.count(bitboard.owned(domain=red_domain)) == 13, "Клетка должна сменить домен!"
+
+
+def test_legal_actions(board):
+    """Тест для проверки генератора допустимых действий"""
+    cells = board.get_cells()
+    count = info_context.log.count
+    actions = list(board.legal_actions())
+    assert info_context.log.count == count, "Проверка действий не должна менять журнал!"
+    assert actions, "У домена, который ходит, должны быть действия!"
+    assert all(figure.domain == board.current_domain for figure, _, _ in actions)
+    waiting = next(domain for domain in (cell.domain for cell in cells.values()) if not domain.turn and domain.figures)
+    assert not list(board.legal_actions(domain=waiting)), "Домен ходит только в свой ход!"
+    positions = {cell.figure: cell for cell in cells.values() if cell.figure}
+    for figure, action, target in actions:
+        if action.attribute == ActionType.move.value:
+            assert not target.figure, "Двигаться можно только на пустую клетку!"
+        elif action.attribute == ActionType.use.value:
+            assert target.figure, "Способность применяется к фигуре!"
+        start = positions[figure]
+        assert target.index.id in board.get_neighbors(cell_id=start.index.id, radius=action.radius)
+
+    figure, action, target = next(
+        (figure, action, target)
+        for figure, action, target in actions
+        if action.attribute == ActionType.move.value
+    )
+    start = positions[figure]
+    board.select_cell(index=start.index)
+    board.select_action(action=action)
+    assert board.select_target(index=target.index)
+    assert target.figure == figure
+    assert not [
+        action
+        for other, action, _ in board.legal_actions()
+        if other == figure and action.attribute == ActionType.move.value
+    ], "Фигура уже ходила!"
+
+    board.finish_circle()
+    night = list(board.legal_actions())
+    assert night and all(figure.domain == board.current_domain for figure, _, _ in night)
+    assert board.current_domain != figure.domain
+
+
+def test_snapshot_restore(board):
+    """Тест для проверки снимка состояния доски"""
+    state = board.snapshot()
+    actions = {name: list(figure.get_actions()) for name, figure in board._figures.items()}
+    cells = board.get_cells()
+    for _ in range(3):
+        for figure, action, target in list(board.legal_actions())[:5]:
+            start = next((cell for cell in cells.values() if cell.figure == figure), None)
+            if start and action.can_realise(current_cell=start, target=target):
+                board.perform(current_cell=start, action=action, target=target)
+        board.finish_circle()
+    assert board.snapshot() != state
+
+    board.restore(state=state)
+    assert board.snapshot() == state, "Снимок должен восстанавливаться полностью!"
+    assert {name: list(figure.get_actions()) for name, figure in board._figures.items()} == actions
+    for domain in board.players:
+        assert set(board.bitboard.ids(board.bitboard.occupancy(domain=domain))) == {
+            cell_id for cell_id, cell in cells.items() if cell.figure and cell.figure.domain == domain
+        }
+
+    twin = Board()
+    twin.initialize_cells()
+    twin.initialize_buildings()
+    twin.initialize_figures()
+    twin.fill_domains()
+    twin.restore(state=state)
+    assert twin.snapshot() == state, "Снимок должен восстанавливаться на доске-двойнике!"
+
+
+def test_zobrist_hash(board):
+    """Тест для проверки хэша Зобриста: пошаговое обновление и транспозиции"""
+    cells = board.get_cells()
+    state = board.snapshot()
+    key = board.position_key
+    assert board.zobrist.key == board.zobrist.recompute()
+
+    def move(column: int) -> None:
+        start = cells[Index(row=6, column=column).id]
+        action = next(
+            action
+            for action in start.figure.get_actions().values()
+            if action.attribute == ActionType.move.value
+        )
+        board.perform(current_cell=start, action=action, target=cells[Index(row=5, column=column).id])
+
+    move(column=1)
+    move(column=2)
+    moved = board.position_key
+    board.restore(state=state)
+    assert board.position_key == key, "Хэш должен восстанавливаться вместе с доской!"
+    move(column=2)
+    move(column=1)
+    assert board.position_key == moved != key, "Одна позиция разными путями - один хэш!"
+
+    board.finish_circle()
+    assert board.zobrist.position(time=Time.day.value) != board.position_key, "Хэш зависит от хода!"
+    for _ in range(3):
+        for figure, action, target in list(board.legal_actions())[:5]:
+            start = next((cell for cell in cells.values() if cell.figure == figure), None)
+            if start and action.can_realise(current_cell=start, target=target):
+                board.perform(current_cell=start, action=action, target=target)
+        board.finish_circle()
+    assert board.zobrist.key == board.zobrist.recompute(), "Пошаговый хэш должен совпадать с полным!"
+    board.restore(state=state)
+    assert board.position_key == key
+
+
+def test_incremental_restore(board):
+    """Тест для проверки восстановления только изменившихся объектов и отмены действий"""
+    cells = board.get_cells()
+    start = cells[Index(row=6, column=1).id]
+    target = cells[Index(row=5, column=1).id]
+    perk = next(iter(start.figure.unit.get_perks().values()))
+    state = board.snapshot()
+
+    history = UndoHistory(board=board)
+    history.record()
+    perk.change_modifier(value=RollModifier.advantage.value)
+    board.select_cell(index=start.index)
+    board.select_target(index=target.index)
+    history.record()
+    history.record()
+    assert len(history) == 2, "Неизменная доска не запоминается повторно!"
+
+    events = []
+    for cell in cells.values():
+        cell.subscribe(observer=lambda source, event: events.append(source.index.name))
+    assert history.undo(), "Действие должно отменяться!"
+    assert board.snapshot() == state
+    assert perk.modifier == RollModifier.standard.value, "Модификатор способности входит в снимок!"
+    assert set(events) == {start.index.name, target.index.name}, "Восстанавливаются только изменения!"
+    assert not history.undo(), "Отменять больше нечего!"
+
+
+def test_unit_store(board):
+    """Тест для проверки хранилища состояния персонажей: значения в массивах, массовый сброс брони"""
+    figures = list(board.get_figures().values())
+    units = [figure.unit.snapshot() for figure in figures]
+    state = board.snapshot()
+    store = UnitStore(capacity=4)
+    store.attach(board=board)
+    assert [figure.unit.snapshot() for figure in figures] == units, "Подключение не меняет персонажей!"
+
+    figure = figures[0]
+    unit = figure.unit
+    perk = next(iter(unit.get_perks().values()))
+    unit.shield_self(value=3)
+    unit.defend_self(damage=1)
+    perk.change_status(value=PerkStatus.done.value)
+    assert store.columns["armor"][unit.slot] == unit.snapshot().armor == 3
+    assert store.columns["current_hp"][unit.slot] == unit.current_hp
+    assert perk.status == PerkStatus.done.value
+
+    figure.domain.end_circle()
+    assert store.columns["armor"][unit.slot] == 0, "Броня снимается в хранилище!"
+    assert perk.status == PerkStatus.active.value, "Способности перезаряжаются в хранилище!"
+    assert figure.can_move
+
+    board.restore(state=state)
+    assert [figure.unit.snapshot() for figure in figures] == units
+
+    other = Board()
+    other.initialize_cells()
+    other.initialize_buildings()
+    other.initialize_figures()
+    other.fill_domains()
+    store.attach(board=other)
+    assert len(store) == 2 * len(figures), "Персонажи двух досок хранятся вместе!"
+    other_unit = next(iter(other.get_figures().values())).unit
+    other_unit.shield_self(value=5)
+    assert unit.snapshot().armor == 0, "Персонажи разных досок не пересекаются!"
+
+
+def test_turn_scheduler(board):
+    """Тест для проверки планировщика конца хода: в фазы попадают только затронутые объекты"""
+    buildings = [cell.building for cell in board.get_cells().values() if cell.building]
+    scheduler = TurnScheduler(figures=board.get_figures().values(), buildings=buildings)
+    castles = [building for building in buildings if building.name.startswith("Castle")]
+    assert scheduler.buildings() == castles, "Эффект действует только в зданиях с фигурой!"
+    assert not scheduler.damaged()
+
+    red = board.get_domain(name="Red")
+    figure, other = list(red.figures.values())[:2]
+    assert not scheduler.expiring(domain=red)
+    figure.unit.defend_self(damage=1)
+    assert scheduler.damaged() == [figure]
+    assert not scheduler.damaged()
+    assert not scheduler.expiring(domain=red), "Урон не записывает фигуру на перезарядку!"
+
+    figure.unit.shield_self(value=3)
+    perk = next(iter(other.unit.get_perks().values()))
+    perk.change_status(value=PerkStatus.done.value)
+    assert scheduler.expiring(domain=board.get_domain(name="Blue")) == []
+    expiring = scheduler.expiring(domain=red)
+    assert {item.name for item in expiring} == {figure.name, other.name}
+    assert not scheduler.expiring(domain=red), "Фигуры забираются из фазы один раз!"
+
+    red.end_circle(expiring=expiring)
+    assert figure.unit.armor == 0 and perk.status == PerkStatus.active.value
+    assert not scheduler.expiring(domain=red), "Перезарядка не записывает фигуру снова!"
+
+    # на доске броня снимается в конце цикла своего домена
+    figure.unit.shield_self(value=2)
+    board.finish_circle()
+    assert figure.unit.armor == 2
+    board.finish_circle()
+    assert figure.unit.armor == 0
+
+
+def test_board_layout():
+    """Тест для проверки расстановки доски: размеры, полосы доменов, пространственный индекс"""
+    layout = stress_layout(rows=30, columns=20)
+    board = Board(layout=layout)
+    standard_scenario(board=board)
+    cells = board.get_cells()
+    assert len(cells) == 30 * 20
+    assert len(board.get_figures()) == 4 * 20, "Имена повторяющихся фигур уникальны!"
+    assert cells[Index(row=1, column=20).id].domain.name == "Blue"
+    assert cells[Index(row=15, column=1).id].domain.name == "Gray"
+    assert cells[Index(row=30, column=20).id].domain.name == "Red"
+    with pytest.raises(ValueError):
+        board.layout = layout
+
+    spatial, bitboard = board.spatial, board.bitboard
+    for cell_id in (Index(row=1, column=1).id, Index(row=12, column=9).id, Index(row=30, column=20).id):
+        for radius in (0, 1, 3, 40):
+            mask = bitboard.neighbors(mask=bitboard.mask(ids=[cell_id]), radius=radius)
+            assert set(bitboard.ids(mask)) == board.get_neighbors(cell_id=cell_id, radius=radius)
+            center = cells[cell_id].index
+            square = {
+                other_id
+                for other_id, other in cells.items()
+                if abs(other.index.row - center.row) <= radius and abs(other.index.column - center.column) <= radius
+            }
+            assert spatial.area(cell_id=cell_id, radius=radius) == square
+            assert spatial.occupied(cell_id=cell_id, radius=radius) == sorted(
+                other_id for other_id in square if cells[other_id].figure
+            )
+
+    board.start_circle()
+    start = cells[Index(row=29, column=5).id]
+    target = cells[Index(row=28, column=5).id]
+    assert board.select_cell(index=start.index) and board.select_target(index=target.index)
+    assert spatial.occupied(cell_id=target.index.id, radius=0) == [target.index.id], "Индекс следит за фигурами!"
+    assert not spatial.occupied(cell_id=start.index.id, radius=0)
+
+
+def test_area_action(board):
+    """Тест для проверки заклинаний с областью поражения: задеваются все фигуры противника в области"""
+    token = random_context.set(PooledBackend(seed=3))
+    cells = board.get_cells()
+
+    def move(source: Index, target: Index) -> None:
+        figure = cells[source.id].figure
+        cells[source.id].remove_figure()
+        cells[target.id].capture(figure=figure)
+
+    # красный чародей подходит к строю синих, рядом с целью стоит своя фигура
+    move(source=Index(row=7, column=3), target=Index(row=4, column=3))
+    move(source=Index(row=6, column=2), target=Index(row=3, column=2))
+    caster, target = cells[Index(row=4, column=3).id], cells[Index(row=2, column=3).id]
+    actions = {action.perk.name: action for action in caster.figure.get_actions().values() if action.perk}
+    fireball, storm = actions["UseFireBall"], actions["UseFireStorm"]
+    assert (fireball.radius, fireball.area, fireball.shape) == (2, 1, AreaShape.square.value)
+    assert not actions["AttackWithDagger"].area and not board.get_footprint(
+        action=actions["AttackWithDagger"], target=target,
+    )
+
+    spatial = board.spatial
+    footprint = spatial.footprint(cell_id=target.index.id, radius=1, shape=AreaShape.square.value)
+    assert spatial.footprint(cell_id=target.index.id, radius=1, shape=AreaShape.square.value) is footprint
+    assert set(footprint) == spatial.area(cell_id=target.index.id, radius=1)
+    assert set(spatial.footprint(cell_id=target.index.id, radius=1)) == board.get_neighbors(cell_id=target.index.id)
+
+    area = board.get_footprint(action=fireball, target=target)
+    assert len(area) == 8 and target not in area
+    splash = fireball.area_targets(target=target, area=area)
+    assert [cell.index for cell in splash] == [
+        Index(row=1, column=2), Index(row=1, column=3), Index(row=1, column=4),
+        Index(row=2, column=2), Index(row=2, column=4),
+    ], "Своя фигура в области не задевается!"
+
+    friend = cells[Index(row=3, column=2).id].figure
+    hit_points = {cell.figure.name: cell.figure.unit.current_hp for cell in (target, *splash)}
+
+    # при поиске броски по целям области - значения части распределения, как и у главной цели
+    state = board.snapshot()
+    figures = [cell.figure for cell in splash]
+    totals = []
+    for bucket in (0, 0, 1):
+        bucket_token = random_context.set(BucketBackend(bucket=bucket, buckets=2))
+        board.perform(current_cell=caster, action=fireball, target=target)
+        random_context.restore(bucket_token)
+        totals.append(sum(hit_points[figure.name] - figure.unit.current_hp for figure in figures))
+        board.restore(state=state)
+    assert totals[0] == totals[1] < totals[2], "Броски области в поиске детерминированы частью распределения!"
+
+    friend_hp = friend.unit.current_hp
+    board.perform(current_cell=caster, action=fireball, target=target)
+    damage = {
+        name: hp - board.get_figures()[name].unit.current_hp
+        for name, hp in hit_points.items()
+    }
+    assert all(value >= 0 for value in damage.values()) and sum(damage.values()) > damage[target.figure.name]
+    assert friend.unit.current_hp == friend_hp
+    assert fireball.perk.status == PerkStatus.done.value
+    assert not fireball.area_targets(target=target, area=area), "Использованная способность не задевает область!"
+    assert storm.area_targets(target=target, area=board.get_footprint(action=storm, target=target))
+    random_context.restore(token)
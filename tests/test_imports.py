@@ -0,0 +1,47 @@
+import os
+import sys
+import subprocess
+
+from src.utils.constants import RULES_IMPORT_BUDGET
+
+# модули правил игры: кости, персонажи, способности, эффекты, предметы, действия, доска и ИИ
+RULES_MODULES = (
+    "src.models.dice",
+    "src.models.unit",
+    "src.models.perk",
+    "src.models.effect",
+    "src.models.item",
+    "src.models.action",
+    "src.models.board",
+    "src.ai.expectimax",
+    "src.ai.mcts",
+    "src.simulation.combat",
+)
+
+IMPORT_SCRIPT = """
+import sys
+import time
+sys.modules["arcade"] = None
+start = time.perf_counter()
+for module in sys.argv[1:]:
+    __import__(module)
+print(time.perf_counter() - start)
+print(sorted(name for name in ("arcade", "pyglet", "PIL") if sys.modules.get(name)))
+"""
+
+
+def test_rules_import():
+    """Тест для проверки импорта правил игры без arcade и в пределах бюджета времени"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join((root, os.path.join(root, "src"))))
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT, *RULES_MODULES],
+        cwd=root,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    elapsed, graphics = result.stdout.splitlines()
+    assert graphics == "[]", "Правила не должны загружать графику!"
+    assert float(elapsed) < RULES_IMPORT_BUDGET, f"Импорт правил занял {elapsed} с!"
@@ -0,0 +1,71 @@
+import pytest
+
+from src.utils.tools import info_context, EventLog, LogRecord, InfoFeed
+from src.utils.enums import LogKind
+from src.utils.messages import DEFAULT_MSG, DICE_ROLL_MSG, ACTION_NO_TARGET_MSG, ACTION_MOVE_MSG
+
+
+@pytest.fixture()
+def small_log() -> EventLog:
+    info_context.set_capacity(capacity=4)
+    yield info_context.log
+    info_context.set_capacity(capacity=EventLog().capacity)
+
+
+def test_message_text(small_log):
+    """Тест для проверки текста текущего сообщения"""
+    info_context.set(template=ACTION_MOVE_MSG, kind=LogKind.move.value, figure="Варвар", cell="Клетка")
+    info_context.update(template=DICE_ROLL_MSG, kind=LogKind.roll.value, value=3, penalty=0)
+    assert info_context.get() == (
+        ACTION_MOVE_MSG.format(figure="Варвар", cell="Клетка") + "\n"
+        + DICE_ROLL_MSG.format(value=3, penalty=0)
+    )
+
+    info_context.reset(template=ACTION_NO_TARGET_MSG)
+    assert info_context.get() == ACTION_NO_TARGET_MSG + "\n" + DEFAULT_MSG, "Сообщение должно начаться заново!"
+
+
+def test_ring_buffer(small_log):
+    """Тест для проверки ограниченной вместимости журнала"""
+    info_context.set(template=DICE_ROLL_MSG, kind=LogKind.roll.value, value=0, penalty=0)
+    for value in range(1, 10):
+        info_context.update(template=DICE_ROLL_MSG, kind=LogKind.roll.value, value=value, penalty=0)
+
+    records = small_log.message()
+    assert small_log.count == 10
+    assert len(records) == 4, "Старые записи должны вытесняться!"
+    assert [record.params["value"] for record in records] == [6, 7, 8, 9]
+    assert all(record.kind == LogKind.roll.value for record in records)
+    assert small_log.records(since=8) == records[2:]
+
+
+def test_disabled_log():
+    """Тест для проверки отключения журнала"""
+    info_context.set_capacity(capacity=0)
+    info_context.set(template=DICE_ROLL_MSG, value=1, penalty=0)
+    info_context.update(template=DICE_ROLL_MSG, value=2, penalty=0)
+    assert info_context.get() == ""
+    info_context.set_capacity(capacity=EventLog().capacity)
+
+    record = LogRecord(kind=None, template=DICE_ROLL_MSG, params={"value": 1, "penalty": -2})
+    assert str(record) == DICE_ROLL_MSG.format(value=1, penalty=-2)
+
+
+def test_info_feed(small_log):
+    """Тест для проверки ленты сообщений: только новые строки и только при изменениях"""
+    feed = InfoFeed()
+    info_context.set(template=ACTION_NO_TARGET_MSG)
+    first = feed.pull()
+    assert first.clear and first.lines == [ACTION_NO_TARGET_MSG], "Первое чтение заполняет табло!"
+    assert feed.pull().lines == [], "Без новых записей табло не обновляется!"
+
+    info_context.update(template=DICE_ROLL_MSG, value=1, penalty=0)
+    info_context.reset()
+    update = feed.pull()
+    assert not update.clear
+    assert update.lines == [DICE_ROLL_MSG.format(value=1, penalty=0), "", DEFAULT_MSG]
+    assert feed.version == small_log.count
+
+    info_context.set_capacity(capacity=4)
+    info_context.set(template=ACTION_NO_TARGET_MSG)
+    assert feed.pull().clear, "Новый журнал - табло заполняется заново!"
@@ -0,0 +1,89 @@
+import pytest
+from itertools import product
+from numpy import isclose
+
+from src.models.dice import Dice, StaticDice, DiceRoll, DifficultyRoll, CritRoll
+from src.utils.enums import RollModifier
+from src.utils.probability import expected_value, bucket_means
+
+
+def modify(first: int, second: int, modifier: str) -> int:
+    """Результат двух бросков с учетом модификатора"""
+    if modifier == RollModifier.advantage.value:
+        return max(first, second)
+    elif modifier == RollModifier.vulnerability.value:
+        return min(first, second)
+    return first
+
+
+@pytest.mark.parametrize("modifier", [modifier.value for modifier in RollModifier])
+@pytest.mark.parametrize("times", [1, 2, 3])
+def test_dice_roll_distribution(modifier, times):
+    """Тест для проверки точного распределения броска кости (полный перебор)"""
+    side = 4
+    roll = DiceRoll(dice=Dice(side=side), modifier=modifier, times=times)
+    expected = {}
+    for first, second in product(product(range(1, side + 1), repeat=times), repeat=2):
+        value = modify(first=sum(first), second=sum(second), modifier=modifier) - 2
+        expected[value] = expected.get(value, 0) + 1 / side ** (2 * times)
+
+    result = dict(roll.distribution(bonus=1, penalty=3))
+    assert result.keys() == expected.keys()
+    assert all(isclose(result[value], expected[value]) for value in expected)
+    assert isclose(sum(result.values()), 1)
+
+
+@pytest.mark.parametrize("modifier", [modifier.value for modifier in RollModifier])
+def test_difficulty_roll_probability(modifier):
+    """Тест для проверки точной вероятности попадания с учетом критических бросков"""
+    roll = DifficultyRoll(dice=Dice(side=20), modifier=modifier, resistance=Dice(side=6))
+    penalty_roll = DiceRoll(dice=Dice(side=4))
+    bonus, penalty = 3, 9
+    expected = 0
+    for first, second, resistance, save in product(range(1, 21), range(1, 21), range(1, 7), range(1, 5)):
+        value = modify(first=first, second=second, modifier=modifier)
+        if value == 1:
+            success = False
+        elif value == 20:
+            success = True
+        else:
+            success = value + bonus >= penalty + save + resistance
+        expected += success / (20 * 20 * 6 * 4)
+
+    result = roll.probability(
+        bonus=bonus,
+        penalty=penalty,
+        penalty_distribution=penalty_roll.distribution(),
+    )
+    assert isclose(result, expected)
+
+
+def test_crit_roll_probability():
+    """Тест для проверки границ вероятности критического удара"""
+    crit = CritRoll(modifier=RollModifier.standard.value)
+    assert isclose(crit.probability(), 1 / 20), "Без бонусов критический удар только на 20!"
+    assert isclose(crit.probability(bonus=1000), 19 / 20), "Единица - всегда промах!"
+    assert isclose(crit.probability(penalty=1000), 1 / 20), "Двадцать - всегда попадание!"
+
+    static = DifficultyRoll(dice=StaticDice(side=10), modifier=RollModifier.advantage.value)
+    assert static.probability(bonus=0, penalty=10) == 1
+    assert static.probability(bonus=0, penalty=11) == 0
+
+
+def test_distribution_cache():
+    """Тест для проверки, что распределения не пересчитываются"""
+    first = DiceRoll(dice=Dice(side=8), times=2, modifier=RollModifier.advantage.value)
+    second = DiceRoll(dice=Dice(side=8), times=2, modifier=RollModifier.advantage.value)
+    assert first.distribution() is second.distribution()
+    assert isclose(expected_value(DiceRoll(dice=Dice(side=6), times=2).distribution()), 7)
+
+
+@pytest.mark.parametrize("modifier", [modifier.value for modifier in RollModifier])
+@pytest.mark.parametrize("side, times", [(4, 1), (8, 1), (12, 1), (20, 1), (6, 2), (6, 3)])
+@pytest.mark.parametrize("buckets", [1, 2, 3])
+def test_bucket_means(modifier, side, times, buckets):
+    """Тест для проверки частей распределения: среднее частей совпадает со средним броска"""
+    distribution = DiceRoll(dice=Dice(side=side), modifier=modifier, times=times).distribution()
+    values = bucket_means(distribution=distribution, buckets=buckets)
+    assert len(values) == buckets and list(values) == sorted(values)
+    assert abs(sum(values) / buckets - expected_value(distribution)) <= 0.5 / buckets + 1e-9
@@ -0,0 +1,26 @@
+from contextvars import copy_context
+
+from src.models.replay import ReplayLog, ReplayPlayer
+from src.utils.enums import ReplayCommand
+
+
+def test_replay(tmp_path, play_recorded):
+    """Тест для проверки записи партии: воспроизведение повторяет партию, запись компактна"""
+    path = tmp_path / "game.jsonl.gz"
+    board = play_recorded(seed=7, path=str(path))
+
+    log = ReplayLog.load(path=path)
+    codes = {command[0] for command in log.commands}
+    assert {ReplayCommand.select_cell.value, ReplayCommand.perform.value, ReplayCommand.undo.value} <= codes
+    assert path.stat().st_size < 4 * 1024, "Запись должна занимать несколько килобайт!"
+
+    replayed = ReplayPlayer(log=log).run()
+    assert replayed.position_key == board.position_key
+    assert replayed.snapshot().objects == board.snapshot().objects, "Воспроизведение повторяет партию!"
+
+    plain = tmp_path / "game.jsonl"
+    log.save(path=plain)
+    assert ReplayLog.load(path=plain).commands == log.commands
+
+    player = ReplayPlayer(log=log)
+    assert copy_context().run(player.step) and player.position == 1 and player.board.started
@@ -0,0 +1,61 @@
+import pytest
+
+from src.models.dice import Dice, DiceRoll
+from src.utils.rng import random_context, PooledBackend, StandardBackend, BucketBackend
+
+
+@pytest.fixture()
+def pooled_backend() -> PooledBackend:
+    backend = PooledBackend(seed=42, block_size=16)
+    token = random_context.set(backend)
+    yield backend
+    random_context.restore(token)
+
+
+def test_pooled_rolls(pooled_backend):
+    """Тест для проверки бросков из заранее сгенерированных блоков"""
+    dice = Dice(side=6)
+    values = [dice.roll() for _ in range(100)]
+    assert set(values) == {1, 2, 3, 4, 5, 6}, "Значения должны покрывать все грани кости!"
+    assert random_context.get() is pooled_backend
+
+
+def test_seeded_games():
+    """Тест для проверки воспроизводимости бросков по зерну"""
+    roll = DiceRoll(dice=Dice(side=20), times=2)
+    results = []
+    for backend in (PooledBackend(seed=7), PooledBackend(seed=7), StandardBackend(seed=7), StandardBackend(seed=7)):
+        token = random_context.set(backend)
+        results.append([roll.action() for _ in range(50)])
+        random_context.restore(token)
+    assert results[0] == results[1], "Одно зерно - одна партия!"
+    assert results[2] == results[3], "Одно зерно - одна партия!"
+
+
+def test_spawned_streams():
+    """Тест для проверки независимых источников для разных партий"""
+    first, second = PooledBackend(seed=7).spawn(count=2)
+    first_values = [first.randint(1, 20) for _ in range(50)]
+    second_values = [second.randint(1, 20) for _ in range(50)]
+    assert first_values != second_values, "Источники должны быть независимы!"
+    again, _ = PooledBackend(seed=7).spawn(count=2)
+    assert first_values == [again.randint(1, 20) for _ in range(50)], "Источники должны воспроизводиться!"
+
+
+def test_bucket_rolls():
+    """Тест для проверки источника поиска: части точного распределения, векторные броски совпадают с одиночными"""
+    dice = Dice(side=8)
+    roll = DiceRoll(dice=Dice(side=6), times=2)
+    values = []
+    for bucket in range(2):
+        backend = BucketBackend(bucket=bucket, buckets=2)
+        token = random_context.set(backend)
+        value = dice.roll()
+        total = roll.action()
+        random_context.restore(token)
+        assert dice.rolls(size=3, generator=backend.dice_generator).tolist() == [value] * 3
+        assert roll.actions(size=3, generator=backend.dice_generator).tolist() == [total] * 3
+        values.append((value, total))
+    assert values == [(2, 5), (7, 9)], "Среднее частей совпадает со средним броска, сумма - не крайние значения!"
+    backend = PooledBackend(seed=1)
+    assert backend.dice_generator is backend.generator
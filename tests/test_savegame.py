@@ -0,0 +1,39 @@
+from time import perf_counter
+
+import pytest
+
+from src.models.board import Board
+from src.models.replay import standard_scenario
+from src.models.savegame import get_codec, save_game, load_game
+
+
+def test_savegame(tmp_path, play_recorded):
+    """Тест для проверки сохранения: загрузка восстанавливает партию, файл компактен, запись быстрая"""
+    board = play_recorded(seed=3, path=str(tmp_path / "game.jsonl"), turns=20)
+    path = tmp_path / "game.sav"
+    size = save_game(board=board, path=path)
+    assert size < 1024, "Сохранение должно занимать меньше килобайта!"
+
+    loaded = load_game(path=path)
+    assert loaded.snapshot().objects == board.snapshot().objects, "Загрузка восстанавливает партию!"
+    assert loaded.time == board.time and loaded.started == board.started
+    assert loaded.position_key == board.position_key
+
+    # загрузка на расставленную доску: объекты не пересоздаются
+    fresh = Board()
+    standard_scenario(board=fresh)
+    figures = list(fresh.get_figures().values())
+    assert load_game(path=path, board=fresh) is fresh
+    assert all(a is b for a, b in zip(fresh.get_figures().values(), figures))
+    assert fresh.snapshot().objects == board.snapshot().objects
+
+    codec, state = get_codec(), board.snapshot()
+    start = perf_counter()
+    for _ in range(100):
+        codec.dumps(state=state)
+    assert (perf_counter() - start) / 100 < 1e-3, "Запись сохранения должна занимать меньше миллисекунды!"
+
+    data = bytearray(path.read_bytes())
+    data[0:4] = b"XXXX"
+    with pytest.raises(ValueError):
+        codec.loads(data=bytes(data))
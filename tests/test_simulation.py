@@ -0,0 +1,176 @@
+import pytest
+from copy import deepcopy
+from numpy import array, isclose, sqrt
+from numpy.random import default_rng
+from typing import TYPE_CHECKING
+
+from src.units.units import UnitBarbarian, UnitCleric, UnitWarlock, UnitPaladin
+from src.utils.characters import barbarian, cleric, warlock, paladin
+from src.utils.enums import PerkStatus
+from src.utils.tools import info_context
+from src.utils.rng import random_context, outcome_context, StandardBackend
+from src.simulation.combat import estimate_combat
+from src.simulation.tournament import play_games, write_results, summarize
+from src.simulation.balance import balance_matrix, create_units, best_perk, kill_turns
+
+if TYPE_CHECKING:
+    from src.abstractions.unit import BaseUnit
+
+
+def create_unit(unit_class: type, character) -> "BaseUnit":
+    return unit_class(
+        name=character.name,
+        title=character.title,
+        description=character.description,
+        characteristic=deepcopy(character.characteristic),
+    )
+
+
+@pytest.fixture()
+def barbarian_unit() -> "BaseUnit":
+    return create_unit(unit_class=UnitBarbarian, character=barbarian)
+
+
+@pytest.fixture()
+def cleric_unit() -> "BaseUnit":
+    return create_unit(unit_class=UnitCleric, character=cleric)
+
+
+@pytest.fixture()
+def warlock_unit() -> "BaseUnit":
+    return create_unit(unit_class=UnitWarlock, character=warlock)
+
+
+def sample_damage(perk, target, times: int, **kwargs) -> array:
+    """Урон от последовательных активаций способности (обычные броски)"""
+    start_hp = target.current_hp
+    result = []
+    for time in range(times):
+        target.heal_self(value=start_hp)
+        perk.change_status(value=PerkStatus.active.value)
+        info_context.reset()
+        perk.activate(target=target, **kwargs)
+        result.append(start_hp - target.current_hp)
+    return array(result)
+
+
+@pytest.mark.parametrize("unit_name", ["barbarian_unit", "warlock_unit"])
+def test_estimate_matches_activate(request, unit_name, cleric_unit):
+    """Тест для проверки совпадения оценки с обычными бросками способности"""
+    unit = request.getfixturevalue(unit_name)
+    perk = list(unit.get_perks().values())[0]
+    kwargs = {"domain_bonus": 1, "building_bonus": 3}
+
+    outcome = estimate_combat(
+        perk=perk,
+        target=cleric_unit,
+        size=20000,
+        generator=default_rng(seed=7),
+        **kwargs,
+    )
+    damage = sample_damage(perk=perk, target=cleric_unit, times=2000, **kwargs)
+
+    error = max(damage.std(), outcome.damage.std()) * sqrt(1 / 2000 + 1 / 20000)
+    assert abs(damage.mean() - outcome.mean_damage) <= 4 * error, "Оценка урона не совпадает!"
+    assert outcome.damage.min() >= 0, "Урон не может быть отрицательным!"
+
+
+def test_combination_outcomes(cleric_unit):
+    """Тест для проверки исходов комбинированной способности: каждая часть бросает кости сама"""
+    unit = create_unit(unit_class=UnitPaladin, character=paladin)
+    perk = unit.get_perks()["AttackWithSwordBySpell"]
+    outcomes = perk.outcomes(target=cleric_unit)
+    assert isclose(sum(probability for probability, _ in outcomes), 1)
+    for index, part in enumerate(perk.parts):
+        hit = sum(probability for probability, outcome in outcomes if outcome[index].hit)
+        assert isclose(hit, part.hit_probability(target=cleric_unit)), "Попадание части - своим броском!"
+
+    # ожидание урона по исходам (как в узлах случая поиска) совпадает с оценкой Монте-Карло
+    random_token = random_context.set(StandardBackend(seed=5))
+    expectation = 0.0
+    for probability, outcome in outcomes:
+        cleric_unit.heal_self(value=cleric_unit.hit_points)
+        token = outcome_context.set(outcome)
+        damage = sample_damage(perk=perk, target=cleric_unit, times=500)
+        outcome_context.restore(token)
+        expectation += probability * damage.mean()
+    random_context.restore(random_token)
+    cleric_unit.heal_self(value=cleric_unit.hit_points)
+    perk.change_status(value=PerkStatus.active.value)
+    estimate = estimate_combat(perk=perk, target=cleric_unit, size=20000, generator=default_rng(seed=3))
+    assert abs(expectation - estimate.mean_damage) < 0.6, "Ожидание урона не совпадает с оценкой!"
+
+
+def test_estimate_keeps_state(barbarian_unit, cleric_unit):
+    """Тест для проверки, что оценка не изменяет персонажей и способность"""
+    perk = list(barbarian_unit.get_perks().values())[0]
+    hit_points = cleric_unit.current_hp
+
+    first = estimate_combat(perk=perk, target=cleric_unit, size=100, generator=default_rng(seed=1))
+    second = estimate_combat(perk=perk, target=cleric_unit, size=100, generator=default_rng(seed=1))
+
+    assert cleric_unit.current_hp == hit_points, "Здоровье цели не должно измениться!"
+    assert perk.status == PerkStatus.active.value, "Статус способности не должен измениться!"
+    assert (first.damage == second.damage).all(), "Оценка должна повторяться при одном зерне!"
+    assert (first.target_hp == hit_points - first.damage).all()
+
+    perk.change_status(value=PerkStatus.done.value)
+    outcome = estimate_combat(perk=perk, target=cleric_unit, size=100)
+    assert not outcome.hit.any() and not outcome.damage.any(), "Использованная способность не действует!"
+
+
+def test_tournament(tmp_path):
+    """Тест для проверки турнира: партии воспроизводятся по зерну, результаты пишутся в файл"""
+    path = tmp_path / "tournament.jsonl"
+    results = list(write_results(
+        results=play_games(red="random", blue="random", games=3, seed=5, workers=1, max_turns=30),
+        path=str(path),
+    ))
+    replay = list(play_games(red="random", blue="random", games=3, seed=5, workers=1, max_turns=30))
+    key = lambda result: (result.winner, result.turns, result.actions, result.captures)
+    assert [key(result) for result in results] == [key(result) for result in replay], "Партии воспроизводятся!"
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 3
+
+    summary = summarize(results=results, seconds=1.0)
+    assert summary.games == 3 and summary.games_per_hour == 3 * 3600
+    assert summary.draws + sum(summary.wins.values()) == 3
+    with pytest.raises(KeyError):
+        next(play_games(red="random", blue="unknown", games=1))
+
+
+def test_tournament_search_agents():
+    """Тест для проверки поисковых игроков турнира: ход ограничен узлами, а не временем, и воспроизводится"""
+    games = [
+        list(play_games(red="expectimax", blue="random", games=1, seed=5, workers=1, max_turns=1, node_budget=600))
+        for _ in range(2)
+    ]
+    key = lambda result: (result.winner, result.turns, result.actions, result.captures)
+    assert key(games[0][0]) == key(games[1][0]), "Партии поисковых игроков воспроизводятся!"
+    assert games[0][0].actions > 0, "Поисковый игрок должен действовать!"
+
+
+def test_balance_matrix():
+    """Тест для проверки матрицы баланса: размеры, доли, воспроизводимость, влияние здания"""
+    matrix = balance_matrix(duels=500, seed=3)
+    assert len(matrix.names) == 12 and matrix.win_rate.shape == (12, 12)
+    assert ((matrix.win_rate >= 0) & (matrix.win_rate + matrix.draw_rate <= 1)).all()
+    assert (matrix.turns_to_kill >= 1).all()
+    assert all(perk is not None for row in matrix.perks for perk in row), "У каждого класса есть атака!"
+
+    replay = balance_matrix(duels=500, seed=3)
+    assert (matrix.win_rate == replay.win_rate).all(), "Матрица воспроизводится по зерну!"
+
+    defended = balance_matrix(duels=500, seed=3, building_defence=6)
+    assert defended.win_rate.mean() < matrix.win_rate.mean(), "Здание защищает второго персонажа!"
+
+
+def test_kill_turns_blocks():
+    """Тест для проверки, что розыгрыш ходов блоками не меняет распределение хода гибели"""
+    barbarian_unit, _, cleric_unit = create_units()[:3]
+    generator = default_rng(seed=2)
+    perk = best_perk(unit=barbarian_unit, target=cleric_unit, generator=generator, size=1000)
+    by_turn = kill_turns(perk=perk, target=cleric_unit, generator=generator, size=20000, block=1)
+    by_block = kill_turns(perk=perk, target=cleric_unit, generator=generator, size=20000, block=8)
+    tolerance = 4 * sqrt(by_turn.var() / by_turn.size + by_block.var() / by_block.size)
+    assert abs(by_turn.mean() - by_block.mean()) < tolerance
+    assert by_turn.min() >= 1 and by_block.max() <= 101
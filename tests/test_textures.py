@@ -0,0 +1,44 @@
+from src.models.board import Board
+from src.utils.atlas import TextureAtlas, build_atlas
+from src.utils.textures import LazyTexture, SheetRect, resolve_texture, FIRE_BALL_TEXTURE, UNIT_SPRITE_SHEET
+from src.sprites.perks import fire_ball_spell
+from src.sprites.units import units_sheet
+
+
+def test_lazy_textures():
+    """Тест для проверки ленивых текстур: без графики рисунки не загружаются"""
+    board = Board()
+    board.initialize_cells()
+    board.initialize_buildings()
+    board.initialize_figures()
+    board.fill_domains()
+    assert not any(handle.loaded for handle in LazyTexture.handles()), "Рисунки не должны загружаться!"
+
+    handle = LazyTexture(path=fire_ball_spell)
+    texture = resolve_texture(handle)
+    assert handle.loaded and texture.size == (256, 256)
+    assert resolve_texture(handle) is texture, "Текстура загружается один раз!"
+    assert resolve_texture(texture) is texture
+    assert UNIT_SPRITE_SHEET.get_texture(rect=SheetRect(1, 2, 3, 4)) is UNIT_SPRITE_SHEET.get_texture(
+        rect=SheetRect(1, 2, 3, 4)
+    )
+
+
+def test_texture_atlas(tmp_path):
+    """Тест для проверки атласа: текстуры атласа совпадают с исходными рисунками"""
+    image_path, metadata_path = tmp_path / "atlas.png", tmp_path / "atlas.json"
+    sheet = LazyTexture(path=units_sheet, rect=SheetRect(left=380, right=530, bottom=580, top=725))
+    regions = build_atlas(
+        handles=[FIRE_BALL_TEXTURE, sheet],
+        image_path=image_path,
+        metadata_path=metadata_path,
+        width=300,
+    )
+    assert set(regions) == {FIRE_BALL_TEXTURE.key, sheet.key}
+
+    atlas = TextureAtlas(image_path=image_path, metadata_path=metadata_path)
+    for handle in (FIRE_BALL_TEXTURE, sheet):
+        texture = atlas.region(handle=handle)
+        assert texture.image.tobytes() == handle._load().image.convert("RGBA").tobytes()
+    assert atlas.region(handle=LazyTexture(path=fire_ball_spell, rect=SheetRect(0, 1, 0, 1))) is None
+    assert TextureAtlas(image_path=tmp_path / "none.png").region(handle=sheet) is None, "Без атласа - пусто!"
@@ -0,0 +1,53 @@
+import argparse
+from time import perf_counter
+
+from src.simulation.tournament import AGENTS, play_games, write_results, summarize
+from src.utils.messages import TOURNAMENT_GAME_MSG, TOURNAMENT_DRAW_MSG, TOURNAMENT_SUMMARY_MSG
+from src.utils.constants import (
+    TOURNAMENT_GAMES,
+    TOURNAMENT_SEED,
+    TOURNAMENT_MAX_TURNS,
+    TOURNAMENT_NODE_BUDGET,
+    TOURNAMENT_WORKERS,
+    TOURNAMENT_OUTPUT,
+)
+
+
+def start():
+
+    parser = argparse.ArgumentParser(description="Турнир компьютерных игроков без графики")
+    parser.add_argument("--red", choices=sorted(AGENTS), default="random", help="игрок красного домена")
+    parser.add_argument("--blue", choices=sorted(AGENTS), default="random", help="игрок синего домена")
+    parser.add_argument("--games", type=int, default=TOURNAMENT_GAMES, help="количество партий")
+    parser.add_argument("--seed", type=int, default=TOURNAMENT_SEED, help="зерно турнира")
+    parser.add_argument("--workers", type=int, default=TOURNAMENT_WORKERS, help="процессы (0 - по числу ядер)")
+    parser.add_argument("--max-turns", type=int, default=TOURNAMENT_MAX_TURNS, help="предел циклов партии")
+    parser.add_argument("--node-budget", type=int, default=TOURNAMENT_NODE_BUDGET, help="узлы expectimax на действие")
+    parser.add_argument("--output", default=TOURNAMENT_OUTPUT, help="файл результатов (JSONL)")
+    parser.add_argument("--quiet", action="store_true", help="не выводить результаты партий")
+    args = parser.parse_args()
+
+    start_time = perf_counter()
+    results = []
+    for result in write_results(
+        results=play_games(
+            red=args.red,
+            blue=args.blue,
+            games=args.games,
+            seed=args.seed,
+            workers=args.workers,
+            max_turns=args.max_turns,
+            node_budget=args.node_budget,
+        ),
+        path=args.output,
+    ):
+        results.append(result)
+        if not args.quiet:
+            print(TOURNAMENT_GAME_MSG.format(**{**result._asdict(), "winner": result.winner or TOURNAMENT_DRAW_MSG}))
+
+    summary = summarize(results=results, seconds=perf_counter() - start_time)
+    print(TOURNAMENT_SUMMARY_MSG.format(**summary._asdict()))
+
+
+if __name__ == '__main__':
+    start()